@@ -15,12 +15,11 @@
 import logging
 import os
 import typing
-from contextlib import contextmanager
 
 import mrc
 import pandas as pd
-from dfp.utils.cached_user_window import CachedUserWindow
 from dfp.utils.logging_timer import log_time
+from dfp.utils.user_window_store import UserWindowStore
 from mrc.core import operators as ops
 
 import cudf
@@ -57,8 +56,11 @@ def dfp_rolling_window(builder: mrc.Builder):
         Default: 'timestamp'
         - aggregation_span (str): Lookback timespan for training data in a new training event; Example: '60d';
         Default: '60d'
-        - cache_to_disk (bool): Whether to cache streaming data to disk; Example: false; Default: false
+        - cache_to_disk (bool): Whether to save the rolling windows to disk once the pipeline completes, and load
+          them when the user is next seen; Example: false; Default: false
         - cache_dir (str): Directory to use for caching streaming data; Example: './.cache'; Default: './.cache'
+        - max_memory_bytes (int): Maximum size of the rolling windows held in memory, the windows of the least recently
+          seen users are spilled to `cache_dir` beyond this size; Example: 1073741824; Default: None (no limit)
     """
 
     config = builder.get_current_module_config()
@@ -71,6 +73,7 @@ def dfp_rolling_window(builder: mrc.Builder):
     aggregation_span = config.get("aggregation_span", "60d")
 
     cache_to_disk = config.get("cache_to_disk", False)
+    max_memory_bytes = config.get("max_memory_bytes", None)
     cache_dir = config.get("cache_dir")
     if (cache_dir is None):
         cache_dir = "./.cache"
@@ -78,26 +81,13 @@ def dfp_rolling_window(builder: mrc.Builder):
 
     cache_dir = os.path.join(cache_dir, "rolling-user-data")
 
-    user_cache_map: typing.Dict[str, CachedUserWindow] = {}
-
-    @contextmanager
-    def get_user_cache(user_id: str):
-        # Determine cache location
-        cache_location = os.path.join(cache_dir, f"{user_id}.pkl") if cache_to_disk else None
-
-        user_cache = user_cache_map.get(user_id, None)
-
-        if (user_cache is None):
-            user_cache = CachedUserWindow(user_id=user_id,
-                                          cache_location=cache_location,
-                                          timestamp_column=timestamp_column_name)
-
-            user_cache_map[user_id] = user_cache
-
-        yield user_cache
+    user_cache_map = UserWindowStore(cache_dir,
+                                     timestamp_column=timestamp_column_name,
+                                     max_memory_bytes=max_memory_bytes,
+                                     persist=cache_to_disk)
 
     def try_build_window(message: MessageMeta, user_id: str) -> typing.Union[MessageMeta, None]:
-        with get_user_cache(user_id) as user_cache:
+        with user_cache_map.user_window(user_id) as user_cache:
 
             # incoming_df = message.get_df()
             with message.mutable_dataframe() as dfm:
@@ -109,10 +99,6 @@ def dfp_rolling_window(builder: mrc.Builder):
                                 "Consider deleting the rolling window cache and restarting."))
                 return None
 
-            if (cache_to_disk and cache_dir is not None):
-                logger.debug("Saved rolling window cache for %s == %d items", user_id, user_cache.total_count)
-                user_cache.save()
-
             # Exit early if we don't have enough data
             if (user_cache.count < min_history):
                 logger.debug("Not enough data to train")
@@ -185,7 +171,8 @@ def dfp_rolling_window(builder: mrc.Builder):
             return None
 
     def node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
-        obs.pipe(ops.map(on_data), ops.filter(lambda x: x is not None)).subscribe(sub)
+        obs.pipe(ops.map(on_data), ops.filter(lambda x: x is not None),
+                 ops.on_completed(user_cache_map.close)).subscribe(sub)
 
     node = builder.make_node(DFP_ROLLING_WINDOW, mrc.core.operators.build(node_fn))
 
@@ -53,6 +53,14 @@ class DFPFileToDataFrameStage(PreallocatorMixin, SinglePortStage):
         Keyword arguments to pass to the DataFrame parser.
     cache_dir : str, optional
         Directory to use for caching.
+    cache_format : str, optional
+        Format of the cached batches, either "pickle" or "arrow".
+    cache_max_bytes : int, optional
+        Maximum total size of the batch cache in bytes. Unbounded when `None`.
+    cache_ttl : float, optional
+        Maximum age of a cached batch in seconds. Unbounded when `None`.
+    cache_compression : str, optional
+        Compression codec for the "arrow" cache format, either "lz4" or "zstd".
     """
 
     def __init__(self,
@@ -61,7 +69,11 @@ class DFPFileToDataFrameStage(PreallocatorMixin, SinglePortStage):
                  filter_null: bool = True,
                  file_type: FileTypes = FileTypes.Auto,
                  parser_kwargs: dict = None,
-                 cache_dir: str = "./.cache/dfp"):
+                 cache_dir: str = "./.cache/dfp",
+                 cache_format: str = "pickle",
+                 cache_max_bytes: int = None,
+                 cache_ttl: float = None,
+                 cache_compression: str = None):
         super().__init__(config)
 
         self._controller = FileToDFController(schema=schema,
@@ -69,7 +81,11 @@ class DFPFileToDataFrameStage(PreallocatorMixin, SinglePortStage):
                                               file_type=file_type,
                                               parser_kwargs=parser_kwargs,
                                               cache_dir=cache_dir,
-                                              timestamp_column_name=config.ae.timestamp_column_name)
+                                              timestamp_column_name=config.ae.timestamp_column_name,
+                                              cache_format=cache_format,
+                                              cache_max_bytes=cache_max_bytes,
+                                              cache_ttl=cache_ttl,
+                                              cache_compression=cache_compression)
 
     @property
     def name(self) -> str:
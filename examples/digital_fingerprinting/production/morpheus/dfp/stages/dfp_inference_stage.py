@@ -14,10 +14,12 @@
 """Inference stage for DFP."""
 
 import logging
+import threading
 import time
 import typing
 
 import mrc
+import pandas as pd
 from mlflow.tracking.client import MlflowClient
 from mrc.core import operators as ops
 
@@ -44,9 +46,25 @@ class DFPInferenceStage(SinglePortStage):
     model_name_formatter : str, optional
         Format string to control the name of models stored in MLflow. Currently available field names are: `user_id`
         and `user_md5` which is an md5 hexadecimal digest as returned by `hash.hexdigest`.
+    max_batch_rows : int, optional
+        When greater than 0, incoming messages are accumulated until they hold at least `max_batch_rows` rows, or the
+        oldest message has been held for `max_batch_delay_sec`. The accumulated messages are grouped by the model of
+        their user, performing a single inference per model, such as the fallback model shared by every user without
+        a model of their own. By default 0, performing inference one message at a time.
+    max_batch_delay_sec : float, optional
+        Maximum time a message is held waiting for more messages when `max_batch_rows` is set, by default 0.1. Once
+        exceeded the held messages are sent, even when no more messages arrive.
+    max_model_bytes : int, optional
+        Maximum size of the models kept loaded, once exceeded the least recently used models are unloaded. By default
+        None (no limit).
     """
 
-    def __init__(self, c: Config, model_name_formatter: str = "dfp-{user_id}"):
+    def __init__(self,
+                 c: Config,
+                 model_name_formatter: str = "dfp-{user_id}",
+                 max_batch_rows: int = 0,
+                 max_batch_delay_sec: float = 0.1,
+                 max_model_bytes: int = None):
         super().__init__(c)
 
         self._client = MlflowClient()
@@ -57,7 +75,19 @@ class DFPInferenceStage(SinglePortStage):
 
         self._cache_timeout_sec = 600
 
-        self._model_manager = ModelManager(model_name_formatter=model_name_formatter)
+        self._model_manager = ModelManager(model_name_formatter=model_name_formatter, max_model_bytes=max_model_bytes)
+
+        self._max_batch_rows = max_batch_rows
+        self._max_batch_delay_sec = max_batch_delay_sec
+
+        self._batch: typing.List[MultiDFPMessage] = []
+        self._batch_rows = 0
+        self._batch_start_time: float = None
+
+        # Guards the batch, shared with the thread sending held batches once their deadline passes
+        self._batch_cond = threading.Condition()
+        self._batch_timer: threading.Thread = None
+        self._batch_timer_stopped = False
 
     @property
     def name(self) -> str:
@@ -82,6 +112,28 @@ class DFPInferenceStage(SinglePortStage):
         """
         return self._model_manager.load_user_model(self._client, user_id=user, fallback_user_ids=[self._fallback_user])
 
+    def prefetch_models(self, user_ids: typing.List[str]):
+        """
+        Load the models of the given users in the background, intended to be called by an upstream stage such as
+        `DFPSplitUsersStage` as users are seen, before their data reaches this stage.
+        """
+        self._model_manager.prefetch_user_models(self._client,
+                                                 user_ids=user_ids,
+                                                 fallback_user_ids=[self._fallback_user])
+
+    def _create_output_message(self, message: MultiDFPMessage, results_df: pd.DataFrame,
+                               model_cache: ModelCache) -> MultiDFPMessage:
+        # Create an output message to allow setting meta
+        output_message = MultiDFPMessage(meta=message.meta,
+                                         mess_offset=message.mess_offset,
+                                         mess_count=message.mess_count)
+
+        output_message.set_meta(list(results_df.columns), results_df)
+
+        output_message.set_meta('model_version', f"{model_cache.reg_model_name}:{model_cache.reg_model_version}")
+
+        return output_message
+
     def on_data(self, message: MultiDFPMessage) -> MultiDFPMessage:
         """Perform inference on the input data."""
         if (not message or message.mess_count == 0):
@@ -108,14 +160,7 @@ class DFPInferenceStage(SinglePortStage):
 
         results_df = loaded_model.get_results(df_user, return_abs=True)
 
-        # Create an output message to allow setting meta
-        output_message = MultiDFPMessage(meta=message.meta,
-                                         mess_offset=message.mess_offset,
-                                         mess_count=message.mess_count)
-
-        output_message.set_meta(list(results_df.columns), results_df)
-
-        output_message.set_meta('model_version', f"{model_cache.reg_model_name}:{model_cache.reg_model_version}")
+        output_message = self._create_output_message(message, results_df, model_cache)
 
         if logger.isEnabledFor(logging.DEBUG):
             load_model_duration = (post_model_time - start_time) * 1000.0
@@ -130,8 +175,177 @@ class DFPInferenceStage(SinglePortStage):
 
         return output_message
 
+    def on_batch(self, messages: typing.List[MultiDFPMessage]) -> typing.List[MultiDFPMessage]:
+        """
+        Perform inference on the input data of several messages, performing a single inference for all of the messages
+        sharing the same model. Messages whose model could not be loaded are dropped, the remaining messages are
+        returned in their original order.
+        """
+        start_time = time.time()
+
+        # Group the messages by model, only looking up the model once per user
+        user_models: typing.Dict[str, ModelCache] = {}
+        model_groups: typing.Dict[typing.Tuple[str, str], typing.List[int]] = {}
+        model_caches: typing.Dict[typing.Tuple[str, str], ModelCache] = {}
+
+        for (i, message) in enumerate(messages):
+            user_id = message.user_id
+
+            if (user_id not in user_models):
+                try:
+                    model_cache = self.get_model(user_id)
+
+                    if (model_cache is None):
+                        raise RuntimeError(f"Could not find model for user {user_id}")
+
+                except Exception:
+                    logger.exception("Error trying to get model", exc_info=True)
+                    model_cache = None
+
+                user_models[user_id] = model_cache
+
+            model_cache = user_models[user_id]
+            if (model_cache is None):
+                continue
+
+            model_key = (model_cache.reg_model_name, model_cache.reg_model_version)
+            model_caches[model_key] = model_cache
+            model_groups.setdefault(model_key, []).append(i)
+
+        output_messages: typing.List[MultiDFPMessage] = [None] * len(messages)
+
+        for (model_key, indices) in model_groups.items():
+            model_cache = model_caches[model_key]
+
+            try:
+                loaded_model = model_cache.load_model()
+            except Exception:
+                logger.exception("Error trying to get model", exc_info=True)
+                continue
+
+            dfs = [messages[i].get_meta() for i in indices]
+
+            results_df = loaded_model.get_results(pd.concat(dfs, ignore_index=True), return_abs=True)
+
+            # Scatter the results back to each message, matching the index of its rows
+            offset = 0
+            for (i, df_user) in zip(indices, dfs):
+                user_results_df = results_df.iloc[offset:offset + len(df_user)].set_axis(df_user.index)
+                offset += len(df_user)
+
+                output_messages[i] = self._create_output_message(messages[i], user_results_df, model_cache)
+
+        output_messages = [message for message in output_messages if message is not None]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Completed inference for %d messages of %d users using %d models in %s ms",
+                         len(output_messages),
+                         len(user_models),
+                         len(model_groups), (time.time() - start_time) * 1000.0)
+
+        return output_messages
+
+    def _flush_batch(self) -> typing.List[MultiDFPMessage]:
+        (messages, self._batch) = (self._batch, [])
+        self._batch_rows = 0
+        self._batch_start_time = None
+
+        if (len(messages) == 0):
+            return []
+
+        return self.on_batch(messages)
+
+    def _on_batch_data(self, message: MultiDFPMessage) -> typing.List[MultiDFPMessage]:
+        if (not message or message.mess_count == 0):
+            return []
+
+        if (self._batch_start_time is None):
+            self._batch_start_time = time.time()
+
+        self._batch.append(message)
+        self._batch_rows += message.mess_count
+
+        if (self._batch_rows >= self._max_batch_rows
+                or (time.time() - self._batch_start_time) >= self._max_batch_delay_sec):
+            return self._flush_batch()
+
+        return []
+
+    def _process_batch_data(self, message: MultiDFPMessage, emit: typing.Callable[[list], None]):
+        with self._batch_cond:
+            emit(self._on_batch_data(message))
+
+            # Wake the timer, which may need to wait for the deadline of a new batch
+            self._batch_cond.notify()
+
+    def _run_batch_timer(self, emit: typing.Callable[[list], None]):
+        with self._batch_cond:
+            while (not self._batch_timer_stopped):
+                if (self._batch_start_time is None):
+                    self._batch_cond.wait()
+                    continue
+
+                remaining = self._batch_start_time + self._max_batch_delay_sec - time.time()
+                if (remaining > 0):
+                    self._batch_cond.wait(remaining)
+                else:
+                    emit(self._flush_batch())
+
+    def _start_batch_timer(self, emit: typing.Callable[[list], None]):
+        """
+        Start a thread sending any held batch through `emit` once it has been held for `max_batch_delay_sec`.
+        """
+        self._batch_timer_stopped = False
+        self._batch_timer = threading.Thread(target=self._run_batch_timer,
+                                             args=(emit, ),
+                                             name=f"{self.name}-batch-timer",
+                                             daemon=True)
+        self._batch_timer.start()
+
+    def _stop_batch_timer(self):
+        with self._batch_cond:
+            self._batch_timer_stopped = True
+            self._batch_cond.notify()
+
+        if (self._batch_timer is not None):
+            self._batch_timer.join()
+            self._batch_timer = None
+
+    def _on_batch_completed(self) -> typing.Union[typing.List[MultiDFPMessage], None]:
+        to_send = self._flush_batch()
+
+        self._model_manager.close()
+
+        return to_send if len(to_send) > 0 else None
+
     def _build_single(self, builder: mrc.Builder, input_node: mrc.SegmentObject) -> mrc.SegmentObject:
-        node = builder.make_node(self.unique_name, ops.map(self.on_data), ops.filter(lambda x: x is not None))
+        if (self._max_batch_rows > 0):
+
+            def node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
+
+                # Batches are sent both as messages arrive and by the timer thread, always while holding the lock
+                def emit(messages: typing.List[MultiDFPMessage]):
+                    for message in messages:
+                        sub.on_next(message)
+
+                def on_completed():
+                    self._stop_batch_timer()
+                    emit(self._on_batch_completed() or [])
+
+                self._start_batch_timer(emit)
+
+                # Every message is sent through `emit`, nothing is passed on by the operators themselves
+                obs.pipe(ops.map(lambda message: self._process_batch_data(message, emit)),
+                         ops.filter(lambda _: False),
+                         ops.on_completed(on_completed)).subscribe(sub)
+
+            node = builder.make_node(self.unique_name, ops.build(node_fn))
+        else:
+            node = builder.make_node(self.unique_name,
+                                     ops.map(self.on_data),
+                                     ops.filter(lambda x: x is not None),
+                                     ops.on_completed(self._model_manager.close))
+
         builder.make_edge(input_node, node)
 
         # node.launch_options.pe_count = self._config.num_threads
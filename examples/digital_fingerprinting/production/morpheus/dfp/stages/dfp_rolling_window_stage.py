@@ -30,6 +30,7 @@ from ..messages.multi_dfp_message import DFPMessageMeta
 from ..messages.multi_dfp_message import MultiDFPMessage
 from ..utils.cached_user_window import CachedUserWindow
 from ..utils.logging_timer import log_time
+from ..utils.user_window_store import UserWindowStore
 
 logger = logging.getLogger(f"morpheus.{__name__}")
 
@@ -39,9 +40,10 @@ class DFPRollingWindowStage(SinglePortStage):
     This stage groups incomming messages into a rolling time window, emitting them only when the history requirements
     are met specified by the `min_history`, `min_increment` and `max_history` parameters.
 
-    Incoming data is cached to disk (`cache_dir`) to reduce memory ussage. This computes a row hash for the first and
-    last rows of the incoming `DataFrame` as such all data contained must be hashable, any non-hashable values such as
-    `lists` should be dropped or converted into hashable types in the `DFPFileToDataFrameStage`.
+    The windows of the least recently seen users are spilled to disk (`cache_dir`) once the windows held in memory
+    exceed `max_memory_bytes`. This computes a row hash for the first and last rows of the incoming `DataFrame` as such
+    all data contained must be hashable, any non-hashable values such as `lists` should be dropped or converted into
+    hashable types in the `DFPFileToDataFrameStage`.
 
     Parameters
     ----------
@@ -60,6 +62,11 @@ class DFPRollingWindowStage(SinglePortStage):
     cache_dir : str
         Path to cache directory, cached items will be stored in a subdirectory under this directory named
         `rolling-user-data`. This directory, along with `cache_dir` will be created if it does not already exist.
+    max_memory_bytes : int, optional
+        Maximum size of the rolling windows held in memory, by default None (all windows are held in memory).
+    cache_to_disk : bool, optional
+        When True, the rolling windows are saved to `cache_dir` once the pipeline completes and loaded again when the
+        user is next seen, allowing the windows to survive restarts. By default False.
     """
 
     def __init__(self,
@@ -67,7 +74,9 @@ class DFPRollingWindowStage(SinglePortStage):
                  min_history: int,
                  min_increment: int,
                  max_history: typing.Union[int, str],
-                 cache_dir: str = "./.cache/dfp"):
+                 cache_dir: str = "./.cache/dfp",
+                 max_memory_bytes: int = None,
+                 cache_to_disk: bool = False):
         super().__init__(c)
 
         self._min_history = min_history
@@ -75,8 +84,11 @@ class DFPRollingWindowStage(SinglePortStage):
         self._max_history = max_history
         self._cache_dir = os.path.join(cache_dir, "rolling-user-data")
 
-        # Map of user ids to total number of messages. Keeps indexes monotonic and increasing per user
-        self._user_cache_map: typing.Dict[str, CachedUserWindow] = {}
+        # Map of user ids to rolling windows. Keeps indexes monotonic and increasing per user
+        self._user_cache_map = UserWindowStore(self._cache_dir,
+                                               timestamp_column=self._config.ae.timestamp_column_name,
+                                               max_memory_bytes=max_memory_bytes,
+                                               persist=cache_to_disk)
 
     @property
     def name(self) -> str:
@@ -96,25 +108,8 @@ class DFPRollingWindowStage(SinglePortStage):
 
     @contextmanager
     def _get_user_cache(self, user_id: str) -> typing.Generator[CachedUserWindow, None, None]:
-
-        # Determine cache location
-        cache_location = os.path.join(self._cache_dir, f"{user_id}.pkl")
-
-        user_cache = None
-
-        user_cache = self._user_cache_map.get(user_id, None)
-
-        if (user_cache is None):
-            user_cache = CachedUserWindow(user_id=user_id,
-                                          cache_location=cache_location,
-                                          timestamp_column=self._config.ae.timestamp_column_name)
-
-            self._user_cache_map[user_id] = user_cache
-
-        yield user_cache
-
-        # # When it returns, make sure to save
-        # user_cache.save()
+        with self._user_cache_map.user_window(user_id) as user_cache:
+            yield user_cache
 
     def _build_window(self, message: DFPMessageMeta) -> MultiDFPMessage:
 
@@ -194,7 +189,10 @@ class DFPRollingWindowStage(SinglePortStage):
             return result
 
     def _build_single(self, builder: mrc.Builder, input_node: mrc.SegmentObject) -> mrc.SegmentObject:
-        node = builder.make_node(self.unique_name, ops.map(self.on_data), ops.filter(lambda x: x is not None))
+        node = builder.make_node(self.unique_name,
+                                 ops.map(self.on_data),
+                                 ops.filter(lambda x: x is not None),
+                                 ops.on_completed(self._user_cache_map.close))
         builder.make_edge(input_node, node)
 
         return node
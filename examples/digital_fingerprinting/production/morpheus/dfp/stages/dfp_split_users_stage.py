@@ -54,6 +54,9 @@ class DFPSplitUsersStage(SinglePortStage):
         List of user ids to skip.
     only_users : list of str
         List of user ids to include.
+    user_callback : callable, optional
+        Called with the ids of the users found in each incoming message, for example `DFPInferenceStage.prefetch_models`
+        allowing the models of these users to be loaded before their data reaches inference.
     """
 
     def __init__(self,
@@ -61,13 +64,15 @@ class DFPSplitUsersStage(SinglePortStage):
                  include_generic: bool,
                  include_individual: bool,
                  skip_users: typing.List[str] = None,
-                 only_users: typing.List[str] = None):
+                 only_users: typing.List[str] = None,
+                 user_callback: typing.Callable[[typing.List[str]], None] = None):
         super().__init__(c)
 
         self._include_generic = include_generic
         self._include_individual = include_individual
         self._skip_users = skip_users if skip_users is not None else []
         self._only_users = only_users if only_users is not None else []
+        self._user_callback = user_callback
 
         # Map of user ids to total number of messages. Keeps indexes monotonic and increasing per user
         self._user_index_map: typing.Dict[str, int] = {}
@@ -147,6 +152,9 @@ class DFPSplitUsersStage(SinglePortStage):
                 #              df_user[self._config.ae.timestamp_column_name].max(),
                 #              df_user[self._config.ae.timestamp_column_name].count())
 
+            if (self._user_callback is not None and len(output_messages) > 0):
+                self._user_callback([x.user_id for x in output_messages])
+
             rows_per_user = [len(x.df) for x in output_messages]
 
             if (len(output_messages) > 0):
@@ -24,6 +24,7 @@ import mrc
 from morpheus.config import Config
 from morpheus.pipeline.single_output_source import SingleOutputSource
 from morpheus.pipeline.stage_schema import StageSchema
+from morpheus.utils.file_discovery import IncrementalFileDiscovery
 
 logger = logging.getLogger(f"morpheus.{__name__}")
 
@@ -47,6 +48,10 @@ class MultiFileSource(SingleOutputSource):
     watch_interval : float, default = 1.0
         When `watch` is True, this is the time in seconds between polling the paths in `filenames` for new files.
         Ignored when `watch` is False.
+    late_arrival_window : float, default = None
+        When `watch` is True, files modified this many seconds before the newest discovered file are still emitted,
+        older files are skipped, bounding the number of files remembered. By default every new file is emitted,
+        regardless of its modification time. Ignored when `watch` is False.
     """
 
     def __init__(
@@ -55,6 +60,7 @@ class MultiFileSource(SingleOutputSource):
         filenames: typing.List[str],
         watch: bool = False,
         watch_interval: float = 1.0,
+        late_arrival_window: float = None,
     ):
         super().__init__(c)
 
@@ -67,6 +73,7 @@ class MultiFileSource(SingleOutputSource):
         self._max_concurrent = c.num_threads
         self._watch = watch
         self._watch_interval = watch_interval
+        self._late_arrival_window = late_arrival_window
 
     @staticmethod
     def _expand_directories(filenames: typing.List[str]) -> typing.List[str]:
@@ -124,7 +131,11 @@ class MultiFileSource(SingleOutputSource):
         yield files
 
     def _polling_generate_frames_fsspec(self) -> typing.Iterable[fsspec.core.OpenFiles]:
-        files_seen = set()
+        # Only lists the directories which may contain new files. Files deleted from the input directory are forgotten,
+        # if a file with a given name was created, seen/processed by the stage, and then deleted, and a new file with
+        # the same name appeared sometime later, the stage will re-ingest that new file.
+        discovery = IncrementalFileDiscovery(self._filenames, late_arrival_window=self._late_arrival_window)
+
         curr_time = time.monotonic()
         next_update_epoch = curr_time
 
@@ -134,23 +145,10 @@ class MultiFileSource(SingleOutputSource):
                 # Only ever add `self._watch_interval` to next_update_epoch so all updates are at repeating intervals
                 next_update_epoch += self._watch_interval
 
-            file_set = set()
-            filtered_files = []
-
-            files = fsspec.open_files(self._filenames)
-            for file in files:
-                file_set.add(file.full_name)
-                if file.full_name not in files_seen:
-                    filtered_files.append(file)
-
-            # Replace files_seen with the new set of files. This prevents a memory leak that could occur if files are
-            # deleted from the input directory. In addition, if a file with a given name was created, seen/processed by
-            # the stage, and then deleted, and a new file with the same name appeared sometime later, the stage will
-            # need to re-ingest that new file.
-            files_seen = file_set
+            files = discovery.discover()
 
-            if len(filtered_files) > 0:
-                yield fsspec.core.OpenFiles(filtered_files, fs=files.fs)
+            if len(files) > 0:
+                yield files
 
             curr_time = time.monotonic()
 
@@ -13,19 +13,71 @@
 # limitations under the License.
 
 import dataclasses
+import json
 import os
-import pickle
 import typing
+from collections import deque
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Key of the Parquet schema metadata holding the fields of the window
+_STATE_METADATA_KEY = b"morpheus.dfp.cached_user_window"
+
+_DATETIME_FIELDS = ("min_epoch", "max_epoch", "last_train_epoch")
+
+
+@dataclasses.dataclass
+class _WindowChunk:
+    """
+    A batch of rows appended to a window, along with the statistics needed to trim the window without scanning it.
+    """
+    df: pd.DataFrame
+    min_timestamp: pd.Timestamp
+    max_timestamp: pd.Timestamp
+    min_batch_id: int
+    max_batch_id: int
+    memory_bytes: int
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame, timestamp_column: str) -> "_WindowChunk":
+        timestamps = df[timestamp_column]
+        batch_ids = df["_batch_id"]
+
+        return cls(df=df,
+                   min_timestamp=timestamps.min(),
+                   max_timestamp=timestamps.max(),
+                   min_batch_id=int(batch_ids.min()),
+                   max_batch_id=int(batch_ids.max()),
+                   memory_bytes=int(df.memory_usage(index=True, deep=True).sum()))
+
+    def new_rows_mask(self, last_batch: int) -> typing.Union[bool, pd.Series]:
+        """
+        Returns True if all of the rows belong to batches after `last_batch`, False if none do, and a mask otherwise.
+        """
+        if (self.min_batch_id > last_batch):
+            return True
+
+        if (self.max_batch_id <= last_batch):
+            return False
+
+        return self.df["_batch_id"] > last_batch
 
 
 @dataclasses.dataclass
 class CachedUserWindow:
+    """
+    Rolling window of the rows of a single user.
+
+    Rows are appended as chunks, which are only concatenated by `get_train_df`. Since each appended chunk only contains
+    rows later than all of the existing rows, the chunks are ordered by time and the window can be trimmed by dropping
+    chunks from the front, only filtering the rows of the oldest remaining chunk.
+    """
     user_id: str
     cache_location: str
     timestamp_column: str = "timestamp"
@@ -40,7 +92,19 @@ class CachedUserWindow:
     last_train_batch: int = 0
 
     _trained_rows: pd.Series = dataclasses.field(init=False, repr=False, default_factory=pd.DataFrame)
-    _df: pd.DataFrame = dataclasses.field(init=False, repr=False, default_factory=pd.DataFrame)
+    _chunks: typing.Deque[_WindowChunk] = dataclasses.field(init=False, repr=False, default_factory=deque)
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        The in-memory size of the rows in the window.
+        """
+        return sum(chunk.memory_bytes for chunk in self._chunks)
+
+    def _update_epochs(self):
+        if (len(self._chunks) > 0):
+            self.min_epoch = self._chunks[0].min_timestamp
+            self.max_epoch = self._chunks[-1].max_timestamp
 
     def append_dataframe(self, incoming_df: pd.DataFrame) -> bool:
 
@@ -66,22 +130,20 @@ class CachedUserWindow:
         # Use batch id to distinguish groups in the same dataframe
         filtered_df["_batch_id"] = self.batch_count
 
-        # Append just the new rows
-        self._df = pd.concat([self._df, filtered_df])
+        # Append just the new rows, without copying the existing ones
+        self._chunks.append(_WindowChunk.from_df(filtered_df, self.timestamp_column))
 
         self.total_count += len(filtered_df)
-        self.count = len(self._df)
+        self.count += len(filtered_df)
 
-        if (len(self._df) > 0):
-            self.min_epoch = self._df[self.timestamp_column].min()
-            self.max_epoch = self._df[self.timestamp_column].max()
+        self._update_epochs()
 
         return True
 
     def flush(self):
         self.batch_count = 0
         self.count = 0
-        self._df = pd.DataFrame()
+        self._chunks = deque()
         self._trained_rows = pd.Series()
         self.last_train_batch = 0
         self.last_train_count = 0
@@ -96,33 +158,124 @@ class CachedUserWindow:
 
     def get_train_df(self, max_history) -> pd.DataFrame:
 
-        new_df = self.trim_dataframe(self._df,
-                                     max_history=max_history,
-                                     last_batch=self.batch_count - self.pending_batch_count,
-                                     timestamp_column=self.timestamp_column)
+        self._trim(max_history=max_history, last_batch=self.batch_count - self.pending_batch_count)
+
+        new_df = self._compact()
 
         self.last_train_count = self.total_count
         self.last_train_epoch = datetime.now()
         self.last_train_batch = self.batch_count
         self.pending_batch_count = 0
 
-        self._df = new_df
+        return new_df
 
-        if (len(self._df) > 0):
-            self.min_epoch = self._df[self.timestamp_column].min()
-            self.max_epoch = self._df[self.timestamp_column].max()
+    def _compact(self) -> pd.DataFrame:
+        """
+        Concatenate the chunks into a single chunk, returning its DataFrame.
+        """
+        if (len(self._chunks) == 0):
+            return pd.DataFrame()
+
+        if (len(self._chunks) > 1):
+            chunks = self._chunks
+            self._chunks = deque([
+                _WindowChunk(df=pd.concat([chunk.df for chunk in chunks]),
+                             min_timestamp=chunks[0].min_timestamp,
+                             max_timestamp=chunks[-1].max_timestamp,
+                             min_batch_id=min(chunk.min_batch_id for chunk in chunks),
+                             max_batch_id=max(chunk.max_batch_id for chunk in chunks),
+                             memory_bytes=sum(chunk.memory_bytes for chunk in chunks))
+            ])
+
+        return self._chunks[0].df
+
+    def _drop_oldest_rows(self, num_rows: int):
+        while (num_rows > 0 and len(self._chunks) > 0):
+            chunk = self._chunks[0]
+
+            if (len(chunk.df) <= num_rows):
+                self._chunks.popleft()
+                num_rows -= len(chunk.df)
+            else:
+                self._chunks[0] = _WindowChunk.from_df(chunk.df.iloc[num_rows:], self.timestamp_column)
+                num_rows = 0
+
+    def _trim(self, max_history: typing.Union[int, str], last_batch: int):
+        """
+        Equivalent to `trim_dataframe` on the concatenated chunks.
+        """
+        if (max_history is None or len(self._chunks) == 0):
+            return
 
-        return new_df
+        # Want to ensure we always see data once. So any new data is preserved
+        new_masks = [chunk.new_rows_mask(last_batch) for chunk in self._chunks]
+
+        # See if max history is an int
+        if (isinstance(max_history, int)):
+            num_new_rows = sum(
+                len(chunk.df) if mask is True else 0 if mask is False else int(mask.sum())
+                for (chunk, mask) in zip(self._chunks, new_masks))
+
+            self._drop_oldest_rows(self.count - max(max_history, num_new_rows))
 
-    def save(self):
-        if (not self.cache_location):
+        # If its a string, then its a duration
+        elif (isinstance(max_history, str)):
+            # Calc the earliest
+            earliest = self._chunks[-1].max_timestamp - pd.Timedelta(max_history)
+
+            for (chunk, mask) in zip(self._chunks, new_masks):
+                if (mask is True):
+                    earliest = min(earliest, chunk.min_timestamp)
+                elif (mask is not False and mask.any()):
+                    earliest = min(earliest, chunk.df.loc[mask, self.timestamp_column].min())
+
+            # The chunks are ordered by time, so only the oldest remaining chunk can span `earliest`
+            while (len(self._chunks) > 0 and self._chunks[0].max_timestamp < earliest):
+                self._chunks.popleft()
+
+            if (len(self._chunks) > 0 and self._chunks[0].min_timestamp < earliest):
+                df = self._chunks[0].df
+                self._chunks[0] = _WindowChunk.from_df(df[df[self.timestamp_column] >= earliest], self.timestamp_column)
+
+        else:
+            raise RuntimeError("Unsupported max_history")
+
+        self.count = sum(len(chunk.df) for chunk in self._chunks)
+        self._update_epochs()
+
+    def save(self, cache_location: str = None):
+        """
+        Save the window to a Parquet file, storing the other fields of the window in the file's metadata.
+
+        Parameters
+        ----------
+        cache_location : str, optional
+            File to save the window to, by default `self.cache_location`.
+        """
+        cache_location = cache_location or self.cache_location
+        if (not cache_location):
             raise RuntimeError("No cache location set")
 
         # Make sure the directories exist
-        os.makedirs(os.path.dirname(self.cache_location), exist_ok=True)
-
-        with open(self.cache_location, "wb") as f:
-            pickle.dump(self, f)
+        os.makedirs(os.path.dirname(cache_location), exist_ok=True)
+
+        state = {}
+        for field in dataclasses.fields(self):
+            if (field.init):
+                value = getattr(self, field.name)
+                if (field.name in _DATETIME_FIELDS and value is not None):
+                    value = pd.Timestamp(value).isoformat()
+                state[field.name] = value
+
+        table = pa.Table.from_pandas(self._compact(), preserve_index=True)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}), _STATE_METADATA_KEY: json.dumps(state).encode("UTF-8")
+        })
+
+        # Write to a temporary file first so that a partially written file is never loaded
+        tmp_location = f"{cache_location}.tmp"
+        pq.write_table(table, tmp_location)
+        os.replace(tmp_location, cache_location)
 
     @staticmethod
     def trim_dataframe(df: pd.DataFrame,
@@ -158,5 +311,16 @@ class CachedUserWindow:
         if (cache_location is None):
             raise RuntimeError("No cache location set")
 
-        with open(cache_location, "rb") as f:
-            return pickle.load(f)
+        table = pq.read_table(cache_location)
+        state = json.loads(table.schema.metadata[_STATE_METADATA_KEY])
+        for name in _DATETIME_FIELDS:
+            if (state[name] is not None):
+                state[name] = pd.Timestamp(state[name])
+
+        window = CachedUserWindow(**state)
+
+        df = table.to_pandas()
+        if (len(df) > 0):
+            window._chunks.append(_WindowChunk.from_df(df, window.timestamp_column))
+
+        return window
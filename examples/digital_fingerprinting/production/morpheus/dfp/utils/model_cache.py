@@ -13,9 +13,13 @@
 # limitations under the License.
 
 import hashlib
+import itertools
 import logging
 import threading
+import time
 import typing
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 
@@ -58,19 +62,34 @@ def user_to_model_name(user_id: str, model_name_formatter: str):
     return model_name_formatter.format(**kwargs)
 
 
+def get_model_bytes(model: AutoEncoder) -> int:
+    """
+    Returns the size in bytes of the parameters and buffers of a loaded model.
+    """
+    tensors = itertools.chain(model.parameters(), model.buffers())
+
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
 class ModelCache:
 
-    def __init__(self, reg_model_name: str, reg_model_version: str, model_uri: str) -> None:
+    def __init__(self,
+                 reg_model_name: str,
+                 reg_model_version: str,
+                 model_uri: str,
+                 manager: "ModelManager" = None) -> None:
 
         self._reg_model_name = reg_model_name
         self._reg_model_version = reg_model_version
         self._model_uri = model_uri
+        self._manager = manager
 
         self._last_checked: datetime = datetime.now()
         self._last_used: datetime = self._last_checked
 
         self._lock = threading.Lock()
         self._model: AutoEncoder = None
+        self._model_bytes = 0
 
     @property
     def reg_model_name(self):
@@ -92,16 +111,30 @@ class ModelCache:
     def last_checked(self):
         return self._last_checked
 
+    @property
+    def is_loaded(self):
+        return self._model is not None
+
+    @property
+    def model_bytes(self):
+        return self._model_bytes
+
+    def mark_checked(self, now: datetime):
+        self._last_checked = now
+
     def load_model(self) -> AutoEncoder:
 
         now = datetime.now()
+        load_duration: float = None
 
-        # Ensure multiple people do not try to load at the same time
+        # Ensure multiple people do not try to load at the same time. Any concurrent requests wait for the first one to
+        # download the model
         with self._lock:
 
             if (self._model is None):
 
-                # Cache miss. Release the lock while we check
+                start_time = time.perf_counter()
+
                 try:
                     with log_time(
                             logger.debug,
@@ -112,10 +145,28 @@ class ModelCache:
                     logger.error("Error downloading model for URI: %s", self._model_uri, exc_info=True)
                     raise
 
+                load_duration = time.perf_counter() - start_time
+                self._model_bytes = get_model_bytes(self._model)
+
             # Update the last time this was used
             self._last_used = now
 
-            return self._model
+            model = self._model
+            model_bytes = self._model_bytes
+
+        # Called without holding the lock since the manager may unload other models
+        if (self._manager is not None):
+            self._manager.on_model_used(self, model_bytes=model_bytes, load_duration=load_duration)
+
+        return model
+
+    def unload_model(self):
+        """
+        Release the loaded model, it will be downloaded again when next used.
+        """
+        with self._lock:
+            self._model = None
+            self._model_bytes = 0
 
 
 class UserModelMap:
@@ -177,9 +228,25 @@ class UserModelMap:
 
 
 class ModelManager:
-
-    def __init__(self, model_name_formatter: str) -> None:
+    """
+    Maps users to the latest version of their model registered in MLflow, falling back to the models of
+    `fallback_user_ids` for users without a model, and caches the loaded models.
+
+    Parameters
+    ----------
+    model_name_formatter : str
+        Format string of the registered model names, see `user_to_model_name`.
+    max_model_bytes : int, optional
+        Maximum size of the loaded models, once exceeded the least recently used models are unloaded. The most recently
+        used model is always kept loaded. By default None (no limit).
+    prefetch_threads : int, optional
+        Number of threads used to load the models requested by `prefetch_user_models`, by default 1.
+    """
+
+    def __init__(self, model_name_formatter: str, max_model_bytes: int = None, prefetch_threads: int = 1) -> None:
         self._model_name_formatter = model_name_formatter
+        self._max_model_bytes = max_model_bytes
+        self._prefetch_threads = prefetch_threads
 
         self._user_model_cache: typing.Dict[str, UserModelMap] = {}
 
@@ -194,6 +261,17 @@ class ModelManager:
         self._existing_models: typing.Set[str] = set()
         self._existing_models_updated = datetime(1970, 1, 1)
 
+        # Loaded models ordered from least to most recently used
+        self._loaded_models: typing.OrderedDict[str, typing.Tuple[ModelCache, int]] = OrderedDict()
+        self._loaded_models_lock = threading.Lock()
+        self._loaded_bytes = 0
+
+        self._metrics = {"hits": 0, "misses": 0, "evictions": 0, "load_seconds": 0.0}
+
+        self._prefetch_executor: ThreadPoolExecutor = None
+        self._prefetch_pending: typing.Set[str] = set()
+        self._prefetch_lock = threading.Lock()
+
         # Force an update of the existing models
         self._model_exists("")
 
@@ -201,6 +279,67 @@ class ModelManager:
     def cache_timeout_sec(self):
         return self._cache_timeout_sec
 
+    @property
+    def metrics(self) -> typing.Dict[str, typing.Union[int, float]]:
+        """
+        Returns the number of model cache hits and misses, the number of unloaded models, the total time spent loading
+        models and the number and size of the loaded models.
+        """
+        with self._loaded_models_lock:
+            return {
+                **self._metrics,
+                "loaded_models": len(self._loaded_models),
+                "loaded_bytes": self._loaded_bytes,
+            }
+
+    def on_model_used(self, model_cache: ModelCache, model_bytes: int, load_duration: float = None):
+        """
+        Called by `ModelCache.load_model` each time a model is used, `load_duration` is set when the model was loaded.
+        Unloads the least recently used models once `max_model_bytes` is exceeded.
+        """
+        to_unload: typing.List[ModelCache] = []
+
+        with self._loaded_models_lock:
+            key = model_cache.reg_model_name
+
+            if (load_duration is None):
+                self._metrics["hits"] += 1
+            else:
+                self._metrics["misses"] += 1
+                self._metrics["load_seconds"] += load_duration
+
+            previous = self._loaded_models.pop(key, None)
+            if (previous is not None):
+                self._loaded_bytes -= previous[1]
+
+                if (previous[0] is not model_cache):
+                    # Replaced by a newer version
+                    to_unload.append(previous[0])
+
+            self._loaded_models[key] = (model_cache, model_bytes)
+            self._loaded_bytes += model_bytes
+
+            while (self._max_model_bytes is not None and self._loaded_bytes > self._max_model_bytes
+                   and len(self._loaded_models) > 1):
+                (_, (evicted, evicted_bytes)) = self._loaded_models.popitem(last=False)
+                self._loaded_bytes -= evicted_bytes
+                self._metrics["evictions"] += 1
+                to_unload.append(evicted)
+
+        for evicted in to_unload:
+            logger.debug("Unloading model '%s:%s'", evicted.reg_model_name, evicted.reg_model_version)
+            evicted.unload_model()
+
+    def _forget_model(self, model_cache: ModelCache):
+        with self._loaded_models_lock:
+            loaded = self._loaded_models.get(model_cache.reg_model_name)
+
+            if (loaded is not None and loaded[0] is model_cache):
+                self._loaded_models.pop(model_cache.reg_model_name)
+                self._loaded_bytes -= loaded[1]
+
+        model_cache.unload_model()
+
     def _model_exists(self, reg_model_name: str, timeout: float = 1.0) -> bool:
 
         now = datetime.now()
@@ -307,9 +446,15 @@ class ModelManager:
                                        latest_model_version.version,
                                        latest_model_version.current_stage)
 
+                    if (model_cache is not None and model_cache.reg_model_version == latest_model_version.version):
+                        # Unchanged, keep the loaded model
+                        model_cache.mark_checked(now)
+                        return model_cache
+
                     model_cache = ModelCache(reg_model_name=reg_model_name,
                                              reg_model_version=latest_model_version.version,
-                                             model_uri=latest_model_version.source)
+                                             model_uri=latest_model_version.source,
+                                             manager=self)
 
                 except MlflowException as e:
                     if e.error_code == 'RESOURCE_DOES_NOT_EXIST':
@@ -325,7 +470,7 @@ class ModelManager:
                 if (len(self._model_cache) > self._model_cache_size_max):
                     time_sorted = sorted(list(self._model_cache.items()), key=lambda x: x[1].last_used)
                     to_delete = time_sorted[0][0]
-                    self._model_cache.pop(to_delete)
+                    self._forget_model(self._model_cache.pop(to_delete))
 
                 return model_cache
 
@@ -347,3 +492,48 @@ class ModelManager:
         except TimeoutError as e:
             logger.error("Deadlock when trying to acquire user model cache lock", exc_info=True)
             raise RuntimeError("Deadlock when trying to acquire user model cache lock") from e
+
+    def _prefetch_user_model(self, client: MlflowClient, user_id: str, fallback_user_ids: typing.List[str]):
+        try:
+            model_cache = self.load_user_model(client, user_id=user_id, fallback_user_ids=fallback_user_ids)
+
+            if (model_cache is not None):
+                model_cache.load_model()
+
+        except Exception:
+            logger.warning("Error prefetching the model of user %s", user_id, exc_info=True)
+
+        finally:
+            with self._prefetch_lock:
+                self._prefetch_pending.discard(user_id)
+
+    def prefetch_user_models(self,
+                             client: MlflowClient,
+                             user_ids: typing.List[str],
+                             fallback_user_ids: typing.List[str]):
+        """
+        Load the models of `user_ids` in the background, allowing the models to be loaded before the data of these users
+        reaches inference. Users already being prefetched are skipped.
+        """
+        with self._prefetch_lock:
+            if (self._prefetch_executor is None):
+                self._prefetch_executor = ThreadPoolExecutor(max_workers=self._prefetch_threads,
+                                                             thread_name_prefix="dfp-model-prefetch")
+
+            for user_id in user_ids:
+                if (user_id in self._prefetch_pending):
+                    continue
+
+                self._prefetch_pending.add(user_id)
+                self._prefetch_executor.submit(self._prefetch_user_model, client, user_id, fallback_user_ids)
+
+    def close(self):
+        """
+        Stop prefetching models, cancelling any pending prefetches.
+        """
+        with self._prefetch_lock:
+            if (self._prefetch_executor is not None):
+                self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+                self._prefetch_executor = None
+
+        logger.debug("Model cache metrics: %s", self.metrics)
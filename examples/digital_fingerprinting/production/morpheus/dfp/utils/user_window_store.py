@@ -0,0 +1,173 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import shutil
+import tempfile
+import typing
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from .cached_user_window import CachedUserWindow
+
+logger = logging.getLogger(f"morpheus.{__name__}")
+
+
+class UserWindowStore:
+    """
+    Rolling windows of every user. The most recently used windows are kept in memory, once their total size exceeds
+    `max_memory_bytes` the least recently used windows are spilled to Parquet files and loaded again when next used.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory the windows are saved to.
+    timestamp_column : str, optional
+        Name of the timestamp column, by default "timestamp".
+    max_memory_bytes : int, optional
+        Maximum size of the windows kept in memory, by default None (all windows are kept in memory). The most recently
+        used window is always kept in memory.
+    persist : bool, optional
+        When True, windows found in `cache_dir` are loaded when first used and `close` saves every window to
+        `cache_dir`, allowing the windows to survive restarts. Otherwise windows are spilled to a temporary
+        subdirectory of `cache_dir` which is removed by `close`. By default False.
+    """
+
+    def __init__(self,
+                 cache_dir: str,
+                 timestamp_column: str = "timestamp",
+                 max_memory_bytes: int = None,
+                 persist: bool = False):
+        self._cache_dir = cache_dir
+        self._timestamp_column = timestamp_column
+        self._max_memory_bytes = max_memory_bytes
+        self._persist = persist
+
+        # Windows held in memory, ordered from least to most recently used
+        self._windows: OrderedDict[str, CachedUserWindow] = OrderedDict()
+        self._spilled_users: set[str] = set()
+
+        self._window_bytes: dict[str, int] = {}
+        self._memory_bytes = 0
+
+        # Created when first needed when not persisting
+        self._spill_dir: str = None
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Size of the windows held in memory, only tracked when `max_memory_bytes` is set.
+        """
+        return self._memory_bytes
+
+    def get_cache_location(self, user_id: str) -> str:
+        """
+        Returns the file the window of `user_id` is saved to.
+        """
+        return os.path.join(self._cache_dir, f"{user_id}.parquet")
+
+    def _get_spill_location(self, user_id: str) -> str:
+        if (self._persist):
+            return self.get_cache_location(user_id)
+
+        if (self._spill_dir is None):
+            os.makedirs(self._cache_dir, exist_ok=True)
+            self._spill_dir = tempfile.mkdtemp(prefix="spill-", dir=self._cache_dir)
+
+        return os.path.join(self._spill_dir, f"{user_id}.parquet")
+
+    def __len__(self) -> int:
+        return len(self._windows) + len(self._spilled_users)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._windows or user_id in self._spilled_users
+
+    def __setitem__(self, user_id: str, window: CachedUserWindow):
+        self._windows[user_id] = window
+        self._windows.move_to_end(user_id)
+        self._spilled_users.discard(user_id)
+
+        self._update_memory(user_id, window)
+
+    def _get_window(self, user_id: str) -> CachedUserWindow:
+        window = self._windows.get(user_id)
+
+        if (window is not None):
+            self._windows.move_to_end(user_id)
+            return window
+
+        location = self._get_spill_location(user_id) if user_id in self._spilled_users else None
+        if (location is None and self._persist and os.path.exists(self.get_cache_location(user_id))):
+            location = self.get_cache_location(user_id)
+
+        if (location is not None):
+            window = CachedUserWindow.load(location)
+            window.cache_location = self.get_cache_location(user_id)
+            self._spilled_users.discard(user_id)
+        else:
+            window = CachedUserWindow(user_id=user_id,
+                                      cache_location=self.get_cache_location(user_id),
+                                      timestamp_column=self._timestamp_column)
+
+        self._windows[user_id] = window
+
+        return window
+
+    def _update_memory(self, user_id: str, window: CachedUserWindow):
+        if (self._max_memory_bytes is None):
+            return
+
+        window_bytes = window.memory_bytes
+        self._memory_bytes += window_bytes - self._window_bytes.get(user_id, 0)
+        self._window_bytes[user_id] = window_bytes
+
+        # Spill the least recently used windows, always keeping the most recently used one
+        while (self._memory_bytes > self._max_memory_bytes and len(self._windows) > 1):
+            (spill_user_id, spill_window) = self._windows.popitem(last=False)
+
+            spill_window.save(self._get_spill_location(spill_user_id))
+
+            self._memory_bytes -= self._window_bytes.pop(spill_user_id, 0)
+            self._spilled_users.add(spill_user_id)
+
+            logger.debug("Spilled the rolling window of %s to disk", spill_user_id)
+
+    @contextmanager
+    def user_window(self, user_id: str) -> typing.Generator[CachedUserWindow, None, None]:
+        """
+        Context manager returning the window of `user_id`, loading it from disk or creating it if needed. Once the
+        `with` block exits, windows are spilled to disk if `max_memory_bytes` is exceeded.
+        """
+        window = self._get_window(user_id)
+
+        try:
+            yield window
+        finally:
+            self._update_memory(user_id, window)
+
+    def close(self):
+        """
+        Save every window held in memory to `cache_dir` when persisting, otherwise remove the spilled windows.
+        """
+        if (self._persist):
+            for window in self._windows.values():
+                window.save()
+
+            logger.debug("Saved %d rolling windows to %s", len(self._windows), self._cache_dir)
+
+        elif (self._spill_dir is not None):
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+            self._spilled_users.clear()
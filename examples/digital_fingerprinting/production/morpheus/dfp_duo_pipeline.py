@@ -318,13 +318,20 @@ def run_pipeline(train_users,
 
     pipeline.add_stage(MonitorStage(config, description="Input data rate"))
 
+    model_name_formatter = mlflow_model_name_template
+    experiment_name_formatter = mlflow_experiment_name_template
+
+    # Created ahead of time allowing the models of users to be loaded as soon as they are seen
+    inference_stage = None if is_training else DFPInferenceStage(config, model_name_formatter=model_name_formatter)
+
     # This will split users or just use one single user
     pipeline.add_stage(
         DFPSplitUsersStage(config,
                            include_generic=include_generic,
                            include_individual=include_individual,
                            skip_users=skip_users,
-                           only_users=only_users))
+                           only_users=only_users,
+                           user_callback=inference_stage.prefetch_models if inference_stage is not None else None))
 
     # Next, have a stage that will create rolling windows
     pipeline.add_stage(
@@ -339,9 +346,6 @@ def run_pipeline(train_users,
     # Output is UserMessageMeta -- Cached frame set
     pipeline.add_stage(DFPPreprocessingStage(config, input_schema=preprocess_schema))
 
-    model_name_formatter = mlflow_model_name_template
-    experiment_name_formatter = mlflow_experiment_name_template
-
     if (is_training):
 
         # Finally, perform training which will output a model
@@ -355,7 +359,7 @@ def run_pipeline(train_users,
                                       model_name_formatter=model_name_formatter,
                                       experiment_name_formatter=experiment_name_formatter))
     else:
-        pipeline.add_stage(DFPInferenceStage(config, model_name_formatter=model_name_formatter))
+        pipeline.add_stage(inference_stage)
 
         pipeline.add_stage(MonitorStage(config, description="Inference rate", smoothing=0.001))
 
@@ -47,6 +47,8 @@ class FileTypes():
       CSV
 
       PARQUET
+
+      ARROW
     """
     def __eq__(self, other: object) -> bool: ...
     def __getstate__(self) -> int: ...
@@ -68,10 +70,11 @@ class FileTypes():
         :type: int
         """
     Auto: morpheus._lib.common.FileTypes # value = <FileTypes.Auto: 0>
+    ARROW: morpheus._lib.common.FileTypes # value = <FileTypes.ARROW: 4>
     CSV: morpheus._lib.common.FileTypes # value = <FileTypes.CSV: 2>
     JSON: morpheus._lib.common.FileTypes # value = <FileTypes.JSON: 1>
     PARQUET: morpheus._lib.common.FileTypes # value = <FileTypes.PARQUET: 3>
-    __members__: dict # value = {'Auto': <FileTypes.Auto: 0>, 'JSON': <FileTypes.JSON: 1>, 'CSV': <FileTypes.CSV: 2>, 'PARQUET': <FileTypes.PARQUET: 3>}
+    __members__: dict # value = {'Auto': <FileTypes.Auto: 0>, 'JSON': <FileTypes.JSON: 1>, 'CSV': <FileTypes.CSV: 2>, 'PARQUET': <FileTypes.PARQUET: 3>, 'ARROW': <FileTypes.ARROW: 4>}
     pass
 class FilterSource():
     """
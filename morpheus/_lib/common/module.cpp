@@ -124,7 +124,8 @@ PYBIND11_MODULE(common, _module)
         .value("Auto", FileTypes::Auto)
         .value("JSON", FileTypes::JSON)
         .value("CSV", FileTypes::CSV)
-        .value("PARQUET", FileTypes::PARQUET);
+        .value("PARQUET", FileTypes::PARQUET)
+        .value("ARROW", FileTypes::ARROW);
 
     _module.def("typeid_to_numpy_str", [](TypeId tid) {
         return DType(tid).type_str();
@@ -302,6 +302,16 @@ struct MORPHEUS_EXPORT MessageMetaInterfaceProxy
 
     static MutableTableCtxMgr mutable_dataframe(MessageMeta& self);
 
+    /**
+     * @brief Get a context manager returning a read-only view of the data frame which does not copy the data. The
+     * context manager is implemented in Python on top of `mutable_dataframe`, see
+     * `morpheus.messages.message_meta.ReadOnlyTableCtxMgr`
+     *
+     * @param self The MessageMeta instance as a python object
+     * @return pybind11::object A `ReadOnlyTableCtxMgr` object
+     */
+    static pybind11::object readonly_dataframe(pybind11::object self);
+
     /**
      * @brief Returns true if the underlying DataFrame's index is unique and monotonic. Sliceable indices have better
      * performance since a range of rows can be specified by a start and stop index instead of requiring boolean masks.
@@ -354,6 +354,15 @@ struct MORPHEUS_EXPORT MultiMessageInterfaceProxy
 
     static std::vector<std::string> get_meta_column_names(const MultiMessage& self);
 
+    /**
+     * @brief Get a context manager returning a read-only view of the rows of this message which does not copy the
+     * data, see `morpheus.messages.message_meta.ReadOnlyTableCtxMgr`
+     *
+     * @param self The MultiMessage instance
+     * @return pybind11::object A `ReadOnlyTableCtxMgr` object
+     */
+    static pybind11::object readonly_meta(const MultiMessage& self);
+
     /**
      * TODO(Documentation)
      */
@@ -38,7 +38,8 @@ enum class MORPHEUS_EXPORT FileTypes : int32_t
     Auto,
     JSON,
     CSV,
-    PARQUET
+    PARQUET,
+    ARROW
 };
 
 /**
@@ -59,6 +60,8 @@ inline std::string MORPHEUS_EXPORT filetypes_to_str(const FileTypes& f)
         return "CSV";
     case FileTypes::PARQUET:
         return "PARQUET";
+    case FileTypes::ARROW:
+        return "ARROW";
     default:
         throw std::logic_error("Unsupported FileTypes enum. Was a new value added recently?");
     }
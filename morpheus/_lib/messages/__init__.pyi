@@ -199,6 +199,7 @@ class MessageMeta():
     @staticmethod
     def make_from_file(arg0: str) -> MessageMeta: ...
     def mutable_dataframe(self) -> MutableTableCtxMgr: ...
+    def readonly_dataframe(self) -> object: ...
     def set_data(self, arg0: object, arg1: object) -> None: ...
     @property
     def count(self) -> int:
@@ -225,6 +226,7 @@ class MultiMessage():
     def get_meta_column_names(self) -> typing.List[str]: ...
     def get_meta_list(self, arg0: object) -> object: ...
     def get_slice(self, arg0: int, arg1: int) -> MultiMessage: ...
+    def readonly_meta(self) -> object: ...
     def set_meta(self, arg0: object, arg1: object) -> None: ...
     @property
     def mess_count(self) -> int:
@@ -262,6 +262,7 @@ PYBIND11_MODULE(messages, _module)
         .def("get_column_names", &MessageMetaInterfaceProxy::get_column_names)
         .def("copy_dataframe", &MessageMetaInterfaceProxy::get_data_frame, py::return_value_policy::move)
         .def("mutable_dataframe", &MessageMetaInterfaceProxy::mutable_dataframe, py::return_value_policy::move)
+        .def("readonly_dataframe", &MessageMetaInterfaceProxy::readonly_dataframe, py::return_value_policy::move)
         .def("has_sliceable_index", &MessageMetaInterfaceProxy::has_sliceable_index)
         .def("ensure_sliceable_index", &MessageMetaInterfaceProxy::ensure_sliceable_index)
         .def("copy_ranges", &MessageMetaInterfaceProxy::copy_ranges, py::return_value_policy::move, py::arg("ranges"))
@@ -282,6 +283,7 @@ PYBIND11_MODULE(messages, _module)
         .def_property_readonly("mess_offset", &MultiMessageInterfaceProxy::mess_offset)
         .def_property_readonly("mess_count", &MultiMessageInterfaceProxy::mess_count)
         .def("get_meta_column_names", &MultiMessageInterfaceProxy::get_meta_column_names)
+        .def("readonly_meta", &MultiMessageInterfaceProxy::readonly_meta, py::return_value_policy::move)
         .def("get_meta",
              static_cast<pybind11::object (*)(MultiMessage&)>(&MultiMessageInterfaceProxy::get_meta),
              py::return_value_policy::move)
@@ -475,6 +475,12 @@ MutableTableCtxMgr MessageMetaInterfaceProxy::mutable_dataframe(MessageMeta& sel
     return {self};
 }
 
+py::object MessageMetaInterfaceProxy::readonly_dataframe(py::object self)
+{
+    auto ctx_mgr_cls = py::module_::import("morpheus.messages.message_meta").attr("ReadOnlyTableCtxMgr");
+    return ctx_mgr_cls(self);
+}
+
 std::shared_ptr<MessageMeta> MessageMetaInterfaceProxy::init_cpp(const std::string& filename)
 {
     // Load the file
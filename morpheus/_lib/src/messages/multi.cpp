@@ -262,6 +262,12 @@ std::vector<std::string> MultiMessageInterfaceProxy::get_meta_column_names(const
     return self.get_meta_column_names();
 }
 
+pybind11::object MultiMessageInterfaceProxy::readonly_meta(const MultiMessage& self)
+{
+    auto ctx_mgr_cls = pybind11::module_::import("morpheus.messages.message_meta").attr("ReadOnlyTableCtxMgr");
+    return ctx_mgr_cls(self.meta, self.mess_offset, self.mess_offset + self.mess_count);
+}
+
 pybind11::object MultiMessageInterfaceProxy::get_meta(MultiMessage& self)
 {
     // Need to release the GIL before calling `get_meta()`
@@ -41,11 +41,16 @@ FileTypes determine_file_type(const std::string& filename)
     {
         return FileTypes::PARQUET;
     }
+    else if (filename_path.extension() == ".arrow")
+    {
+        return FileTypes::ARROW;
+    }
     else
     {
         throw std::runtime_error(MORPHEUS_CONCAT_STR("Unsupported extension '"
                                                      << filename_path.extension()
-                                                     << "' with 'auto' type. 'auto' only works with: csv, json"));
+                                                     << "' with 'auto' type. 'auto' only works with: csv, json, "
+                                                        "parquet, arrow"));
     }
 }
 
@@ -37,7 +37,9 @@ from morpheus.config import Config
 from morpheus.config import ConfigAutoEncoder
 from morpheus.config import ConfigFIL
 from morpheus.config import ConfigOnnxToTRT
+from morpheus.config import ConfigStageMetrics
 from morpheus.config import CppConfig
+from morpheus.config import ExecutionMode
 from morpheus.config import PipelineModes
 from morpheus.utils.logger import configure_logging
 
@@ -288,6 +290,21 @@ def install(**kwargs):
               type=bool,
               help=("Whether or not to use C++ node and message types or to prefer python. "
                     "Only use as a last resort if bugs are encountered"))
+@click.option('--use_cpu_only',
+              default=False,
+              is_flag=True,
+              help=("Execute the pipeline on the CPU using pandas and NumPy rather than cuDF and CuPy. Implies "
+                    "--use_cpp=False, and only stages supporting the CPU execution mode can be used."))
+@click.option('--stage_metrics_file',
+              default=None,
+              type=click.Path(dir_okay=False, writable=True),
+              help=("Record the throughput and processing time of every stage, periodically writing them to this "
+                    "file as JSON."))
+@click.option('--stage_metrics_port',
+              default=None,
+              type=click.IntRange(min=0, max=65535),
+              help=("Record the throughput and processing time of every stage, serving them on this port in the "
+                    "Prometheus text format."))
 @click.option('--manual_seed',
               default=None,
               type=click.IntRange(min=1),
@@ -299,6 +316,17 @@ def run(ctx: click.Context, **kwargs):
     # Since the option isnt the same name as `should_use_cpp` anymore, manually set the value here.
     CppConfig.set_should_use_cpp(kwargs.pop("use_cpp", CppConfig.get_should_use_cpp()))
 
+    if (kwargs.pop("use_cpu_only", False)):
+        config = get_config_from_ctx(ctx)
+        config.execution_mode = ExecutionMode.CPU
+        CppConfig.set_should_use_cpp(False)
+
+    stage_metrics_file = kwargs.pop("stage_metrics_file", None)
+    stage_metrics_port = kwargs.pop("stage_metrics_port", None)
+    if (stage_metrics_file is not None or stage_metrics_port is not None):
+        config = get_config_from_ctx(ctx)
+        config.stage_metrics = ConfigStageMetrics(json_file=stage_metrics_file, prometheus_port=stage_metrics_port)
+
     manual_seed_val = kwargs.pop("manual_seed", None)
     if manual_seed_val is not None:
         from morpheus.utils.seed import manual_seed
@@ -132,6 +132,34 @@ class ConfigFIL(ConfigBase):
     feature_columns: typing.List[str] = None
 
 
+@dataclasses.dataclass
+class ConfigStageMetrics(ConfigBase):
+    """
+    Configuration of the per-stage instrumentation, see `morpheus.pipeline.stage_metrics`. Setting
+    `Config.stage_metrics` enables recording the metrics of every stage in the pipeline.
+
+    Parameters
+    ----------
+    json_file : str
+        File the metrics are periodically written to as JSON, by default None (not written).
+    json_interval_secs : float
+        Interval in seconds between writes of `json_file`, by default 5.0. The file is also written once the pipeline
+        completes.
+    prometheus_port : int
+        Port to serve the metrics on in the Prometheus text format, by default None (not served).
+    prometheus_host : str
+        Address to bind the Prometheus endpoint to, by default "127.0.0.1".
+    latency_buckets : typing.List[float]
+        Upper bounds in seconds of the buckets of the processing time histograms.
+    """
+    json_file: str = None
+    json_interval_secs: float = 5.0
+    prometheus_port: int = None
+    prometheus_host: str = "127.0.0.1"
+    latency_buckets: typing.List[float] = dataclasses.field(
+        default_factory=lambda: [0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0])
+
+
 class PipelineModes(str, Enum):
     """The type of usecases that can be executed by the pipeline is determined by the enum."""
     OTHER = "OTHER"
@@ -140,6 +168,15 @@ class PipelineModes(str, Enum):
     AE = "AE"
 
 
+class ExecutionMode(str, Enum):
+    """
+    The device the pipeline is executed on. In `CPU` mode, messages hold pandas DataFrames and NumPy arrays, and no C++
+    nodes or messages are used.
+    """
+    GPU = "GPU"
+    CPU = "CPU"
+
+
 class CppConfig:
     """
     Allows setting whether C++ implementations should be used for Morpheus stages and messages. Defaults to True,
@@ -191,11 +228,17 @@ class Config(ConfigBase):
         The size of buffered channels to use between nodes in a pipeline. Larger values reduce backpressure at the cost
         of memory. Smaller values will push messages through the pipeline quicker. Must be greater than 1 and a power of
         2 (i.e., 2, 4, 8, 16, etc.).
+    execution_mode : `ExecutionMode`, default = `ExecutionMode.GPU`
+        Determines whether the pipeline is executed on the GPU with cuDF and CuPy, or on the CPU with pandas and NumPy.
+        Only stages which support the execution mode can be added to the pipeline, see
+        `morpheus.pipeline.execution_mode_mixins.GpuAndCpuMixin`.
 
     Attributes
     ----------
     ae : `ConfigAutoEncoder`
         Config for autoencoder.
+    stage_metrics : `ConfigStageMetrics`
+        Config of the per-stage instrumentation, by default None (disabled).
     log_config_file : str
         File corresponding to this Config.
     """
@@ -213,12 +256,14 @@ class Config(ConfigBase):
     num_threads: int = 1
     model_max_batch_size: int = 8
     edge_buffer_size: int = 128
+    execution_mode: ExecutionMode = ExecutionMode.GPU
 
     # Class labels to convert class index to label.
     class_labels: typing.List[str] = dataclasses.field(default_factory=list)
 
     ae: ConfigAutoEncoder = dataclasses.field(default=None)
     fil: ConfigFIL = dataclasses.field(default=None)
+    stage_metrics: ConfigStageMetrics = dataclasses.field(default=None)
 
     def save(self, filename: str):
         """
@@ -12,23 +12,43 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import logging
 import time
+import typing
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from io import StringIO
 
 import pandas as pd
 
+from morpheus.utils.type_aliases import DataFrameType
+
 logger = logging.getLogger(__name__)
 
 IMPORT_EXCEPTION = None
 IMPORT_ERROR_MESSAGE = "ElasticsearchController requires the elasticsearch package to be installed."
 
 try:
+    from elasticsearch import ApiError
     from elasticsearch import ConnectionError as ESConnectionError
     from elasticsearch import Elasticsearch
+    from elasticsearch import TransportError
     from elasticsearch.helpers import parallel_bulk
 except ImportError as import_exc:
     IMPORT_EXCEPTION = import_exc
 
+# Number of rows serialized to JSON at a time by `df_to_bulk_write`, bounds the memory used by the encoded rows
+ENCODE_BATCH_ROWS = 10000
+
+# Status codes of bulk requests and bulk items which are retried
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Only the parts of the bulk response needed to find the failed items
+BULK_FILTER_PATH = ["errors", "items.*.status", "items.*.error"]
+
 
 class ElasticsearchController:
     """
@@ -42,9 +62,28 @@ class ElasticsearchController:
         Whether to raise exceptions on Elasticsearch errors.
     refresh_period_secs : int, optional, default: 2400
         The refresh period in seconds for client refreshing.
+    max_chunk_bytes : int, optional, default: 10 MiB
+        Maximum size in bytes of the body of a bulk request sent by `df_to_bulk_write`.
+    max_concurrent_requests : int, optional, default: 4
+        Maximum number of bulk requests sent concurrently by `df_to_bulk_write`.
+    max_retries : int, optional, default: 3
+        Number of times `df_to_bulk_write` retries a bulk request which failed, or the documents of a bulk request
+        which were rejected with a retriable status such as 429.
+    initial_backoff_secs : float, optional, default: 1.0
+        Time in seconds to wait before the first retry, doubled for each following retry.
+    max_backoff_secs : float, optional, default: 30.0
+        Maximum time in seconds to wait before a retry.
     """
 
-    def __init__(self, connection_kwargs: dict, raise_on_exception: bool = False, refresh_period_secs: int = 2400):
+    def __init__(self,
+                 connection_kwargs: dict,
+                 raise_on_exception: bool = False,
+                 refresh_period_secs: int = 2400,
+                 max_chunk_bytes: int = 10 * 1024 * 1024,
+                 max_concurrent_requests: int = 4,
+                 max_retries: int = 3,
+                 initial_backoff_secs: float = 1.0,
+                 max_backoff_secs: float = 30.0):
         if IMPORT_EXCEPTION is not None:
             raise ImportError(IMPORT_ERROR_MESSAGE) from IMPORT_EXCEPTION
 
@@ -52,6 +91,11 @@ class ElasticsearchController:
         self._last_refresh_time = None
         self._raise_on_exception = raise_on_exception
         self._refresh_period_secs = refresh_period_secs
+        self._max_chunk_bytes = max_chunk_bytes
+        self._max_concurrent_requests = max_concurrent_requests
+        self._max_retries = max_retries
+        self._initial_backoff_secs = initial_backoff_secs
+        self._max_backoff_secs = max_backoff_secs
 
         if connection_kwargs is not None and not connection_kwargs:
             raise ValueError("Connection kwargs cannot be none or empty.")
@@ -168,6 +212,151 @@ class ElasticsearchController:
 
         self.parallel_bulk_write(actions)  # Parallel bulk upload to Elasticsearch
 
+    def _iter_bulk_chunks(self, action: bytes, df: DataFrameType) -> typing.Iterator[list[bytes]]:
+        """
+        Serialize the rows of a DataFrame to JSON in batches, yielding lists of documents which fit in a single bulk
+        request body of at most `max_chunk_bytes` bytes. A larger document is yielded on its own.
+        """
+        chunk: list[bytes] = []
+        chunk_bytes = 0
+
+        for start in range(0, len(df), ENCODE_BATCH_ROWS):
+            # The "records" orientation never writes the index, which is why `index` isn't passed at all. Depending on
+            # the version of pandas, passing either value raises for this orientation.
+            str_buf = StringIO()
+            df.iloc[start:start + ENCODE_BATCH_ROWS].to_json(str_buf, orient="records", lines=True)
+
+            docs = str_buf.getvalue().encode("UTF-8").split(b"\n")
+            if (len(docs) > 0 and len(docs[-1]) == 0):
+                docs.pop()
+
+            for doc in docs:
+                # The action and document lines, each terminated by a newline
+                item_bytes = len(action) + len(doc) + 2
+                if (len(chunk) > 0 and chunk_bytes + item_bytes > self._max_chunk_bytes):
+                    yield chunk
+                    chunk = []
+                    chunk_bytes = 0
+
+                chunk.append(doc)
+                chunk_bytes += item_bytes
+
+        if (len(chunk) > 0):
+            yield chunk
+
+    def _get_backoff_secs(self, attempt: int) -> float:
+        return min(self._initial_backoff_secs * (2**attempt), self._max_backoff_secs)
+
+    def _send_bulk_chunk(self, action: bytes, docs: list[bytes]) -> tuple[int, list[dict]]:
+        """
+        Send a chunk of documents as a single bulk request. Only the documents which were rejected with a retriable
+        status are sent again, returns the number of documents written and the errors of those which were not.
+        """
+        written = 0
+        errors = []
+        attempt = 0
+
+        while (len(docs) > 0):
+            # Interleave the action line with the document lines, no per document dict is created or encoded
+            lines = [action] * (2 * len(docs))
+            lines[1::2] = docs
+            body = b"\n".join(lines) + b"\n"
+
+            try:
+                response = self._client.bulk(operations=body, filter_path=BULK_FILTER_PATH)
+            except (ApiError, TransportError) as exc:
+                status = exc.status_code if isinstance(exc, ApiError) else None
+                if (attempt >= self._max_retries or (status is not None and status not in RETRY_STATUS_CODES)):
+                    errors.extend({"type": type(exc).__name__, "reason": str(exc)} for _ in docs)
+                    break
+
+                logger.warning("Retrying bulk request of %d documents after error: %s", len(docs), exc)
+                time.sleep(self._get_backoff_secs(attempt))
+                attempt += 1
+                continue
+
+            if (not response.get("errors", False)):
+                written += len(docs)
+                break
+
+            retry_docs = []
+            for (doc, item) in zip(docs, response["items"]):
+                (result, ) = item.values()
+                status = result.get("status", 0)
+                if (200 <= status < 300):
+                    written += 1
+                elif (status in RETRY_STATUS_CODES and attempt < self._max_retries):
+                    retry_docs.append(doc)
+                else:
+                    errors.append(result.get("error", {"status": status}))
+
+            if (len(retry_docs) > 0):
+                logger.debug("Retrying %d of %d documents of a bulk request", len(retry_docs), len(docs))
+                time.sleep(self._get_backoff_secs(attempt))
+                attempt += 1
+
+            docs = retry_docs
+
+        return (written, errors)
+
+    def df_to_bulk_write(self, index: str, df: DataFrameType) -> int:
+        """
+        Write the rows of a DataFrame to Elasticsearch as documents, using bulk requests whose NDJSON body is built
+        directly from the JSON serialization of the DataFrame.
+
+        The requests are sized by `max_chunk_bytes` and up to `max_concurrent_requests` of them are sent concurrently.
+        Requests and documents which failed with a retriable status are retried up to `max_retries` times with an
+        exponential backoff. Documents which could not be written are logged, or raise a `RuntimeError` when
+        `raise_on_exception` is set.
+
+        Parameters
+        ----------
+        index : str
+            The name of the index to write.
+        df : DataFrameType
+            DataFrame entries that require writing to Elasticsearch.
+
+        Returns
+        -------
+        int
+            The number of documents written.
+        """
+
+        self.refresh_client()
+
+        action = json.dumps({"index": {"_index": index}}, separators=(",", ":")).encode("UTF-8")
+
+        written = 0
+        errors = []
+        pending: set[Future] = set()
+
+        def collect(done: set[Future]):
+            nonlocal written
+            for future in done:
+                (chunk_written, chunk_errors) = future.result()
+                written += chunk_written
+                errors.extend(chunk_errors)
+
+        with ThreadPoolExecutor(max_workers=self._max_concurrent_requests,
+                                thread_name_prefix="elasticsearch_bulk") as executor:
+            for docs in self._iter_bulk_chunks(action, df):
+                # Bound the number of chunks encoded ahead of the requests
+                if (len(pending) >= self._max_concurrent_requests):
+                    (done, pending) = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+                pending.add(executor.submit(self._send_bulk_chunk, action, docs))
+
+            collect(wait(pending).done)
+
+        if (len(errors) > 0):
+            logger.error("Error writing %d documents to ElasticSearch index '%s': %s", len(errors), index, errors[0])
+            if self._raise_on_exception:
+                raise RuntimeError(f"Error writing {len(errors)} documents to ElasticSearch index '{index}': "
+                                   f"{errors[0]}")
+
+        return written
+
     def close_client(self) -> None:
         """
         Close the Elasticsearch client connection.
@@ -27,6 +27,7 @@ import pandas as pd
 import cudf
 
 from morpheus.common import FileTypes
+from morpheus.io.batch_cache import create_batch_cache
 from morpheus.io.deserializers import read_file_to_df
 from morpheus.utils.column_info import DataFrameInputSchema
 from morpheus.utils.column_info import PreparedDFInfo
@@ -105,6 +106,15 @@ class FileToDFController:
         Directory where cache will be stored.
     timestamp_column_name : str
         Name of the timestamp column.
+    cache_format : str, optional
+        Format of the cached batches, either "pickle" or "arrow". Arrow files are memory-mapped on cache hits.
+    cache_max_bytes : int, optional
+        Maximum total size of the batch cache in bytes, least recently used batches are evicted first. Unbounded when
+        `None`.
+    cache_ttl : float, optional
+        Maximum age in seconds of a cached batch before it is evicted. Unbounded when `None`.
+    cache_compression : str, optional
+        Compression codec for the "arrow" cache format, either "lz4" or "zstd". Uncompressed when `None`.
     """
 
     def __init__(self,
@@ -113,7 +123,11 @@ class FileToDFController:
                  file_type: FileTypes,
                  parser_kwargs: dict,
                  cache_dir: str,
-                 timestamp_column_name: str):
+                 timestamp_column_name: str,
+                 cache_format: str = "pickle",
+                 cache_max_bytes: int = None,
+                 cache_ttl: float = None,
+                 cache_compression: str = None):
 
         self._schema = schema
         self._file_type = file_type
@@ -122,8 +136,19 @@ class FileToDFController:
         self._cache_dir = os.path.join(cache_dir, "file_cache")
         self._timestamp_column_name = timestamp_column_name
 
+        self._batch_cache = create_batch_cache(cache_format=cache_format,
+                                               cache_dir=os.path.join(self._cache_dir, "batches"),
+                                               max_bytes=cache_max_bytes,
+                                               ttl=cache_ttl,
+                                               compression=cache_compression)
+
         self._downloader = Downloader()
 
+    @property
+    def cache_stats(self) -> typing.Dict[str, int]:
+        """Hit, miss and eviction counters of the batch cache."""
+        return self._batch_cache.stats
+
     def _get_or_create_dataframe_from_batch(
             self, file_object_batch: typing.Tuple[fsspec.core.OpenFiles, int]) -> typing.Tuple[cudf.DataFrame, bool]:
 
@@ -142,11 +167,9 @@ class FileToDFController:
         # Convert to base 64 encoding to remove - values
         objects_hash_hex = hashlib.md5(json.dumps(hash_data, sort_keys=True).encode()).hexdigest()
 
-        batch_cache_location = os.path.join(self._cache_dir, "batches", f"{objects_hash_hex}.pkl")
-
         # Return the cache if it exists
-        if (os.path.exists(batch_cache_location)):
-            output_df = pd.read_pickle(batch_cache_location)
+        output_df = self._batch_cache.get(objects_hash_hex)
+        if (output_df is not None):
             output_df["batch_count"] = batch_count
             output_df["origin_hash"] = objects_hash_hex
 
@@ -181,10 +204,8 @@ class FileToDFController:
         output_df.reset_index(drop=True, inplace=True)
 
         # Save dataframe to cache future runs
-        os.makedirs(os.path.dirname(batch_cache_location), exist_ok=True)
-
         try:
-            output_df.to_pickle(batch_cache_location)
+            self._batch_cache.put(objects_hash_hex, output_df)
         except Exception:
             logger.warning("Failed to save batch cache. Skipping cache for this batch.", exc_info=True)
 
@@ -234,4 +255,5 @@ class FileToDFController:
         """
         Close the resources used by the controller.
         """
+        logger.debug("Batch cache stats: %s", self.cache_stats)
         self._downloader.close()
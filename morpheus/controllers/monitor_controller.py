@@ -196,9 +196,9 @@ class MonitorController:
         if isinstance(x, ControlMessage):
 
             def check_df(y):
-                df = y.payload().df
-                if df is not None:
-                    return len(df)
+                payload = y.payload()
+                if payload is not None:
+                    return payload.count
 
                 return 0
 
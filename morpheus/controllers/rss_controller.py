@@ -12,15 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+import json
 import logging
 import os
+import threading
 import time
+import typing
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from dataclasses import asdict
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
 import requests
 import requests_cache
+from requests.adapters import HTTPAdapter
 
 import cudf
 
@@ -72,6 +80,14 @@ class RSSController:
         Request timeout in secs to fetch the feed.
     strip_markup : bool, optional, default = False
         When true, strip HTML & XML markup from the from the content, summary and title fields.
+    max_concurrent_requests : int, optional, default = 16
+        Maximum number of feeds fetched and parsed concurrently.
+    max_requests_per_host : int, optional, default = 2
+        Maximum number of feeds fetched concurrently from the same host.
+    feed_state_file : str, optional, default = None
+        JSON file persisting the ETag and Last-Modified validators and the IDs of the entries seen for each feed URL,
+        so that unchanged feeds are not downloaded again and entries are not emitted again after a restart. When None,
+        this state is only kept in memory.
     """
 
     # Fields which may contain HTML or XML content
@@ -89,7 +105,10 @@ class RSSController:
                  cache_dir: str = "./.cache/http",
                  cooldown_interval: int = 600,
                  request_timeout: float = 2.0,
-                 strip_markup: bool = False):
+                 strip_markup: bool = False,
+                 max_concurrent_requests: int = 16,
+                 max_requests_per_host: int = 2,
+                 feed_state_file: str = None):
         if IMPORT_EXCEPTION is not None:
             raise ImportError(IMPORT_ERROR_MESSAGE) from IMPORT_EXCEPTION
 
@@ -99,10 +118,20 @@ class RSSController:
         # Convert list to set to remove any duplicate feed inputs.
         self._feed_input = set(feed_input)
         self._batch_size = batch_size
-        self._previous_entries = set()  # Stores the IDs of previous entries to prevent the processing of duplicates.
         self._cooldown_interval = cooldown_interval
         self._request_timeout = request_timeout
         self._strip_markup = strip_markup
+        self._max_concurrent_requests = max_concurrent_requests
+        self._feed_state_file = feed_state_file
+
+        # IDs of the entries of the previous successful fetch of each feed, to prevent the processing of duplicates.
+        self._previous_entries: dict[str, set[str]] = {}
+
+        # ETag and Last-Modified validators of the previous successful fetch of each feed. Validators of a new fetch
+        # are only committed once the entries of the feed have been processed.
+        self._validators: dict[str, dict[str, str]] = {}
+        self._pending_validators: dict[str, dict[str, str]] = {}
+        self._validators_lock = threading.Lock()
 
         # Validate feed_input
         for f in self._feed_input:
@@ -127,12 +156,25 @@ class RSSController:
                 "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/116.0.0.0 Safari/537.36"
         })
 
+        # The session is shared by the worker threads, keep enough pooled connections for each host
+        adapter = HTTPAdapter(pool_connections=max_concurrent_requests, pool_maxsize=max_requests_per_host)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._host_semaphores = {
+            urlparse(url).netloc: threading.BoundedSemaphore(max_requests_per_host)
+            for url in self._feed_input if RSSController.is_url(url)
+        }
+
         self._feed_stats_dict = {
             url:
                 FeedStats(failure_count=0, success_count=0, last_failure=-1, last_success=-1, last_try_result="Unknown")
             for url in self._feed_input
         }
 
+        if (self._feed_state_file is not None and os.path.exists(self._feed_state_file)):
+            self._load_feed_state()
+
     @property
     def run_indefinitely(self):
         """Property that determines to run the source indefinitely"""
@@ -162,6 +204,75 @@ class RSSController:
 
         return self._feed_stats_dict[feed_url]
 
+    def _load_feed_state(self):
+        with open(self._feed_state_file, "r", encoding="utf-8") as file:
+            feed_state = json.load(file)
+
+        for (url, state) in feed_state.items():
+            if (url in self._feed_input):
+                self._validators[url] = state.get("validators", {})
+                self._previous_entries[url] = set(state.get("entries", []))
+
+        logger.debug("Loaded the state of %d feeds from: %s", len(self._validators), self._feed_state_file)
+
+    def _save_feed_state(self):
+        feed_state = {
+            url: {
+                "validators": self._validators.get(url, {}), "entries": list(self._previous_entries.get(url, []))
+            }
+            for url in self._feed_input
+        }
+
+        # Write to a temporary file first, so that an interrupted write doesn't corrupt the previous state
+        tmp_file = f"{self._feed_state_file}.tmp"
+        os.makedirs(os.path.dirname(os.path.abspath(self._feed_state_file)), exist_ok=True)
+        with open(tmp_file, "w", encoding="utf-8") as file:
+            json.dump(feed_state, file)
+
+        os.replace(tmp_file, self._feed_state_file)
+
+    def _commit_feed(self, url: str, entry_ids: set[str] = None):
+        """
+        Record that the entries of a fetched feed have been processed, the next fetch of the feed is then conditional on
+        it having changed.
+        """
+        with self._validators_lock:
+            validators = self._pending_validators.pop(url, None)
+
+        if (validators is not None):
+            self._validators[url] = validators
+
+        if (entry_ids is not None):
+            self._previous_entries[url] = entry_ids
+
+    def _fetch_feed_content(self, url: str) -> requests.Response | None:
+        """
+        Fetch the content of a feed, returning None when it hasn't changed since the previous successful fetch.
+        """
+        headers = {}
+        validators = self._validators.get(url, {})
+        if ("etag" in validators):
+            headers["If-None-Match"] = validators["etag"]
+        if ("last_modified" in validators):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        with self._host_semaphores[urlparse(url).netloc]:
+            response = self._session.get(url, timeout=self._request_timeout, headers=headers)
+
+        if (response.status_code == 304 and len(validators) > 0):
+            return None
+
+        new_validators = {}
+        for (name, header) in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+            value = response.headers.get(header)
+            if (isinstance(value, str)):
+                new_validators[name] = value
+
+        with self._validators_lock:
+            self._pending_validators[url] = new_validators
+
+        return response
+
     def _read_file_content(self, file_path: str) -> str:
         with open(file_path, 'r', encoding="utf-8") as file:
             return file.read()
@@ -215,14 +326,18 @@ class RSSController:
 
         return feed
 
-    def _try_parse_feed(self, url: str) -> "feedparser.FeedParserDict":
+    def _try_parse_feed(self, url: str) -> typing.Optional["feedparser.FeedParserDict"]:
         is_url = RSSController.is_url(url)
 
         fallback = False
         cache_hit = False
 
         if is_url:
-            response = self._session.get(url, timeout=self._request_timeout)
+            response = self._fetch_feed_content(url)
+            if (response is None):
+                logger.debug("Feed not modified: %s", url)
+                return None
+
             feed_input = response.text
             if self._enable_cache:
                 cache_hit = response.from_cache
@@ -285,35 +400,75 @@ class RSSController:
                     detail_field["type"] = "text/plain"
                     entry[detail_field_name] = detail_field
 
-    def parse_feeds(self):
+    def _get_urls_to_fetch(self, current_time: float) -> list[str]:
         """
-        Parse the RSS feed using the feedparser library.
-
-        Yeilds
-        ------
-        feedparser.FeedParserDict
-            The parsed feed content.
+        Get the feeds which are not cooling down after a failure, interleaving the feeds of different hosts so that
+        the workers aren't all waiting for the same host.
         """
+        urls_by_host = defaultdict(list)
         for url in self._feed_input:
             feed_stats: FeedStats = self._feed_stats_dict[url]
-            current_time = time.time()
+            if ((current_time - feed_stats.last_failure) >= self._cooldown_interval):
+                urls_by_host[urlparse(url).netloc].append(url)
+
+        return [url for urls in itertools.zip_longest(*urls_by_host.values()) for url in urls if url is not None]
+
+    def _parse_feeds(self) -> typing.Iterator[tuple[str, "feedparser.FeedParserDict"]]:
+        """
+        Fetch and parse the feeds concurrently, yielding each feed which changed since its previous fetch along with its
+        URL as soon as it has been parsed.
+        """
+        current_time = time.time()
+        urls = self._get_urls_to_fetch(current_time)
+        if (len(urls) == 0):
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self._max_concurrent_requests, len(urls)),
+                                thread_name_prefix="rss_fetch") as executor:
+            futures = {executor.submit(self._try_parse_feed, url): url for url in urls}
+
             try:
-                if ((current_time - feed_stats.last_failure) >= self._cooldown_interval):
-                    feed = self._try_parse_feed(url)
+                for future in as_completed(futures):
+                    url = futures[future]
+                    feed_stats: FeedStats = self._feed_stats_dict[url]
+                    try:
+                        feed = future.result()
+
+                        feed_stats.last_success = current_time
+                        feed_stats.success_count += 1
+                        feed_stats.last_try_result = "Success"
 
-                    feed_stats.last_success = current_time
-                    feed_stats.success_count += 1
-                    feed_stats.last_try_result = "Success"
+                    except Exception as ex:
+                        logger.warning("Failed to parse feed: %s Feed stats: %s\n%s.", url, asdict(feed_stats), ex)
+                        feed_stats.last_failure = current_time
+                        feed_stats.failure_count += 1
+                        feed_stats.last_try_result = "Failure"
+                        feed = None
 
-                    yield feed
+                    logger.debug("Feed stats: %s", asdict(feed_stats))
 
-            except Exception as ex:
-                logger.warning("Failed to parse feed: %s Feed stats: %s\n%s.", url, asdict(feed_stats), ex)
-                feed_stats.last_failure = current_time
-                feed_stats.failure_count += 1
-                feed_stats.last_try_result = "Failure"
+                    if (feed is not None):
+                        yield (url, feed)
 
-            logger.debug("Feed stats: %s", asdict(feed_stats))
+            finally:
+                # Don't start fetching the remaining feeds when the caller stops early
+                for future in futures:
+                    future.cancel()
+
+    def parse_feeds(self):
+        """
+        Parse the RSS feeds using the feedparser library. The feeds are fetched and parsed concurrently, feeds which
+        haven't changed since their previous fetch are skipped.
+
+        Yeilds
+        ------
+        feedparser.FeedParserDict
+            The parsed feed content.
+        """
+        for (url, feed) in self._parse_feeds():
+            yield feed
+
+            self._commit_feed(url)
 
     def fetch_dataframes(self):
         """
@@ -330,16 +485,17 @@ class RSSController:
             If there is error fetching or processing feed entries.
         """
         entry_accumulator = []
-        current_entries = set()
 
         try:
 
-            for feed in self.parse_feeds():
+            for (url, feed) in self._parse_feeds():
+                previous_entries = self._previous_entries.get(url, set())
+                current_entries = set()
 
                 for entry in feed.entries:
                     entry_id = entry.get('id')
                     current_entries.add(entry_id)
-                    if entry_id not in self._previous_entries:
+                    if entry_id not in previous_entries:
                         if self._strip_markup:
                             self._strip_markup_from_fields(entry)
 
@@ -349,7 +505,7 @@ class RSSController:
                             yield cudf.DataFrame(entry_accumulator)
                             entry_accumulator.clear()
 
-            self._previous_entries = current_entries
+                self._commit_feed(url, current_entries)
 
             # Yield any remaining entries.
             if entry_accumulator:
@@ -357,6 +513,9 @@ class RSSController:
             else:
                 logger.debug("No new entries found.")
 
+            if (self._feed_state_file is not None):
+                self._save_feed_state()
+
         except Exception as exc:
             logger.error("Error fetching or processing feed entries: %s", exc)
             raise
@@ -85,11 +85,13 @@ class SerializeController:
         else:
             columns: typing.List[str] = []
 
-            # Minimize access to x.meta.df
+            # Only the column names are needed, avoid copying the DataFrame
             if isinstance(x, MultiMessage):
-                df_columns = list(x.meta.df.columns)
+                with x.readonly_meta() as view:
+                    df_columns = view.columns
             elif isinstance(x, ControlMessage):
-                df_columns = list(x.payload().get_column_names())
+                with x.payload().readonly_dataframe() as view:
+                    df_columns = view.columns
 
             # First build up list of included. If no include regex is specified, select all
             if (include_columns is None):
@@ -18,10 +18,8 @@ import mrc
 import mrc.core.operators as ops
 
 from morpheus.common import FileTypes
-from morpheus.common import determine_file_type
-from morpheus.io import serializers
+from morpheus.io.streaming_file_writer import StreamingFileWriter
 from morpheus.messages import MessageMeta
-from morpheus.utils.type_aliases import DataFrameType
 
 
 class WriteToFileController:
@@ -40,9 +38,23 @@ class WriteToFileController:
         Flag to indicate whether to include the index column in the output.
     flush : bool
         Flag to indicate whether to flush the output file after writing.
+    compression : str, optional
+        Compression of the output file, see `StreamingFileWriter`, by default None.
+    max_file_size : int, optional
+        Size in bytes after which the output is rotated to a new file, by default None (never rotate).
+    row_group_size : int, optional
+        Number of rows per Parquet row group or Arrow record batch, by default 100000.
     """
 
-    def __init__(self, filename: str, overwrite: bool, file_type: FileTypes, include_index_col: bool, flush: bool):
+    def __init__(self,
+                 filename: str,
+                 overwrite: bool,
+                 file_type: FileTypes,
+                 include_index_col: bool,
+                 flush: bool,
+                 compression: str = None,
+                 max_file_size: int = None,
+                 row_group_size: int = 100000):
         self._output_file = filename
         self._overwrite = overwrite
 
@@ -56,14 +68,20 @@ class WriteToFileController:
             # Ensure our directory exists
             os.makedirs(os.path.realpath(os.path.dirname(self._output_file)), exist_ok=True)
 
-        self._file_type = file_type
-
-        if (self._file_type == FileTypes.Auto):
-            self._file_type = determine_file_type(self._output_file)
-
-        self._is_first = True
         self._include_index_col = include_index_col
         self._flush = flush
+        self._compression = compression
+        self._max_file_size = max_file_size
+
+        self._writer = StreamingFileWriter(filename,
+                                           file_type,
+                                           include_index_col=include_index_col,
+                                           compression=compression,
+                                           max_file_size=max_file_size,
+                                           row_group_size=row_group_size,
+                                           overwrite=overwrite)
+
+        self._file_type = self._writer.file_type
 
     @property
     def output_file(self):
@@ -100,37 +118,50 @@ class WriteToFileController:
         """
         return self._flush
 
-    def _convert_to_strings(self, df: DataFrameType):
-        if self._file_type in (FileTypes.JSON, 'JSON'):
-            output_strs = serializers.df_to_json(df, include_index_col=self._include_index_col)
-        elif self._file_type in (FileTypes.CSV, 'CSV'):
-            output_strs = serializers.df_to_csv(df,
-                                                include_header=self._is_first,
-                                                include_index_col=self._include_index_col)
-            self._is_first = False
-        else:
-            raise NotImplementedError(f"Unknown file type: {self._file_type}")
-
-        # Remove any trailing whitespace
-        if (len(output_strs[-1].strip()) == 0):
-            output_strs = output_strs[:-1]
+    @property
+    def compression(self):
+        """
+        Get the compression of the output file.
+        """
+        return self._compression
 
-        return output_strs
+    @property
+    def max_file_size(self):
+        """
+        Get the size in bytes after which the output is rotated to a new file.
+        """
+        return self._max_file_size
 
-    def node_fn(self, obs: mrc.Observable, sub: mrc.Subscriber):
+    @property
+    def output_files(self) -> list[str]:
+        """
+        Get the names of the files written so far, more than one when the output has been rotated.
+        """
+        return self._writer.file_names
 
-        # Open up the file handle
-        with open(self._output_file, "a", encoding='UTF-8') as out_file:
+    def _write_message(self, x: MessageMeta) -> MessageMeta:
+        # Only serialize under the lock, compression and file I/O happen once it is released
+        with x.readonly_dataframe() as view:
+            serialized = self._writer.serialize(view.df)
 
-            def write_to_file(x: MessageMeta):
+        self._writer.write_serialized(serialized)
 
-                lines = self._convert_to_strings(x.df)
+        if self._flush:
+            self._writer.flush()
 
-                out_file.writelines(lines)
+        return x
 
-                if self._flush:
-                    out_file.flush()
+    def close(self):
+        """
+        Write any buffered rows and close the output file.
+        """
+        self._writer.close()
 
-                return x
+    def node_fn(self, obs: mrc.Observable, sub: mrc.Subscriber):
+        # Create the output file even if no messages are received
+        self._writer.open()
 
-            obs.pipe(ops.map(write_to_file)).subscribe(sub)
+        try:
+            obs.pipe(ops.map(self._write_message)).subscribe(sub)
+        finally:
+            self.close()
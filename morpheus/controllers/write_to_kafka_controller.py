@@ -0,0 +1,289 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+import time
+import typing
+from io import StringIO
+
+import confluent_kafka as ck
+
+import cudf
+
+from morpheus.io import serializers
+from morpheus.messages import MessageMeta
+from morpheus.utils.type_aliases import SeriesType
+
+logger = logging.getLogger(__name__)
+
+
+def _column_to_list(series: SeriesType) -> list:
+    if (isinstance(series, cudf.Series)):
+        return series.to_arrow().to_pylist()
+
+    return series.tolist()
+
+
+class WriteToKafkaController:
+    """
+    Controller class for producing the rows of DataFrames to a Kafka topic as JSON records, without waiting for each
+    batch of records to be delivered.
+
+    Each DataFrame is serialized to bytes in bulk and produced asynchronously. Delivery reports are served by a
+    background thread which polls the producer, and the amount of data waiting to be delivered is bounded by
+    `max_in_flight_bytes`. Only `flush` waits for all outstanding records to be delivered.
+
+    Parameters
+    ----------
+    kafka_conf : dict
+        Configuration of the Kafka producer.
+    output_topic : str
+        Output Kafka topic.
+    key_column : str, optional
+        Column containing the key of each record, by default None (records have no key).
+    partition_column : str, optional
+        Column containing the partition of each record, by default None (partitioned by the producer).
+    max_in_flight_bytes : int, optional
+        Maximum number of bytes produced but not yet delivered, by default 64 MiB. A single DataFrame which is larger
+        than this limit is produced once all previous records have been delivered.
+    poll_interval : float, optional
+        Maximum time in seconds the background thread blocks waiting for delivery reports, by default 0.1.
+    producer_factory : typing.Callable[[dict], ck.Producer], optional
+        Factory used to create the producer from `kafka_conf`, by default `confluent_kafka.Producer`.
+    """
+
+    def __init__(self,
+                 kafka_conf: dict,
+                 output_topic: str,
+                 *,
+                 key_column: str = None,
+                 partition_column: str = None,
+                 max_in_flight_bytes: int = 64 * 1024 * 1024,
+                 poll_interval: float = 0.1,
+                 producer_factory: typing.Callable[[dict], ck.Producer] = None):
+        self._kafka_conf = kafka_conf
+        self._output_topic = output_topic
+        self._key_column = key_column
+        self._partition_column = partition_column
+        self._max_in_flight_bytes = max_in_flight_bytes
+        self._poll_interval = poll_interval
+        self._producer_factory = producer_factory or ck.Producer
+
+        self._producer: ck.Producer = None
+        self._poll_thread: threading.Thread = None
+        self._stop_polling = threading.Event()
+
+        # Guards the counters below, notified whenever a delivery report is received
+        self._cond = threading.Condition()
+        self._in_flight_records = 0
+        self._in_flight_bytes = 0
+        self._delivered_records = 0
+        self._delivered_bytes = 0
+        self._failed_records = 0
+        self._error: ck.KafkaError = None
+        self._start_time: float = None
+
+    @property
+    def kafka_conf(self) -> dict:
+        """
+        Get the configuration of the Kafka producer.
+        """
+        return self._kafka_conf
+
+    @property
+    def output_topic(self) -> str:
+        """
+        Get the output Kafka topic.
+        """
+        return self._output_topic
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """
+        Get the throughput counters of the producer: records and bytes delivered in total and per second since
+        `start`, records which failed to be delivered, records and bytes in flight, and the depth of the producer's
+        queue.
+        """
+        with self._cond:
+            elapsed = (time.perf_counter() - self._start_time) if self._start_time is not None else 0.0
+
+            return {
+                "delivered_records": self._delivered_records,
+                "delivered_bytes": self._delivered_bytes,
+                "records_per_sec": self._delivered_records / elapsed if elapsed > 0 else 0.0,
+                "bytes_per_sec": self._delivered_bytes / elapsed if elapsed > 0 else 0.0,
+                "failed_records": self._failed_records,
+                "in_flight_records": self._in_flight_records,
+                "in_flight_bytes": self._in_flight_bytes,
+                "queue_depth": len(self._producer) if self._producer is not None else 0,
+            }
+
+    def start(self):
+        """
+        Create the producer and start the background thread serving delivery reports.
+        """
+        self._producer = self._producer_factory(self._kafka_conf)
+        self._start_time = time.perf_counter()
+
+        self._stop_polling.clear()
+        self._poll_thread = threading.Thread(target=self._poll_loop, name="to-kafka-poll", daemon=True)
+        self._poll_thread.start()
+
+    def _poll_loop(self):
+        while (not self._stop_polling.is_set()):
+            self._producer.poll(self._poll_interval)
+
+    def _on_delivery(self, err: ck.KafkaError, msg: ck.Message):
+        size = len(msg)
+
+        with self._cond:
+            self._in_flight_records -= 1
+            self._in_flight_bytes -= size
+
+            if (err is None):
+                self._delivered_records += 1
+                self._delivered_bytes += size
+            else:
+                self._failed_records += 1
+                if (self._error is None):
+                    self._error = err
+
+            self._cond.notify_all()
+
+        if (err is not None):
+            logger.error("Error occurred in `to-kafka` stage with broker '%s' while producing message:\n%s\nError:\n%s",
+                         self._kafka_conf.get("bootstrap.servers"),
+                         msg.value(),
+                         err)
+
+    def _raise_on_error(self):
+        if (self._error is not None):
+            raise ck.KafkaException(self._error)
+
+    def _serialize(self, meta: MessageMeta) -> tuple[list[bytes], list, list]:
+        keys = None
+        partitions = None
+
+        with meta.readonly_dataframe() as view:
+            str_buf = StringIO()
+            serializers.df_to_stream_json(df=view.df, stream=str_buf)
+
+            if (self._key_column is not None):
+                keys = [(None if key is None else str(key))
+                        for key in _column_to_list(view.get_column(self._key_column))]
+
+            if (self._partition_column is not None):
+                partitions = _column_to_list(view.get_column(self._partition_column))
+
+        # Encode once and split the records on the bytes, rather than creating a str per record first
+        records = str_buf.getvalue().encode("UTF-8").split(b"\n")
+        if (len(records) > 0 and len(records[-1]) == 0):
+            records.pop()
+
+        return (records, keys, partitions)
+
+    def _reserve(self, num_records: int, num_bytes: int):
+        with self._cond:
+            while (self._in_flight_bytes > 0 and self._in_flight_bytes + num_bytes > self._max_in_flight_bytes):
+                self._raise_on_error()
+                self._cond.wait(self._poll_interval)
+
+            self._raise_on_error()
+
+            self._in_flight_records += num_records
+            self._in_flight_bytes += num_bytes
+
+    def _release(self, num_records: int, num_bytes: int):
+        with self._cond:
+            self._in_flight_records -= num_records
+            self._in_flight_bytes -= num_bytes
+
+    def _produce(self, value: bytes, kwargs: dict):
+        while True:
+            try:
+                self._producer.produce(self._output_topic, value, on_delivery=self._on_delivery, **kwargs)
+                return
+            except BufferError:
+                # The producer's queue is full, wait for the poll thread to serve some delivery reports
+                with self._cond:
+                    self._cond.wait(self._poll_interval)
+
+    def write(self, meta: MessageMeta) -> MessageMeta:
+        """
+        Produce the rows of a DataFrame, returning once they have been queued in the producer. Raises the first
+        delivery error reported since the last call.
+
+        Parameters
+        ----------
+        meta : MessageMeta
+            The message to produce.
+
+        Returns
+        -------
+        MessageMeta
+            The same message.
+        """
+        (records, keys, partitions) = self._serialize(meta)
+
+        total_bytes = sum(len(record) for record in records)
+        self._reserve(len(records), total_bytes)
+
+        produced_records = 0
+        produced_bytes = 0
+        kwargs = {}
+        try:
+            for (i, record) in enumerate(records):
+                if (keys is not None):
+                    kwargs["key"] = keys[i]
+                if (partitions is not None):
+                    kwargs["partition"] = partitions[i]
+
+                self._produce(record, kwargs)
+
+                produced_records += 1
+                produced_bytes += len(record)
+        finally:
+            # Release the reservation for any records which were never produced
+            if (produced_records < len(records)):
+                self._release(len(records) - produced_records, total_bytes - produced_bytes)
+
+        return meta
+
+    def flush(self, timeout: float = -1):
+        """
+        Wait for all outstanding records to be delivered, raising the first delivery error if any.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait in seconds, by default -1 (wait indefinitely).
+        """
+        remaining = self._producer.flush(timeout)
+        if (remaining > 0):
+            logger.warning("%d records were not delivered by the `to-kafka` stage before the flush timed out",
+                           remaining)
+
+        with self._cond:
+            self._raise_on_error()
+
+    def stop(self):
+        """
+        Stop the background thread serving delivery reports. Call `flush` first to wait for outstanding records.
+        """
+        self._stop_polling.set()
+        if (self._poll_thread is not None):
+            self._poll_thread.join()
+            self._poll_thread = None
@@ -0,0 +1,337 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+import time
+import typing
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+import cudf
+
+from morpheus.service.vdb.vector_db_service import VectorDBService
+from morpheus.utils.type_aliases import DataFrameType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResourceWriteStats:
+    """
+    Counters of the writes to a single vector database resource.
+    """
+    inserted_rows: int = 0
+    inserts: int = 0
+    insert_seconds: float = 0.0
+    failed_rows: int = 0
+    flushes: int = 0
+    flush_seconds: float = 0.0
+
+
+class _ResourceWriter:
+    """
+    Accumulates the rows for a single resource and writes them from a thread pool.
+
+    Rows are double-buffered: new rows are appended to the active buffer while the previous buffer is being inserted.
+    Inserts and flushes of a resource are chained so that at most one of them is running at a time, a new insert waits
+    for the previous one to complete.
+    """
+
+    def __init__(self, name: str, controller: "WriteToVectorDBController"):
+        self.name = name
+        self.stats = ResourceWriteStats()
+
+        self._controller = controller
+        self._buffer: list[tuple[DataFrameType, np.ndarray | None]] = []
+        self._buffered_rows = 0
+        self._last_insert_time = time.time()
+        self._last_flush_time = time.time()
+        self._unflushed_rows = 0
+        self._future: Future = None
+
+        # Guards `stats` and `_unflushed_rows`, which are updated by the thread pool
+        self._lock = threading.Lock()
+
+    def append(self, df: DataFrameType, embeddings: np.ndarray = None):
+        self._buffer.append((df, embeddings))
+        self._buffered_rows += len(df)
+
+    def is_insert_due(self, current_time: float) -> bool:
+        return (self._buffered_rows > 0
+                and (self._buffered_rows >= self._controller.batch_size or
+                     (current_time - self._last_insert_time) >= self._controller.write_time_interval))
+
+    def is_flush_due(self, current_time: float) -> bool:
+        flush_rows = self._controller.flush_rows
+        flush_interval = self._controller.flush_interval
+
+        with self._lock:
+            return (self._unflushed_rows > 0
+                    and ((flush_rows is not None and self._unflushed_rows >= flush_rows) or
+                         (flush_interval is not None and (current_time - self._last_flush_time) >= flush_interval)))
+
+    def _submit(self, fn: typing.Callable[[], None]):
+        # Wait for the previous insert or flush of this resource, which is what bounds the amount of buffered data
+        if (self._future is not None):
+            self._future.result()
+
+        self._future = self._controller.executor.submit(fn)
+
+    def submit_insert(self, current_time: float) -> int:
+        """
+        Swap the active buffer out and insert it in the background, returning the number of rows being inserted.
+        """
+        (buffer, num_rows) = (self._buffer, self._buffered_rows)
+        self._buffer = []
+        self._buffered_rows = 0
+        self._last_insert_time = current_time
+
+        self._submit(lambda: self._insert(buffer, num_rows))
+
+        return num_rows
+
+    def submit_flush(self):
+        self._submit(self._flush)
+
+    def is_busy(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def _concat(self, buffer: list[tuple[DataFrameType, np.ndarray | None]]) -> tuple[DataFrameType, dict]:
+        embedding_column_name = self._controller.embedding_column_name
+
+        if (all(embeddings is not None for (_, embeddings) in buffer)):
+            dfs = [df for (df, _) in buffer]
+            embeddings = np.concatenate([embeddings for (_, embeddings) in buffer])
+            embedding_kwargs = {"embeddings": embeddings, "embedding_column_name": embedding_column_name}
+        else:
+            # Fall back to list columns when only some of the DataFrames had separate embeddings
+            dfs = []
+            for (df, embeddings) in buffer:
+                if (embeddings is not None):
+                    df = df.copy(deep=False)
+                    df[embedding_column_name] = embeddings.tolist()
+                dfs.append(df)
+
+            embedding_kwargs = {}
+
+        if (isinstance(dfs[0], cudf.DataFrame)):
+            df = cudf.concat(dfs)
+        else:
+            df = pd.concat(dfs)
+
+        return (df, embedding_kwargs)
+
+    def _insert(self, buffer: list[tuple[DataFrameType, np.ndarray | None]], num_rows: int):
+        start_time = time.perf_counter()
+        try:
+            (df, embedding_kwargs) = self._concat(buffer)
+
+            # Flushing is scheduled by the flush policy rather than on every insert
+            self._controller.service.insert_dataframe(name=self.name,
+                                                      df=df,
+                                                      flush=False,
+                                                      **{
+                                                          **self._controller.resource_kwargs, **embedding_kwargs
+                                                      })
+        except Exception as exc:
+            logger.error("Unable to insert %d rows into resource: %s due to %s", num_rows, self.name, exc)
+            with self._lock:
+                self.stats.failed_rows += num_rows
+            return
+
+        elapsed = time.perf_counter() - start_time
+
+        with self._lock:
+            self.stats.inserted_rows += num_rows
+            self.stats.inserts += 1
+            self.stats.insert_seconds += elapsed
+            self._unflushed_rows += num_rows
+
+        logger.debug("Inserted %d rows into resource: %s in %.3f seconds", num_rows, self.name, elapsed)
+
+        if (self.is_flush_due(time.time())):
+            self._flush()
+
+    def _flush(self):
+        with self._lock:
+            if (self._unflushed_rows == 0):
+                return
+
+        start_time = time.perf_counter()
+        try:
+            self._controller.service.flush(self.name)
+        except Exception as exc:
+            logger.error("Unable to flush resource: %s due to %s", self.name, exc)
+            return
+
+        with self._lock:
+            self.stats.flushes += 1
+            self.stats.flush_seconds += time.perf_counter() - start_time
+            self._unflushed_rows = 0
+            self._last_flush_time = time.time()
+
+    def close(self):
+        if (self._buffered_rows > 0):
+            self.submit_insert(time.time())
+
+        if (self._controller.flush_on_completion):
+            self.submit_flush()
+
+        if (self._future is not None):
+            self._future.result()
+            self._future = None
+
+
+class WriteToVectorDBController:
+    """
+    Controller class for writing DataFrames to vector database resources without blocking the caller on the vector
+    database's round trip.
+
+    Rows are accumulated per resource and inserted from a thread pool once `batch_size` rows have been accumulated, or
+    `write_time_interval` seconds have passed since the previous insert. Flushing, which seals segments for vector
+    databases such as Milvus, is scheduled independently of inserts according to `flush_rows`, `flush_interval` and
+    `flush_on_completion`. When none of these are set, resources are never flushed explicitly.
+
+    Failed inserts are logged and counted in `stats`, they do not raise exceptions.
+
+    Parameters
+    ----------
+    service : VectorDBService
+        The vector database service to write to.
+    resource_kwargs : dict, optional
+        Additional keyword arguments to pass to `VectorDBService.insert_dataframe`.
+    embedding_column_name : str, optional
+        Name of the embedding column, by default "embedding". Embeddings passed separately to `write` are inserted
+        into this column.
+    batch_size : int, optional
+        Number of rows to accumulate for a resource before inserting them, by default 1024.
+    write_time_interval : float, optional
+        Maximum time in seconds rows are accumulated before inserting them, by default 1.0. This is only checked when
+        `write` is called.
+    max_concurrent_inserts : int, optional
+        Maximum number of resources being inserted into concurrently, by default 2.
+    flush_rows : int, optional
+        Flush a resource once this many rows have been inserted since it was last flushed, by default None.
+    flush_interval : float, optional
+        Flush a resource once this many seconds have passed since it was last flushed, by default None.
+    flush_on_completion : bool, optional
+        Flush each resource when `close` is called, by default True.
+    """
+
+    def __init__(self,
+                 service: VectorDBService,
+                 *,
+                 resource_kwargs: dict = None,
+                 embedding_column_name: str = "embedding",
+                 batch_size: int = 1024,
+                 write_time_interval: float = 1.0,
+                 max_concurrent_inserts: int = 2,
+                 flush_rows: int = None,
+                 flush_interval: float = None,
+                 flush_on_completion: bool = True):
+        self.service = service
+        self.resource_kwargs = resource_kwargs or {}
+        self.embedding_column_name = embedding_column_name
+        self.batch_size = batch_size
+        self.write_time_interval = write_time_interval
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.flush_on_completion = flush_on_completion
+
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrent_inserts, thread_name_prefix="write_to_vdb")
+
+        self._writers: dict[str, _ResourceWriter] = {}
+
+    @property
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Get the write counters of each resource, see `ResourceWriteStats`.
+        """
+        stats = {}
+        for (name, writer) in self._writers.items():
+            with writer._lock:
+                stats[name] = asdict(writer.stats)
+
+        return stats
+
+    def write(self, resource_name: str, df: DataFrameType, embeddings: np.ndarray = None) -> int:
+        """
+        Accumulate the rows of a DataFrame for a resource, and start inserting the accumulated rows of any resource for
+        which an insert is due. Blocks only while the previous insert into the same resource is still running.
+
+        Parameters
+        ----------
+        resource_name : str
+            Name of the resource to write to.
+        df : DataFrameType
+            The rows to write. The DataFrame must not be modified after this call.
+        embeddings : np.ndarray, optional
+            Contiguous 2-D float32 array with the embedding of each row of `df`, by default None in which case `df`
+            contains an `embedding_column_name` column. The embeddings are passed to the vector database service as a
+            single array, rather than as a column of Python lists.
+
+        Returns
+        -------
+        int
+            The number of rows of `resource_name` which started being inserted, 0 if they were accumulated.
+        """
+        writer = self._writers.get(resource_name)
+        if (writer is None):
+            writer = _ResourceWriter(resource_name, self)
+            self._writers[resource_name] = writer
+
+        writer.append(df, embeddings)
+
+        current_time = time.time()
+        submitted_rows = 0
+        for (name, resource_writer) in self._writers.items():
+            if (resource_writer.is_insert_due(current_time)):
+                num_rows = resource_writer.submit_insert(current_time)
+                if (name == resource_name):
+                    submitted_rows = num_rows
+            elif (not resource_writer.is_busy() and resource_writer.is_flush_due(current_time)):
+                # A running insert checks whether a flush is due once it completes
+                resource_writer.submit_flush()
+            else:
+                logger.debug("Accumulated %d rows for resource: %s", resource_writer._buffered_rows, name)
+
+        return submitted_rows
+
+    def close(self):
+        """
+        Insert all remaining rows, flush each resource if `flush_on_completion` is set, and wait for all writes to
+        complete.
+        """
+        try:
+            for writer in self._writers.values():
+                writer.close()
+        finally:
+            self.executor.shutdown(wait=True)
+
+        # Control messages are only told their rows were submitted, report any failed inserts once they have completed
+        for (name, stats) in self.stats.items():
+            if (stats["failed_rows"] > 0):
+                logger.error("Failed to write %d rows to vector database resource '%s': %s",
+                             stats["failed_rows"],
+                             name,
+                             stats)
+            else:
+                logger.info("Wrote to vector database resource '%s': %s", name, stats)
@@ -0,0 +1,318 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""On-disk caches for DataFrames keyed by a batch hash, bounded by total size and entry age."""
+
+import logging
+import os
+import threading
+import time
+import typing
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+
+class BatchCache(ABC):
+    """
+    Base class for a directory of cached DataFrames, one file per key.
+
+    Entries older than `ttl` seconds are treated as misses and removed. After each write, the least recently used
+    entries are evicted until the total size of the cache directory is at most `max_bytes`.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory where the cached batches are stored.
+    max_bytes : int, optional
+        Maximum total size of the cached files in bytes. `None` disables size based eviction.
+    ttl : float, optional
+        Maximum age of a cached file in seconds, measured from when it was written. `None` disables age based eviction.
+    """
+
+    FILE_EXTENSION: str = None
+
+    def __init__(self, cache_dir: str, max_bytes: int = None, ttl: float = None):
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+
+        self._lock = threading.Lock()
+
+        # Maps key -> (size in bytes, write time), ordered from least to most recently used
+        self._entries: OrderedDict[str, typing.Tuple[int, float]] = OrderedDict()
+        self._total_bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self._scan_cache_dir()
+
+    @property
+    def cache_dir(self) -> str:
+        """Directory where the cached batches are stored."""
+        return self._cache_dir
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the cached files in bytes."""
+        return self._total_bytes
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        """Hit, miss and eviction counters along with the current number and size of the cached entries."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    def get_path(self, key: str) -> str:
+        """
+        Returns the path of the cache file for the given key.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        str
+            Path of the cache file.
+        """
+        return os.path.join(self._cache_dir, f"{key}{self.FILE_EXTENSION}")
+
+    def _scan_cache_dir(self):
+        """Populate the in-memory index from any files left by a previous run, oldest first."""
+        if (not os.path.isdir(self._cache_dir)):
+            return
+
+        found = []
+        with os.scandir(self._cache_dir) as it:
+            for entry in it:
+                if (entry.is_file() and entry.name.endswith(self.FILE_EXTENSION)):
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, entry.name[:-len(self.FILE_EXTENSION)], stat.st_size))
+
+        for (mtime, key, size) in sorted(found):
+            self._entries[key] = (size, mtime)
+            self._total_bytes += size
+
+        with self._lock:
+            self._evict_locked()
+
+    def _remove_locked(self, key: str):
+        (size, _) = self._entries.pop(key)
+        self._total_bytes -= size
+        self._evictions += 1
+
+        try:
+            os.remove(self.get_path(key))
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.warning("Failed to remove cached batch '%s'", self.get_path(key), exc_info=True)
+
+    def _evict_locked(self):
+        if (self._ttl is not None):
+            expire_before = time.time() - self._ttl
+            for key in [key for (key, (_, mtime)) in self._entries.items() if mtime < expire_before]:
+                self._remove_locked(key)
+
+        if (self._max_bytes is not None):
+            while (self._entries and self._total_bytes > self._max_bytes):
+                self._remove_locked(next(iter(self._entries)))
+
+    def get(self, key: str) -> typing.Optional[pd.DataFrame]:
+        """
+        Load the DataFrame cached under `key`.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        pd.DataFrame
+            The cached DataFrame, or `None` if the key is not cached or has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is not None and self._ttl is not None and entry[1] < time.time() - self._ttl):
+                self._remove_locked(key)
+                entry = None
+
+            if (entry is None):
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+
+        try:
+            df = self._read(self.get_path(key))
+        except Exception:
+            logger.warning("Failed to read cached batch '%s'. Treating as a cache miss.", key, exc_info=True)
+            with self._lock:
+                if (key in self._entries):
+                    self._remove_locked(key)
+                self._misses += 1
+            return None
+
+        with self._lock:
+            self._hits += 1
+
+        return df
+
+    def put(self, key: str, df: pd.DataFrame):
+        """
+        Write `df` to the cache under `key`, evicting entries as needed to stay within the configured bounds.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+        df : pd.DataFrame
+            DataFrame to cache.
+        """
+        path = self.get_path(key)
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+        # Write to a temporary file first so readers never observe a partially written batch
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            self._write(df, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if (os.path.exists(tmp_path)):
+                os.remove(tmp_path)
+
+        size = os.path.getsize(path)
+
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if (old_entry is not None):
+                self._total_bytes -= old_entry[0]
+
+            self._entries[key] = (size, time.time())
+            self._total_bytes += size
+
+            self._evict_locked()
+
+    @abstractmethod
+    def _read(self, path: str) -> pd.DataFrame:
+        pass
+
+    @abstractmethod
+    def _write(self, df: pd.DataFrame, path: str):
+        pass
+
+
+class PickleBatchCache(BatchCache):
+    """
+    Batch cache storing each DataFrame as a pickle file.
+    """
+
+    FILE_EXTENSION = ".pkl"
+
+    def _read(self, path: str) -> pd.DataFrame:
+        return pd.read_pickle(path)
+
+    def _write(self, df: pd.DataFrame, path: str):
+        df.to_pickle(path)
+
+
+class ArrowBatchCache(BatchCache):
+    """
+    Batch cache storing each DataFrame as an Arrow IPC (Feather V2) file. Cache hits are read through a memory map,
+    avoiding the deserialization cost of pickle files.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory where the cached batches are stored.
+    max_bytes : int, optional
+        Maximum total size of the cached files in bytes. `None` disables size based eviction.
+    ttl : float, optional
+        Maximum age of a cached file in seconds. `None` disables age based eviction.
+    compression : str, optional
+        Compression codec to use, one of `"lz4"` or `"zstd"`. Compressed files must be decompressed on read and
+        therefore can't be used zero-copy from the memory map. By default `None` (uncompressed).
+    """
+
+    FILE_EXTENSION = ".arrow"
+
+    def __init__(self, cache_dir: str, max_bytes: int = None, ttl: float = None, compression: str = None):
+        super().__init__(cache_dir=cache_dir, max_bytes=max_bytes, ttl=ttl)
+        self._write_options = pa.ipc.IpcWriteOptions(compression=compression)
+
+    def _read(self, path: str) -> pd.DataFrame:
+        with pa.memory_map(path, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+
+        return table.to_pandas()
+
+    def _write(self, df: pd.DataFrame, path: str):
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema, options=self._write_options) as writer:
+                writer.write_table(table)
+
+
+def create_batch_cache(cache_format: str,
+                       cache_dir: str,
+                       max_bytes: int = None,
+                       ttl: float = None,
+                       compression: str = None) -> BatchCache:
+    """
+    Create a batch cache for the given format.
+
+    Parameters
+    ----------
+    cache_format : str
+        Either `"pickle"` or `"arrow"`.
+    cache_dir : str
+        Directory where the cached batches are stored.
+    max_bytes : int, optional
+        Maximum total size of the cached files in bytes. `None` disables size based eviction.
+    ttl : float, optional
+        Maximum age of a cached file in seconds. `None` disables age based eviction.
+    compression : str, optional
+        Compression codec, only supported by the `"arrow"` format.
+
+    Returns
+    -------
+    BatchCache
+        The batch cache.
+    """
+    cache_format = cache_format.lower()
+    if (cache_format == "pickle"):
+        if (compression is not None):
+            raise ValueError("Compression is not supported by the 'pickle' batch cache format")
+        return PickleBatchCache(cache_dir=cache_dir, max_bytes=max_bytes, ttl=ttl)
+
+    if (cache_format == "arrow"):
+        return ArrowBatchCache(cache_dir=cache_dir, max_bytes=max_bytes, ttl=ttl, compression=compression)
+
+    raise ValueError(f"Unknown batch cache format '{cache_format}'. Valid values are 'pickle' or 'arrow'")
@@ -18,6 +18,7 @@ import io
 import typing
 
 import pandas as pd
+import pyarrow as pa
 
 import cudf
 
@@ -77,6 +78,12 @@ def _read_file_to_df_py(*,
     elif (mode == FileTypes.PARQUET):
         df = df_class.read_parquet(file_name, **kwargs)
 
+    elif (mode == FileTypes.ARROW):
+        with pa.ipc.open_file(file_name, **kwargs) as reader:
+            table = reader.read_all()
+
+        df = cudf.DataFrame.from_arrow(table) if df_type == "cudf" else table.to_pandas()
+
     else:
         assert False, f"Unsupported file type mode: {mode}"
 
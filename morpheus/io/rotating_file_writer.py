@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Size based rotation of optionally compressed output files."""
+
+import gzip
+import logging
+import os
+import typing
+
+logger = logging.getLogger(__name__)
+
+IMPORT_EXCEPTION = None
+IMPORT_ERROR_MESSAGE = "zstd compression requires the zstandard package to be installed."
+
+try:
+    import zstandard
+except ImportError as import_exc:
+    IMPORT_EXCEPTION = import_exc
+
+COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def split_file_name(filename: str, compression: str = None) -> typing.Tuple[str, str, str]:
+    """
+    Splits an output file name into its root, extension and compression extension. The compression extension is
+    empty unless `filename` ends with the extension of `compression`.
+
+    Parameters
+    ----------
+    filename : str
+        The output file name.
+    compression : str, optional
+        Compression of the output, by default None.
+
+    Returns
+    -------
+    typing.Tuple[str, str, str]
+        The root, extension and compression extension, for example `("out", ".csv", ".gz")` for `out.csv.gz`.
+    """
+    compression_ext = ""
+    if (compression is not None):
+        ext = COMPRESSION_EXTENSIONS.get(compression, f".{compression}")
+        if (filename.endswith(ext)):
+            compression_ext = ext
+            filename = filename[:-len(ext)]
+
+    (root, ext) = os.path.splitext(filename)
+
+    return (root, ext, compression_ext)
+
+
+def get_rotated_file_name(filename: str, index: int, compression: str = None) -> str:
+    """
+    Returns the name of the rotated output file `index`, inserting the index before the file extension. The first file
+    (index 0) keeps the original name, for example `out.jsonlines`, `out.1.jsonlines`, `out.2.jsonlines`.
+
+    Parameters
+    ----------
+    filename : str
+        The output file name, including the compression extension if any.
+    index : int
+        Index of the rotated file.
+    compression : str, optional
+        Compression of the output, by default None.
+
+    Returns
+    -------
+    str
+        The rotated file name.
+    """
+    if (index == 0):
+        return filename
+
+    (root, ext, compression_ext) = split_file_name(filename, compression)
+
+    return f"{root}.{index}{ext}{compression_ext}"
+
+
+class RotatingFileWriter:
+    """
+    Writes chunks of bytes to a buffered file, optionally compressed with gzip or zstd. When `max_file_size` is set,
+    the output is rotated to a new file (see `get_rotated_file_name`) once the current file reaches that size. Each
+    chunk can carry a header, which is only written when the chunk starts a new file.
+
+    Parameters
+    ----------
+    filename : str
+        The output file name, including the compression extension if any.
+    compression : str, optional
+        Compression of the output, either 'gzip' or 'zstd', by default None.
+    max_file_size : int, optional
+        Size in bytes after which the output is rotated to a new file, by default None (never rotate). Since the size
+        is checked after each chunk is written, files will exceed this size by up to one chunk.
+    buffer_size : int, optional
+        Size in bytes of the file buffer, by default 1 MiB.
+    overwrite : bool, optional
+        Overwrite output files which already exist, by default False.
+    """
+
+    def __init__(self,
+                 filename: str,
+                 *,
+                 compression: str = None,
+                 max_file_size: int = None,
+                 buffer_size: int = 1024 * 1024,
+                 overwrite: bool = False):
+        if (compression not in (None, "gzip", "zstd")):
+            raise ValueError(f"Unsupported compression '{compression}', use 'gzip' or 'zstd'")
+
+        if (compression == "zstd" and IMPORT_EXCEPTION is not None):
+            raise ImportError(IMPORT_ERROR_MESSAGE) from IMPORT_EXCEPTION
+
+        self._filename = filename
+        self._compression = compression
+        self._max_file_size = max_file_size
+        self._buffer_size = buffer_size
+        self._overwrite = overwrite
+
+        self._file_index = 0
+        self._file_names: list[str] = []
+
+        self._raw_file: typing.BinaryIO = None
+        self._stream: typing.BinaryIO = None
+        self._is_first = True
+
+    @property
+    def file_names(self) -> list[str]:
+        """Names of the files written so far, including the current file."""
+        return list(self._file_names)
+
+    def open(self):
+        """
+        Open the current output file, if it isn't already open. Called automatically by `write`.
+        """
+        if (self._stream is not None):
+            return
+
+        file_name = get_rotated_file_name(self._filename, self._file_index, self._compression)
+
+        if (os.path.exists(file_name) and not self._overwrite):
+            raise FileExistsError(f"Cannot write output to '{file_name}'. File exists and overwrite = False")
+
+        self._file_names.append(file_name)
+
+        self._raw_file = open(file_name, "wb", buffering=self._buffer_size)  # pylint: disable=consider-using-with
+
+        if (self._compression == "gzip"):
+            self._stream = gzip.GzipFile(fileobj=self._raw_file, mode="wb")
+        elif (self._compression == "zstd"):
+            self._stream = zstandard.ZstdCompressor().stream_writer(self._raw_file, closefd=False)
+        else:
+            self._stream = self._raw_file
+
+        self._is_first = True
+
+    def write(self, data: bytes, header: bytes = None):
+        """
+        Write a chunk to the output, rotating to a new file afterwards if the current file is full.
+
+        Parameters
+        ----------
+        data : bytes
+            The chunk to write.
+        header : bytes, optional
+            Written before the chunk when it is the first chunk of a file, by default None.
+        """
+        self.open()
+
+        if (self._is_first and header is not None):
+            self._stream.write(header)
+
+        self._stream.write(data)
+        self._is_first = False
+
+        # Does not include data held by the compressor, so the size lags behind for compressed output
+        if (self._max_file_size is not None and self._raw_file.tell() >= self._max_file_size):
+            self.close()
+            self._file_index += 1
+
+    def flush(self):
+        """
+        Flush buffered output to the operating system.
+        """
+        if (self._stream is not None):
+            self._stream.flush()
+            if (self._stream is not self._raw_file):
+                self._raw_file.flush()
+
+    def close(self):
+        """Close the current file."""
+        if (self._stream is not None):
+            if (self._stream is not self._raw_file):
+                self._stream.close()
+
+            self._raw_file.close()
+
+            self._stream = None
+            self._raw_file = None
+
+    def __enter__(self) -> "RotatingFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
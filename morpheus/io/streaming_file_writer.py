@@ -0,0 +1,338 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming DataFrame file writer."""
+
+import io
+import logging
+import os
+import typing
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import cudf
+
+from morpheus.common import FileTypes
+from morpheus.common import determine_file_type
+from morpheus.io import serializers
+from morpheus.io.rotating_file_writer import RotatingFileWriter
+from morpheus.io.rotating_file_writer import get_rotated_file_name
+from morpheus.io.rotating_file_writer import split_file_name
+from morpheus.utils.type_aliases import DataFrameType
+
+logger = logging.getLogger(__name__)
+
+
+class _EncodedTextStream(io.TextIOBase):
+    """
+    Text stream which encodes each write directly into a binary stream, avoiding an intermediate string holding the
+    whole serialized DataFrame.
+    """
+
+    def __init__(self, stream: typing.BinaryIO, encoding: str = "UTF-8") -> None:
+        super().__init__()
+        self._stream = stream
+        self._encoding = encoding
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: typing.Union[str, bytes]) -> int:
+        if (isinstance(s, str)):
+            s = s.encode(self._encoding)
+
+        self._stream.write(s)
+
+        return len(s)
+
+
+class SerializedDataFrame(typing.NamedTuple):
+    """
+    A DataFrame serialized by `StreamingFileWriter.serialize`, which no longer references the DataFrame.
+    """
+    data: typing.Union[bytes, pa.Table]
+    """Encoded CSV or JSON lines rows, or a table of rows for Parquet and Arrow output."""
+
+    header: bytes = None
+    """The CSV header, written at the start of each output file."""
+
+
+class StreamingFileWriter:
+    """
+    Writes DataFrames to a file, serializing each one into memory before writing it to a buffered binary file handle.
+    CSV and JSON lines output can optionally be compressed with gzip or zstd. Parquet and Arrow IPC output is appended
+    to a single file with rows buffered into row groups (record batches for Arrow) of `row_group_size` rows, using the
+    schema of the first DataFrame written.
+
+    DataFrames can be serialized with `serialize` and written later with `write_serialized`, allowing the DataFrame to
+    be released before any compression or file I/O takes place.
+
+    When `max_file_size` is set, the output is rotated to a new file once the current file reaches that size. Rotated
+    files insert a counter before the file extension, for example `out.jsonlines`, `out.1.jsonlines`,
+    `out.2.jsonlines`.
+
+    Parameters
+    ----------
+    filename : str
+        The output file name, including the compression extension if any.
+    file_type : FileTypes, optional
+        The type of the output file, by default `FileTypes.Auto` which determines the type from the extension.
+    include_index_col : bool, optional
+        Write out the index as a column, by default True.
+    compression : str, optional
+        Compression of the output, by default None. CSV and JSON support 'gzip' and 'zstd', Parquet supports any codec
+        supported by `pyarrow.parquet.ParquetWriter` and Arrow supports 'lz4' and 'zstd'.
+    max_file_size : int, optional
+        Size in bytes after which the output is rotated to a new file, by default None (never rotate). Since the size
+        is checked after each DataFrame is written, files will exceed this size by up to one DataFrame (or row group).
+    row_group_size : int, optional
+        Number of rows per Parquet row group or Arrow record batch, by default 100000. Ignored for CSV and JSON.
+    buffer_size : int, optional
+        Size in bytes of the file buffer, by default 1 MiB.
+    overwrite : bool, optional
+        Overwrite output files which already exist, by default False.
+    """
+
+    def __init__(self,
+                 filename: str,
+                 file_type: FileTypes = FileTypes.Auto,
+                 *,
+                 include_index_col: bool = True,
+                 compression: str = None,
+                 max_file_size: int = None,
+                 row_group_size: int = 100000,
+                 buffer_size: int = 1024 * 1024,
+                 overwrite: bool = False):
+        self._filename = filename
+        self._include_index_col = include_index_col
+        self._compression = compression
+        self._max_file_size = max_file_size
+        self._row_group_size = row_group_size
+        self._overwrite = overwrite
+
+        # The compression extension isn't part of the file type
+        (root, ext, _) = split_file_name(filename, compression)
+
+        if (isinstance(file_type, str)):
+            file_type = {name.lower(): value for (name, value) in FileTypes.__members__.items()}[file_type.lower()]
+
+        if (file_type == FileTypes.Auto):
+            file_type = determine_file_type(root + ext)
+
+        self._file_type = file_type
+        self._is_table_type = file_type in (FileTypes.PARQUET, FileTypes.ARROW)
+
+        if (not self._is_table_type and file_type not in (FileTypes.JSON, FileTypes.CSV)):
+            raise NotImplementedError(f"Unknown file type: {file_type}")
+
+        # CSV and JSON output
+        self._text_file: RotatingFileWriter = None
+        if (not self._is_table_type):
+            self._text_file = RotatingFileWriter(filename,
+                                                 compression=compression,
+                                                 max_file_size=max_file_size,
+                                                 buffer_size=buffer_size,
+                                                 overwrite=overwrite)
+
+        # Parquet and Arrow output
+        self._file_index = 0
+        self._file_names: list[str] = []
+        self._sink: pa.NativeFile = None
+        self._table_writer: typing.Union[pq.ParquetWriter, pa.ipc.RecordBatchFileWriter] = None
+        self._pending_tables: list[pa.Table] = []
+        self._pending_rows = 0
+        self._schema: pa.Schema = None
+
+    @property
+    def file_type(self) -> FileTypes:
+        """The type of the output file."""
+        return self._file_type
+
+    @property
+    def file_names(self) -> list[str]:
+        """Names of the files written so far, including the current file."""
+        if (self._text_file is not None):
+            return self._text_file.file_names
+
+        return list(self._file_names)
+
+    def _open_file(self):
+        file_name = get_rotated_file_name(self._filename, self._file_index, self._compression)
+
+        if (os.path.exists(file_name) and not self._overwrite):
+            raise FileExistsError(f"Cannot write output to '{file_name}'. File exists and overwrite = False")
+
+        self._file_names.append(file_name)
+
+        # Table writers are created with the schema of the first DataFrame
+        self._sink = pa.OSFile(file_name, "wb")
+
+    def _close_file(self):
+        self._write_pending_tables()
+
+        if (self._table_writer is not None):
+            self._table_writer.close()
+            self._table_writer = None
+
+        if (self._sink is not None):
+            self._sink.close()
+            self._sink = None
+
+    def _rotate_if_needed(self):
+        if (self._max_file_size is not None and self._sink.tell() >= self._max_file_size):
+            self._close_file()
+            self._file_index += 1
+
+    def _df_to_table(self, df: DataFrameType) -> pa.Table:
+        if (isinstance(df, cudf.DataFrame)):
+            return df.to_arrow(preserve_index=self._include_index_col)
+
+        # Numeric columns of the table would otherwise share memory with the DataFrame
+        return pa.Table.from_pandas(df.copy(), preserve_index=self._include_index_col)
+
+    def _write_pending_tables(self):
+        if (self._pending_rows == 0):
+            return
+
+        table = pa.concat_tables(self._pending_tables)
+        self._pending_tables.clear()
+        self._pending_rows = 0
+
+        if (self._table_writer is None):
+            if (self._file_type == FileTypes.PARQUET):
+                self._table_writer = pq.ParquetWriter(self._sink,
+                                                      table.schema,
+                                                      compression=self._compression or "snappy")
+            else:
+                options = pa.ipc.IpcWriteOptions(compression=self._compression)
+                self._table_writer = pa.ipc.new_file(self._sink, table.schema, options=options)
+
+        if (self._file_type == FileTypes.PARQUET):
+            self._table_writer.write_table(table, row_group_size=self._row_group_size)
+        else:
+            # Record batches are written per chunk, merge the buffered tables to produce full size batches
+            self._table_writer.write_table(table.combine_chunks(), max_chunksize=self._row_group_size)
+
+    def open(self):
+        """
+        Open the current output file, if it isn't already open. Called automatically by `write`.
+        """
+        if (self._text_file is not None):
+            self._text_file.open()
+        elif (self._sink is None):
+            self._open_file()
+
+    def serialize(self, df: DataFrameType) -> SerializedDataFrame:
+        """
+        Serialize a DataFrame into memory, to be written with `write_serialized`. No file is opened or written.
+
+        Parameters
+        ----------
+        df : DataFrameType
+            The DataFrame to serialize. It is only read during this call, so it may be a view of another DataFrame.
+
+        Returns
+        -------
+        SerializedDataFrame
+            The serialized DataFrame.
+        """
+        if (self._is_table_type):
+            return SerializedDataFrame(self._df_to_table(df))
+
+        buffer = io.BytesIO()
+
+        if (self._file_type == FileTypes.JSON):
+            serializers.df_to_stream_json(df, _EncodedTextStream(buffer), include_index_col=self._include_index_col)
+
+            return SerializedDataFrame(buffer.getvalue())
+
+        serializers.df_to_stream_csv(df, _EncodedTextStream(buffer), include_index_col=self._include_index_col)
+
+        header = io.BytesIO()
+        serializers.df_to_stream_csv(df.iloc[:0],
+                                     _EncodedTextStream(header),
+                                     include_header=True,
+                                     include_index_col=self._include_index_col)
+
+        return SerializedDataFrame(buffer.getvalue(), header.getvalue())
+
+    def write_serialized(self, serialized: SerializedDataFrame):
+        """
+        Write a DataFrame serialized by `serialize` to the output, rotating to a new file afterwards if the current
+        file is full.
+
+        Parameters
+        ----------
+        serialized : SerializedDataFrame
+            The serialized DataFrame.
+        """
+        if (self._text_file is not None):
+            self._text_file.write(serialized.data, header=serialized.header)
+            return
+
+        self.open()
+
+        table = serialized.data
+
+        # Every table is written with the schema of the first one. Casting here means a DataFrame which can't be
+        # converted (as opposed to one with an all-null column typed as null) fails on its own write
+        if (self._schema is None):
+            self._schema = table.schema
+        elif (not table.schema.equals(self._schema)):
+            table = table.cast(self._schema)
+
+        self._pending_tables.append(table)
+        self._pending_rows += table.num_rows
+
+        if (self._pending_rows >= self._row_group_size):
+            self._write_pending_tables()
+
+        self._rotate_if_needed()
+
+    def write(self, df: DataFrameType):
+        """
+        Write a DataFrame to the output, rotating to a new file afterwards if the current file is full.
+
+        Parameters
+        ----------
+        df : DataFrameType
+            The DataFrame to write. It is only read during this call, so it may be a view of another DataFrame.
+        """
+        self.write_serialized(self.serialize(df))
+
+    def flush(self):
+        """
+        Flush buffered output to the operating system. For Parquet and Arrow output this writes any buffered rows as
+        a row group, prefer calling this infrequently.
+        """
+        if (self._text_file is not None):
+            self._text_file.flush()
+        else:
+            self._write_pending_tables()
+            if (self._sink is not None):
+                self._sink.flush()
+
+    def close(self):
+        """Write any buffered rows and close the current file."""
+        if (self._text_file is not None):
+            self._text_file.close()
+        else:
+            self._close_file()
+
+    def __enter__(self) -> "StreamingFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -17,6 +17,8 @@ import logging
 from morpheus.llm import LLMContext
 from morpheus.llm import LLMNodeBase
 from morpheus.llm.services.llm_service import LLMClient
+from morpheus.llm.services.utils.caching_llm_client import CachingLLMClient
+from morpheus.llm.services.utils.llm_response_cache import LLMResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -33,11 +35,18 @@ class LLMGenerateNode(LLMNodeBase):
 
     input_names : list[str], optional
         The names of the inputs to this node. Defaults to `["prompt"]`.
+
+    cache : LLMResponseCache, optional
+        When set, responses are cached keyed on the model name, model arguments and the inputs, and duplicate inputs
+        within a batch are only sent to the LLM once. Defaults to `None` (no caching).
     """
 
-    def __init__(self, llm_client: LLMClient) -> None:
+    def __init__(self, llm_client: LLMClient, cache: LLMResponseCache = None) -> None:
         super().__init__()
 
+        if (cache is not None):
+            llm_client = CachingLLMClient(llm_client, cache)
+
         self._llm_client = llm_client
 
     def get_input_names(self) -> list[str]:
@@ -18,6 +18,8 @@ import typing
 from abc import ABC
 from abc import abstractmethod
 
+from morpheus.llm.services.utils.rate_limiter import RateLimiter
+
 if typing.TYPE_CHECKING:
     from morpheus.llm.services.nemo_llm_service import NeMoLLMService
     from morpheus.llm.services.openai_chat_service import OpenAIChatService
@@ -147,8 +149,40 @@ class LLMClient(ABC):
 class LLMService(ABC):
     """
     Abstract interface for services which are able to construct clients for interacting with LLM models.
+
+    Parameters
+    ----------
+    max_concurrency : int, optional
+        Maximum number of requests in flight at once across all clients created by this service, by default None
+        (unlimited).
+    requests_per_minute : float, optional
+        Maximum number of requests per minute across all clients created by this service, by default None (unlimited).
+    tokens_per_minute : float, optional
+        Maximum number of estimated prompt tokens per minute across all clients created by this service, by default
+        None (unlimited).
     """
 
+    def __init__(self,
+                 *,
+                 max_concurrency: int = None,
+                 requests_per_minute: float = None,
+                 tokens_per_minute: float = None) -> None:
+        self._limiter = RateLimiter(max_concurrency=max_concurrency,
+                                    requests_per_minute=requests_per_minute,
+                                    tokens_per_minute=tokens_per_minute)
+
+    @property
+    def limiter(self) -> RateLimiter:
+        """
+        The rate limiter shared by all clients created by this service.
+
+        Returns
+        -------
+        RateLimiter
+            The rate limiter, exposing the in-flight and queue depth metrics.
+        """
+        return self._limiter
+
     @abstractmethod
     def get_client(self, *, model_name: str, **model_kwargs) -> LLMClient:
         """
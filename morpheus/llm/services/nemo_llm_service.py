@@ -19,6 +19,8 @@ import warnings
 
 from morpheus.llm.services.llm_service import LLMClient
 from morpheus.llm.services.llm_service import LLMService
+from morpheus.llm.services.utils.rate_limiter import RateLimitError
+from morpheus.llm.services.utils.rate_limiter import estimate_tokens
 from morpheus.utils.env_config_value import EnvConfigValue
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,18 @@ except ImportError as import_exc:
     IMPORT_EXCEPTION = import_exc
 
 
+def _is_rate_limited(response: typing.Any, result: dict) -> bool:
+    """
+    NeMo reports errors, including HTTP 429 (Too Many Requests), through a failed result rather than raising.
+    """
+    if (getattr(response, "status_code", None) == 429):
+        return True
+
+    msg = str(result.get('msg', ''))
+
+    return "429" in msg or "too many requests" in msg.lower()
+
+
 class NeMoLLMClient(LLMClient):
     """
     Client for interacting with a specific model in Nemo. This class should be constructed with the
@@ -64,6 +78,31 @@ class NeMoLLMClient(LLMClient):
         self._model_kwargs = model_kwargs
         self._prompt_key = "prompt"
 
+    @property
+    def model_name(self):
+        """
+        Get the name of the model associated with this client.
+
+        Returns
+        -------
+        str
+            The name of the model.
+        """
+        return self._model_name
+
+    @property
+    def model_kwargs(self):
+        """
+        Get the keyword args that will be passed to the model when calling generation functions.
+
+        Returns
+        -------
+        dict
+            The keyword arguments dictionary.
+        """
+        # Return a copy to avoid modification of the original
+        return self._model_kwargs.copy()
+
     def get_input_names(self) -> list[str]:
         return [self._prompt_key]
 
@@ -131,14 +170,25 @@ class NeMoLLMClient(LLMClient):
         errors = []
 
         while iterations < self._parent._retry_count:
-            fut = await asyncio.wrap_future(
-                self._parent._conn.generate(model=self._model_name,
-                                            prompt=prompt,
-                                            return_type="async",
-                                            **self._model_kwargs))  # type: ignore
-
-            result: dict = nemollm.NemoLLM.post_process_generate_response(
-                fut, return_text_completion_only=False)  # type: ignore
+            try:
+                # The response is checked inside the limiter, allowing it to back off when the service is rate limited
+                async with self._parent.limiter.limit(tokens=estimate_tokens(prompt)):
+                    response = await asyncio.wrap_future(
+                        self._parent._conn.generate(model=self._model_name,
+                                                    prompt=prompt,
+                                                    return_type="async",
+                                                    **self._model_kwargs))  # type: ignore
+
+                    result: dict = nemollm.NemoLLM.post_process_generate_response(
+                        response, return_text_completion_only=False)  # type: ignore
+
+                    if (result.get('status', None) == 'fail' and _is_rate_limited(response, result)):
+                        raise RateLimitError(result.get('msg', 'Too Many Requests'))
+
+            except RateLimitError as exc:
+                iterations += 1
+                errors.append(str(exc))
+                continue
 
             if result.get('status', None) == 'fail':
                 iterations += 1
@@ -203,7 +253,14 @@ class NeMoLLMService(LLMService):
         variable. If neither are present the NeMo default will be used, by default None
     retry_count : int, optional
         The number of times to retry a request before raising an exception, by default 5
-
+    max_concurrency : int, optional
+        Maximum number of requests in flight at once across all clients created by this service, by default None
+        (unlimited).
+    requests_per_minute : float, optional
+        Maximum number of requests per minute across all clients created by this service, by default None (unlimited).
+    tokens_per_minute : float, optional
+        Maximum number of estimated prompt tokens per minute across all clients created by this service, by default
+        None (unlimited).
     """
 
     class APIKey(EnvConfigValue):
@@ -223,7 +280,10 @@ class NeMoLLMService(LLMService):
                  api_key: APIKey | str = None,
                  org_id: OrgId | str = None,
                  base_url: BaseURL | str = None,
-                 retry_count=5) -> None:
+                 retry_count=5,
+                 max_concurrency: int = None,
+                 requests_per_minute: float = None,
+                 tokens_per_minute: float = None) -> None:
         """
         Creates a service for interacting with NeMo LLM models.
 
@@ -233,7 +293,9 @@ class NeMoLLMService(LLMService):
         if IMPORT_EXCEPTION is not None:
             raise ImportError(IMPORT_ERROR_MESSAGE) from IMPORT_EXCEPTION
 
-        super().__init__()
+        super().__init__(max_concurrency=max_concurrency,
+                         requests_per_minute=requests_per_minute,
+                         tokens_per_minute=tokens_per_minute)
 
         if not isinstance(api_key, NeMoLLMService.APIKey):
             api_key = NeMoLLMService.APIKey(api_key)
@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 import typing
 
 from morpheus.llm.services.llm_service import LLMClient
 from morpheus.llm.services.llm_service import LLMService
+from morpheus.llm.services.utils.rate_limiter import estimate_tokens
 from morpheus.utils.env_config_value import EnvConfigValue
 
 logger = logging.getLogger(__name__)
@@ -82,6 +84,18 @@ class NVFoundationLLMClient(LLMClient):
     def get_input_names(self) -> list[str]:
         return [self._prompt_key]
 
+    @property
+    def model_name(self):
+        """
+        Get the name of the model associated with this client.
+
+        Returns
+        -------
+        str
+            The name of the model.
+        """
+        return self._model_name
+
     @property
     def model_kwargs(self):
         return self._model_kwargs
@@ -179,20 +193,19 @@ class NVFoundationLLMClient(LLMClient):
             Additional keyword arguments for generate batch async.
         """
 
-        prompts = [StringPromptValue(text=p) for p in inputs[self._prompt_key]]
         final_kwargs = {**self._model_kwargs, **kwargs}
 
-        responses = []
-        try:
-            generated_responses = await self._client.agenerate_prompt(prompts=prompts, **final_kwargs)  # type: ignore
-            responses = [g[0].text for g in generated_responses.generations]
-        except Exception as e:
-            if return_exceptions:
-                responses.append(e)
-            else:
-                raise e
+        # Issue one request per prompt so that each one is individually subject to the service's rate limits
+        coros = [self._generate_one_async(prompt, final_kwargs) for prompt in inputs[self._prompt_key]]
 
-        return responses
+        return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+    async def _generate_one_async(self, prompt: str, final_kwargs: dict) -> str:
+        async with self._parent.limiter.limit(tokens=estimate_tokens(prompt)):
+            generated_responses = await self._client.agenerate_prompt(prompts=[StringPromptValue(text=prompt)],
+                                                                      **final_kwargs)  # type: ignore
+
+        return generated_responses.generations[0][0].text
 
 
 class NVFoundationLLMService(LLMService):
@@ -207,6 +220,16 @@ class NVFoundationLLMService(LLMService):
     base_url : str, optional
         The api host url, by default None. If `None` the url will be read from the `NVIDIA_API_BASE` environment
         variable. If neither are present the NVIDIA default will be used, by default None
+    max_concurrency : int, optional
+        Maximum number of requests in flight at once across all clients created by this service, by default None
+        (unlimited).
+    requests_per_minute : float, optional
+        Maximum number of requests per minute across all clients created by this service, by default None (unlimited).
+    tokens_per_minute : float, optional
+        Maximum number of estimated prompt tokens per minute across all clients created by this service, by default
+        None (unlimited).
+    model_kwargs : dict[str, typing.Any]
+        Default keyword arguments to pass to the model when creating a client.
     """
 
     class APIKey(EnvConfigValue):
@@ -216,11 +239,20 @@ class NVFoundationLLMService(LLMService):
         _ENV_KEY: str = "NVIDIA_API_BASE"
         _ALLOW_NONE: bool = True
 
-    def __init__(self, *, api_key: APIKey | str = None, base_url: BaseURL | str = None, **model_kwargs) -> None:
+    def __init__(self,
+                 *,
+                 api_key: APIKey | str = None,
+                 base_url: BaseURL | str = None,
+                 max_concurrency: int = None,
+                 requests_per_minute: float = None,
+                 tokens_per_minute: float = None,
+                 **model_kwargs) -> None:
         if IMPORT_EXCEPTION is not None:
             raise ImportError(IMPORT_ERROR_MESSAGE) from IMPORT_EXCEPTION
 
-        super().__init__()
+        super().__init__(max_concurrency=max_concurrency,
+                         requests_per_minute=requests_per_minute,
+                         tokens_per_minute=tokens_per_minute)
 
         if not isinstance(api_key, NVFoundationLLMService.APIKey):
             api_key = NVFoundationLLMService.APIKey(api_key)
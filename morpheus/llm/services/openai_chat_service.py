@@ -24,6 +24,7 @@ import appdirs
 
 from morpheus.llm.services.llm_service import LLMClient
 from morpheus.llm.services.llm_service import LLMService
+from morpheus.llm.services.utils.rate_limiter import estimate_tokens
 from morpheus.utils.env_config_value import EnvConfigValue
 
 logger = logging.getLogger(__name__)
@@ -254,17 +255,20 @@ class OpenAIChatClient(LLMClient):
 
         messages = self._create_messages(prompt, assistant)
 
-        with self._api_logger(inputs=messages) as msg_logger:
+        tokens = estimate_tokens(prompt) + (estimate_tokens(assistant) if assistant is not None else 0)
 
-            try:
-                output = await self._client_async.chat.completions.create(model=self._model_name,
-                                                                          messages=messages,
-                                                                          **self._model_kwargs)
-            except Exception as exc:
-                self._parent._logger.error("Error generating completion: %s", exc)
-                raise
+        async with self._parent.limiter.limit(tokens=tokens):
+            with self._api_logger(inputs=messages) as msg_logger:
 
-            msg_logger.set_output(output)
+                try:
+                    output = await self._client_async.chat.completions.create(model=self._model_name,
+                                                                              messages=messages,
+                                                                              **self._model_kwargs)
+                except Exception as exc:
+                    self._parent._logger.error("Error generating completion: %s", exc)
+                    raise
+
+                msg_logger.set_output(output)
 
         return self._extract_completion(output)
 
@@ -378,7 +382,14 @@ class OpenAIChatService(LLMService):
         will automatically be used when calling `get_client`. Arguments specified in the `get_client` function will
         overwrite default values specified here. This is useful to set model arguments before creating multiple
         clients. By default None
-
+    max_concurrency : int, optional
+        Maximum number of requests in flight at once across all clients created by this service, by default None
+        (unlimited).
+    requests_per_minute : float, optional
+        Maximum number of requests per minute across all clients created by this service, by default None (unlimited).
+    tokens_per_minute : float, optional
+        Maximum number of estimated prompt tokens per minute across all clients created by this service, by default
+        None (unlimited).
     """
 
     class APIKey(EnvConfigValue):
@@ -397,12 +408,17 @@ class OpenAIChatService(LLMService):
                  api_key: APIKey | str = None,
                  org_id: OrgId | str = None,
                  base_url: BaseURL | str = None,
-                 default_model_kwargs: dict = None) -> None:
+                 default_model_kwargs: dict = None,
+                 max_concurrency: int = None,
+                 requests_per_minute: float = None,
+                 tokens_per_minute: float = None) -> None:
 
         if IMPORT_EXCEPTION is not None:
             raise ImportError(IMPORT_ERROR_MESSAGE) from IMPORT_EXCEPTION
 
-        super().__init__()
+        super().__init__(max_concurrency=max_concurrency,
+                         requests_per_minute=requests_per_minute,
+                         tokens_per_minute=tokens_per_minute)
 
         if not isinstance(api_key, OpenAIChatService.APIKey):
             api_key = OpenAIChatService.APIKey(api_key)
@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import typing
+from collections import OrderedDict
+
+from morpheus.llm.services.llm_service import LLMClient
+from morpheus.llm.services.utils.llm_response_cache import LLMResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachingLLMClient(LLMClient):
+    """
+    Wraps an `LLMClient`, returning cached responses for previously seen requests. Within a batch, rows with identical
+    inputs are coalesced into a single request to the wrapped client. Responses which are exceptions are never cached.
+
+    Parameters
+    ----------
+    client : LLMClient
+        The client to wrap.
+    cache : LLMResponseCache
+        The cache to store responses in, can be shared between clients.
+    model_name : str, optional
+        Model name used in the cache key, by default the `model_name` property of `client` if it exists.
+    model_kwargs : dict, optional
+        Model arguments used in the cache key, by default the `model_kwargs` property of `client` if it exists.
+    """
+
+    def __init__(self,
+                 client: LLMClient,
+                 cache: LLMResponseCache,
+                 *,
+                 model_name: str = None,
+                 model_kwargs: dict = None) -> None:
+        super().__init__()
+
+        self._client = client
+        self._cache = cache
+        self._model_name = model_name if model_name is not None else getattr(client, "model_name", None)
+        self._model_kwargs = model_kwargs if model_kwargs is not None else getattr(client, "model_kwargs", None)
+
+    @property
+    def client(self) -> LLMClient:
+        """The wrapped client."""
+        return self._client
+
+    @property
+    def cache(self) -> LLMResponseCache:
+        """The response cache."""
+        return self._cache
+
+    def get_input_names(self) -> list[str]:
+        return self._client.get_input_names()
+
+    def _make_key(self, input_dict: dict[str, typing.Any]) -> str:
+        return LLMResponseCache.make_key(self._model_name, self._model_kwargs, input_dict)
+
+    def _lookup_batch(self, inputs: dict[str, list]) -> tuple[list, OrderedDict[str, list[int]], dict[str, list]]:
+        """
+        Returns the batch results filled in from the cache, the rows which still need to be generated grouped by key,
+        and the inputs for one request per key.
+        """
+        num_rows = len(next(iter(inputs.values()))) if inputs else 0
+
+        results = [None] * num_rows
+        pending: OrderedDict[str, list[int]] = OrderedDict()
+
+        for i in range(num_rows):
+            row = {name: values[i] for (name, values) in inputs.items()}
+            key = self._make_key(row)
+
+            if (key in pending):
+                pending[key].append(i)
+                continue
+
+            cached = self._cache.get(key)
+            if (cached is not None):
+                results[i] = cached
+            else:
+                pending[key] = [i]
+
+        pending_inputs = {name: [values[rows[0]] for rows in pending.values()] for (name, values) in inputs.items()}
+
+        return (results, pending, pending_inputs)
+
+    def _merge_batch(self, results: list, pending: OrderedDict[str, list[int]], responses: list) -> list:
+        for ((key, rows), response) in zip(pending.items(), responses):
+            if (not isinstance(response, BaseException)):
+                self._cache.put(key, response)
+
+            for i in rows:
+                results[i] = response
+
+        return results
+
+    def generate(self, **input_dict) -> str:
+        """
+        Issue a request to generate a response based on a given prompt, returning the cached response if available.
+
+        Parameters
+        ----------
+        input_dict : dict
+            Input containing prompt data.
+        """
+        key = self._make_key(input_dict)
+
+        response = self._cache.get(key)
+        if (response is None):
+            response = self._client.generate(**input_dict)
+            self._cache.put(key, response)
+
+        return response
+
+    async def generate_async(self, **input_dict) -> str:
+        """
+        Issue an asynchronous request to generate a response based on a given prompt, returning the cached response
+        if available.
+
+        Parameters
+        ----------
+        input_dict : dict
+            Input containing prompt data.
+        """
+        key = self._make_key(input_dict)
+
+        response = self._cache.get(key)
+        if (response is None):
+            response = await self._client.generate_async(**input_dict)
+            self._cache.put(key, response)
+
+        return response
+
+    @typing.overload
+    def generate_batch(self,
+                       inputs: dict[str, list],
+                       return_exceptions: typing.Literal[True] = True) -> list[str | BaseException]:
+        ...
+
+    @typing.overload
+    def generate_batch(self, inputs: dict[str, list], return_exceptions: typing.Literal[False] = False) -> list[str]:
+        ...
+
+    def generate_batch(self, inputs: dict[str, list], return_exceptions=False) -> list[str] | list[str | BaseException]:
+        """
+        Issue a request to generate a list of responses based on a list of prompts. Only prompts without a cached
+        response are sent to the wrapped client, and each distinct prompt is sent once.
+
+        Parameters
+        ----------
+        inputs : dict
+            Inputs containing prompt data.
+        return_exceptions : bool
+            Whether to return exceptions in the output list or raise them immediately.
+        """
+        (results, pending, pending_inputs) = self._lookup_batch(inputs)
+
+        if (len(pending) > 0):
+            responses = self._client.generate_batch(pending_inputs, return_exceptions=return_exceptions)
+            self._merge_batch(results, pending, responses)
+
+        return results
+
+    @typing.overload
+    async def generate_batch_async(self,
+                                   inputs: dict[str, list],
+                                   return_exceptions: typing.Literal[True] = True) -> list[str | BaseException]:
+        ...
+
+    @typing.overload
+    async def generate_batch_async(self,
+                                   inputs: dict[str, list],
+                                   return_exceptions: typing.Literal[False] = False) -> list[str]:
+        ...
+
+    async def generate_batch_async(self,
+                                   inputs: dict[str, list],
+                                   return_exceptions=False) -> list[str] | list[str | BaseException]:
+        """
+        Issue an asynchronous request to generate a list of responses based on a list of prompts. Only prompts without
+        a cached response are sent to the wrapped client, and each distinct prompt is sent once.
+
+        Parameters
+        ----------
+        inputs : dict
+            Inputs containing prompt data.
+        return_exceptions : bool
+            Whether to return exceptions in the output list or raise them immediately.
+        """
+        (results, pending, pending_inputs) = self._lookup_batch(inputs)
+
+        if (len(pending) > 0):
+            responses = await self._client.generate_batch_async(pending_inputs, return_exceptions=return_exceptions)
+            self._merge_batch(results, pending, responses)
+
+        return results
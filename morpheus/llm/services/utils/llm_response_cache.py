@@ -0,0 +1,212 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import typing
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    Two tier cache of LLM responses. Responses are kept in an in-memory LRU and, when `db_path` is set, in a SQLite
+    database so that they persist across runs.
+
+    Parameters
+    ----------
+    max_memory_entries : int, optional
+        Maximum number of responses kept in memory, by default 1024.
+    db_path : str, optional
+        Path to the SQLite database file, by default None (memory only).
+    max_db_entries : int, optional
+        Maximum number of responses kept in the database, the least recently used are evicted first, by default None
+        (unbounded). The limit is enforced every `db_evict_interval` writes, so the database may temporarily exceed
+        it.
+    ttl : float, optional
+        Maximum age of a cached response in seconds, by default None (never expires).
+    db_evict_interval : int, optional
+        Number of writes between evictions from the database, by default 100.
+    """
+
+    def __init__(self,
+                 *,
+                 max_memory_entries: int = 1024,
+                 db_path: str = None,
+                 max_db_entries: int = None,
+                 ttl: float = None,
+                 db_evict_interval: int = 100) -> None:
+        self._max_memory_entries = max_memory_entries
+        self._max_db_entries = max_db_entries
+        self._ttl = ttl
+        self._db_evict_interval = db_evict_interval
+        self._db_writes_since_evict = 0
+
+        self._lock = threading.Lock()
+
+        # Maps key -> (response, creation time), ordered from least to most recently used
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+        self._conn = None
+        if (db_path is not None):
+            db_dir = os.path.dirname(db_path)
+            if (db_dir):
+                os.makedirs(db_dir, exist_ok=True)
+
+            self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS responses "
+                               "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL, "
+                               "accessed REAL NOT NULL)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit and miss counters of the cache."""
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "memory_entries": len(self._memory)}
+
+    @staticmethod
+    def make_key(model_name: str | None, model_kwargs: dict | None, inputs: dict[str, typing.Any]) -> str:
+        """
+        Build a cache key from the model name, the model arguments and the rendered inputs of a single request.
+
+        Parameters
+        ----------
+        model_name : str
+            Name of the model.
+        model_kwargs : dict
+            Keyword arguments passed to the model.
+        inputs : dict[str, typing.Any]
+            Inputs of a single request, for example `{"prompt": "..."}`.
+
+        Returns
+        -------
+        str
+            Hex digest identifying the request.
+        """
+        key_data = {"model_name": model_name, "model_kwargs": model_kwargs or {}, "inputs": inputs}
+
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _is_expired(self, created: float, now: float) -> bool:
+        return self._ttl is not None and created < now - self._ttl
+
+    def _put_memory_locked(self, key: str, response: str, created: float):
+        self._memory[key] = (response, created)
+        self._memory.move_to_end(key)
+        while (len(self._memory) > self._max_memory_entries):
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cached response.
+
+        Parameters
+        ----------
+        key : str
+            Key built with `make_key`.
+
+        Returns
+        -------
+        str
+            The cached response, or `None` if there is no valid entry for `key`.
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if (entry is not None):
+                if (not self._is_expired(entry[1], now)):
+                    self._memory.move_to_end(key)
+                    self._hits += 1
+                    return entry[0]
+
+                del self._memory[key]
+
+            if (self._conn is not None):
+                row = self._conn.execute("SELECT response, created FROM responses WHERE key = ?", (key, )).fetchone()
+                if (row is not None):
+                    (response, created) = row
+                    if (not self._is_expired(created, now)):
+                        self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                        self._put_memory_locked(key, response, created)
+                        self._hits += 1
+                        return response
+
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key, ))
+
+            self._misses += 1
+
+        return None
+
+    def put(self, key: str, response: str):
+        """
+        Store a response in the cache.
+
+        Parameters
+        ----------
+        key : str
+            Key built with `make_key`.
+        response : str
+            Response returned by the model.
+        """
+        now = time.time()
+
+        with self._lock:
+            self._put_memory_locked(key, response, now)
+
+            if (self._conn is not None):
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created, accessed) "
+                    "VALUES (?, ?, ?, ?)", (key, response, now, now))
+
+                self._db_writes_since_evict += 1
+                if (self._db_writes_since_evict >= self._db_evict_interval):
+                    self._evict_db_locked(now)
+
+    def _evict_db_locked(self, now: float):
+        self._db_writes_since_evict = 0
+
+        if (self._ttl is not None):
+            self._conn.execute("DELETE FROM responses WHERE created < ?", (now - self._ttl, ))
+
+        if (self._max_db_entries is not None):
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)", (self._max_db_entries, ))
+
+    def clear(self):
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if (self._conn is not None):
+                self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if (self._conn is not None):
+                self._conn.close()
+                self._conn = None
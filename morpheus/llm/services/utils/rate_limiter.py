@@ -0,0 +1,294 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import collections
+import logging
+import threading
+import time
+import typing
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitError(RuntimeError):
+    """
+    Raised by clients whose library reports an HTTP 429 (Too Many Requests) status in a result rather than raising.
+    """
+    status_code = 429
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """
+    Returns `True` if `exc` indicates that the request was rejected with an HTTP 429 (Too Many Requests) status.
+
+    Parameters
+    ----------
+    exc : BaseException
+        Exception raised by an LLM client library.
+
+    Returns
+    -------
+    bool
+        Whether the exception represents a rate limit error.
+    """
+    status_code = getattr(exc, "status_code", None)
+    if (status_code is None):
+        status_code = getattr(getattr(exc, "response", None), "status_code", None)
+
+    return status_code == 429 or type(exc).__name__ == "RateLimitError"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap estimate of the number of tokens in `text`, assuming roughly four characters per token.
+
+    Parameters
+    ----------
+    text : str
+        Input text.
+
+    Returns
+    -------
+    int
+        Estimated number of tokens, at least 1.
+    """
+    return max(1, len(text) // 4)
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket which hands out reservations. A caller reserving more than the current level drives the
+    bucket negative and is told how long to wait, so later callers queue up behind it without any shared waiters.
+    """
+
+    def __init__(self, per_minute: float):
+        self._rate = per_minute / 60.0
+        self._capacity = per_minute
+        self._level = per_minute
+        self._last_update = time.monotonic()
+
+    def reserve(self, amount: float, rate_scale: float) -> float:
+        # Callers must hold the lock of the owning `RateLimiter`
+        rate = self._rate * rate_scale
+        now = time.monotonic()
+        self._level = min(self._capacity, self._level + (now - self._last_update) * rate)
+        self._last_update = now
+
+        # Never reserve more than the capacity, otherwise a single large request could never be satisfied
+        self._level -= min(amount, self._capacity)
+
+        if (self._level >= 0):
+            return 0.0
+
+        return -self._level / rate
+
+
+class RateLimiter:
+    """
+    Limits the number of concurrent requests and the request and token throughput of all clients created by an
+    `LLMService`. Requests over budget are delayed rather than sent, so the endpoint is held close to its maximum
+    sustainable rate instead of returning 429 errors. The limiter is safe to share between threads and event loops.
+
+    When a request fails with a rate limit error, the effective request and token rates are halved and new requests
+    are held back for an exponentially increasing cooldown period. Each successful request afterwards gradually
+    restores the configured rates.
+
+    Parameters
+    ----------
+    max_concurrency : int, optional
+        Maximum number of requests in flight at once, by default None (unlimited).
+    requests_per_minute : float, optional
+        Maximum number of requests started per minute, by default None (unlimited).
+    tokens_per_minute : float, optional
+        Maximum number of prompt tokens sent per minute, by default None (unlimited). Token counts are estimated by the
+        calling client.
+    min_rate_scale : float, optional
+        Lower bound on the fraction of the configured rates used after repeated rate limit errors, by default 0.05.
+    max_backoff : float, optional
+        Maximum cooldown in seconds after a rate limit error, by default 60.
+    """
+
+    def __init__(self,
+                 *,
+                 max_concurrency: int = None,
+                 requests_per_minute: float = None,
+                 tokens_per_minute: float = None,
+                 min_rate_scale: float = 0.05,
+                 max_backoff: float = 60.0):
+
+        if (max_concurrency is not None and max_concurrency < 1):
+            raise ValueError("max_concurrency must be at least 1")
+
+        self._lock = threading.Lock()
+
+        self._max_concurrency = max_concurrency
+        self._available = max_concurrency
+        self._waiters: collections.deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = collections.deque()
+
+        self._request_bucket = _TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._token_bucket = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+        self._min_rate_scale = min_rate_scale
+        self._max_backoff = max_backoff
+        self._rate_scale = 1.0
+        self._consecutive_rate_limits = 0
+        self._cooldown_until = 0.0
+
+        self._in_flight = 0
+        self._queue_depth = 0
+        self._total_requests = 0
+        self._rate_limited_requests = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently being executed."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a concurrency slot or rate budget."""
+        return self._queue_depth
+
+    @property
+    def stats(self) -> dict[str, typing.Any]:
+        """Snapshot of the limiter metrics."""
+        with self._lock:
+            return {
+                "in_flight": self._in_flight,
+                "queue_depth": self._queue_depth,
+                "total_requests": self._total_requests,
+                "rate_limited_requests": self._rate_limited_requests,
+                "rate_scale": self._rate_scale,
+            }
+
+    def _reserve_delay(self, tokens: int) -> float:
+        with self._lock:
+            delay = max(0.0, self._cooldown_until - time.monotonic())
+
+            if (self._request_bucket is not None):
+                delay = max(delay, self._request_bucket.reserve(1, self._rate_scale))
+
+            if (self._token_bucket is not None and tokens > 0):
+                delay = max(delay, self._token_bucket.reserve(tokens, self._rate_scale))
+
+            return delay
+
+    async def _acquire_slot(self):
+        with self._lock:
+            if (self._available is None):
+                return
+
+            if (self._available > 0 and not self._waiters):
+                self._available -= 1
+                return
+
+            loop = asyncio.get_running_loop()
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    # The slot was handed to us after we were cancelled, pass it on
+                    self._release_slot_locked()
+            raise
+
+    def _release_slot_locked(self):
+        if (self._available is None):
+            return
+
+        while (self._waiters):
+            (loop, fut) = self._waiters.popleft()
+            if (not loop.is_closed()):
+                # The slot is transferred directly to the waiter
+                loop.call_soon_threadsafe(_set_future_result, fut)
+                return
+
+        self._available += 1
+
+    def _on_complete(self, exc: BaseException | None):
+        with self._lock:
+            self._in_flight -= 1
+            self._release_slot_locked()
+
+            if (exc is not None and is_rate_limit_error(exc)):
+                self._rate_limited_requests += 1
+                self._consecutive_rate_limits += 1
+                self._rate_scale = max(self._min_rate_scale, self._rate_scale * 0.5)
+
+                backoff = min(self._max_backoff, 2.0**(self._consecutive_rate_limits - 1))
+                self._cooldown_until = max(self._cooldown_until, time.monotonic() + backoff)
+
+                logger.warning("Rate limited by the LLM service, backing off for %.1f s. Rate scale is now %.2f",
+                               backoff,
+                               self._rate_scale)
+            elif (exc is None):
+                self._consecutive_rate_limits = 0
+                self._rate_scale = min(1.0, self._rate_scale + 0.05)
+
+    @asynccontextmanager
+    async def limit(self, tokens: int = 0):
+        """
+        Asynchronous context manager which waits until a request can be sent within the configured limits. The
+        request should be issued inside the context, any exception raised is used to adapt the limits.
+
+        Parameters
+        ----------
+        tokens : int, optional
+            Estimated number of prompt tokens in the request, by default 0.
+        """
+        with self._lock:
+            self._queue_depth += 1
+            self._total_requests += 1
+
+        try:
+            await self._acquire_slot()
+        except BaseException:
+            with self._lock:
+                self._queue_depth -= 1
+            raise
+
+        try:
+            delay = self._reserve_delay(tokens)
+            if (delay > 0):
+                await asyncio.sleep(delay)
+        except BaseException:
+            with self._lock:
+                self._queue_depth -= 1
+                self._release_slot_locked()
+            raise
+
+        with self._lock:
+            self._queue_depth -= 1
+            self._in_flight += 1
+
+        try:
+            yield
+        except BaseException as exc:
+            self._on_complete(exc)
+            raise
+
+        self._on_complete(None)
+
+
+def _set_future_result(fut: asyncio.Future):
+    if (not fut.done()):
+        fut.set_result(None)
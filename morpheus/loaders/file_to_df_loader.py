@@ -13,8 +13,10 @@
 # limitations under the License.
 """Loader for fetching files and emitting them as DataFrames."""
 
+import json
 import logging
 import pickle
+import threading
 
 import fsspec
 
@@ -29,6 +31,11 @@ from morpheus.utils.loader_utils import register_loader
 
 logger = logging.getLogger(__name__)
 
+# Controllers are shared by every control message with the same loader config, keeping the index of the batch cache
+# in memory rather than scanning the cache directory for each message
+_controllers: dict[str, FileToDFController] = {}
+_controllers_lock = threading.Lock()
+
 
 @register_loader(FILE_TO_DF_LOADER)
 def file_to_df_loader(control_message: ControlMessage, task: dict):
@@ -78,33 +85,61 @@ def file_to_df_loader(control_message: ControlMessage, task: dict):
     filter_null = config.get("filter_null", False)
     parser_kwargs = config.get("parser_kwargs", None)
     cache_dir = config.get("cache_dir", None)
+    cache_format = config.get("cache_format", "pickle")
+    cache_max_bytes = config.get("cache_max_bytes", None)
+    cache_ttl = config.get("cache_ttl", None)
+    cache_compression = config.get("cache_compression", None)
 
     if (cache_dir is None):
         cache_dir = "./.cache"
         logger.warning("Cache directory not set. Defaulting to ./.cache")
 
-    # Load input schema
-    schema = pickle.loads(bytes(schema_str, encoding))
-
-    try:
-        file_type = str_to_file_type(file_type.lower())
-    except Exception as exec_info:
-        raise ValueError(f"Invalid input file type '{file_type}'. Available file types are: CSV, JSON.") from exec_info
-
-    try:
-        controller = FileToDFController(schema=schema,
-                                        filter_null=filter_null,
-                                        file_type=file_type,
-                                        parser_kwargs=parser_kwargs,
-                                        cache_dir=cache_dir,
-                                        timestamp_column_name=timestamp_column_name)
-        pdf = controller.convert_to_dataframe(file_object_batch=(fsspec.open_files(files), n_groups))
-        df = cudf.from_pandas(pdf)
-
-        # Overwriting payload with derived data
-        control_message.payload(MessageMeta(df))
-
-    finally:
-        controller.close()
+    controller_settings = [
+        schema_str,
+        encoding,
+        filter_null,
+        file_type,
+        parser_kwargs,
+        cache_dir,
+        timestamp_column_name,
+        cache_format,
+        cache_max_bytes,
+        cache_ttl,
+        cache_compression
+    ]
+    controller_key = json.dumps(controller_settings, sort_keys=True, default=str)
+
+    with _controllers_lock:
+        controller = _controllers.get(controller_key)
+
+        if (controller is None):
+            # Load input schema
+            schema = pickle.loads(bytes(schema_str, encoding))
+
+            try:
+                file_type = str_to_file_type(file_type.lower())
+            except Exception as exec_info:
+                raise ValueError(
+                    f"Invalid input file type '{file_type}'. Available file types are: CSV, JSON.") from exec_info
+
+            controller = FileToDFController(schema=schema,
+                                            filter_null=filter_null,
+                                            file_type=file_type,
+                                            parser_kwargs=parser_kwargs,
+                                            cache_dir=cache_dir,
+                                            timestamp_column_name=timestamp_column_name,
+                                            cache_format=cache_format,
+                                            cache_max_bytes=cache_max_bytes,
+                                            cache_ttl=cache_ttl,
+                                            cache_compression=cache_compression)
+            _controllers[controller_key] = controller
+
+    pdf = controller.convert_to_dataframe(file_object_batch=(fsspec.open_files(files), n_groups))
+    df = cudf.from_pandas(pdf)
+
+    # Overwriting payload with derived data
+    control_message.payload(MessageMeta(df))
+
+    logger.debug("Batch cache stats: %s", controller.cache_stats)
 
     return control_message
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import functools
 import logging
+import queue
+import threading
 import typing
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from sqlalchemy import create_engine
@@ -26,11 +28,15 @@ from morpheus.messages import ControlMessage
 from morpheus.messages import MessageMeta
 from morpheus.utils.control_message_utils import CMDefaultFailureContextManager
 from morpheus.utils.control_message_utils import cm_skip_processing_if_failed
-from morpheus.utils.execution_chain import ExecutionChain
+from morpheus.utils.loader_ids import SQL_LOADER
 from morpheus.utils.loader_utils import register_loader
 
 logger = logging.getLogger(__name__)
 
+# Number of chunks each query may read ahead of the consumer when queries are run concurrently
+_MAX_QUEUED_CHUNKS = 2
+_END_OF_QUERY = object()
+
 
 def _parse_query_data(
     query_data: dict[str, str | typing.Optional[dict[str, typing.Any]]]
@@ -41,7 +47,7 @@ def _parse_query_data(
     Parameters
     ----------
     query_data : Dict[str, Union[str, Optional[Dict[str, Any]]]]
-        The dictionary containing the query, and params (optional).
+        The dictionary containing the connection string, query, and params (optional).
 
     Returns
     -------
@@ -49,14 +55,19 @@ def _parse_query_data(
         A dictionary containing parsed connection string, query, and params (if present).
     """
 
-    return {"query": query_data["query"], "params": query_data.get("params", None)}
+    return {
+        "connection_string": query_data["connection_string"],
+        "query": query_data["query"],
+        "params": query_data.get("params", None)
+    }
 
 
 def _read_sql(engine_obj: engine.Engine,
               query: str,
-              params: typing.Optional[typing.Dict[str, typing.Any]] = None) -> typing.Dict[str, pd.DataFrame]:
+              params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+              chunksize: typing.Optional[int] = None) -> typing.Iterator[pd.DataFrame]:
     """
-    Creates a DataFrame from a SQL query.
+    Creates DataFrames from a SQL query.
 
     Parameters
     ----------
@@ -66,46 +77,223 @@ def _read_sql(engine_obj: engine.Engine,
         SQL query.
     params : Optional[Dict[str, Any]], default=None
         Parameters to pass to pd.read_sql.
+    chunksize : Optional[int], default=None
+        When set, the result is fetched from the database `chunksize` rows at a time.
 
-    Returns
-    -------
-    Dict[str, pd.DataFrame]
-        A dictionary containing a DataFrame of the SQL query result.
+    Yields
+    ------
+    pd.DataFrame
+        The SQL query result, either as a single DataFrame or one DataFrame per chunk.
     """
 
-    if (params is None):
-        df = pd.read_sql(query, engine_obj)
+    if (chunksize is None):
+        yield pd.read_sql(query, engine_obj, params=params)
     else:
-        df = pd.read_sql(query, engine_obj, params=params)
+        yield from pd.read_sql(query, engine_obj, params=params, chunksize=chunksize)
+
+
+def _produce_query_chunks(engine_obj: engine.Engine,
+                          query_data: dict[str, typing.Any],
+                          chunksize: typing.Optional[int],
+                          out_queue: queue.Queue,
+                          stop_event: threading.Event):
+    """
+    Reads the chunks of a single query into `out_queue`, followed by `_END_OF_QUERY`. Any exception raised is put in
+    the queue in place of a chunk.
+    """
 
-    return {"df": df}
+    def put(item) -> bool:
+        while (not stop_event.is_set()):
+            try:
+                out_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
 
+        return False
 
-def _aggregate_df(df_aggregate: typing.Optional[cudf.DataFrame], df: pd.DataFrame) -> cudf.DataFrame:
+    if (stop_event.is_set()):
+        return
+
+    try:
+        for df in _read_sql(engine_obj, chunksize=chunksize, **query_data):
+            if (not put(df)):
+                return
+
+        put(_END_OF_QUERY)
+    except Exception as e:
+        put(e)
+
+
+def _rebatch(dfs: typing.Iterable[pd.DataFrame], num_rows: int) -> typing.Iterator[pd.DataFrame]:
     """
-    Aggregates two DataFrames.
+    Regroups a stream of DataFrames into DataFrames of exactly `num_rows` rows, except for the last one. When the stream
+    holds no rows, a single empty DataFrame is yielded instead.
+    """
+
+    pending: list[pd.DataFrame] = []
+    pending_rows = 0
+    has_yielded = False
+
+    for df in dfs:
+        pending.append(df)
+        pending_rows += len(df)
+
+        if (pending_rows < num_rows):
+            continue
+
+        df_pending = pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0]
+
+        while (len(df_pending) >= num_rows):
+            yield df_pending.iloc[:num_rows].reset_index(drop=True)
+            has_yielded = True
+            df_pending = df_pending.iloc[num_rows:]
+
+        pending = [df_pending]
+        pending_rows = len(df_pending)
+
+    # Results without any rows still yield an empty DataFrame holding their columns
+    if (pending_rows > 0 or (not has_yielded and len(pending) > 0)):
+        yield pd.concat(pending, ignore_index=True)
+
+
+def iter_sql_chunks(sql_config: dict[str, typing.Any],
+                    chunk_rows: typing.Optional[int] = None) -> typing.Iterator[pd.DataFrame]:
+    """
+    Runs the queries of a SQL loader configuration, yielding the results in the order of the queries. Up to
+    `sql_config["max_workers"]` queries are run concurrently, sharing one pooled engine per connection string, with
+    each query reading at most a few chunks ahead of the consumer.
 
     Parameters
     ----------
-    df_aggregate : Optional[cudf.DataFrame]
-        DataFrame to append the other DataFrame to. If None, returns the converted DataFrame.
-    df : pd.DataFrame
-        DataFrame to append to df_aggregate.
+    sql_config : dict[str, Any]
+        The `sql_config` of a load task, containing the `queries` to run and optionally `max_workers` and `chunksize`.
+    chunk_rows : Optional[int], default=None
+        When set, the results are yielded as DataFrames of `chunk_rows` rows (the last one may be smaller), combining
+        the results of consecutive queries. Otherwise a DataFrame is yielded for each chunk read from the database.
 
-    Returns
-    -------
-    cudf.DataFrame
-        The aggregated DataFrame.
+    Yields
+    ------
+    pd.DataFrame
+        The query results.
     """
 
-    cdf = cudf.from_pandas(df)
-    if (df_aggregate):
-        return df_aggregate.append(cdf)
+    queries = [_parse_query_data(query_data) for query_data in sql_config["queries"]]
+    max_workers = sql_config.get("max_workers", 1)
+    chunksize = sql_config.get("chunksize", chunk_rows)
+
+    engine_registry: dict[str, engine.Engine] = {}
+    for query_data in queries:
+        conn_str = query_data.pop("connection_string")
+        if conn_str not in engine_registry:
+            engine_registry[conn_str] = create_engine(conn_str)
+
+        query_data["engine_obj"] = engine_registry[conn_str]
+
+    def read_sequential() -> typing.Iterator[pd.DataFrame]:
+        for query_data in queries:
+            yield from _read_sql(chunksize=chunksize, **query_data)
 
-    return cdf
+    def read_concurrent(executor: ThreadPoolExecutor, stop_event: threading.Event) -> typing.Iterator[pd.DataFrame]:
+        query_queues = [queue.Queue(maxsize=_MAX_QUEUED_CHUNKS) for _ in queries]
 
+        for (query_data, query_queue) in zip(queries, query_queues):
+            executor.submit(_produce_query_chunks,
+                            query_data.pop("engine_obj"),
+                            query_data,
+                            chunksize,
+                            query_queue,
+                            stop_event)
 
-@register_loader("SQLLoader")
+        for query_queue in query_queues:
+            while ((item := query_queue.get()) is not _END_OF_QUERY):
+                if (isinstance(item, Exception)):
+                    raise item
+
+                yield item
+
+    try:
+        if (max_workers > 1 and len(queries) > 1):
+            stop_event = threading.Event()
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sql_loader") as executor:
+                try:
+                    dfs = read_concurrent(executor, stop_event)
+                    yield from (_rebatch(dfs, chunk_rows) if chunk_rows is not None else dfs)
+                finally:
+                    # Unblock any queries still reading when the consumer stops early or a query fails
+                    stop_event.set()
+        else:
+            dfs = read_sequential()
+            yield from (_rebatch(dfs, chunk_rows) if chunk_rows is not None else dfs)
+    finally:
+        # Dispose all open connections.
+        for engine_obj in engine_registry.values():
+            engine_obj.dispose()
+
+
+def load_sql_chunks(control_message: ControlMessage,
+                    task: typing.Dict[str, typing.Any],
+                    chunk_rows: int,
+                    raise_on_failure: bool = False) -> typing.Iterator[ControlMessage]:
+    """
+    Streaming variant of `sql_loader`, yielding a copy of the control message for each `chunk_rows` rows fetched, so
+    large extractions never need to be held in a single DataFrame.
+
+    Parameters
+    ----------
+    control_message : ControlMessage
+        The control message containing metadata and a payload.
+    task : Dict[str, Any]
+        The task configuration containing SQL config and queries.
+    chunk_rows : int
+        Number of rows in the payload of each control message, the last one may be smaller.
+    raise_on_failure : bool, default=False
+        Whether to raise exceptions. Otherwise the control message is marked as failed and yielded after any chunks
+        already sent.
+
+    Yields
+    ------
+    ControlMessage
+        Copies of the control message, each with a chunk of the results in the payload.
+    """
+
+    if (control_message.has_metadata("cm_failed") and control_message.get_metadata("cm_failed")):
+        yield control_message
+        return
+
+    chunks = iter_sql_chunks(task["sql_config"], chunk_rows=chunk_rows)
+    has_chunks = False
+
+    try:
+        while (True):
+            # Only fetching each chunk is guarded, yielding inside the context manager would swallow `GeneratorExit`
+            # when the consumer stops early
+            chunk_message = None
+            with CMDefaultFailureContextManager(control_message, raise_on_failure=raise_on_failure):
+                df = next(chunks, None)
+                if (df is not None):
+                    chunk_message = control_message.copy()
+                    chunk_message.payload(MessageMeta(cudf.from_pandas(df)))
+
+            if (chunk_message is None):
+                break
+
+            has_chunks = True
+            yield chunk_message
+    finally:
+        chunks.close()
+
+    failed = control_message.has_metadata("cm_failed") and control_message.get_metadata("cm_failed")
+
+    # Like `sql_loader`, queries without any results still send the control message on, with an empty payload
+    if (not failed and not has_chunks):
+        control_message.payload(MessageMeta(cudf.DataFrame()))
+
+    if (failed or not has_chunks):
+        yield control_message
+
+
+@register_loader(SQL_LOADER)
 @cm_skip_processing_if_failed
 def sql_loader(control_message: ControlMessage, task: typing.Dict[str, typing.Any]) -> ControlMessage:
     """
@@ -125,26 +313,9 @@ def sql_loader(control_message: ControlMessage, task: typing.Dict[str, typing.An
     """
 
     with CMDefaultFailureContextManager(control_message):
-        final_df = None
-        engine_registry = {}
-
-        sql_config = task["sql_config"]
-        queries = sql_config["queries"]
-        try:
-            for query_data in queries:
-                conn_str = query_data.pop("connection_string")
-                if conn_str not in engine_registry:
-                    engine_registry[conn_str] = create_engine(conn_str)
-
-                aggregate_df = functools.partial(_aggregate_df, df_aggregate=final_df)
-                read_sql = functools.partial(_read_sql, engine_obj=engine_registry[conn_str])
-                execution_chain = ExecutionChain(function_chain=[_parse_query_data, read_sql, aggregate_df])
-                final_df = execution_chain(query_data=query_data)
-        finally:
-            # Dispose all open connections.
-            for engine_obj in engine_registry.values():
-                engine_obj.dispose()
-
-        control_message.payload(MessageMeta(final_df))
+        # Concatenate the results of every query at once, rather than appending them one query at a time
+        final_df = pd.concat(list(iter_sql_chunks(task["sql_config"])), ignore_index=True)
+
+        control_message.payload(MessageMeta(cudf.from_pandas(final_df)))
 
     return control_message
@@ -175,6 +175,6 @@ class TensorMemory(MessageData, cpp_class=_messages.TensorMemory):
             If the number of rows in `tensor` does not match `count`
         """
         # Ensure that we have 2D array here (`ensure_2d` inserts the wrong axis)
-        reshaped_tensor = tensor if tensor.ndim == 2 else cp.reshape(tensor, (tensor.shape[0], -1))
+        reshaped_tensor = tensor if tensor.ndim == 2 else tensor.reshape((tensor.shape[0], -1))
         self._check_tensor(reshaped_tensor)
         self._tensors[name] = reshaped_tensor
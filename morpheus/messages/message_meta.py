@@ -70,6 +70,122 @@ class MutableTableCtxMgr:
         raise AttributeError(self.ussage_error)
 
 
+class DataFrameView:
+    """
+    Read-only view of a range of rows of the DataFrame held by a MessageMeta, column names, dtypes and columns are
+    returned without copying the underlying data. Not intended to be created directly but is instead returned by the
+    `readonly_dataframe` context manager of MessageMeta or the `readonly_meta` context manager of MultiMessage.
+
+    The view, and any object returned by it, is only valid inside of the `with` block and must not be modified.
+
+    Parameters
+    ----------
+    df : DataFrameType
+        The DataFrame held by the MessageMeta.
+    start : int
+        Position of the first row in the view.
+    stop : int, optional
+        Position one past the last row in the view, by default None (the last row of `df`).
+    """
+
+    def __init__(self, df: DataFrameType, start: int = 0, stop: int = None) -> None:
+        if (stop is None):
+            stop = len(df)
+
+        # Avoid creating a sliced frame when the view covers all of the rows
+        self._is_full = (start == 0 and stop == len(df))
+        self._df = df
+        self._start = start
+        self._stop = stop
+
+    @property
+    def columns(self) -> list[str]:
+        """Names of the columns in the view."""
+        return self._df.columns.to_list()
+
+    @property
+    def dtypes(self) -> pd.Series:
+        """Dtypes of the columns in the view, indexed by column name."""
+        return self._df.dtypes
+
+    @property
+    def df(self) -> DataFrameType:
+        """All columns of the rows in the view."""
+        if (self._is_full):
+            return self._df
+
+        return self._df.iloc[self._start:self._stop]
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def get_column(self, name: str):
+        """
+        Return a single column of the rows in the view.
+
+        Parameters
+        ----------
+        name : str
+            Column name.
+
+        Returns
+        -------
+        Series
+            The column values.
+        """
+        column = self._df[name]
+        if (self._is_full):
+            return column
+
+        return column.iloc[self._start:self._stop]
+
+    def get_columns(self, columns: typing.List[str] = None) -> DataFrameType:
+        """
+        Return a subset of the columns of the rows in the view. Note that pandas may copy the requested columns when
+        they are not all of the columns, prefer `get_column` or `df` on the hot path.
+
+        Parameters
+        ----------
+        columns : typing.List[str], optional
+            Column names, by default None (all columns).
+
+        Returns
+        -------
+        DataFrameType
+            The column values.
+        """
+        if (columns is None):
+            return self.df
+
+        return self._df.iloc[self._start:self._stop, self._df.columns.get_indexer_for(columns)]
+
+
+class ReadOnlyTableCtxMgr:
+    """
+    Context manager for reading the DataFrame held by a MessageMeta without copying it, holds the same lock as
+    `mutable_dataframe` for the duration of the `with` block. Not intended to be used directly but is instead invoked
+    via MessageMeta's `readonly_dataframe` or MultiMessage's `readonly_meta`.
+
+    Works with both the Python and C++ implementations of MessageMeta.
+
+    Examples
+    --------
+    >>> with meta.readonly_dataframe() as view:
+    >>>     lines = serializers.df_to_json(view.df)
+    """
+
+    def __init__(self, meta, start: int = 0, stop: int = None) -> None:
+        self._mutable_ctx = meta.mutable_dataframe()
+        self._start = start
+        self._stop = stop
+
+    def __enter__(self) -> DataFrameView:
+        return DataFrameView(self._mutable_ctx.__enter__(), start=self._start, stop=self._stop)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._mutable_ctx.__exit__(exc_type, exc_value, traceback)
+
+
 @dataclasses.dataclass(init=False)
 class MessageMeta(MessageBase, cpp_class=_messages.MessageMeta):
     """
@@ -118,6 +234,18 @@ class MessageMeta(MessageBase, cpp_class=_messages.MessageMeta):
     def mutable_dataframe(self):
         return MutableTableCtxMgr(self)
 
+    def readonly_dataframe(self) -> ReadOnlyTableCtxMgr:
+        """
+        Context manager returning a `DataFrameView` of the DataFrame without copying it, prefer this over the `df`
+        property and `copy_dataframe` when the DataFrame is only read.
+
+        Returns
+        -------
+        ReadOnlyTableCtxMgr
+            Context manager holding the lock of this MessageMeta while the view is in use.
+        """
+        return ReadOnlyTableCtxMgr(self)
+
     @property
     def count(self) -> int:
         """
@@ -26,6 +26,7 @@ import cudf
 import morpheus._lib.messages as _messages
 from morpheus.messages.message_base import MessageData
 from morpheus.messages.message_meta import MessageMeta
+from morpheus.messages.message_meta import ReadOnlyTableCtxMgr
 
 # Needed to provide the return type of `@classmethod`
 Self = typing.TypeVar("Self", bound="MultiMessage")
@@ -166,6 +167,23 @@ class MultiMessage(MessageData, cpp_class=_messages.MultiMessage):
 
         return self.meta.get_column_names()
 
+    def readonly_meta(self) -> ReadOnlyTableCtxMgr:
+        """
+        Context manager returning a `DataFrameView` of the rows in this message without copying them.
+
+        Returns
+        -------
+        ReadOnlyTableCtxMgr
+            Context manager holding the lock of the underlying MessageMeta while the view is in use.
+
+        Examples
+        --------
+        >>> with multi_message.readonly_meta() as view:
+        >>>     columns = view.columns
+        """
+
+        return ReadOnlyTableCtxMgr(self.meta, start=self.mess_offset, stop=self.mess_offset + self.mess_count)
+
     @typing.overload
     def get_meta(self) -> cudf.DataFrame:
         ...
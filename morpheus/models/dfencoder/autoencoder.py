@@ -62,8 +62,10 @@ from torch.utils.data import DataLoader
 
 from .ae_module import AEModule
 from .dataframe import EncoderDataFrame
+from .dataframe import swap_indices
 from .dataloader import DataframeDataset
 from .dataloader import DFEncoderDataLoader
+from .dataloader import EncodedTensorDataset
 from .dataloader import FileSystemDataset
 from .distributed_ae import DistributedAutoEncoder
 from .logging import BasicLogger
@@ -120,6 +122,10 @@ class AutoEncoder(torch.nn.Module):
             activation='relu',
             min_cats=10,
             swap_probability=.15,
+            swap_encoded=False,
+            cache_encoded_data=False,
+            encoded_data_storage='device',
+            encoded_data_dir=None,
             learning_rate=0.01,
             batch_size=256,
             eval_batch_size=1024,
@@ -183,6 +189,17 @@ class AutoEncoder(torch.nn.Module):
         self.preset_numerical_scaler_params = preset_numerical_scaler_params
 
         self.swap_probability = swap_probability
+        # When set, swap noise is applied to the encoded target tensors instead of the prepared dataframe
+        self.swap_encoded = swap_encoded
+        # When set, dataframes passed to `fit` are encoded once into an `EncodedTensorDataset` held on the device, in
+        # pinned host memory or in memory-mapped files depending on `encoded_data_storage`
+        self.cache_encoded_data = cache_encoded_data
+        if encoded_data_storage not in ('device', 'pinned', 'mmap'):
+            raise ValueError('`encoded_data_storage` must be one of: [device, pinned, mmap].')
+        if encoded_data_storage == 'mmap' and encoded_data_dir is None:
+            raise ValueError('`encoded_data_dir` is required when `encoded_data_storage` is mmap.')
+        self.encoded_data_storage = encoded_data_storage
+        self.encoded_data_dir = encoded_data_dir
         self.batch_size = batch_size
         self.eval_batch_size = eval_batch_size
 
@@ -531,21 +548,57 @@ class AutoEncoder(torch.nn.Module):
         elif self.logger == 'tensorboard':
             self.logger = TensorboardXLogger(logdir=self.logdir, run=self.run, fts=fts)
 
-    def compute_targets(self, df):
-        num = torch.tensor(df[self.num_names].values).float().to(self.device)
-        bin = torch.tensor(df[self.bin_names].astype(int).values).float().to(self.device)
+    def compute_targets(self, df, device=None):
+        device = self.device if device is None else device
+        num = torch.tensor(df[self.num_names].values).float().to(device)
+        bin = torch.tensor(df[self.bin_names].astype(int).values).float().to(device)
         codes = []
         for ft in self.categorical_fts:
-            code = torch.tensor(df[ft].cat.codes.astype(int).values).to(self.device)
+            code = torch.tensor(df[ft].cat.codes.astype(int).values).to(device)
             codes.append(code)
         return num, bin, codes
 
+    def swap_targets(self, num, bin, codes):
+        """Performs random swapping of the tensors returned by `compute_targets`, equivalent to calling
+        `EncoderDataFrame.swap` on the prepared dataframe before computing the targets.
+
+        Parameters
+        ----------
+        num : torch.Tensor
+            Numeric features of shape (n_rows, n_numeric).
+        bin : torch.Tensor
+            Binary features of shape (n_rows, n_binary).
+        codes : list[torch.Tensor]
+            Category codes of shape (n_rows,), one per categorical feature.
+
+        Returns
+        -------
+        Tuple[torch.Tensor, torch.Tensor, list[torch.Tensor]]
+            The swapped numeric features, binary features and category codes.
+        """
+        n_num = num.shape[1]
+        n_bin = bin.shape[1]
+
+        indices = swap_indices(num.shape[0], n_num + n_bin + len(codes), likelihood=self.swap_probability)
+        indices = torch.from_numpy(indices).to(self.device)
+
+        num = torch.gather(num, 0, indices[:, :n_num])
+        bin = torch.gather(bin, 0, indices[:, n_num:n_num + n_bin])
+        codes = [code[indices[:, n_num + n_bin + i]] for (i, code) in enumerate(codes)]
+
+        return num, bin, codes
+
     def encode_input(self, df):
         """
         Handles raw df inputs.
         Passes categories through embedding layers.
         """
-        num, bin, codes = self.compute_targets(df)
+        return self.encode_targets(*self.compute_targets(df))
+
+    def encode_targets(self, num, bin, codes):
+        """
+        Passes the category codes returned by `compute_targets` through embedding layers.
+        """
         embeddings = []
         for i, embedding_layer in enumerate(self.model.categorical_embedding.values()):
             emb = embedding_layer(codes[i])
@@ -557,6 +610,11 @@ class AutoEncoder(torch.nn.Module):
         x = torch.cat(num + bin + embeddings, dim=1)
         return x
 
+    def build_input_tensor_from_targets(self, num, bin, codes):
+        num, bin, embeddings = self.encode_targets(num, bin, codes)
+        x = torch.cat(num + bin + embeddings, dim=1)
+        return x
+
     def preprocess_training_data(self, df, shuffle_rows_in_batch=True):
         """ Wrapper function round `self.preprocess_data` feeding in the args suitable for a training set."""
         return self.preprocess_data(
@@ -605,10 +663,15 @@ class AutoEncoder(torch.nn.Module):
         if shuffle_rows_in_batch:
             df = df.sample(frac=1.0)
         df = self.prepare_df(df)
-        swapped_df = df.swap(likelihood=self.swap_probability)
-        swapped_input_tensor = self.build_input_tensor(swapped_df)
         num_target, bin_target, codes = self.compute_targets(df)
 
+        if self.swap_encoded:
+            num_swapped, bin_swapped, codes_swapped = self.swap_targets(num_target, bin_target, codes)
+            swapped_input_tensor = self.build_input_tensor_from_targets(num_swapped, bin_swapped, codes_swapped)
+        else:
+            swapped_df = df.swap(likelihood=self.swap_probability)
+            swapped_input_tensor = self.build_input_tensor(swapped_df)
+
         preprocessed_data = {
             'input_swapped': swapped_input_tensor,
             'num_target': num_target,
@@ -621,7 +684,107 @@ class AutoEncoder(torch.nn.Module):
             preprocessed_data['input_original'] = self.build_input_tensor(df)
 
         if include_swapped_input_by_feature_type:
-            num_swapped, bin_swapped, codes_swapped = self.compute_targets(swapped_df)
+            if not self.swap_encoded:
+                num_swapped, bin_swapped, codes_swapped = self.compute_targets(swapped_df)
+            preprocessed_data['num_swapped'] = num_swapped
+            preprocessed_data['bin_swapped'] = bin_swapped
+            preprocessed_data['cat_swapped'] = codes_swapped
+
+        return preprocessed_data
+
+    def build_encoded_dataset(self, df):
+        """Prepares and encodes a pandas dataframe once, returning a dataset whose batches are slices of the encoded
+        tensors. Used in place of a `DataframeDataset` when `cache_encoded_data` is set.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            The input dataframe.
+
+        Returns
+        -------
+        EncodedTensorDataset
+            The encoded dataset.
+        """
+        on_host = self.encoded_data_storage in ('pinned', 'mmap')
+        num, bin, codes = self.compute_targets(self.prepare_df(df), device='cpu' if on_host else None)
+
+        return EncodedTensorDataset.from_targets(
+            num,
+            bin,
+            codes,
+            pin_memory=(self.encoded_data_storage == 'pinned'),
+            mmap_dir=(self.encoded_data_dir if self.encoded_data_storage == 'mmap' else None),
+        )
+
+    def preprocess_encoded_training_data(self, batch, shuffle_rows_in_batch=True):
+        """ Wrapper function round `self.preprocess_encoded_data` feeding in the args suitable for a training set."""
+        return self.preprocess_encoded_data(
+            batch,
+            shuffle_rows_in_batch=shuffle_rows_in_batch,
+            include_original_input_tensor=False,
+            include_swapped_input_by_feature_type=False,
+        )
+
+    def preprocess_encoded_validation_data(self, batch, shuffle_rows_in_batch=False):
+        """ Wrapper function round `self.preprocess_encoded_data` feeding in the args suitable for a validation set."""
+        return self.preprocess_encoded_data(
+            batch,
+            shuffle_rows_in_batch=shuffle_rows_in_batch,
+            include_original_input_tensor=True,
+            include_swapped_input_by_feature_type=True,
+        )
+
+    def preprocess_encoded_data(
+        self,
+        batch,
+        shuffle_rows_in_batch,
+        include_original_input_tensor,
+        include_swapped_input_by_feature_type,
+    ):
+        """Equivalent of `preprocess_data` for a batch of an `EncodedTensorDataset`, swap noise is applied to the
+        encoded tensors.
+
+        Parameters
+        ----------
+        batch : Dict[str, Union[torch.Tensor, List[torch.Tensor]]]
+            The `num`, `bin` and `codes` tensors of the batch.
+        shuffle_rows_in_batch : bool
+            Whether to shuffle the rows of the batch before processing.
+        include_original_input_tensor : bool
+            Whether to include the input tensor without swapping in the returned data dict.
+        include_swapped_input_by_feature_type : bool
+            Whether to include the swapped num/bin/cat feature tensors in the returned data dict.
+
+        Returns
+        -------
+        Dict[str, Union[int, torch.Tensor]]
+            A dict containing the preprocessed input data and targets by feature type.
+        """
+        num_target = batch['num'].to(self.device, non_blocking=True)
+        bin_target = batch['bin'].to(self.device, non_blocking=True)
+        codes = [code.to(self.device, non_blocking=True) for code in batch['codes']]
+
+        if shuffle_rows_in_batch:
+            perm = torch.randperm(len(num_target), device=self.device)
+            num_target = num_target[perm]
+            bin_target = bin_target[perm]
+            codes = [code[perm] for code in codes]
+
+        num_swapped, bin_swapped, codes_swapped = self.swap_targets(num_target, bin_target, codes)
+
+        preprocessed_data = {
+            'input_swapped': self.build_input_tensor_from_targets(num_swapped, bin_swapped, codes_swapped),
+            'num_target': num_target,
+            'bin_target': bin_target,
+            'cat_target': codes,
+            'size': len(num_target),
+        }
+
+        if include_original_input_tensor:
+            preprocessed_data['input_original'] = self.build_input_tensor_from_targets(num_target, bin_target, codes)
+
+        if include_swapped_input_by_feature_type:
             preprocessed_data['num_swapped'] = num_swapped
             preprocessed_data['bin_swapped'] = bin_swapped
             preprocessed_data['cat_swapped'] = codes_swapped
@@ -757,7 +920,10 @@ class AutoEncoder(torch.nn.Module):
 
     def _transform_dataset_for_training(self, dataset):
         dataset.batch_size = self.batch_size
-        dataset.preprocess_fn = self.preprocess_training_data
+        if isinstance(dataset, EncodedTensorDataset):
+            dataset.preprocess_fn = self.preprocess_encoded_training_data
+        else:
+            dataset.preprocess_fn = self.preprocess_training_data
         dataset.shuffle_batch_indices = True
         dataset.shuffle_rows_in_batch = True
 
@@ -765,7 +931,10 @@ class AutoEncoder(torch.nn.Module):
 
     def _transform_dataset_for_validation(self, dataset):
         dataset.batch_size = self.eval_batch_size
-        dataset.preprocess_fn = self.preprocess_validation_data
+        if isinstance(dataset, EncodedTensorDataset):
+            dataset.preprocess_fn = self.preprocess_encoded_validation_data
+        else:
+            dataset.preprocess_fn = self.preprocess_validation_data
         dataset.shuffle_batch_indices = False
         dataset.shuffle_rows_in_batch = False
 
@@ -781,7 +950,9 @@ class AutoEncoder(torch.nn.Module):
 
         is_loader = isinstance(data, torch.utils.data.DataLoader)
 
-        if (isinstance(data, pd.DataFrame)):
+        if (isinstance(data, pd.DataFrame) and self.cache_encoded_data):
+            dset = self.build_encoded_dataset(data)
+        elif (isinstance(data, pd.DataFrame)):
             dset = DataframeDataset(df=data)
         elif (isinstance(data, DFEncoderDataLoader)):
             dset = data.dataset
@@ -52,6 +52,35 @@ import numpy as np
 import pandas as pd
 
 
+def swap_indices(n_rows: int, n_cols: int, likelihood: float = .15) -> np.ndarray:
+    """Generates the row gather indices used to perform random swapping of data.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of rows of the data.
+    n_cols : int
+        Number of columns of the data.
+    likelihood : float, optional
+        The probability of a value being randomly replaced with a value from a different row. By default .15
+
+    Returns
+    -------
+    numpy.ndarray
+        An integer array of shape (n_rows, n_cols) holding, for each value, the row to take it from.
+    """
+    n_swaps = int(round(n_rows * likelihood))
+
+    # Rows to take values from, followed by the rows to place them in
+    from_rows = np.random.randint(0, n_rows, size=(n_swaps, n_cols))
+    to_rows = np.random.randint(0, n_rows, size=(n_swaps, n_cols))
+
+    indices = np.repeat(np.arange(n_rows).reshape(-1, 1), repeats=n_cols, axis=1)
+    indices[to_rows, np.arange(n_cols)] = from_rows
+
+    return indices
+
+
 class EncoderDataFrame(pd.DataFrame):
 
     def __init__(self, *args, **kwargs):
@@ -60,6 +89,8 @@ class EncoderDataFrame(pd.DataFrame):
     def swap(self, likelihood=.15):
         """Performs random swapping of data.
 
+        Each column is gathered from its own typed values, so the frame is never converted to an object matrix.
+
         Parameters
         ----------
         likelihood : float, optional
@@ -70,25 +101,11 @@ class EncoderDataFrame(pd.DataFrame):
         pandas.DataFrame
             A copy of the dataframe with equal size.
         """
-        #select values to swap
-        tot_rows = self.__len__()
-        n_rows = int(round(tot_rows * likelihood))
-        n_cols = len(self.columns)
-
-        def gen_indices():
-            column = np.repeat(np.arange(n_cols).reshape(1, -1), repeats=n_rows, axis=0)
-            row = np.random.randint(0, tot_rows, size=(n_rows, n_cols))
-            return row, column
-
-        row, column = gen_indices()
-        new_mat = self.values
-        to_place = new_mat[row, column]
-
-        row, column = gen_indices()
-        new_mat[row, column] = to_place
-
-        dtypes = {col: typ for col, typ in zip(self.columns, self.dtypes)}
-        result = EncoderDataFrame(columns=self.columns, data=new_mat)
-        result = result.astype(dtypes, copy=False)
+        indices = swap_indices(len(self), len(self.columns), likelihood=likelihood)
+
+        swapped = {i: self.iloc[:, i].array.take(indices[:, i]) for i in range(len(self.columns))}
+
+        result = EncoderDataFrame(swapped)
+        result.columns = self.columns
 
         return result
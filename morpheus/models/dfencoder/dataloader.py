@@ -13,14 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import logging
 import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
+import torch
 from torch.utils.data import DataLoader
 from torch.utils.data import Dataset
 from torch.utils.data.distributed import DistributedSampler
 
+logger = logging.getLogger(__name__)
+
 
 class DFEncoderDataLoader(DataLoader):
 
@@ -163,8 +172,12 @@ class DFEncoderDataLoader(DataLoader):
 class FileSystemDataset(Dataset):
     """ A dataset class that reads data in batches from a folder and applies preprocessing to each batch.
     * This class assumes that the data is saved in small csv files in one folder.
+    * Row counts for each file are stored in a small index file inside the data folder so that the cumulative row
+      offsets don't need to be recomputed each time the dataset is constructed.
     """
 
+    INDEX_FILENAME = ".dfencoder_index.json"
+
     def __init__(
         self,
         data_folder,
@@ -174,6 +187,9 @@ class FileSystemDataset(Dataset):
         shuffle_rows_in_batch=True,
         shuffle_batch_indices=False,
         preload_data_into_memory=False,
+        max_cached_files=8,
+        prefetch_batches=0,
+        persist_index=True,
     ):
         """Initialize a `DatasetFromPath` object.
 
@@ -196,9 +212,17 @@ class FileSystemDataset(Dataset):
         preload_data_into_memory : bool, optional
             Whether to preload all the data into memory, by default False.
             (Can speed up data loading if the data can fit into memory)
+        max_cached_files : int, optional
+            The maximum number of parsed files to keep in an in-memory LRU cache, by default 8. Ignored when
+            `preload_data_into_memory` is True. Set to 0 to disable caching.
+        prefetch_batches : int, optional
+            The number of upcoming batches whose files are loaded in a background thread, by default 0 (disabled).
+            Prefetching assumes batches are requested in order and requires `max_cached_files` > 0.
+        persist_index : bool, optional
+            Whether to read/write the per-file row counts from/to an index file in `data_folder`, by default True.
         """
         self._data_folder = data_folder
-        self._filenames = sorted(os.listdir(data_folder))
+        self._filenames = sorted(fn for fn in os.listdir(data_folder) if fn != self.INDEX_FILENAME)
         self._preprocess_fn = preprocess_fn
         self._load_data_fn = load_data_fn
 
@@ -206,15 +230,86 @@ class FileSystemDataset(Dataset):
         if preload_data_into_memory:
             self._preloaded_data = {fn: self._load_data_fn(f"{self._data_folder}/{fn}") for fn in self._filenames}
 
-        self._file_sizes = {
-            fn: self._get_file_len(fn) - 1 if not self._preloaded_data else len(self._preloaded_data[fn])
-            for fn in self._filenames
-        }
-        self._count = sum(v for v in self._file_sizes.values())
+        if self._preloaded_data:
+            self._file_sizes = {fn: len(self._preloaded_data[fn]) for fn in self._filenames}
+        else:
+            self._file_sizes = self._build_file_sizes(persist_index)
+
+        # Cumulative row offsets, `self._file_offsets[i]` is the global row index of the first row in file i
+        self._file_offsets = np.cumsum([0] + [self._file_sizes[fn] for fn in self._filenames])
+        self._count = int(self._file_offsets[-1])
         self._batch_size = batch_size
         self._shuffle_rows_in_batch = shuffle_rows_in_batch
         self._shuffle_batch_indices = shuffle_batch_indices
 
+        self._max_cached_files = max_cached_files
+        self._prefetch_batches = prefetch_batches if max_cached_files > 0 else 0
+        self._init_cache()
+
+    def _init_cache(self):
+        """Private method for (re)creating the non-picklable LRU cache and prefetch state."""
+        self._file_cache = OrderedDict()
+        self._pending_loads = {}
+        self._cache_lock = threading.Lock()
+        self._prefetch_executor = None
+
+    def __getstate__(self):
+        # The lock, futures and executor can't be pickled, which is required when used with a multi-worker DataLoader
+        state = self.__dict__.copy()
+        for key in ("_file_cache", "_pending_loads", "_cache_lock", "_prefetch_executor"):
+            del state[key]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_cache()
+
+    def _build_file_sizes(self, persist_index):
+        """Private method for building the number of rows in each file, reusing the persisted index when the file
+        size and modification time of an entry match the file on disk.
+
+        Parameters
+        ----------
+        persist_index : bool
+            Whether to read/write the index file in the data folder.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of data rows in each file.
+        """
+        index_path = os.path.join(self._data_folder, self.INDEX_FILENAME)
+        index = {}
+        if persist_index and os.path.exists(index_path):
+            try:
+                with open(index_path, encoding="utf-8") as f:
+                    index = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning("Unable to read dataset index '%s', rebuilding: %s", index_path, e)
+                index = {}
+
+        file_sizes = {}
+        new_index = {}
+        index_changed = False
+        for fn in self._filenames:
+            stat = os.stat(os.path.join(self._data_folder, fn))
+            entry = index.get(fn)
+            if entry is None or entry.get("size") != stat.st_size or entry.get("mtime_ns") != stat.st_mtime_ns:
+                entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "rows": self._get_file_len(fn)}
+                index_changed = True
+
+            new_index[fn] = entry
+            file_sizes[fn] = entry["rows"]
+
+        if persist_index and (index_changed or len(new_index) != len(index)):
+            try:
+                with open(index_path, "w", encoding="utf-8") as f:
+                    json.dump(new_index, f)
+            except OSError as e:
+                logger.warning("Unable to write dataset index '%s': %s", index_path, e)
+
+        return file_sizes
+
     def _get_file_len(self, fn, file_include_header_line=True):
         """Private method for getting the number of lines in a file.
 
@@ -230,8 +325,17 @@ class FileSystemDataset(Dataset):
         int
             The number of lines in the file.
         """
-        with open(f"{self._data_folder}/{fn}") as f:
-            count = sum(1 for _ in f)
+        count = 0
+        last_chunk = b""
+        with open(f"{self._data_folder}/{fn}", "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                count += chunk.count(b"\n")
+                last_chunk = chunk
+
+        # Account for a final line without a trailing newline
+        if last_chunk and not last_chunk.endswith(b"\n"):
+            count += 1
+
         return count - 1 if file_include_header_line else count
 
     @property
@@ -266,8 +370,11 @@ class FileSystemDataset(Dataset):
         if self._shuffle_batch_indices:
             indices = np.arange(len(self))
             np.random.shuffle(indices)
-        for i in indices:
-            yield self[i]
+        try:
+            for i in indices:
+                yield self[i]
+        finally:
+            self.close()
 
     def __getitem__(self, idx):
         """Gets the item at the given index in the dataset.
@@ -283,26 +390,103 @@ class FileSystemDataset(Dataset):
             A dictionary containing the preprocessed data for the current batch. 
             Example: {"batch_index": 0, "data": {"data1": tensor1, "data2": tensor2}}
         """
+        data = [self._get_data_from_filename(fn)[start:end] for (fn, start, end) in self._get_batch_slices(idx)]
+
+        if self._prefetch_batches > 0:
+            if idx + 1 < len(self):
+                self._prefetch(idx)
+            else:
+                # Nothing is left to prefetch once the last batch is read, the executor is recreated for the next epoch
+                self.close()
+
+        return self._preprocess(pd.concat(data), batch_index=idx)
+
+    def _get_batch_slices(self, idx):
+        """Returns the file slices that make up the batch at the given index.
+
+        Parameters
+        ----------
+        idx : int
+            The index of the batch.
+
+        Returns
+        -------
+        List[Tuple[str, int, int]]
+            A list of `(filename, start, end)` tuples, where `start` and `end` are row offsets within the file.
+        """
         start = idx * self._batch_size
-        end = (idx + 1) * self._batch_size
+        end = min((idx + 1) * self._batch_size, self._count)
 
-        data = []
-        curr_cnt = 0
-        for fn in self._filenames:
-            f_count = self._file_sizes[fn]
-            curr_cnt = f_count
+        slices = []
+        file_idx = int(np.searchsorted(self._file_offsets, start, side="right")) - 1
+        while start < end and file_idx < len(self._filenames):
+            file_start = int(self._file_offsets[file_idx])
+            file_end = int(self._file_offsets[file_idx + 1])
+            if file_end > start:
+                slice_end = min(end, file_end)
+                slices.append((self._filenames[file_idx], start - file_start, slice_end - file_start))
+                start = slice_end
+            file_idx += 1
 
-            if start < curr_cnt and end <= curr_cnt:
-                data.append(self._get_data_from_filename(fn)[start:end])
-                return self._preprocess(pd.concat(data), batch_index=idx)
+        return slices
 
-            if start < curr_cnt and end > curr_cnt:
-                data.append(self._get_data_from_filename(fn)[start:])
-            start = max(0, start - curr_cnt)
-            end = end - curr_cnt
+    def _prefetch(self, idx):
+        """Schedules background loading of the files needed by the next `prefetch_batches` batches.
 
-        # clear out last batch
-        return self._preprocess(pd.concat(data), batch_index=idx)
+        Parameters
+        ----------
+        idx : int
+            The index of the batch currently being returned.
+        """
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dfencoder_prefetch")
+
+        for next_idx in range(idx + 1, min(idx + 1 + self._prefetch_batches, len(self))):
+            for (fn, _, _) in self._get_batch_slices(next_idx):
+                with self._cache_lock:
+                    if fn in self._file_cache or fn in self._pending_loads:
+                        continue
+                    self._pending_loads[fn] = self._prefetch_executor.submit(self._load_and_cache, fn)
+
+    def close(self):
+        """Shuts down the background prefetch thread, cancelling any loads which haven't started yet. Called
+        automatically once the last batch is read or iterating through the dataset stops, prefetching resumes when
+        further batches are read.
+        """
+        if self._prefetch_executor is None:
+            return
+
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        self._prefetch_executor = None
+
+        # Cancelled loads never remove themselves, loads which are already running complete in the background
+        with self._cache_lock:
+            self._pending_loads = {fn: future for (fn, future) in self._pending_loads.items() if not future.cancelled()}
+
+    def _load_and_cache(self, filename):
+        """Loads the given file and stores it in the LRU cache, evicting the least recently used entries.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the file to load.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Loaded data.
+        """
+        try:
+            df = self._load_data_fn(f"{self._data_folder}/{filename}")
+            with self._cache_lock:
+                self._file_cache[filename] = df
+                self._file_cache.move_to_end(filename)
+                while len(self._file_cache) > self._max_cached_files:
+                    self._file_cache.popitem(last=False)
+            return df
+        finally:
+            with self._cache_lock:
+                self._pending_loads.pop(filename, None)
 
     def _get_data_from_filename(self, filename):
         """Returns the data from the given file as a pandas.DataFrame.
@@ -319,7 +503,21 @@ class FileSystemDataset(Dataset):
         """
         if self._preloaded_data:
             return self._preloaded_data[filename]
-        return self._load_data_fn(f"{self._data_folder}/{filename}")
+
+        if self._max_cached_files <= 0:
+            return self._load_data_fn(f"{self._data_folder}/{filename}")
+
+        with self._cache_lock:
+            df = self._file_cache.get(filename)
+            if df is not None:
+                self._file_cache.move_to_end(filename)
+                return df
+            pending = self._pending_loads.get(filename)
+
+        if pending is not None:
+            return pending.result()
+
+        return self._load_and_cache(filename)
 
     def _preprocess(self, df, batch_index):
         """Preprocesses the given dataframe and returns a dictionary containing the preprocessed data.
@@ -454,8 +652,11 @@ class DataframeDataset(Dataset):
             indices = np.arange(len(self))
             np.random.shuffle(indices)
 
-        for i in indices:
-            yield self[i]
+        try:
+            for i in indices:
+                yield self[i]
+        finally:
+            self.close()
 
     def __getitem__(self, idx):
         """Gets the item (batch) at the given index in the dataset.
@@ -530,3 +731,145 @@ class DataframeDataset(Dataset):
     @shuffle_batch_indices.setter
     def shuffle_batch_indices(self, value):
         self._shuffle_batch_indices = value
+
+
+class EncodedTensorDataset(DataframeDataset):
+
+    def __init__(
+        self,
+        num,
+        bin,
+        codes,
+        batch_size=128,
+        preprocess_fn=lambda x, **kwargs: x,
+        shuffle_rows_in_batch=True,
+        shuffle_batch_indices=False,
+    ):
+        """A dataset holding features which have already been encoded by `AutoEncoder.compute_targets` in contiguous
+        tensors. Like `DataframeDataset`, one batch is returned at a time, however the batches are slices (views) of
+        the tensors so no pandas work is performed per batch or per epoch.
+        Use `from_targets` to construct the dataset from the output of `AutoEncoder.compute_targets`.
+
+        Parameters
+        ----------
+        num : torch.Tensor
+            Numeric features of shape (n_rows, n_numeric).
+        bin : torch.Tensor
+            Binary features of shape (n_rows, n_binary).
+        codes : torch.Tensor
+            Category codes of shape (n_categorical, n_rows).
+        batch_size : int
+            The size of the batches to read the data in.
+        preprocess_fn : function
+            A function to preprocess the data, which should take a dictionary with the `num`, `bin` and `codes`
+            tensors of a batch and a boolean indicating whether to shuffle rows in batch or not, and return a
+            dictionary containing the preprocessed data.
+        shuffle_rows_in_batch : bool, optional
+            Whether to shuffle the rows within each batch, by default True.
+        shuffle_batch_indices : bool, optional
+            Whether to shuffle the order when iterating through the dataset (affects the __iter__ functionality)
+        """
+        self._num = num
+        self._bin = bin
+        self._codes = codes
+        self._preprocess_fn = preprocess_fn
+
+        self._count = len(num)
+        self._batch_size = batch_size
+        self._shuffle_rows_in_batch = shuffle_rows_in_batch
+        self._shuffle_batch_indices = shuffle_batch_indices
+
+    @classmethod
+    def from_targets(cls, num, bin, codes, device=None, pin_memory=False, mmap_dir=None, **kwargs):
+        """Creates a dataset from the tensors returned by `AutoEncoder.compute_targets`, copying them into contiguous
+        buffers.
+
+        Parameters
+        ----------
+        num : torch.Tensor
+            Numeric features of shape (n_rows, n_numeric).
+        bin : torch.Tensor
+            Binary features of shape (n_rows, n_binary).
+        codes : list[torch.Tensor]
+            Category codes of shape (n_rows,), one per categorical feature.
+        device : torch.device, optional
+            Device to hold the buffers on, by default None (keep the device of the inputs). Ignored when `pin_memory`
+            or `mmap_dir` is set.
+        pin_memory : bool, optional
+            Whether to hold the buffers in pinned host memory, allowing asynchronous copies to the GPU, by default
+            False.
+        mmap_dir : str, optional
+            When set, the buffers are held in memory-mapped files created in this directory. The files are unlinked
+            immediately and removed by the OS once the dataset is garbage collected. By default None.
+        **kwargs
+            Additional arguments passed to the constructor.
+
+        Returns
+        -------
+        EncodedTensorDataset
+            The dataset.
+        """
+        if len(codes) > 0:
+            codes = torch.stack(codes)
+        else:
+            codes = torch.empty((0, len(num)), dtype=torch.int64, device=num.device)
+
+        tensors = []
+        for tensor in (num, bin, codes):
+            if mmap_dir is not None:
+                tensor = cls._to_mmap(tensor, mmap_dir)
+            elif pin_memory:
+                tensor = tensor.cpu().contiguous().pin_memory()
+            else:
+                tensor = tensor.to(device).contiguous()
+
+            tensors.append(tensor)
+
+        return cls(*tensors, **kwargs)
+
+    @staticmethod
+    def _to_mmap(tensor, mmap_dir):
+        array = tensor.cpu().numpy()
+
+        os.makedirs(mmap_dir, exist_ok=True)
+        (fd, path) = tempfile.mkstemp(dir=mmap_dir, suffix=".bin")
+        os.close(fd)
+
+        try:
+            mapped = np.memmap(path, dtype=array.dtype, mode="w+", shape=array.shape)
+        finally:
+            # The mapping stays valid after the file is unlinked
+            os.unlink(path)
+
+        mapped[...] = array
+
+        return torch.from_numpy(mapped)
+
+    @property
+    def num_samples(self):
+        """Returns the number of samples in the dataset. """
+        return self._count
+
+    def __getitem__(self, idx):
+        """Gets the item (batch) at the given index in the dataset.
+
+        Parameters
+        ----------
+        idx : int
+            The index of the item to get.
+
+        Returns
+        -------
+        Dict[str, Union[int, Dict[str, torch.Tensor]]]
+            A dictionary containing the preprocessed data for the current batch.
+            Example: {"batch_index": 0, "data": {"data1": tensor1, "data2": tensor2}}
+        """
+        start = idx * self._batch_size
+        end = (idx + 1) * self._batch_size
+
+        batch = {
+            "num": self._num[start:end],
+            "bin": self._bin[start:end],
+            "codes": list(self._codes[:, start:end]),
+        }
+        return self._preprocess(batch, batch_index=idx)
@@ -26,6 +26,7 @@ from morpheus.modules import from_control_message
 from morpheus.modules import mlflow_model_writer
 from morpheus.modules import payload_batcher
 from morpheus.modules import serialize
+from morpheus.modules import sql_chunk_loader
 from morpheus.modules import to_control_message
 from morpheus.modules import write_to_elasticsearch
 from morpheus.modules import write_to_file
@@ -41,6 +42,7 @@ __all__ = [
     "modules",
     "payload_batcher",
     "serialize",
+    "sql_chunk_loader",
     "to_control_message",
     "write_to_file",
     "write_to_elasticsearch"
@@ -48,6 +48,10 @@ def file_to_df(builder: mrc.Builder):
         - parser_kwargs (dict): Keyword arguments to pass to the parser.
         - schema (dict): Schema of the input data.
         - timestamp_column_name (str): Name of the timestamp column.
+        - cache_format (str): Format of the cached batches, "pickle" or "arrow"; default is "pickle".
+        - cache_max_bytes (int): Maximum total size of the batch cache in bytes; default is None (unbounded).
+        - cache_ttl (float): Maximum age of a cached batch in seconds; default is None (unbounded).
+        - cache_compression (str): Compression for the "arrow" cache format, "lz4" or "zstd"; default is None.
     """
 
     config = builder.get_current_module_config()
@@ -65,6 +69,10 @@ def file_to_df(builder: mrc.Builder):
     filter_null = config.get("filter_null", False)
     parser_kwargs = config.get("parser_kwargs", None)
     cache_dir = config.get("cache_dir", None)
+    cache_format = config.get("cache_format", "pickle")
+    cache_max_bytes = config.get("cache_max_bytes", None)
+    cache_ttl = config.get("cache_ttl", None)
+    cache_compression = config.get("cache_compression", None)
 
     if (cache_dir is None):
         cache_dir = "./.cache"
@@ -83,7 +91,11 @@ def file_to_df(builder: mrc.Builder):
                                     file_type=file_type,
                                     parser_kwargs=parser_kwargs,
                                     cache_dir=cache_dir,
-                                    timestamp_column_name=timestamp_column_name)
+                                    timestamp_column_name=timestamp_column_name,
+                                    cache_format=cache_format,
+                                    cache_max_bytes=cache_max_bytes,
+                                    cache_ttl=cache_ttl,
+                                    cache_compression=cache_compression)
 
     node = builder.make_node(FILE_TO_DF, ops.map(controller.convert_to_dataframe), ops.on_completed(controller.close))
 
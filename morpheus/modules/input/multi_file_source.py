@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import logging
+import re
 import time
 import typing
 
@@ -21,6 +22,7 @@ import mrc
 from pydantic import ValidationError
 
 from morpheus.modules.schemas.multi_file_source_schema import MultiFileSourceSchema
+from morpheus.utils.file_discovery import IncrementalFileDiscovery
 from morpheus.utils.module_utils import ModuleLoaderFactory
 from morpheus.utils.module_utils import register_module
 
@@ -96,6 +98,14 @@ def _multi_file_source(builder: mrc.Builder):
         - 'watch_dir': Boolean indicating whether to watch the directory for changes.
         - 'watch_interval': Time interval (in seconds) for watching the directory.
         - 'batch_size': The number of files to process in a batch.
+        - 'late_arrival_window': When watching, files modified this many seconds before the newest discovered file
+          are still discovered, older files are skipped. By default None, discovering every new file.
+        - 'partition_regex': When watching, regex with the named groups `year` and optionally `month`, `day` and
+          `hour` matching date partitioned directories, partitions ending before the window are not listed.
+        - 'cursor_file': When watching, local file the discovery cursor is saved to, allowing discovery to continue
+          where it left off after a restart.
+        - 'use_inotify': When watching, watch local directories with inotify, when available, only listing the changed
+          directories.
     """
     module_config = builder.get_current_module_config()
     source_config = module_config.get('source_config', {})
@@ -116,7 +126,13 @@ def _multi_file_source(builder: mrc.Builder):
     batch_size = validated_config.batch_size
 
     def polling_generate_frames_fsspec():
-        files_seen = set()
+        partition_regex = validated_config.partition_regex
+        discovery = IncrementalFileDiscovery(
+            filenames,
+            late_arrival_window=validated_config.late_arrival_window,
+            partition_regex=re.compile(partition_regex) if partition_regex is not None else None,
+            cursor_file=validated_config.cursor_file,
+            use_inotify=validated_config.use_inotify)
 
         while True:
             start_time = time.monotonic()
@@ -128,12 +144,9 @@ def _multi_file_source(builder: mrc.Builder):
                 time.sleep(watch_interval)
                 continue
 
-            files = fsspec.open_files(filenames)
-
-            new_files = [file for file in files if file.full_name not in files_seen]
-
-            # Update files_seen with the new set of files
-            files_seen.update(file.full_name for file in new_files)
+            # Only lists the directories which may contain new files
+            files = discovery.discover()
+            new_files = list(files)
 
             # Process new files in batches
             batch = []
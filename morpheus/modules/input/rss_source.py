@@ -52,6 +52,9 @@ def _rss_source(builder: mrc.Builder):
         run_indefinitely: True,
         "stop_after_rec": 0,
         "strip_markup": True,
+        "max_concurrent_requests": 16,
+        "max_requests_per_host": 2,
+        "feed_state_file": "./.cache/rss_feed_state.json",
     }
     """
 
@@ -74,7 +77,10 @@ def _rss_source(builder: mrc.Builder):
                                cache_dir=validated_config.cache_dir,
                                cooldown_interval=validated_config.cooldown_interval_sec,
                                request_timeout=validated_config.request_timeout_sec,
-                               strip_markup=validated_config.strip_markup)
+                               strip_markup=validated_config.strip_markup,
+                               max_concurrent_requests=validated_config.max_concurrent_requests,
+                               max_requests_per_host=validated_config.max_requests_per_host,
+                               feed_state_file=validated_config.feed_state_file)
 
     stop_requested = False
 
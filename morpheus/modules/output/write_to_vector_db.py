@@ -14,16 +14,17 @@
 
 import logging
 import pickle
-import time
 import typing
-from dataclasses import dataclass
 
+import cupy as cp
 import mrc
+import numpy as np
 from mrc.core import operators as ops
 from pydantic import ValidationError
 
 import cudf
 
+from morpheus.controllers.write_to_vector_db_controller import WriteToVectorDBController
 from morpheus.messages import ControlMessage
 from morpheus.messages import MultiMessage
 from morpheus.messages import MultiResponseMessage
@@ -69,13 +70,6 @@ def preprocess_vdb_resources(service, recreate: bool, resource_schemas: dict):
             service.create(name=resource_name, **resource_schema_config)
 
 
-@dataclass
-class AccumulationStats:
-    msg_count: int
-    last_insert_time: float
-    data: list[cudf.DataFrame]
-
-
 @register_module(WRITE_TO_VECTOR_DB, MORPHEUS_MODULE_NAMESPACE)
 def _write_to_vector_db(builder: mrc.Builder):
     """
@@ -100,6 +94,13 @@ def _write_to_vector_db(builder: mrc.Builder):
     - 'batch_size': int, accumulates messages until reaching the specified batch size for writing to VDB.
     - 'write_time_interval': float, specifies the time interval (in seconds) for writing messages, or writing messages
     when the accumulated batch size is reached.
+    - 'max_concurrent_inserts': int, maximum number of resources being inserted into concurrently (default is 2).
+    - 'flush_rows': int, flush a resource after this many rows have been inserted since its last flush (default is
+    None).
+    - 'flush_interval': float, flush a resource after this many seconds since its last flush (default is None).
+    - 'flush_on_completion': bool, flush each resource once all messages have been written (default is True).
+
+    Inserts run in the background, accumulating new messages while the previous batch of a resource is being inserted.
 
     Raises
     ------
@@ -128,8 +129,6 @@ def _write_to_vector_db(builder: mrc.Builder):
     resource_kwargs = write_to_vdb_config.resource_kwargs
     resource_schemas = write_to_vdb_config.resource_schemas
     service_kwargs = write_to_vdb_config.service_kwargs
-    batch_size = write_to_vdb_config.batch_size
-    write_time_interval = write_to_vdb_config.write_time_interval
 
     # Check if service is serialized and convert if needed
     # pylint: disable=not-a-mapping
@@ -138,25 +137,27 @@ def _write_to_vector_db(builder: mrc.Builder):
 
     preprocess_vdb_resources(service, recreate, resource_schemas)
 
-    accumulator_dict = {default_resource_name: AccumulationStats(msg_count=0, last_insert_time=time.time(), data=[])}
+    controller = WriteToVectorDBController(service,
+                                           resource_kwargs=resource_kwargs,
+                                           embedding_column_name=embedding_column_name,
+                                           batch_size=write_to_vdb_config.batch_size,
+                                           write_time_interval=write_to_vdb_config.write_time_interval,
+                                           max_concurrent_inserts=write_to_vdb_config.max_concurrent_inserts,
+                                           flush_rows=write_to_vdb_config.flush_rows,
+                                           flush_interval=write_to_vdb_config.flush_interval,
+                                           flush_on_completion=write_to_vdb_config.flush_on_completion)
 
     def on_completed():
-        final_df_references = []
-
-        # Pushing remaining messages
-        for key, accum_stats in accumulator_dict.items():
-            try:
-                if accum_stats.data:
-                    merged_df = cudf.concat(accum_stats.data)
-                    service.insert_dataframe(name=key, df=merged_df)
-                    final_df_references.append(accum_stats.data)
-            except Exception as e:
-                logger.error("Unable to upload dataframe entries to vector database: %s", e)
-        # Close vector database service connection
-        service.close()
+        try:
+            # Insert the remaining rows and wait for all inserts to complete
+            controller.close()
+        finally:
+            # Close vector database service connection
+            service.close()
 
     def extract_df(msg: typing.Union[ControlMessage, MultiResponseMessage, MultiMessage]):
         df = None
+        embeddings = None
         resource_name = None
 
         if isinstance(msg, ControlMessage):
@@ -168,26 +169,28 @@ def _write_to_vector_db(builder: mrc.Builder):
         elif isinstance(msg, MultiResponseMessage):
             df = msg.get_meta()
             if df is not None and not df.empty:
-                embeddings = msg.get_probs_tensor()
-                df[embedding_column_name] = embeddings.tolist()
+                # Keep the embeddings as a single contiguous host array rather than a column of Python lists
+                embeddings = np.ascontiguousarray(cp.asnumpy(msg.get_probs_tensor()), dtype=np.float32)
+                if (embeddings.ndim != 2 or len(embeddings) != len(df)):
+                    df[embedding_column_name] = embeddings.tolist()
+                    embeddings = None
         elif isinstance(msg, MultiMessage):
             df = msg.get_meta()
         else:
             raise RuntimeError(f"Unexpected message type '{type(msg)}' was encountered.")
 
-        return df, resource_name
+        return df, embeddings, resource_name
 
     def on_data(msg: typing.Union[ControlMessage, MultiResponseMessage, MultiMessage]):
         msg_resource_target = None
         try:
-            df, msg_resource_target = extract_df(msg)
+            df, embeddings, msg_resource_target = extract_df(msg)
 
             if df is not None and not df.empty:
                 if (not isinstance(df, cudf.DataFrame)):
                     df = cudf.DataFrame(df)
 
                 df_size = len(df)
-                current_time = time.time()
 
                 # Use default resource name
                 if not msg_resource_target:
@@ -196,51 +199,25 @@ def _write_to_vector_db(builder: mrc.Builder):
                         logger.error("Resource not exists in the vector database: %s", msg_resource_target)
                         raise ValueError(f"Resource not exists in the vector database: {msg_resource_target}")
 
-                if msg_resource_target in accumulator_dict:
-                    accumulator: AccumulationStats = accumulator_dict[msg_resource_target]
-                    accumulator.msg_count += df_size
-                    accumulator.data.append(df)
-                else:
-                    accumulator_dict[msg_resource_target] = AccumulationStats(msg_count=df_size,
-                                                                              last_insert_time=time.time(),
-                                                                              data=[df])
-
-                for key, accum_stats in accumulator_dict.items():
-                    if accum_stats.msg_count >= batch_size or (accum_stats.last_insert_time != -1 and
-                                                               (current_time - accum_stats.last_insert_time)
-                                                               >= write_time_interval):
-                        if accum_stats.data:
-                            merged_df = cudf.concat(accum_stats.data)
-
-                            # pylint: disable=not-a-mapping
-                            service.insert_dataframe(name=key, df=merged_df, **resource_kwargs)
-                            # Reset accumulator stats
-                            accum_stats.data.clear()
-                            accum_stats.last_insert_time = current_time
-                            accum_stats.msg_count = 0
-
-                        if (isinstance(msg, ControlMessage)):
-                            msg.set_metadata(
-                                "insert_response",
-                                {
-                                    "status": "inserted",
-                                    "accum_count": 0,
-                                    "insert_count": df_size,
-                                    "succ_count": df_size,
-                                    "err_count": 0
-                                })
+                insert_count = controller.write(msg_resource_target, df, embeddings=embeddings)
+
+                if (isinstance(msg, ControlMessage)):
+                    # Inserts complete asynchronously, so the outcome isn't known yet. Failures are logged and counted
+                    # in the controller's stats
+                    if (insert_count > 0):
+                        msg.set_metadata("insert_response", {
+                            "status": "submitted", "accum_count": 0, "insert_count": insert_count
+                        })
                     else:
-                        logger.debug("Accumulated %d rows for collection: %s", accum_stats.msg_count, key)
-                        if (isinstance(msg, ControlMessage)):
-                            msg.set_metadata(
-                                "insert_response",
-                                {
-                                    "status": "accumulated",
-                                    "accum_count": df_size,
-                                    "insert_count": 0,
-                                    "succ_count": 0,
-                                    "err_count": 0
-                                })
+                        msg.set_metadata(
+                            "insert_response",
+                            {
+                                "status": "accumulated",
+                                "accum_count": df_size,
+                                "insert_count": 0,
+                                "succ_count": 0,
+                                "err_count": 0
+                            })
 
                 return msg
 
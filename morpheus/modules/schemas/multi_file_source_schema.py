@@ -14,6 +14,7 @@
 
 import logging
 from typing import List
+from typing import Optional
 
 from pydantic import BaseModel
 from pydantic import Field
@@ -26,6 +27,10 @@ class MultiFileSourceSchema(BaseModel):
     watch_dir: bool = False
     watch_interval: float = 1.0
     batch_size: int = 128
+    late_arrival_window: Optional[float] = None
+    partition_regex: Optional[str] = None
+    cursor_file: Optional[str] = None
+    use_inotify: bool = False
 
     class Config:
         extra = "forbid"
@@ -14,6 +14,7 @@
 
 import logging
 from typing import List
+from typing import Optional
 
 from pydantic import BaseModel
 from pydantic import Field
@@ -32,6 +33,9 @@ class RSSSourceSchema(BaseModel):
     interval_sec: int = 600
     stop_after_rec: int = 0
     strip_markup: bool = True
+    max_concurrent_requests: int = 16
+    max_requests_per_host: int = 2
+    feed_state_file: Optional[str] = None
 
     class Config:
         extra = "forbid"
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import logging
+import typing
 
 from pydantic import BaseModel
 from pydantic import Field
@@ -38,6 +39,10 @@ class WriteToVDBSchema(BaseModel):
     service_kwargs: dict = Field(default_factory=dict)
     batch_size: int = 1024
     write_time_interval: float = 1.0
+    max_concurrent_inserts: int = 2
+    flush_rows: typing.Optional[int] = None
+    flush_interval: typing.Optional[float] = None
+    flush_on_completion: bool = True
 
     @validator('service', pre=True)
     def validate_service(cls, to_validate):  # pylint: disable=no-self-argument
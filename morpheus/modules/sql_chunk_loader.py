@@ -0,0 +1,70 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import typing
+
+import mrc
+from mrc.core import operators as ops
+
+from morpheus.loaders.sql_loader import load_sql_chunks
+from morpheus.messages import ControlMessage
+from morpheus.utils.loader_ids import SQL_LOADER
+from morpheus.utils.module_ids import MORPHEUS_MODULE_NAMESPACE
+from morpheus.utils.module_ids import SQL_CHUNK_LOADER
+from morpheus.utils.module_utils import register_module
+
+logger = logging.getLogger(__name__)
+
+
+@register_module(SQL_CHUNK_LOADER, MORPHEUS_MODULE_NAMESPACE)
+def sql_chunk_loader(builder: mrc.Builder):
+    """
+    Streams the results of `SQLLoader` load tasks, emitting a copy of the control message for every `chunk_rows`
+    rows fetched instead of loading the entire result into a single payload. Control messages whose next load task
+    is not for the `SQLLoader` are passed through unchanged, allowing this module to be placed before a `DataLoader`.
+
+    Parameters
+    ----------
+    builder : mrc.Builder
+        The mrc Builder object used to configure the module.
+
+    Notes
+    -----
+    Configurable Parameters:
+        - chunk_rows (int): The number of rows in the payload of each control message (default: 100000).
+        - raise_on_failure (bool): Whether to raise an exception if a failure occurs during processing (default: False).
+    """
+
+    config = builder.get_current_module_config()
+    chunk_rows = config.get("chunk_rows", 100000)
+    raise_on_failure = config.get("raise_on_failure", False)
+
+    if (chunk_rows <= 0):
+        raise ValueError(f"chunk_rows must be greater than 0, got {chunk_rows}")
+
+    def on_next(control_message: ControlMessage) -> typing.Iterable[ControlMessage]:
+        load_tasks = control_message.get_tasks().get("load", [])
+        if (len(load_tasks) == 0 or load_tasks[0].get("loader_id") != SQL_LOADER):
+            return [control_message]
+
+        task = control_message.remove_task("load")
+
+        # A generator, allowing each chunk to be sent downstream as soon as it has been fetched
+        return load_sql_chunks(control_message, task, chunk_rows=chunk_rows, raise_on_failure=raise_on_failure)
+
+    node = builder.make_node(SQL_CHUNK_LOADER, ops.map(on_next), ops.flatten())
+
+    builder.register_module_input("input", node)
+    builder.register_module_output("output", node)
@@ -54,6 +54,9 @@ def write_to_elasticsearch(builder: mrc.Builder):
     raise_on_exception = config.get("raise_on_exception", False)
     pickled_func_config = config.get("pickled_func_config", None)
     refresh_period_secs = config.get("refresh_period_secs", 2400)
+    max_chunk_bytes = config.get("max_chunk_bytes", 10 * 1024 * 1024)
+    max_concurrent_requests = config.get("max_concurrent_requests", 4)
+    max_retries = config.get("max_retries", 3)
 
     if pickled_func_config:
         pickled_func_str = pickled_func_config.get("pickled_func_str")
@@ -65,13 +68,16 @@ def write_to_elasticsearch(builder: mrc.Builder):
 
     controller = ElasticsearchController(connection_kwargs=connection_kwargs,
                                          raise_on_exception=raise_on_exception,
-                                         refresh_period_secs=refresh_period_secs)
+                                         refresh_period_secs=refresh_period_secs,
+                                         max_chunk_bytes=max_chunk_bytes,
+                                         max_concurrent_requests=max_concurrent_requests,
+                                         max_retries=max_retries)
 
     def on_data(message: ControlMessage):
 
         df = message.payload().df.to_pandas()
 
-        controller.df_to_parallel_bulk_write(index=index, df=df)
+        controller.df_to_bulk_write(index=index, df=df)
 
         return message
 
@@ -44,6 +44,11 @@ def write_to_file(builder: mrc.Builder):
             - flush (bool): If true, flush the file after each write; Example: `false`; Default: false
             - include_index_col (bool): If true, include the index column; Example: `false`; Default: true
             - overwrite (bool): If true, overwrite the file if it exists; Example: `true`; Default: false
+            - compression (str): Compression of the output file; Example: `gzip`; Default: None
+            - max_file_size (int): Size in bytes after which the output is rotated to a new file;
+                Example: `1073741824`; Default: None
+            - row_group_size (int): Number of rows per Parquet row group or Arrow record batch; Example: `10000`;
+                Default: 100000
     """
     config = builder.get_current_module_config()
 
@@ -52,12 +57,18 @@ def write_to_file(builder: mrc.Builder):
     flush = config.get("flush", False)
     file_type = config.get("file_type", FileTypes.Auto)
     include_index_col = config.get("include_index_col", True)
+    compression = config.get("compression", None)
+    max_file_size = config.get("max_file_size", None)
+    row_group_size = config.get("row_group_size", 100000)
 
     controller = WriteToFileController(filename=filename,
                                        overwrite=overwrite,
                                        file_type=file_type,
                                        include_index_col=include_index_col,
-                                       flush=flush)
+                                       flush=flush,
+                                       compression=compression,
+                                       max_file_size=max_file_size,
+                                       row_group_size=row_group_size)
 
     node = builder.make_node(WRITE_TO_FILE, mrc.core.operators.build(controller.node_fn))
 
@@ -33,9 +33,12 @@ All objects related to building and running a pipeline.
 # isort: off
 
 from morpheus.pipeline.boundary_stage_mixin import BoundaryStageMixin
+from morpheus.pipeline.execution_mode_mixins import GpuAndCpuMixin
 from morpheus.pipeline.preallocator_mixin import PreallocatorMixin
 from morpheus.pipeline.stage_schema import PortSchema
 from morpheus.pipeline.stage_schema import StageSchema
+from morpheus.pipeline.stage_metrics import StageMetrics
+from morpheus.pipeline.stage_metrics import StageMetricsRegistry
 from morpheus.pipeline.sender import Sender
 from morpheus.pipeline.receiver import Receiver
 from morpheus.pipeline.stage_base import StageBase
@@ -0,0 +1,30 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC
+
+from morpheus.config import ExecutionMode
+
+
+class GpuAndCpuMixin(ABC):
+    """
+    Mixin intended to be added to stages which support both the GPU and CPU execution modes. In CPU mode these stages
+    receive and emit messages holding pandas DataFrames and NumPy arrays, and must not convert them to cuDF or CuPy.
+    """
+
+    def supported_execution_modes(self) -> tuple[ExecutionMode, ...]:
+        """
+        Returns the execution modes supported by this stage.
+        """
+        return (ExecutionMode.GPU, ExecutionMode.CPU)
@@ -30,6 +30,8 @@ from tqdm import tqdm
 
 import morpheus.pipeline as _pipeline  # pylint: disable=cyclic-import
 from morpheus.config import Config
+from morpheus.config import CppConfig
+from morpheus.config import ExecutionMode
 from morpheus.utils.type_utils import pretty_print_type_name
 
 logger = logging.getLogger(__name__)
@@ -67,6 +69,16 @@ class Pipeline():
 
         self._id_counter = 0
         self._num_threads = config.num_threads
+        self._execution_mode = config.execution_mode
+
+        # Value of `CppConfig.get_should_use_cpp()` to restore once a CPU pipeline stops
+        self._restore_should_use_cpp: bool = None
+
+        self._stage_metrics: _pipeline.StageMetricsRegistry = None
+        if (config.stage_metrics is not None):
+            # Each stage can hold at most the contents of its input channel plus the message being processed
+            self._stage_metrics = _pipeline.StageMetricsRegistry(config.stage_metrics,
+                                                                 max_pending=config.edge_buffer_size + 1)
 
         # Complete set of nodes across segments in this pipeline
         self._stages: typing.List[_pipeline.Stage] = []
@@ -95,6 +107,13 @@ class Pipeline():
     def state(self) -> PipelineState:
         return self._state
 
+    @property
+    def stage_metrics(self) -> typing.Optional["_pipeline.StageMetricsRegistry"]:
+        """
+        The metrics of every stage, None unless enabled by `Config.stage_metrics`.
+        """
+        return self._stage_metrics
+
     def _assert_not_built(self):
         assert self._state == PipelineState.INITIALIZED, "Pipeline has already been built. Cannot modify pipeline."
 
@@ -113,6 +132,10 @@ class Pipeline():
         self._assert_not_built()
         assert stage._pipeline is None or stage._pipeline is self, "A stage can only be added to one pipeline at a time"
 
+        if (self._execution_mode not in stage.supported_execution_modes()):
+            raise RuntimeError(f"Stage '{stage.name}' does not support the {self._execution_mode.value} execution "
+                               f"mode, supported modes: {[mode.value for mode in stage.supported_execution_modes()]}")
+
         segment_nodes = self._segments[segment_id]["nodes"]
         segment_graph = self._segment_graphs[segment_id]
 
@@ -291,6 +314,31 @@ class Pipeline():
         assert self._state == PipelineState.INITIALIZED, "Pipeline can only be built once!"
         assert len(self._sources) > 0, "Pipeline must have a source stage"
 
+        self._disable_cpp_for_cpu_mode()
+
+        try:
+            self._build()
+        except Exception:
+            self._restore_cpp()
+            raise
+
+    def _disable_cpp_for_cpu_mode(self):
+        if (self._execution_mode != ExecutionMode.CPU):
+            return
+
+        # Messages choose between their Python and C++ implementations globally, the C++ messages hold cuDF
+        # DataFrames and CuPy arrays. The setting only applies while the pipeline is built and run, any other pipeline
+        # running in the same process at the same time is affected as well.
+        logger.info("Executing the pipeline on the CPU, disabling C++ nodes and messages")
+        self._restore_should_use_cpp = CppConfig.get_should_use_cpp()
+        CppConfig.set_should_use_cpp(False)
+
+    def _restore_cpp(self):
+        if (self._restore_should_use_cpp is not None):
+            CppConfig.set_should_use_cpp(self._restore_should_use_cpp)
+            self._restore_should_use_cpp = None
+
+    def _build(self):
         self._pre_build()
 
         logger.info("====Registering Pipeline====")
@@ -396,6 +444,9 @@ class Pipeline():
 
         self._mrc_executor.start()
 
+        if (self._stage_metrics is not None):
+            self._stage_metrics.start()
+
         logger.info("====Pipeline Started====")
 
         async def post_start(executor):
@@ -451,6 +502,11 @@ class Pipeline():
     def _on_stop(self):
         self._mrc_executor = None
 
+        self._restore_cpp()
+
+        if (self._stage_metrics is not None):
+            self._stage_metrics.stop()
+
     async def build_and_start(self):
 
         if (self._state == PipelineState.INITIALIZED):
@@ -27,6 +27,7 @@ import mrc
 import morpheus.pipeline as _pipeline  # pylint: disable=cyclic-import
 from morpheus.config import Config
 from morpheus.config import CppConfig
+from morpheus.config import ExecutionMode
 from morpheus.utils.atomic_integer import AtomicInteger
 from morpheus.utils.type_utils import _DecoratorType
 
@@ -285,11 +286,20 @@ class StageBase(ABC, collections.abc.Hashable):
         # return False
         pass
 
+    def supported_execution_modes(self) -> tuple[ExecutionMode, ...]:
+        """
+        Returns the execution modes supported by this stage, by default only `ExecutionMode.GPU`. Stages which also
+        support `ExecutionMode.CPU` should add the `GpuAndCpuMixin`.
+        """
+        return (ExecutionMode.GPU, )
+
     def _build_cpp_node(self):
         """
         Specifies whether to build a C++ node. Only should be called during the build phase.
         """
-        return CppConfig.get_should_use_cpp() and self.supports_cpp_node()
+        # The C++ nodes and messages hold cuDF DataFrames and CuPy arrays
+        return (self._config.execution_mode == ExecutionMode.GPU and CppConfig.get_should_use_cpp()
+                and self.supports_cpp_node())
 
     def can_pre_build(self, check_ports=False) -> bool:
         """
@@ -390,11 +400,28 @@ class StageBase(ABC, collections.abc.Hashable):
 
         in_ports_nodes = [x.get_input_node(builder=builder) for x in self.input_ports]
 
+        # Boundary stages connect directly to the segment's ingress and egress ports
+        stage_metrics = self._pipeline.stage_metrics
+        if (isinstance(self, _pipeline.BoundaryStageMixin)):
+            stage_metrics = None
+
+        if (stage_metrics is not None):
+            in_ports_nodes = [
+                stage_metrics.build_input_probe(builder, self.unique_name, port_idx, node)
+                for (port_idx, node) in enumerate(in_ports_nodes)
+            ]
+
         out_ports_nodes = self._build(builder=builder, input_nodes=in_ports_nodes)
 
         # Allow stages to do any post build steps (i.e., for sinks, or timing functions)
         out_ports_nodes = self._post_build(builder=builder, out_ports_nodes=out_ports_nodes)
 
+        if (stage_metrics is not None):
+            out_ports_nodes = [
+                stage_metrics.build_output_probe(builder, self.unique_name, port_idx, node)
+                for (port_idx, node) in enumerate(out_ports_nodes)
+            ]
+
         assert len(out_ports_nodes) == len(self.output_ports), \
             "Build must return same number of output pairs as output ports"
 
@@ -0,0 +1,441 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Opt-in instrumentation recording the throughput and processing time of every stage in a pipeline."""
+
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+import typing
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import mrc
+import pandas as pd
+from mrc.core import operators as ops
+
+import cudf
+
+from morpheus.config import ConfigStageMetrics
+from morpheus.messages import ControlMessage
+from morpheus.messages import MessageMeta
+from morpheus.messages import MultiMessage
+
+logger = logging.getLogger(__name__)
+
+
+def _get_meta_size(meta: MessageMeta) -> int:
+    with meta.readonly_dataframe() as view:
+        return int(view.df.memory_usage(index=False, deep=False).sum())
+
+
+def get_message_size(msg: typing.Any) -> tuple[int, int]:
+    """
+    Returns the number of rows and the approximate number of bytes of a message. The bytes of DataFrames are the
+    in-memory size of their columns, not including the contents of Python objects held by pandas columns.
+
+    Parameters
+    ----------
+    msg : typing.Any
+        The message.
+
+    Returns
+    -------
+    tuple[int, int]
+        The number of rows and bytes, a message which is not a DataFrame or does not hold one counts as a single row of
+        zero bytes unless it is a `str` or `bytes`.
+    """
+    if (isinstance(msg, (str, bytes))):
+        return (1, len(msg))
+
+    if (isinstance(msg, (cudf.DataFrame, pd.DataFrame))):
+        return (len(msg), int(msg.memory_usage(index=False, deep=False).sum()))
+
+    if (isinstance(msg, MessageMeta)):
+        return (msg.count, _get_meta_size(msg))
+
+    if (isinstance(msg, MultiMessage)):
+        # Attribute the bytes of the DataFrame in proportion to the rows of the message
+        meta_count = msg.meta.count
+        meta_size = _get_meta_size(msg.meta)
+        return (msg.mess_count, (meta_size * msg.mess_count) // meta_count if meta_count > 0 else 0)
+
+    if (isinstance(msg, ControlMessage)):
+        payload = msg.payload()
+        if (payload is None):
+            return (0, 0)
+
+        return (payload.count, _get_meta_size(payload))
+
+    if (isinstance(msg, list)):
+        sizes = [get_message_size(x) for x in msg]
+        return (sum(rows for (rows, _) in sizes), sum(num_bytes for (_, num_bytes) in sizes))
+
+    return (1, 0)
+
+
+class StageMetrics:
+    """
+    Metrics of a single stage, updated by probe nodes placed on the edges into and out of the stage.
+
+    The processing time of a message is the time between the message being received by the stage's input probe and
+    being emitted by its output probe, which includes the time the message was queued in the stage's input channel.
+    Messages which are emitted unchanged are matched exactly. Otherwise the output is matched with the oldest message
+    received, which is only approximate for stages which do not emit one message per message received. At most
+    `max_pending` received messages are tracked, older ones are discarded.
+
+    Parameters
+    ----------
+    stage_name : str
+        Unique name of the stage.
+    latency_buckets : typing.List[float]
+        Sorted upper bounds in seconds of the buckets of the processing time histogram.
+    max_pending : int
+        Maximum number of received messages tracked while waiting for the stage to emit them.
+    """
+
+    def __init__(self, stage_name: str, latency_buckets: typing.List[float], max_pending: int):
+        self._stage_name = stage_name
+        self._latency_buckets = sorted(latency_buckets)
+        self._max_pending = max_pending
+
+        self._lock = threading.Lock()
+        self._pending: OrderedDict[int, float] = OrderedDict()
+
+        self._messages_in = 0
+        self._messages_out = 0
+        self._rows_out = 0
+        self._bytes_out = 0
+        self._first_output_time: float = None
+        self._last_output_time: float = None
+
+        # The last bucket counts the observations greater than all of the bounds
+        self._latency_counts = [0] * (len(self._latency_buckets) + 1)
+        self._latency_sum = 0.0
+        self._latency_count = 0
+
+    @property
+    def stage_name(self) -> str:
+        """
+        Unique name of the stage.
+        """
+        return self._stage_name
+
+    def on_input(self, msg: typing.Any) -> typing.Any:
+        """
+        Record a message received by the stage, returning the message unchanged.
+        """
+        current_time = time.perf_counter()
+
+        with self._lock:
+            self._messages_in += 1
+
+            self._pending[id(msg)] = current_time
+            if (len(self._pending) > self._max_pending):
+                self._pending.popitem(last=False)
+
+        return msg
+
+    def on_output(self, msg: typing.Any) -> typing.Any:
+        """
+        Record a message emitted by the stage, returning the message unchanged.
+        """
+        (num_rows, num_bytes) = get_message_size(msg)
+        current_time = time.perf_counter()
+
+        with self._lock:
+            self._messages_out += 1
+            self._rows_out += num_rows
+            self._bytes_out += num_bytes
+
+            if (self._first_output_time is None):
+                self._first_output_time = current_time
+            self._last_output_time = current_time
+
+            input_time = self._pending.pop(id(msg), None)
+            if (input_time is None and len(self._pending) > 0):
+                (_, input_time) = self._pending.popitem(last=False)
+
+            if (input_time is not None):
+                latency = current_time - input_time
+                self._latency_counts[bisect.bisect_left(self._latency_buckets, latency)] += 1
+                self._latency_sum += latency
+                self._latency_count += 1
+
+        return msg
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        """
+        Returns a consistent copy of the metrics of the stage.
+
+        Returns
+        -------
+        dict[str, typing.Any]
+            The counters of messages received and emitted, the rows and bytes emitted in total and per second since the
+            first message was emitted, the number of received messages not yet emitted (`backlog`), and the processing
+            time histogram with cumulative bucket counts.
+        """
+        with self._lock:
+            elapsed = 0.0
+            if (self._first_output_time is not None):
+                elapsed = self._last_output_time - self._first_output_time
+
+            cumulative_counts = []
+            total = 0
+            for count in self._latency_counts:
+                total += count
+                cumulative_counts.append(total)
+
+            return {
+                "stage": self._stage_name,
+                "messages_in": self._messages_in,
+                "messages_out": self._messages_out,
+                "rows_out": self._rows_out,
+                "bytes_out": self._bytes_out,
+                "rows_per_sec": self._rows_out / elapsed if elapsed > 0 else 0.0,
+                "bytes_per_sec": self._bytes_out / elapsed if elapsed > 0 else 0.0,
+                "backlog": len(self._pending),
+                "processing_seconds": {
+                    "buckets": dict(zip([*self._latency_buckets, float("inf")], cumulative_counts)),
+                    "sum": self._latency_sum,
+                    "count": self._latency_count,
+                },
+            }
+
+
+class _PrometheusHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = self.server.registry.to_prometheus_text().encode("UTF-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class StageMetricsRegistry:
+    """
+    Holds the `StageMetrics` of every stage of a pipeline and exports them, created by the pipeline when
+    `Config.stage_metrics` is set.
+
+    When enabled, `StageBase.build` places a probe node on each input and output edge of every stage, so each message
+    is passed through two additional Python nodes per stage. When disabled, nothing is added to the pipeline.
+
+    Parameters
+    ----------
+    config : `morpheus.config.ConfigStageMetrics`
+        Instrumentation configuration.
+    max_pending : int
+        Maximum number of received messages each stage tracks while waiting for the stage to emit them.
+    """
+
+    _PROMETHEUS_COUNTERS = [
+        ("messages_in", "Messages received by the stage"),
+        ("messages_out", "Messages emitted by the stage"),
+        ("rows_out", "Rows emitted by the stage"),
+        ("bytes_out", "Approximate bytes emitted by the stage"),
+    ]
+
+    _PROMETHEUS_GAUGES = [
+        ("rows_per_sec", "Rows emitted per second by the stage"),
+        ("bytes_per_sec", "Approximate bytes emitted per second by the stage"),
+        ("backlog", "Messages received by the stage which have not been emitted yet"),
+    ]
+
+    def __init__(self, config: ConfigStageMetrics, max_pending: int):
+        self._config = config
+        self._max_pending = max_pending
+
+        self._lock = threading.Lock()
+        self._stages: dict[str, StageMetrics] = {}
+
+        self._http_server: ThreadingHTTPServer = None
+        self._http_thread: threading.Thread = None
+        self._json_thread: threading.Thread = None
+        self._stop_event = threading.Event()
+
+    @property
+    def prometheus_address(self) -> tuple[str, int] | None:
+        """
+        The address the Prometheus endpoint is bound to while exporting, None otherwise.
+        """
+        if (self._http_server is None):
+            return None
+
+        return self._http_server.server_address[:2]
+
+    def get_stage_metrics(self, stage_name: str) -> StageMetrics:
+        """
+        Returns the metrics of a stage, creating them if they don't exist.
+
+        Parameters
+        ----------
+        stage_name : str
+            Unique name of the stage.
+
+        Returns
+        -------
+        StageMetrics
+            The metrics of the stage.
+        """
+        with self._lock:
+            metrics = self._stages.get(stage_name)
+            if (metrics is None):
+                metrics = StageMetrics(stage_name, self._config.latency_buckets, self._max_pending)
+                self._stages[stage_name] = metrics
+
+            return metrics
+
+    def build_input_probe(self, builder: mrc.Builder, stage_name: str, port_idx: int,
+                          input_node: mrc.SegmentObject) -> mrc.SegmentObject:
+        """
+        Build a node recording the messages received from `input_node`, returning the node to use as the input of
+        the stage instead.
+        """
+        metrics = self.get_stage_metrics(stage_name)
+        node = builder.make_node(f"{stage_name}-metrics-in-{port_idx}", ops.map(metrics.on_input))
+        builder.make_edge(input_node, node)
+
+        return node
+
+    def build_output_probe(self, builder: mrc.Builder, stage_name: str, port_idx: int,
+                           output_node: mrc.SegmentObject) -> mrc.SegmentObject:
+        """
+        Build a node recording the messages emitted by `output_node`, returning the node to use as the output of the
+        stage instead.
+        """
+        metrics = self.get_stage_metrics(stage_name)
+        node = builder.make_node(f"{stage_name}-metrics-out-{port_idx}", ops.map(metrics.on_output))
+        builder.make_edge(output_node, node)
+
+        return node
+
+    def snapshot(self) -> list[dict[str, typing.Any]]:
+        """
+        Returns the metrics of every stage, see `StageMetrics.snapshot`.
+        """
+        with self._lock:
+            stages = list(self._stages.values())
+
+        return [metrics.snapshot() for metrics in stages]
+
+    def to_json(self) -> str:
+        """
+        Returns the metrics of every stage as a JSON document.
+        """
+        snapshots = self.snapshot()
+        for snapshot in snapshots:
+            buckets = snapshot["processing_seconds"]["buckets"]
+            snapshot["processing_seconds"]["buckets"] = {str(bound): count for (bound, count) in buckets.items()}
+
+        return json.dumps({"timestamp": time.time(), "stages": snapshots}, indent=2)
+
+    def to_prometheus_text(self) -> str:
+        """
+        Returns the metrics of every stage in the Prometheus text exposition format.
+        """
+        snapshots = self.snapshot()
+        lines = []
+
+        def add_metric(name: str, metric_type: str, description: str, key: str):
+            lines.append(f"# HELP morpheus_stage_{name} {description}")
+            lines.append(f"# TYPE morpheus_stage_{name} {metric_type}")
+            for snapshot in snapshots:
+                lines.append(f'morpheus_stage_{name}{{stage="{snapshot["stage"]}"}} {snapshot[key]}')
+
+        for (key, description) in self._PROMETHEUS_COUNTERS:
+            add_metric(f"{key}_total", "counter", description, key)
+
+        for (key, description) in self._PROMETHEUS_GAUGES:
+            add_metric(key, "gauge", description, key)
+
+        lines.append("# HELP morpheus_stage_processing_seconds Time between a message being received and emitted")
+        lines.append("# TYPE morpheus_stage_processing_seconds histogram")
+        for snapshot in snapshots:
+            histogram = snapshot["processing_seconds"]
+            stage_name = snapshot["stage"]
+            for (bound, count) in histogram["buckets"].items():
+                bound_str = "+Inf" if bound == float("inf") else str(bound)
+                lines.append(f'morpheus_stage_processing_seconds_bucket{{stage="{stage_name}",le="{bound_str}"}} '
+                             f'{count}')
+            lines.append(f'morpheus_stage_processing_seconds_sum{{stage="{stage_name}"}} {histogram["sum"]}')
+            lines.append(f'morpheus_stage_processing_seconds_count{{stage="{stage_name}"}} {histogram["count"]}')
+
+        return "\n".join(lines) + "\n"
+
+    def write_json(self):
+        """
+        Write the metrics of every stage to `ConfigStageMetrics.json_file`, replacing the previous contents atomically.
+        """
+        tmp_file = f"{self._config.json_file}.tmp"
+        with open(tmp_file, "w", encoding="UTF-8") as f:
+            f.write(self.to_json())
+
+        os.replace(tmp_file, self._config.json_file)
+
+    def _json_loop(self):
+        while (not self._stop_event.wait(self._config.json_interval_secs)):
+            try:
+                self.write_json()
+            except Exception:
+                logger.exception("Unable to write the stage metrics to: %s", self._config.json_file)
+
+    def start(self):
+        """
+        Start serving the Prometheus endpoint and periodically writing the JSON file, if configured.
+        """
+        self._stop_event.clear()
+
+        if (self._config.prometheus_port is not None):
+            self._http_server = ThreadingHTTPServer((self._config.prometheus_host, self._config.prometheus_port),
+                                                    _PrometheusHandler)
+            self._http_server.daemon_threads = True
+            self._http_server.registry = self
+
+            self._http_thread = threading.Thread(target=self._http_server.serve_forever,
+                                                 name="stage-metrics-http",
+                                                 daemon=True)
+            self._http_thread.start()
+
+            logger.info("Serving stage metrics on http://%s:%d/metrics", *self.prometheus_address)
+
+        if (self._config.json_file is not None):
+            self._json_thread = threading.Thread(target=self._json_loop, name="stage-metrics-json", daemon=True)
+            self._json_thread.start()
+
+    def stop(self):
+        """
+        Stop exporting the metrics, writing the JSON file a final time. Does nothing if not started.
+        """
+        self._stop_event.set()
+
+        if (self._json_thread is not None):
+            self._json_thread.join()
+            self._json_thread = None
+            self.write_json()
+
+        if (self._http_server is not None):
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_thread.join()
+            self._http_server = None
+            self._http_thread = None
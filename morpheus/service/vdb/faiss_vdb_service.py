@@ -13,10 +13,17 @@
 # limitations under the License.
 
 import asyncio
+import contextlib
+import glob
+import json
 import logging
+import os
+import pickle
+import threading
 import time
 import typing
 
+import numpy as np
 import pandas as pd
 
 import cudf
@@ -30,25 +37,58 @@ IMPORT_EXCEPTION = None
 IMPORT_ERROR_MESSAGE = "FaissDBResourceService requires the FAISS library to be installed."
 
 try:
+    import faiss
+    from langchain.docstore.in_memory import InMemoryDocstore
     from langchain.embeddings.base import Embeddings
     from langchain.vectorstores.faiss import FAISS
 except ImportError as import_exc:
     IMPORT_EXCEPTION = import_exc
 
 
+def _fsync_file(path: str):
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+
+
 class FaissVectorDBResourceService(VectorDBResourceService):
     """
     Represents a service for managing resources in a FAISS Vector Database.
 
+    A resource is made up of a base index, stored in the LangChain format as `<name>.faiss` and `<name>.pkl`, and zero
+    or more append-only delta segments stored as `<name>.delta-<seq>.faiss` and `<name>.delta-<seq>.pkl`. Inserted rows
+    are buffered in an in-memory delta which is written out as a new segment once it reaches `delta_flush_rows` rows,
+    existing files are never rewritten by an insert. Searches query every segment and merge the results. Calling
+    `compact` merges all of the delta segments into the base index.
+
+    A compaction writes the merged index to temporary files, then commits by atomically writing a manifest,
+    `<name>.compact.json`, listing the temporary files and the merged delta segments. Only then are the base index
+    files replaced and the delta segments removed. If the process stops part way through, loading the resource
+    completes a committed compaction or discards an uncommitted one, so a base index is never paired with the wrong
+    docstore and merged rows are never applied twice.
+
     Parameters
     ----------
     parent : FaissVectorDBService
         The parent service for this resource.
     name : str
         The name of the resource.
+    mmap : bool, optional
+        When `True`, index files are opened with `faiss.IO_FLAG_MMAP` so that loading does not read the index data into
+        memory (for index types supporting it), by default False.
+    delta_flush_rows : int, optional
+        Number of buffered rows after which the in-memory delta is written to disk as a new segment, by default 10000.
+    auto_compact_segments : int, optional
+        When set, a background compaction is started once the number of delta segments on disk reaches this value, by
+        default None (only compact when `compact` is called).
     """
 
-    def __init__(self, parent: "FaissVectorDBService", *, name: str) -> None:
+    def __init__(self,
+                 parent: "FaissVectorDBService",
+                 *,
+                 name: str,
+                 mmap: bool = False,
+                 delta_flush_rows: int = 10000,
+                 auto_compact_segments: int = None) -> None:
         if IMPORT_EXCEPTION is not None:
             raise ImportError(IMPORT_ERROR_MESSAGE) from IMPORT_EXCEPTION
 
@@ -57,11 +97,128 @@ class FaissVectorDBResourceService(VectorDBResourceService):
         self._parent = parent
         self._folder_path = self._parent._local_dir
         self._index_name = name
+        self._mmap = mmap
+        self._delta_flush_rows = delta_flush_rows
+        self._auto_compact_segments = auto_compact_segments
+
+        self._lock = threading.RLock()
+        self._compact_thread: threading.Thread = None
+
+        self._recover_compaction()
+
+        self._index = self._load_store(self._index_name)
+
+        # Delta segments already written to disk, in insertion order
+        self._delta_names: list[str] = sorted(
+            os.path.basename(path)[:-len(".faiss")]
+            for path in glob.glob(os.path.join(self._folder_path, glob.escape(self._index_name) + ".delta-*.faiss")))
+        self._deltas: list["FAISS"] = [self._load_store(delta_name) for delta_name in self._delta_names]
+        self._next_delta_seq = max((int(n.rsplit("-", 1)[1]) for n in self._delta_names), default=-1) + 1
+
+        # Rows inserted since the last flush
+        self._active_delta: "FAISS" = None
+
+    def _load_store(self, index_name: str) -> "FAISS":
+        store_kwargs = {}
+        if (hasattr(self, "_index")):
+            # Delta segments share the distance settings of the base index
+            store_kwargs = {
+                "normalize_L2": self._index._normalize_L2, "distance_strategy": self._index.distance_strategy
+            }
 
-        self._index = FAISS.load_local(folder_path=self._parent._local_dir,
-                                       embeddings=self._parent._embeddings,
-                                       index_name=self._index_name,
-                                       allow_dangerous_deserialization=True)
+        if (not self._mmap):
+            return FAISS.load_local(folder_path=self._folder_path,
+                                    embeddings=self._parent._embeddings,
+                                    index_name=index_name,
+                                    allow_dangerous_deserialization=True,
+                                    **store_kwargs)
+
+        index = faiss.read_index(os.path.join(self._folder_path, f"{index_name}.faiss"), faiss.IO_FLAG_MMAP)
+
+        with open(os.path.join(self._folder_path, f"{index_name}.pkl"), "rb") as f:
+            (docstore, index_to_docstore_id) = pickle.load(f)
+
+        return FAISS(self._parent._embeddings, index, docstore, index_to_docstore_id, **store_kwargs)
+
+    def _path(self, file_name: str) -> str:
+        return os.path.join(self._folder_path, file_name)
+
+    @property
+    def _manifest_path(self) -> str:
+        return self._path(f"{self._index_name}.compact.json")
+
+    @property
+    def _compact_tmp_name(self) -> str:
+        return f"{self._index_name}.compact-tmp"
+
+    def _recover_compaction(self):
+        """
+        Completes a compaction which was committed but not applied, or discards the files of one which was never
+        committed.
+        """
+        if (os.path.exists(self._manifest_path)):
+            with open(self._manifest_path, encoding="UTF-8") as f:
+                manifest = json.load(f)
+
+            logger.warning("Completing an interrupted compaction of FAISS index %s", self._index_name)
+            self._apply_compaction(manifest["tmp_name"], manifest["delta_names"])
+        else:
+            tmp_paths = [self._path(f"{self._compact_tmp_name}{ext}") for ext in (".faiss", ".pkl")]
+            for tmp_path in tmp_paths + [f"{self._manifest_path}.tmp"]:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(tmp_path)
+
+    def _commit_compaction(self, tmp_name: str, delta_names: list[str]):
+        # The temporary files must be on disk before the manifest referencing them
+        for ext in (".faiss", ".pkl"):
+            _fsync_file(self._path(f"{tmp_name}{ext}"))
+
+        tmp_manifest_path = f"{self._manifest_path}.tmp"
+        with open(tmp_manifest_path, "w", encoding="UTF-8") as f:
+            json.dump({"tmp_name": tmp_name, "delta_names": delta_names}, f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # The single atomic step committing the compaction
+        os.replace(tmp_manifest_path, self._manifest_path)
+
+    def _apply_compaction(self, tmp_name: str, delta_names: list[str]):
+        # Each step can be repeated, allowing an interrupted compaction to be completed by `_recover_compaction`
+        for ext in (".faiss", ".pkl"):
+            tmp_path = self._path(f"{tmp_name}{ext}")
+            if (os.path.exists(tmp_path)):
+                os.replace(tmp_path, self._path(f"{self._index_name}{ext}"))
+
+        for delta_name in delta_names:
+            for ext in (".faiss", ".pkl"):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(self._path(f"{delta_name}{ext}"))
+
+        os.remove(self._manifest_path)
+
+    def _segments(self) -> list["FAISS"]:
+        with self._lock:
+            segments = [self._index] + self._deltas
+            if (self._active_delta is not None):
+                segments.append(self._active_delta)
+
+            return segments
+
+    def _insert_rows(self, embeddings: list[list[float]] | np.ndarray, texts: list[str], metadatas: list[dict]) -> dict:
+        with self._lock:
+            if (self._active_delta is None):
+                self._active_delta = FAISS(self._parent._embeddings,
+                                           faiss.IndexFlat(self._index.index.d, self._index.index.metric_type),
+                                           InMemoryDocstore(), {},
+                                           normalize_L2=self._index._normalize_L2,
+                                           distance_strategy=self._index.distance_strategy)
+
+            ids = self._active_delta.add_embeddings(text_embeddings=list(zip(texts, embeddings)), metadatas=metadatas)
+
+            if (self._active_delta.index.ntotal >= self._delta_flush_rows):
+                self.flush()
+
+        return {"insert_count": len(ids), "primary_keys": ids}
 
     def insert(self, data: list[list] | list[dict], **kwargs) -> dict:
         """
@@ -70,16 +227,32 @@ class FaissVectorDBResourceService(VectorDBResourceService):
         Parameters
         ----------
         data : list[list] | list[dict]
-            Data to be inserted into the collection.
+            Data to be inserted into the collection, each row must be a dictionary.
         **kwargs
             Extra keyword arguments specific to the vector database implementation.
+            - embedding_column_name (str): Key containing the embedding, by default "embedding".
+            - text_column_name (str): Key containing the document text, by default "page_content". All other keys are
+              stored as the document metadata.
 
         Returns
         -------
         dict
             Returns response content as a dictionary.
         """
-        raise NotImplementedError("Insert operation is not supported in FAISS")
+        embedding_column_name = kwargs.get("embedding_column_name", "embedding")
+        text_column_name = kwargs.get("text_column_name", "page_content")
+
+        if (not all(isinstance(row, dict) for row in data)):
+            raise ValueError("FAISS insert requires each row to be a dictionary")
+
+        embeddings = [row[embedding_column_name] for row in data]
+        texts = [row[text_column_name] for row in data]
+        metadatas = [{
+            key: value
+            for (key, value) in row.items() if key not in (embedding_column_name, text_column_name)
+        } for row in data]
+
+        return self._insert_rows(embeddings, texts, metadatas)
 
     def insert_dataframe(self, df: typing.Union[cudf.DataFrame, pd.DataFrame], **kwargs) -> dict:
         """
@@ -91,13 +264,113 @@ class FaissVectorDBResourceService(VectorDBResourceService):
             Dataframe to be inserted into the collection.
         **kwargs
             Extra keyword arguments specific to the vector database implementation.
+            - embedding_column_name (str): Column containing the embeddings, by default "embedding".
+            - text_column_name (str): Column containing the document text, by default "page_content". All other
+              columns are stored as the document metadata.
+            - embeddings (np.ndarray): 2-D array with one embedding per row of `df`, used instead of the
+              `embedding_column_name` column. The rows of the array are added to the index without being converted to
+              Python lists.
 
         Returns
         -------
         dict
             Returns response content as a dictionary.
         """
-        raise NotImplementedError("Insert operation is not supported in FAISS")
+        embedding_column_name = kwargs.get("embedding_column_name", "embedding")
+        text_column_name = kwargs.get("text_column_name", "page_content")
+        embeddings = kwargs.get("embeddings")
+
+        if (isinstance(df, cudf.DataFrame)):
+            df = df.to_pandas()
+
+        metadata_columns = [col for col in df.columns if col not in (embedding_column_name, text_column_name)]
+
+        if (embeddings is None):
+            embeddings = df[embedding_column_name].tolist()
+        elif (len(embeddings) != len(df)):
+            raise ValueError(f"Number of embeddings ({len(embeddings)}) does not match the number of rows ({len(df)})")
+
+        return self._insert_rows(embeddings,
+                                 df[text_column_name].tolist(),
+                                 df[metadata_columns].to_dict(orient="records"))
+
+    def flush(self) -> None:
+        """
+        Write any buffered rows to disk as a new append-only delta segment.
+        """
+        with self._lock:
+            if (self._active_delta is None or self._active_delta.index.ntotal == 0):
+                return
+
+            delta_name = f"{self._index_name}.delta-{self._next_delta_seq:06d}"
+            self._next_delta_seq += 1
+
+            self._active_delta.save_local(folder_path=self._folder_path, index_name=delta_name)
+
+            self._delta_names.append(delta_name)
+            self._deltas.append(self._active_delta)
+            self._active_delta = None
+
+            logger.debug("Wrote FAISS delta segment %s", delta_name)
+
+            if (self._auto_compact_segments is not None and len(self._delta_names) >= self._auto_compact_segments
+                    and (self._compact_thread is None or not self._compact_thread.is_alive())):
+                self._compact_thread = threading.Thread(target=self.compact,
+                                                        name=f"faiss_compact_{self._index_name}",
+                                                        daemon=True)
+                self._compact_thread.start()
+
+    def compact(self) -> None:
+        """
+        Merge all delta segments into the base index, rewriting the base index files and removing the delta segment
+        files. Inserts and searches can continue while the merge is running, rows inserted during the merge are kept
+        in new delta segments.
+        """
+        with self._lock:
+            self.flush()
+            delta_names = list(self._delta_names)
+            deltas = list(self._deltas)
+
+        if (len(delta_names) == 0):
+            return
+
+        # Merge into a fully loaded copy of the base index, the live (possibly memory-mapped) index is left untouched
+        merged = FAISS.load_local(folder_path=self._folder_path,
+                                  embeddings=self._parent._embeddings,
+                                  index_name=self._index_name,
+                                  allow_dangerous_deserialization=True,
+                                  normalize_L2=self._index._normalize_L2,
+                                  distance_strategy=self._index.distance_strategy)
+
+        for delta in deltas:
+            doc_ids = [delta.index_to_docstore_id[i] for i in range(delta.index.ntotal)]
+            docs = [delta.docstore.search(doc_id) for doc_id in doc_ids]
+            vectors = delta.index.reconstruct_n(0, delta.index.ntotal)
+
+            merged.add_embeddings(text_embeddings=list(zip((d.page_content for d in docs), vectors)),
+                                  metadatas=[d.metadata for d in docs],
+                                  ids=doc_ids)
+
+        tmp_name = self._compact_tmp_name
+        merged.save_local(folder_path=self._folder_path, index_name=tmp_name)
+
+        with self._lock:
+            self._commit_compaction(tmp_name, delta_names)
+            self._apply_compaction(tmp_name, delta_names)
+
+            self._index = self._load_store(self._index_name) if self._mmap else merged
+            self._delta_names = self._delta_names[len(delta_names):]
+            self._deltas = self._deltas[len(deltas):]
+
+        logger.debug("Compacted %d FAISS delta segments into %s", len(delta_names), self._index_name)
+
+    def wait_for_compaction(self) -> None:
+        """
+        Block until any background compaction has finished.
+        """
+        compact_thread = self._compact_thread
+        if (compact_thread is not None):
+            compact_thread.join()
 
     def describe(self, **kwargs) -> dict:
         """
@@ -116,6 +389,7 @@ class FaissVectorDBResourceService(VectorDBResourceService):
         return {
             "index_name": self._index_name,
             "folder_path": self._folder_path,
+            "delta_segments": len(self._delta_names),
         }
 
     def query(self, query: str, **kwargs) -> typing.Any:
@@ -136,10 +410,17 @@ class FaissVectorDBResourceService(VectorDBResourceService):
         """
         raise NotImplementedError("Query operation is not supported in FAISS")
 
+    def _higher_is_better(self) -> bool:
+        return self._index.index.metric_type == faiss.METRIC_INNER_PRODUCT
+
     async def similarity_search(self, embeddings: list[list[float]], k: int = 4, **kwargs) -> list[list[dict]]:
         """
         Perform a similarity search within the FAISS docstore.
 
+        When no extra keyword arguments are given, all of the embeddings are searched with a single call to the FAISS
+        index in a worker thread. Otherwise, the keyword arguments (such as `filter` or `score_threshold`) are passed to
+        the LangChain FAISS store and each embedding is searched individually.
+
         Parameters
         ----------
         embeddings : list[list[float]]
@@ -155,13 +436,71 @@ class FaissVectorDBResourceService(VectorDBResourceService):
             Returns a list of dictionaries representing the results of the similarity search.
         """
 
+        if (len(kwargs) == 0):
+            return await asyncio.get_running_loop().run_in_executor(None, self._batch_similarity_search, embeddings, k)
+
+        segments = self._segments()
+
         async def single_search(single_embedding):
-            docs = await self._index.asimilarity_search_by_vector(embedding=single_embedding, k=k)
+            results = []
+            for segment in segments:
+                results.extend(await segment.asimilarity_search_with_score_by_vector(embedding=single_embedding,
+                                                                                     k=k,
+                                                                                     **kwargs))
 
-            return [d.dict() for d in docs]
+            results.sort(key=lambda result: result[1], reverse=self._higher_is_better())
+
+            return [d.dict() for (d, _) in results[:k]]
 
         return await asyncio.gather(*(single_search(embedding) for embedding in embeddings))
 
+    def _batch_similarity_search(self, embeddings: list[list[float]], k: int) -> list[list[dict]]:
+        if (len(embeddings) == 0):
+            return []
+
+        segments = self._segments()
+
+        vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+        # Matches the normalization performed by the LangChain FAISS store for single searches
+        if (self._index._normalize_L2):
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            np.divide(vectors, norms, out=vectors, where=norms > 0)
+
+        all_scores = []
+        all_ids = []
+        for (segment_idx, segment) in enumerate(segments):
+            scores, indices = segment.index.search(vectors, k)
+
+            # FAISS returns -1 when there are fewer than k vectors in the index
+            scores[indices < 0] = -np.inf if self._higher_is_better() else np.inf
+
+            all_scores.append(scores)
+            all_ids.append(np.where(indices >= 0, indices * len(segments) + segment_idx, -1))
+
+        if (len(segments) > 1):
+            scores = np.hstack(all_scores)
+            ids = np.hstack(all_ids)
+
+            order = np.argsort(-scores if self._higher_is_better() else scores, axis=1, kind="stable")[:, :k]
+            ids = np.take_along_axis(ids, order, axis=1)
+        else:
+            ids = all_ids[0]
+
+        # Look up each distinct document once
+        docs = {}
+        for global_id in np.unique(ids[ids >= 0]).tolist():
+            (i, segment_idx) = divmod(global_id, len(segments))
+            segment = segments[segment_idx]
+            doc_id = segment.index_to_docstore_id[i]
+            doc = segment.docstore.search(doc_id)
+            if (isinstance(doc, str)):
+                raise ValueError(f"Could not find document for id {doc_id}, got {doc}")
+
+            docs[global_id] = doc.dict()
+
+        return [[dict(docs[i]) for i in row if i >= 0] for row in ids.tolist()]
+
     def update(self, data: list[typing.Any], **kwargs) -> dict[str, typing.Any]:
         """
         Update data in the collection.
@@ -249,7 +588,7 @@ class FaissVectorDBResourceService(VectorDBResourceService):
         int
             Returns number of entities in the collection.
         """
-        return self._index.index.ntotal
+        return sum(segment.index.ntotal for segment in self._segments())
 
     def drop(self, **kwargs) -> None:
         """
@@ -276,19 +615,25 @@ class FaissVectorDBService(VectorDBService):
         The local directory where the FAISS index files are stored.
     embeddings : Embeddings
         The embeddings object to use for embedding text.
+    **resource_kwargs
+        Default keyword arguments for the resources loaded by this service, see `FaissVectorDBResourceService`.
     """
 
     _collection_locks = {}
     _cleanup_interval = 600  # 10mins
     _last_cleanup_time = time.time()
 
-    def __init__(self, local_dir: str, embeddings: "Embeddings"):
+    def __init__(self, local_dir: str, embeddings: "Embeddings", **resource_kwargs):
 
         if IMPORT_EXCEPTION is not None:
             raise ImportError(IMPORT_ERROR_MESSAGE) from IMPORT_EXCEPTION
 
         self._local_dir = local_dir
         self._embeddings = embeddings
+        self._resource_kwargs = resource_kwargs
+
+        self._resources: dict[str, FaissVectorDBResourceService] = {}
+        self._resources_lock = threading.Lock()
 
     @property
     def embeddings(self):
@@ -296,14 +641,16 @@ class FaissVectorDBService(VectorDBService):
 
     def load_resource(self, name: str = "index", **kwargs) -> FaissVectorDBResourceService:
         """
-        Loads a VDB resource into memory for use.
+        Loads a VDB resource into memory for use. Resources are loaded once and shared until `release_resource` is
+        called, so that rows buffered by inserts are visible to every user of the resource.
 
         Parameters
         ----------
         name : str, optional
             The VDB resource to load. For FAISS, this corresponds to the index name, by default "index"
         **kwargs
-            Additional keyword arguments specific to the resource service.
+            Additional keyword arguments specific to the resource service, these override the defaults given to the
+            service and are only used when the resource is first loaded.
 
         Returns
         -------
@@ -311,7 +658,13 @@ class FaissVectorDBService(VectorDBService):
             The loaded resource service.
         """
 
-        return FaissVectorDBResourceService(self, name=name, **kwargs)
+        with self._resources_lock:
+            resource = self._resources.get(name)
+            if (resource is None):
+                resource = FaissVectorDBResourceService(self, name=name, **{**self._resource_kwargs, **kwargs})
+                self._resources[name] = resource
+
+            return resource
 
     def has_store_object(self, name: str) -> bool:
         """
@@ -414,7 +767,7 @@ class FaissVectorDBService(VectorDBService):
             If the collection not exists exists.
         """
 
-        raise NotImplementedError("create_from_dataframe operation is not supported in FAISS")
+        return self.load_resource(name).insert(data, **kwargs)
 
     def insert_dataframe(self, name: str, df: typing.Union[cudf.DataFrame, pd.DataFrame],
                          **kwargs) -> dict[str, typing.Any]:
@@ -440,7 +793,7 @@ class FaissVectorDBService(VectorDBService):
         RuntimeError
             If the collection not exists exists.
         """
-        raise NotImplementedError("insert_dataframe operation is not supported in FAISS")
+        return self.load_resource(name).insert_dataframe(df, **kwargs)
 
     def query(self, name: str, query: str = None, **kwargs) -> typing.Any:
         """
@@ -584,7 +937,7 @@ class FaissVectorDBService(VectorDBService):
             Returns number of entities in the collection.
         """
 
-        raise NotImplementedError("count operation is not supported in FAISS")
+        return self.load_resource(name).count(**kwargs)
 
     def drop(self, name: str, **kwargs) -> None:
         """
@@ -622,7 +975,18 @@ class FaissVectorDBService(VectorDBService):
             Returns collection information.
         """
 
-        raise NotImplementedError("describe operation is not supported in FAISS")
+        return self.load_resource(name).describe(**kwargs)
+
+    def compact(self, name: str) -> None:
+        """
+        Merge the delta segments of a resource into its base index.
+
+        Parameters
+        ----------
+        name : str
+            Name of the resource.
+        """
+        self.load_resource(name).compact()
 
     def release_resource(self, name: str) -> None:
         """
@@ -634,10 +998,16 @@ class FaissVectorDBService(VectorDBService):
             Name of the collection to release.
         """
 
-        raise NotImplementedError("release_resource operation is not supported in FAISS")
+        with self._resources_lock:
+            resource = self._resources.pop(name, None)
+
+        if (resource is not None):
+            resource.wait_for_compaction()
+            resource.flush()
 
     def close(self) -> None:
         """
         Close the vector database service and release all resources.
         """
-        raise NotImplementedError("close operation is not supported in FAISS")
+        for name in list(self._resources.keys()):
+            self.release_resource(name)
@@ -20,6 +20,8 @@ import time
 import typing
 from functools import wraps
 
+import numpy as np
+
 import cudf
 
 from morpheus.io.utils import cudf_string_cols_exceed_max_bytes
@@ -273,7 +275,7 @@ class MilvusVectorDBResourceService(VectorDBResourceService):
         """
         self._fields = self._collection.schema.fields
 
-    def insert(self, data: list[list] | list[dict], **kwargs: dict[str, typing.Any]) -> dict:
+    def insert(self, data: list[list] | list[dict], flush: bool = True, **kwargs: dict[str, typing.Any]) -> dict:
         """
         Insert data into the vector database.
 
@@ -281,6 +283,9 @@ class MilvusVectorDBResourceService(VectorDBResourceService):
         ----------
         data : list[list] | list[dict]
             Data to be inserted into the collection.
+        flush : bool, optional
+            Flush the collection after the insert, sealing its segments, by default True. Set this to False when
+            inserting many batches and call `flush` once they have all been inserted.
         **kwargs : dict[str, typing.Any]
             Extra keyword arguments specific to the vector database implementation.
 
@@ -290,11 +295,17 @@ class MilvusVectorDBResourceService(VectorDBResourceService):
             Returns response content as a dictionary.
         """
         result = self._collection.insert(data, **kwargs)
-        self._collection.flush()
+        if (flush):
+            self._collection.flush()
 
         return self._insert_result_to_dict(result=result)
 
-    def insert_dataframe(self, df: DataFrameType, **kwargs: dict[str, typing.Any]) -> dict:
+    def insert_dataframe(self,
+                         df: DataFrameType,
+                         flush: bool = True,
+                         embeddings: np.ndarray = None,
+                         embedding_column_name: str = "embedding",
+                         **kwargs: dict[str, typing.Any]) -> dict:
         """
         Insert a dataframe entires into the vector database.
 
@@ -302,6 +313,15 @@ class MilvusVectorDBResourceService(VectorDBResourceService):
         ----------
         df : DataFrameType
             Dataframe to be inserted into the collection.
+        flush : bool, optional
+            Flush the collection after the insert, sealing its segments, by default True. Set this to False when
+            inserting many batches and call `flush` once they have all been inserted.
+        embeddings : np.ndarray, optional
+            2-D array with one embedding per row of `df`, inserted as the `embedding_column_name` field. When set, the
+            rows are inserted column-wise and the embeddings are not converted to Python lists. By default None, in
+            which case the embeddings are taken from the `embedding_column_name` column of `df`.
+        embedding_column_name : str, optional
+            Name of the field the `embeddings` are inserted into, by default "embedding".
         **kwargs : dict[str, typing.Any]
             Extra keyword arguments specific to the vector database implementation.
 
@@ -335,6 +355,14 @@ class MilvusVectorDBResourceService(VectorDBResourceService):
         # From the schema, this is the list of columns we need, excluding any auto_id columns
         column_names = [field.name for field in self._fields if not field.auto_id]
 
+        if embeddings is not None:
+            if (len(embeddings) != len(df)):
+                raise ValueError(f"Number of embeddings ({len(embeddings)}) does not match the number of rows "
+                                 f"({len(df)})")
+
+            # Only the metadata columns are converted, the embeddings are inserted as a single 2-D array
+            column_names = [name for name in column_names if name != embedding_column_name]
+
         collection_df = df[column_names]
         if isinstance(collection_df, cudf.DataFrame):
             collection_df = collection_df.to_pandas()
@@ -342,12 +370,27 @@ class MilvusVectorDBResourceService(VectorDBResourceService):
         if needs_truncate:
             truncate_string_cols_by_bytes(collection_df, self._fields_max_length, warn_on_truncate=True)
 
-        # Note: dataframe columns has to be in the order of collection schema fields.s
-        result = self._collection.insert(data=collection_df, **kwargs)
-        self._collection.flush()
+        if embeddings is not None:
+            # Column-based insert, the columns have to be in the order of the collection schema fields
+            data = [
+                embeddings if field.name == embedding_column_name else collection_df[field.name].tolist()
+                for field in self._fields if not field.auto_id
+            ]
+            result = self._collection.insert(data=data, **kwargs)
+        else:
+            # Note: dataframe columns has to be in the order of collection schema fields.s
+            result = self._collection.insert(data=collection_df, **kwargs)
+        if (flush):
+            self._collection.flush()
 
         return self._insert_result_to_dict(result=result)
 
+    def flush(self) -> None:
+        """
+        Flush the collection, sealing its segments.
+        """
+        self._collection.flush()
+
     def describe(self, **kwargs: dict[str, typing.Any]) -> dict:
         """
         Provides a description of the collection.
@@ -1106,6 +1149,18 @@ class MilvusVectorDBService(VectorDBService):
 
         return resource.describe(**kwargs)
 
+    @with_collection_lock
+    def flush(self, name: str) -> None:
+        """
+        Flush a collection in the Milvus vector database, sealing its segments.
+
+        Parameters
+        ----------
+        name : str
+            Name of the collection to flush.
+        """
+        self.load_resource(name).flush()
+
     def release_resource(self, name: str) -> None:
         """
         Release a loaded collection from the memory.
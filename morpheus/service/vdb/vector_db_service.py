@@ -59,7 +59,8 @@ class VectorDBResourceService(ABC):
         df : typing.Union[cudf.DataFrame, pd.DataFrame]
             Dataframe to be inserted into the resource.
         **kwargs : dict[str, typing.Any]
-            Extra keyword arguments specific to the vector database implementation.
+            Extra keyword arguments specific to the vector database implementation. Implementations which support it
+            accept the embeddings as a 2-D `np.ndarray` in `embeddings`, rather than as a column of lists in `df`.
 
         Returns
         -------
@@ -208,6 +209,13 @@ class VectorDBResourceService(ABC):
 
         pass
 
+    def flush(self) -> None:
+        """
+        Make previously inserted data durable, for vector databases which buffer inserts. The default implementation
+        does nothing.
+        """
+        pass
+
 
 class VectorDBService(ABC):
     """
@@ -442,6 +450,17 @@ class VectorDBService(ABC):
         """
         pass
 
+    def flush(self, name: str) -> None:
+        """
+        Make previously inserted data durable, for vector databases which buffer inserts.
+
+        Parameters
+        ----------
+        name : str
+            Name of the resource to flush.
+        """
+        self.load_resource(name).flush()
+
     @abstractmethod
     def close(self) -> None:
         """
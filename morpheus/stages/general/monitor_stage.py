@@ -22,6 +22,7 @@ from tqdm import tqdm
 from morpheus.cli.register_stage import register_stage
 from morpheus.config import Config
 from morpheus.controllers.monitor_controller import MonitorController
+from morpheus.pipeline.execution_mode_mixins import GpuAndCpuMixin
 from morpheus.pipeline.pass_thru_type_mixin import PassThruTypeMixin
 from morpheus.pipeline.single_port_stage import SinglePortStage
 from morpheus.utils.logger import LogLevels
@@ -30,7 +31,7 @@ logger = logging.getLogger(__name__)
 
 
 @register_stage("monitor", ignore_args=["determine_count_fn"])
-class MonitorStage(PassThruTypeMixin, SinglePortStage):
+class MonitorStage(GpuAndCpuMixin, PassThruTypeMixin, SinglePortStage):
     """
     Display throughput numbers at a specific point in the pipeline.
 
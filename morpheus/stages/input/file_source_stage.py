@@ -24,9 +24,11 @@ from morpheus._lib.messages import MessageMeta as CppMessageMeta
 from morpheus.cli import register_stage
 from morpheus.common import FileTypes
 from morpheus.config import Config
+from morpheus.config import ExecutionMode
 from morpheus.config import PipelineModes
 from morpheus.io.deserializers import read_file_to_df
 from morpheus.messages import MessageMeta
+from morpheus.pipeline.execution_mode_mixins import GpuAndCpuMixin
 from morpheus.pipeline.preallocator_mixin import PreallocatorMixin
 from morpheus.pipeline.single_output_source import SingleOutputSource
 from morpheus.pipeline.stage_schema import StageSchema
@@ -35,7 +37,7 @@ logger = logging.getLogger(__name__)
 
 
 @register_stage("from-file", modes=[PipelineModes.FIL, PipelineModes.NLP, PipelineModes.OTHER])
-class FileSourceStage(PreallocatorMixin, SingleOutputSource):
+class FileSourceStage(GpuAndCpuMixin, PreallocatorMixin, SingleOutputSource):
     """
     Load messages from a file.
 
@@ -140,7 +142,7 @@ class FileSourceStage(PreallocatorMixin, SingleOutputSource):
             filter_nulls=self._filter_null,
             filter_null_columns=self._filter_null_columns,
             parser_kwargs=self._parser_kwargs,
-            df_type="cudf",
+            df_type="pandas" if self._config.execution_mode == ExecutionMode.CPU else "cudf",
         )
 
         for i in range(self._repeat_count):
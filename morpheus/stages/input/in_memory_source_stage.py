@@ -18,12 +18,13 @@ import cudf
 
 from morpheus.config import Config
 from morpheus.messages import MessageMeta
+from morpheus.pipeline.execution_mode_mixins import GpuAndCpuMixin
 from morpheus.pipeline.preallocator_mixin import PreallocatorMixin
 from morpheus.pipeline.stage_schema import StageSchema
 from morpheus.stages.input.in_memory_data_generation_stage import InMemoryDataGenStage
 
 
-class InMemorySourceStage(PreallocatorMixin, InMemoryDataGenStage):
+class InMemorySourceStage(GpuAndCpuMixin, PreallocatorMixin, InMemoryDataGenStage):
     """
     Input source that emits a pre-defined list of dataframes, derived from InMemoryDataGenStage.
 
@@ -54,6 +54,13 @@ class RSSSourceStage(PreallocatorMixin, SingleOutputSource):
         Request timeout in secs to fetch the feed.
     strip_markup : bool, optional, default = False
         When true, strip HTML & XML markup from the from the content, summary and title fields.
+    max_concurrent_requests : int, optional, default = 16
+        Maximum number of feeds fetched and parsed concurrently.
+    max_requests_per_host : int, optional, default = 2
+        Maximum number of feeds fetched concurrently from the same host.
+    feed_state_file : str, optional, default = None
+        JSON file persisting the ETag and Last-Modified validators and the IDs of the entries seen for each feed URL,
+        so that unchanged feeds are not downloaded again and entries are not emitted again after a restart.
     """
 
     def __init__(self,
@@ -67,7 +74,10 @@ class RSSSourceStage(PreallocatorMixin, SingleOutputSource):
                  cache_dir: str = "./.cache/http",
                  cooldown_interval: int = 600,
                  request_timeout: float = 2.0,
-                 strip_markup: bool = False):
+                 strip_markup: bool = False,
+                 max_concurrent_requests: int = 16,
+                 max_requests_per_host: int = 2,
+                 feed_state_file: str = None):
         super().__init__(c)
         self._stop_requested = False
 
@@ -91,7 +101,10 @@ class RSSSourceStage(PreallocatorMixin, SingleOutputSource):
                 "cache_dir": cache_dir,
                 "cooldown_interval_sec": cooldown_interval,
                 "request_timeout_sec": request_timeout,
-                "strip_markup": strip_markup
+                "strip_markup": strip_markup,
+                "max_concurrent_requests": max_concurrent_requests,
+                "max_requests_per_host": max_requests_per_host,
+                "feed_state_file": feed_state_file
             }
         }
 
@@ -13,7 +13,12 @@
 # limitations under the License.
 """Write all messages to an HTTP endpoint."""
 
+import asyncio
+import collections
+import concurrent.futures
+import gzip
 import logging
+import threading
 import typing
 from http import HTTPStatus
 from io import StringIO
@@ -34,6 +39,14 @@ from morpheus.utils.type_aliases import DataFrameType
 
 logger = logging.getLogger(__name__)
 
+IMPORT_EXCEPTION = None
+IMPORT_ERROR_MESSAGE = "HttpClientSinkStage requires the aiohttp package to be installed when async_mode is True."
+
+try:
+    import aiohttp
+except ImportError as import_exc:
+    IMPORT_EXCEPTION = import_exc
+
 
 @register_stage("to-http", ignore_args=["query_params", "headers", "df_to_request_kwargs_fn", "**request_kwargs"])
 class HttpClientSinkStage(PassThruTypeMixin, SinglePortStage):
@@ -108,6 +121,23 @@ class HttpClientSinkStage(PassThruTypeMixin, SinglePortStage):
     lines : bool, default False
         If False, dataframes will be serialized to a JSON array of objects. If True, then the dataframes will be
         serialized to a string JSON objects separated by end-of-line characters.
+    compression : str, optional
+        Compression of the request bodies serialized by the stage, by default None. Only "gzip" is supported, which
+        also sets the `Content-Encoding` header of those requests. Payloads returned by `df_to_request_kwargs_fn` are
+        neither compressed nor sent with a `Content-Encoding` header.
+    async_mode : bool, default False
+        If True, requests are sent concurrently from the pipeline's event loop with a pooled `aiohttp` client session
+        which keeps connections alive between requests. Requires the `aiohttp` package.
+    max_in_flight_requests : int, default 16
+        Maximum number of requests which have been sent without having completed, when `async_mode` is True. Once this
+        limit is reached the stage waits for a request to complete before sending another.
+    max_connections_per_host : int, default 8
+        Maximum number of concurrent connections to a single host, when `async_mode` is True.
+    preserve_order : bool, default False
+        When `async_mode` is True, messages are passed downstream as soon as all of their requests have completed,
+        without waiting for more messages to arrive. If True, messages are passed downstream in the order they were
+        received, otherwise in the order their requests completed. In either case the requests themselves may complete
+        in any order.
     df_to_request_kwargs_fn: typing.Callable[[str, str, DataFrameType], dict], optional
         Optional function to perform additional customizations of the request. This function will be called for each
         DataFrame (according to `max_rows_per_payload`) before the request is sent.
@@ -124,9 +154,10 @@ class HttpClientSinkStage(PassThruTypeMixin, SinglePortStage):
         string. This method has the potential of returning a value for `url` overriding the value of `endpoint` and
         `base_url`, even when `static_endpoint` is True.
     **request_kwargs : dict
-        Additional arguments to pass to the `requests.Session.request` function. These values will are potentially
-        overridden by the results of `df_to_request_kwargs_fn` if it is not `None`, otherwise the value of `data` will
-        be overwritten, as will `url` when `static_endpoint` is False.
+        Additional arguments to pass to the `requests.Session.request` function, or the `aiohttp.ClientSession.request`
+        function when `async_mode` is True. These values will are potentially overridden by the results of
+        `df_to_request_kwargs_fn` if it is not `None`, otherwise the value of `data` will be overwritten, as will `url`
+        when `static_endpoint` is False.
     """
 
     def __init__(self,
@@ -149,6 +180,11 @@ class HttpClientSinkStage(PassThruTypeMixin, SinglePortStage):
                  max_rows_per_payload: int = 10000,
                  lines: bool = False,
                  df_to_request_kwargs_fn: typing.Optional[typing.Callable[[str, str, DataFrameType], dict]] = None,
+                 compression: str = None,
+                 async_mode: bool = False,
+                 max_in_flight_requests: int = 16,
+                 max_connections_per_host: int = 8,
+                 preserve_order: bool = False,
                  **request_kwargs):
         super().__init__(c)
         self._base_url = http_utils.prepare_url(base_url)
@@ -165,8 +201,17 @@ class HttpClientSinkStage(PassThruTypeMixin, SinglePortStage):
             else:
                 headers = {"Content-Type": MimeTypes.JSON.value}
 
+        if (compression not in (None, "gzip")):
+            raise ValueError(f"Unsupported compression '{compression}', only 'gzip' is supported")
+
+        self._compression = compression
         self._headers = headers
 
+        # Only sent with the request bodies compressed by the stage
+        self._compressed_headers = headers
+        if (compression is not None):
+            self._compressed_headers = {**headers, "Content-Encoding": compression}
+
         self._method = method
 
         if error_sleep_time >= 0:
@@ -190,6 +235,31 @@ class HttpClientSinkStage(PassThruTypeMixin, SinglePortStage):
         self._requst_kwargs = request_kwargs
         self._http_session = None
 
+        if (async_mode and IMPORT_EXCEPTION is not None):
+            raise ImportError(IMPORT_ERROR_MESSAGE) from IMPORT_EXCEPTION
+
+        if (max_in_flight_requests < 1):
+            raise ValueError("max_in_flight_requests must be >= 1")
+
+        self._async_mode = async_mode
+        self._max_in_flight_requests = max_in_flight_requests
+        self._max_connections_per_host = max_connections_per_host
+        self._preserve_order = preserve_order
+
+        # Async mode state, the session is created on the pipeline's event loop in `start_async`
+        self._loop: asyncio.AbstractEventLoop = None
+        self._async_session: "aiohttp.ClientSession" = None
+        self._in_flight = threading.BoundedSemaphore(max_in_flight_requests)
+        self._pending: typing.Deque[typing.Tuple[MessageMeta, typing.List[concurrent.futures.Future]]] = \
+            collections.deque()
+
+        # Completed messages are passed downstream by an emitter thread, woken by the completion of each request
+        self._pending_cond = threading.Condition()
+        self._emitter: threading.Thread = None
+        self._emitter_stopped = False
+        self._emitter_error: Exception = None
+        self._requests_completed = False
+
     @property
     def name(self) -> str:
         """Unique name of the stage."""
@@ -228,9 +298,16 @@ class HttpClientSinkStage(PassThruTypeMixin, SinglePortStage):
         endpoint = self._endpoint.format(**df.iloc[0].to_dict())
         return f"{self._base_url}{endpoint}"
 
-    def _df_to_payload(self, df: DataFrameType) -> StringIO:
+    def _df_to_payload(self, df: DataFrameType) -> typing.Union[StringIO, bytes]:
         str_buf = StringIO()
         serializers.df_to_stream_json(df=df, stream=str_buf, lines=self._lines)
+
+        if (self._compression == "gzip"):
+            return gzip.compress(str_buf.getvalue().encode("UTF-8"))
+
+        if (self._async_mode):
+            return str_buf.getvalue().encode("UTF-8")
+
         str_buf.seek(0)
         return str_buf
 
@@ -251,7 +328,7 @@ class HttpClientSinkStage(PassThruTypeMixin, SinglePortStage):
             if self._df_to_request_kwargs_fn is not None:
                 yield self._df_to_request_kwargs_fn(self._base_url, self._endpoint, df_slice)
             else:
-                chunk = {'data': self._df_to_payload(df_slice)}
+                chunk = {'data': self._df_to_payload(df_slice), 'headers': self._compressed_headers}
                 if not self._static_endpoint:
                     chunk['url'] = self._df_to_url(df_slice)
 
@@ -259,8 +336,7 @@ class HttpClientSinkStage(PassThruTypeMixin, SinglePortStage):
 
             slice_start = slice_end
 
-    def _process_message(self, msg: MessageMeta) -> MessageMeta:
-
+    def _make_request_args(self) -> dict:
         request_args = {
             'method': self._method.value,
             'headers': self._headers,
@@ -273,7 +349,17 @@ class HttpClientSinkStage(PassThruTypeMixin, SinglePortStage):
 
         request_args.update(self._requst_kwargs)
 
-        for chunk in self._chunk_requests(msg.df):
+        return request_args
+
+    def _process_message(self, msg: MessageMeta) -> MessageMeta:
+
+        request_args = self._make_request_args()
+
+        # Serialize all of the chunks while holding the lock, but don't hold it while waiting on the requests
+        with msg.readonly_dataframe() as view:
+            chunks = list(self._chunk_requests(view.df))
+
+        for chunk in chunks:
             request_args.update(chunk)
             http_utils.request_with_retry(request_args,
                                           requests_session=self._http_session,
@@ -284,8 +370,181 @@ class HttpClientSinkStage(PassThruTypeMixin, SinglePortStage):
 
         return msg
 
+    async def start_async(self):
+        """
+        Creates the pooled client session on the pipeline's event loop when `async_mode` is True.
+        """
+        if (self._async_mode):
+            self._loop = asyncio.get_running_loop()
+            connector = aiohttp.TCPConnector(limit=self._max_in_flight_requests,
+                                             limit_per_host=self._max_connections_per_host)
+            self._async_session = aiohttp.ClientSession(connector=connector)
+
+        return await super().start_async()
+
+    async def join(self):
+        """
+        Closes the client session, if any.
+        """
+        if (self._async_session is not None):
+            await self._async_session.close()
+            self._async_session = None
+
+        await super().join()
+
+    async def _send_async(self, request_args: dict):
+        timeout = request_args.get('timeout')
+        if (timeout is not None and not isinstance(timeout, aiohttp.ClientTimeout)):
+            request_args['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+        data = request_args.get('data')
+        if (isinstance(data, StringIO)):
+            # Payloads from `df_to_request_kwargs_fn` are file objects intended for `requests`
+            request_args['data'] = data.getvalue().encode("UTF-8")
+
+        await http_utils.request_with_retry_async(request_args,
+                                                  session=self._async_session,
+                                                  max_retries=self._max_retries,
+                                                  sleep_time=self._error_sleep_time,
+                                                  respect_retry_after_header=self._respect_retry_after_header,
+                                                  accept_status_codes=self._accept_status_codes)
+
+    def _pop_completed(self) -> typing.List[MessageMeta]:
+        """
+        Removes the messages whose requests have all completed from the pending queue, raising the first error
+        encountered by their requests. When `preserve_order` is True, only messages at the front of the queue are
+        removed.
+        """
+        completed = []
+        still_pending = collections.deque()
+
+        while (len(self._pending) > 0):
+            (msg, futures) = self._pending.popleft()
+
+            if (all(future.done() for future in futures)):
+                for future in futures:
+                    future.result()
+
+                completed.append(msg)
+            elif (self._preserve_order):
+                self._pending.appendleft((msg, futures))
+                break
+            else:
+                still_pending.append((msg, futures))
+
+        still_pending.extend(self._pending)
+        self._pending = still_pending
+
+        return completed
+
+    def _on_request_done(self, _: concurrent.futures.Future):
+        # Called on the event loop, so only wakes the emitter rather than passing messages downstream itself
+        with self._pending_cond:
+            self._requests_completed = True
+            self._pending_cond.notify()
+
+    def _process_message_async(self, msg: MessageMeta):
+        if (self._emitter_error is not None):
+            raise self._emitter_error
+
+        request_args = self._make_request_args()
+
+        with msg.readonly_dataframe() as view:
+            chunks = list(self._chunk_requests(view.df))
+
+        futures = []
+        for chunk in chunks:
+            # Blocks once `max_in_flight_requests` requests are outstanding, released as each request completes
+            self._in_flight.acquire()
+
+            future = asyncio.run_coroutine_threadsafe(self._send_async({**request_args, **chunk}), loop=self._loop)
+            future.add_done_callback(lambda _: self._in_flight.release())
+            futures.append(future)
+
+        with self._pending_cond:
+            self._pending.append((msg, futures))
+
+        # Added after the message is pending, so the emitter is woken for requests which have already completed
+        for future in futures:
+            future.add_done_callback(self._on_request_done)
+
+    def _run_emitter(self, emit: typing.Callable[[MessageMeta], None]):
+        while (True):
+            with self._pending_cond:
+                while (not self._emitter_stopped and not self._requests_completed):
+                    self._pending_cond.wait()
+
+                if (self._emitter_stopped):
+                    return
+
+                self._requests_completed = False
+
+                try:
+                    completed = self._pop_completed()
+                except Exception as exc:
+                    # Raised by the stage on its next message, or once its input completes
+                    self._emitter_error = exc
+                    return
+
+            # Not holding the lock, as the downstream node may block
+            for msg in completed:
+                emit(msg)
+
+    def _start_emitter(self, emit: typing.Callable[[MessageMeta], None]):
+        """
+        Start a thread passing messages to `emit` as soon as all of their requests have completed.
+        """
+        self._emitter_stopped = False
+        self._emitter_error = None
+        self._emitter = threading.Thread(target=self._run_emitter,
+                                         args=(emit, ),
+                                         name=f"{self.name}-emitter",
+                                         daemon=True)
+        self._emitter.start()
+
+    def _stop_emitter(self):
+        with self._pending_cond:
+            self._emitter_stopped = True
+            self._pending_cond.notify()
+
+        if (self._emitter is not None):
+            self._emitter.join()
+            self._emitter = None
+
+    def _wait_for_pending(self) -> typing.List[MessageMeta]:
+        """
+        Stop the emitter, returning the messages whose requests were still outstanding once they have completed.
+        """
+        self._stop_emitter()
+
+        if (self._emitter_error is not None):
+            raise self._emitter_error
+
+        concurrent.futures.wait([future for (_, futures) in self._pending for future in futures])
+
+        return self._pop_completed()
+
     def _build_single(self, builder: mrc.Builder, input_node: mrc.SegmentObject) -> mrc.SegmentObject:
-        node = builder.make_node(self.unique_name, ops.map(self._process_message))
+        if (not self._async_mode):
+            node = builder.make_node(self.unique_name, ops.map(self._process_message))
+            builder.make_edge(input_node, node)
+
+            return node
+
+        def node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
+
+            def on_completed():
+                # Pass on the messages whose requests were still outstanding
+                for msg in self._wait_for_pending():
+                    sub.on_next(msg)
+
+            self._start_emitter(sub.on_next)
+
+            # Every message is passed on by the emitter, or once the input completes, not by the operators themselves
+            obs.pipe(ops.map(self._process_message_async), ops.filter(lambda _: False),
+                     ops.on_completed(on_completed)).subscribe(sub)
+
+        node = builder.make_node(self.unique_name, ops.build(node_fn))
         builder.make_edge(input_node, node)
 
         return node
@@ -234,7 +234,12 @@ class HttpServerSinkStage(PassThruTypeMixin, SinglePortStage):
     def _process_message(self, msg: MessageMeta) -> MessageMeta:
         # In order to conform to the `self._max_rows_per_response` argument we need to slice up the dataframe here
         # because our queue isn't a deque.
-        for df_slice in self._partition_df(msg.df):
+        # The slices are read by the server thread after the lock is released, so each one needs its own copy of the
+        # rows. Slicing a view avoids the additional copy of the whole DataFrame made by `msg.df`.
+        with msg.readonly_dataframe() as view:
+            df_slices = [df_slice.copy(deep=True) for df_slice in self._partition_df(view.df)]
+
+        for df_slice in df_slices:
             # We want to block, such that if the queue is full, we want our edgebuffer to start filling up.
             self._queue.put(df_slice, block=True)
 
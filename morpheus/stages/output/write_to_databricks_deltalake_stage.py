@@ -96,11 +96,12 @@ class DataBricksDeltaLakeSinkStage(PassThruTypeMixin, SinglePortStage):
             """
             convert cudf to spark dataframe
             """
-            df = meta.copy_dataframe()
-            if isinstance(df, cudf.DataFrame):
-                df = df.to_pandas()
-            schema = self._extract_schema_from_pandas_dataframe(df)
-            spark_df = self.spark.createDataFrame(df, schema=schema)
+            with meta.readonly_dataframe() as view:
+                df = view.df
+                if isinstance(df, cudf.DataFrame):
+                    df = df.to_pandas()
+                schema = self._extract_schema_from_pandas_dataframe(df)
+                spark_df = self.spark.createDataFrame(df, schema=schema)
             spark_df.write \
                 .format('delta') \
                 .option("mergeSchema", "true") \
@@ -50,6 +50,12 @@ class WriteToElasticsearchStage(PassThruTypeMixin, SinglePortStage):
         Whether to raise exceptions on Elasticsearch errors.
     refresh_period_secs : int, optional, default: 2400
         The refresh period in seconds for client refreshing.
+    max_chunk_bytes : int, optional, default: 10 MiB
+        Maximum size in bytes of the body of a bulk request.
+    max_concurrent_requests : int, optional, default: 4
+        Maximum number of bulk requests sent concurrently.
+    max_retries : int, optional, default: 3
+        Number of times a failed bulk request, or the rejected documents of a bulk request, are retried.
     connection_kwargs_update_func : typing.Callable, optional, default: None
         Custom function to update connection parameters.
     """
@@ -60,6 +66,9 @@ class WriteToElasticsearchStage(PassThruTypeMixin, SinglePortStage):
                  connection_conf_file: str,
                  raise_on_exception: bool = False,
                  refresh_period_secs: int = 2400,
+                 max_chunk_bytes: int = 10 * 1024 * 1024,
+                 max_concurrent_requests: int = 4,
+                 max_retries: int = 3,
                  connection_kwargs_update_func: typing.Callable = None):
 
         super().__init__(config)
@@ -80,7 +89,10 @@ class WriteToElasticsearchStage(PassThruTypeMixin, SinglePortStage):
 
         self._controller = ElasticsearchController(connection_kwargs=connection_kwargs,
                                                    raise_on_exception=raise_on_exception,
-                                                   refresh_period_secs=refresh_period_secs)
+                                                   refresh_period_secs=refresh_period_secs,
+                                                   max_chunk_bytes=max_chunk_bytes,
+                                                   max_concurrent_requests=max_concurrent_requests,
+                                                   max_retries=max_retries)
 
     @property
     def name(self) -> str:
@@ -109,12 +121,16 @@ class WriteToElasticsearchStage(PassThruTypeMixin, SinglePortStage):
 
             self._controller.refresh_client()
 
-            df = meta.copy_dataframe()
-            if isinstance(df, cudf.DataFrame):
-                df = df.to_pandas()
-                logger.debug("Converted cudf of size: %s to pandas dataframe.", len(df))
+            # Only take a copy under the lock, the bulk write and its retries happen once it is released
+            with meta.readonly_dataframe() as view:
+                df = view.df
+                if isinstance(df, cudf.DataFrame):
+                    df = df.to_pandas()
+                    logger.debug("Converted cudf of size: %s to pandas dataframe.", len(df))
+                else:
+                    df = df.copy()
 
-            self._controller.df_to_parallel_bulk_write(index=self._index, df=df)
+            self._controller.df_to_bulk_write(index=self._index, df=df)
 
             return meta
 
@@ -24,12 +24,13 @@ from morpheus.common import FileTypes
 from morpheus.config import Config
 from morpheus.controllers.write_to_file_controller import WriteToFileController
 from morpheus.messages import MessageMeta
+from morpheus.pipeline.execution_mode_mixins import GpuAndCpuMixin
 from morpheus.pipeline.pass_thru_type_mixin import PassThruTypeMixin
 from morpheus.pipeline.single_port_stage import SinglePortStage
 
 
 @register_stage("to-file", rename_options={"include_index_col": "--include-index-col"})
-class WriteToFileStage(PassThruTypeMixin, SinglePortStage):
+class WriteToFileStage(GpuAndCpuMixin, PassThruTypeMixin, SinglePortStage):
     """
     Write all messages to a file.
 
@@ -45,11 +46,19 @@ class WriteToFileStage(PassThruTypeMixin, SinglePortStage):
         Overwrite file if exists. Will generate an error otherwise.
     file_type : `morpheus.common.FileTypes`, optional, case_sensitive = False
         Indicates what type of file to write. Specifying 'auto' will determine the file type from the extension.
-        Supported extensions: 'csv', 'json' and 'jsonlines'
+        Supported extensions: 'csv', 'json', 'jsonlines', 'parquet' and 'arrow'
     include_index_col : bool, default = True
         Write out the index as a column, by default True.
     flush : bool, default = False, is_flag = True
         When `True` flush the output buffer to disk on each message.
+    compression : str, optional
+        Compression of the output file. CSV and JSON support 'gzip' and 'zstd', Parquet and Arrow use the compression
+        codecs of the format.
+    max_file_size : int, optional
+        Size in bytes after which the output is rotated to a new file, by inserting a counter before the file
+        extension.
+    row_group_size : int, default = 100000
+        Number of rows per Parquet row group or Arrow record batch.
     """
 
     def __init__(self,
@@ -58,7 +67,10 @@ class WriteToFileStage(PassThruTypeMixin, SinglePortStage):
                  overwrite: bool = False,
                  file_type: FileTypes = FileTypes.Auto,
                  include_index_col: bool = True,
-                 flush: bool = False):
+                 flush: bool = False,
+                 compression: str = None,
+                 max_file_size: int = None,
+                 row_group_size: int = 100000):
 
         super().__init__(c)
 
@@ -66,7 +78,10 @@ class WriteToFileStage(PassThruTypeMixin, SinglePortStage):
                                                  overwrite=overwrite,
                                                  file_type=file_type,
                                                  include_index_col=include_index_col,
-                                                 flush=flush)
+                                                 flush=flush,
+                                                 compression=compression,
+                                                 max_file_size=max_file_size,
+                                                 row_group_size=row_group_size)
 
     @property
     def name(self) -> str:
@@ -87,7 +102,9 @@ class WriteToFileStage(PassThruTypeMixin, SinglePortStage):
 
     def supports_cpp_node(self):
         """Indicates whether this stage supports a C++ node."""
-        return True
+        # The C++ implementation only writes uncompressed CSV and JSON to a single file
+        return (self._controller.file_type in (FileTypes.CSV, FileTypes.JSON) and self._controller.compression is None
+                and self._controller.max_file_size is None)
 
     def _build_single(self, builder: mrc.Builder, input_node: mrc.SegmentObject) -> mrc.SegmentObject:
         # Sink to file
@@ -13,16 +13,14 @@
 # limitations under the License.
 
 import logging
-import time
 import typing
 
-import confluent_kafka as ck
 import mrc
 from mrc.core import operators as ops
 
 from morpheus.cli.register_stage import register_stage
 from morpheus.config import Config
-from morpheus.io import serializers
+from morpheus.controllers.write_to_kafka_controller import WriteToKafkaController
 from morpheus.messages import MessageMeta
 from morpheus.pipeline.pass_thru_type_mixin import PassThruTypeMixin
 from morpheus.pipeline.single_port_stage import SinglePortStage
@@ -35,6 +33,9 @@ class WriteToKafkaStage(PassThruTypeMixin, SinglePortStage):
     """
     Write all messages to a Kafka cluster.
 
+    Messages are passed downstream once their rows have been queued in the producer, delivery is only waited for when
+    the stage completes.
+
     Parameters
     ----------
     c : `morpheus.config.Config`
@@ -43,10 +44,24 @@ class WriteToKafkaStage(PassThruTypeMixin, SinglePortStage):
         Kafka cluster bootstrap servers separated by comma.
     output_topic : str
         Output kafka topic.
-
+    client_id : str, optional
+        Client ID of the Kafka producer.
+    key_column : str, optional
+        Column containing the key of each record, records have no key when not set.
+    partition_column : str, optional
+        Column containing the partition of each record, records are partitioned by the producer when not set.
+    max_in_flight_bytes : int, default = 67108864
+        Maximum number of bytes produced but not yet delivered to the broker.
     """
 
-    def __init__(self, c: Config, bootstrap_servers: str, output_topic: str, client_id: str = None):
+    def __init__(self,
+                 c: Config,
+                 bootstrap_servers: str,
+                 output_topic: str,
+                 client_id: str = None,
+                 key_column: str = None,
+                 partition_column: str = None,
+                 max_in_flight_bytes: int = 64 * 1024 * 1024):
         super().__init__(c)
 
         self._kafka_conf = {'bootstrap.servers': bootstrap_servers}
@@ -54,13 +69,25 @@ class WriteToKafkaStage(PassThruTypeMixin, SinglePortStage):
             self._kafka_conf['client.id'] = client_id
 
         self._output_topic = output_topic
-        self._poll_time = 0.2
         self._max_concurrent = c.num_threads
 
+        self._controller = WriteToKafkaController(self._kafka_conf,
+                                                  output_topic,
+                                                  key_column=key_column,
+                                                  partition_column=partition_column,
+                                                  max_in_flight_bytes=max_in_flight_bytes)
+
     @property
     def name(self) -> str:
         return "to-kafka"
 
+    @property
+    def stats(self) -> dict[str, float]:
+        """
+        Throughput counters of the producer, see `WriteToKafkaController.stats`.
+        """
+        return self._controller.stats
+
     def accepted_types(self) -> typing.Tuple:
         """
         Returns accepted input types for this stage.
@@ -78,61 +105,19 @@ class WriteToKafkaStage(PassThruTypeMixin, SinglePortStage):
 
     def _build_single(self, builder: mrc.Builder, input_node: mrc.SegmentObject) -> mrc.SegmentObject:
 
-        # Convert the messages to rows of strings
         def node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
 
-            producer = ck.Producer(self._kafka_conf)
-
-            outstanding_requests = 0
-
-            def on_next(x: MessageMeta):
-                nonlocal outstanding_requests
-
-                def callback(_, msg):
-                    if msg is not None and msg.value() is not None:
-                        pass
-                    else:
-                        # fut.set_exception(err or msg.error())
-                        logger.error(("Error occurred in `to-kafka` stage with broker '%s' "
-                                      "while committing message:\n%s\nError:\n%s"),
-                                     self._kafka_conf["bootstrap.servers"],
-                                     msg.value(),
-                                     msg.error())
-                        sub.on_error(msg.error())
-
-                records = serializers.df_to_json(x.df, strip_newlines=True)
-                for mess in records:
-
-                    # Push all of the messages
-                    while True:
-                        try:
-                            # this runs asynchronously, in C-K's thread
-                            producer.produce(self._output_topic, mess, callback=callback)
-                            break
-                        except BufferError:
-                            time.sleep(self._poll_time)
-                        except Exception:
-                            logger.exception(("Error occurred in `to-kafka` stage with broker '%s' "
-                                              "while committing message:\n%s"),
-                                             self._kafka_conf["bootstrap.servers"],
-                                             mess)
-                            break
-                        finally:
-                            # Try and process some
-                            producer.poll(0)
-
-                while len(producer) > 0:
-                    producer.poll(0)
-
-                return x
+            self._controller.start()
 
             def on_completed():
+                self._controller.flush()
 
-                producer.flush(-1)
-
-            obs.pipe(ops.map(on_next), ops.on_completed(on_completed)).subscribe(sub)
+            try:
+                obs.pipe(ops.map(self._controller.write), ops.on_completed(on_completed)).subscribe(sub)
+            finally:
+                self._controller.stop()
 
-            assert outstanding_requests == 0, "Not all inference requests were completed"
+            logger.debug("`to-kafka` stage completed: %s", self._controller.stats)
 
         # Write to kafka
         node = builder.make_node(self.unique_name, ops.build(node_fn))
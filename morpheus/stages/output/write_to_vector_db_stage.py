@@ -55,6 +55,19 @@ class WriteToVectorDBStage(PassThruTypeMixin, SinglePortStage):
     write_time_interval : float
         Specifies the time interval (in seconds) for writing messages, or writing messages
         when the accumulated batch size is reached.
+    resource_schemas : dict, optional
+        Schemas of the resources to create when they don't exist, keyed by resource name.
+    max_concurrent_inserts : int, optional
+        Maximum number of resources being inserted into concurrently, by default 2. Messages continue to be
+        accumulated while a resource's previous batch is being inserted.
+    flush_rows : int, optional
+        Flush a resource, sealing its segments, once this many rows have been inserted since it was last flushed. By
+        default None.
+    flush_interval : float, optional
+        Flush a resource once this many seconds have passed since it was last flushed, by default None.
+    flush_on_completion : bool, optional
+        Flush each resource once all messages have been written, by default True. When this, `flush_rows` and
+        `flush_interval` are all unset resources are never flushed explicitly.
     **service_kwargs : dict
         Additional keyword arguments to pass when creating a VectorDBService instance.
 
@@ -74,6 +87,10 @@ class WriteToVectorDBStage(PassThruTypeMixin, SinglePortStage):
                  batch_size: int = 1024,
                  write_time_interval: float = 3.0,
                  resource_schemas: dict = None,
+                 max_concurrent_inserts: int = 2,
+                 flush_rows: int = None,
+                 flush_interval: float = None,
+                 flush_on_completion: bool = True,
                  **service_kwargs):
 
         super().__init__(config)
@@ -89,7 +106,11 @@ class WriteToVectorDBStage(PassThruTypeMixin, SinglePortStage):
             "batch_size": batch_size,
             "default_resource_name": resource_name,
             "embedding_column_name": embedding_column_name,
+            "flush_interval": flush_interval,
+            "flush_on_completion": flush_on_completion,
+            "flush_rows": flush_rows,
             "is_service_serialized": is_service_serialized,
+            "max_concurrent_inserts": max_concurrent_inserts,
             "recreate": recreate,
             "resource_kwargs": resource_kwargs,
             "resource_schemas": resource_schemas,
@@ -14,17 +14,20 @@
 # limitations under the License.
 
 import dataclasses
-import datetime as dt
 import logging
 import typing
+from collections import defaultdict
 from collections import deque
 from math import ceil
 
 import cupy as cp
 import mrc
+import numpy as np
 import pandas as pd
 from mrc.core import operators as ops
 
+import cudf
+
 from morpheus.cli.register_stage import register_stage
 from morpheus.config import Config
 from morpheus.config import PipelineModes
@@ -153,19 +156,174 @@ def fftAD(signalvalues: cp.ndarray, percentile=90, zthresh=8, lowpass=None):  #
     return cp.arange(len(signalvalues))[z_score >= zthresh]
 
 
+def _fft_ad_batch(signals: cp.ndarray, percentile=90, zthresh=8, lowpass=None) -> cp.ndarray:
+    """
+    Batched version of `fftAD`, detecting anomalies in each row of `signals` independently.
+
+    Parameters
+    ----------
+    signals : cupy.ndarray
+        2D array with one time signal (real valued) per row, all of the same length.
+    percentile : int, optional
+        Filtering percentile for spectral density based filtering, by default 90.
+    zthresh : int, optional
+        Z-score threshold, can be tuned for datasets and sensitivity, by default 8.
+    lowpass : _type_, optional
+        Filtering percentile for frequency based filtering, by default None.
+
+    Returns
+    -------
+    cupy.ndarray
+        Boolean array with the same shape as `signals`, indicating whether each point is anomalous.
+    """
+    num_points = signals.shape[1]
+
+    # Standardize each signal, signals with no deviation are all 0 sigma away
+    std_dev = cp.std(signals, axis=1, keepdims=True)
+    signals_std = (signals - cp.mean(signals, axis=1, keepdims=True)) / cp.where(std_dev != 0.0, std_dev, 1.0)
+
+    periodogram = (1 / num_points) * (cp.absolute(cp.fft.fft(signals_std, axis=1))**2)
+    periodogram = periodogram[:, :num_points // 2 + 1]
+
+    if lowpass:
+        freq_perct = int(cp.percentile(cp.arange(periodogram.shape[1]), lowpass))
+        indices_mask = cp.zeros_like(periodogram, dtype=bool)
+        indices_mask[:, freq_perct:] = True
+    else:
+        threshold = cp.percentile(periodogram, percentile, axis=1, keepdims=True)
+        indices_mask = (periodogram < threshold)
+
+    rft = cp.fft.rfft(signals, n=num_points, axis=1)
+    rft[indices_mask] = 0
+    recon = cp.fft.irfft(rft, n=num_points, axis=1)
+
+    err = cp.abs(recon - signals)
+    z_score = cp.abs(err - cp.mean(err, axis=1, keepdims=True)) / cp.std(err, axis=1, keepdims=True)
+
+    return z_score >= zthresh
+
+
+class _BinnedCounts:
+    """
+    Ring buffer holding the number of events in each time bin from `first_bin` to `last_bin`. Used internally by
+    `_UserTimeSeries` so that memory is proportional to the number of bins in the window rather than the number of
+    events. The buffer grows to hold outlying events, and shrinks back once they are evicted, but never below the
+    initial `capacity`.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._counts = np.zeros(capacity, dtype=np.int64)
+        self._min_capacity = capacity
+
+        self.first_bin: int = None
+        self.last_bin: int = None
+
+    @property
+    def capacity(self) -> int:
+        return len(self._counts)
+
+    def _resize(self, capacity: int):
+        counts = np.zeros(capacity, dtype=np.int64)
+
+        if (self.first_bin is not None):
+            bins = np.arange(self.first_bin, self.last_bin + 1)
+            counts[bins % len(counts)] = self._counts[bins % self.capacity]
+
+        self._counts = counts
+
+    def _ensure_capacity(self, first_bin: int, last_bin: int):
+        span = last_bin - first_bin + 1
+        if (span > self.capacity):
+            self._resize(1 << (span - 1).bit_length())
+
+    def _shrink_to_fit(self):
+        span = 0 if self.first_bin is None else self.last_bin - self.first_bin + 1
+
+        # Leave room for the span to double, and only shrink by at least half to avoid resizing back and forth
+        capacity = max(self._min_capacity, 2 << max(span - 1, 0).bit_length())
+        if (capacity * 2 <= self.capacity):
+            self._resize(capacity)
+
+    def add(self, event_bins: np.ndarray):
+        """
+        Count one event for each value in `event_bins`.
+        """
+        if (len(event_bins) == 0):
+            return
+
+        (unique_bins, counts) = np.unique(event_bins, return_counts=True)
+
+        first_bin = int(unique_bins[0]) if self.first_bin is None else min(int(unique_bins[0]), self.first_bin)
+        last_bin = int(unique_bins[-1]) if self.last_bin is None else max(int(unique_bins[-1]), self.last_bin)
+
+        self._ensure_capacity(first_bin, last_bin)
+
+        self._counts[unique_bins % self.capacity] += counts
+        self.first_bin = first_bin
+        self.last_bin = last_bin
+
+    def evict_before(self, bin_idx: int):
+        """
+        Remove the counts of all bins before `bin_idx`.
+        """
+        if (self.first_bin is None or self.first_bin >= bin_idx):
+            return
+
+        evict_end = min(bin_idx, self.last_bin + 1)
+        self._counts[np.arange(self.first_bin, evict_end) % self.capacity] = 0
+
+        # The first bin is always the earliest bin holding an event
+        remaining = np.flatnonzero(self.window(evict_end, self.last_bin))
+        if (len(remaining) > 0):
+            self.first_bin = evict_end + int(remaining[0])
+        else:
+            self.first_bin = None
+            self.last_bin = None
+
+        self._shrink_to_fit()
+
+    def window(self, start_bin: int, end_bin: int) -> np.ndarray:
+        """
+        Returns the counts for the bins from `start_bin` to `end_bin` inclusive.
+        """
+        window = np.zeros(max(end_bin - start_bin + 1, 0), dtype=np.int64)
+
+        if (self.first_bin is not None):
+            overlap_start = max(start_bin, self.first_bin)
+            overlap_end = min(end_bin, self.last_bin)
+
+            if (overlap_start <= overlap_end):
+                bins = np.arange(overlap_start, overlap_end + 1)
+                window[overlap_start - start_bin:overlap_end - start_bin + 1] = self._counts[bins % self.capacity]
+
+        return window
+
+
 @dataclasses.dataclass
 class _TimeSeriesAction:
     """
     Dataclass representing actions to be performed. Used internally by `UserTimeSeries`
     """
     perform_calc: bool = False
-    window: pd.DataFrame = None
-    window_start: dt.datetime = None
-    window_end: dt.datetime = None
+    window: np.ndarray = None
+    window_start: int = None
+    window_end: int = None
 
     send_message: bool = False
     message: MultiResponseMessage | ControlMessage = None
 
+    timeseries: "_UserTimeSeries" = None
+    event_bins: np.ndarray = None
+
+
+@dataclasses.dataclass
+class _PendingMessage:
+    """
+    A message waiting for its window to fill, along with the time bin of each of its rows.
+    """
+    message: MultiResponseMessage | ControlMessage
+    event_bins: np.ndarray
+
 
 class _UserTimeSeries:
     """
@@ -202,61 +360,58 @@ class _UserTimeSeries:
         self._filter_percent = filter_percent
         self._zscore_threshold = zscore_threshold
 
-        # Keep track of the max index we have seen. All dataframes must share a single index to confirm order
-        self._processed_index = 0
-        self._holding_timestamps = deque()
-
         # Stateful members
-        self._pending_messages: deque[MultiResponseMessage
-                                      | ControlMessage] = deque()  # Holds the existing messages pending
-        self._timeseries_data: pd.DataFrame = pd.DataFrame(columns=[self._timestamp_col
-                                                                    ])  # Holds all available timeseries data
+        self._pending_messages: deque[_PendingMessage] = deque()  # Holds the existing messages pending
+        self._event_counts = _BinnedCounts(capacity=2 * self._half_window_bins +
+                                           2)  # Number of events in each bin of the window
 
-        self._t0_epoch: float = None
+        self._t0_epoch: pd.Timestamp = None
 
     def _calc_bin_series(self, timeseries: pd.Series) -> pd.Series:
 
         return round(
             (timeseries.dt.round(freq="S") - self._t0_epoch).dt.total_seconds()).astype(int) // self._resolution_sec
 
-    def _calc_outliers(self, action: _TimeSeriesAction):
-
-        # Subtract one bin to add buffers on either side. This makes the calculation of the bins easier
-        window_start = action.window_start - 1
-        window_end = action.window_end
-
-        signal_cp, signal_bins = cp.histogram(cp.array(action.window["event_bin"]),
-                                              bins=cp.arange(window_start, window_end + 1, 1))
-
-        # TODO(MDD): Take this out after testing
-        assert cp.sum(signal_cp) == len(action.window), "All points in window are not accounted for in histogram"
+    def _get_timestamps(self, x: MultiResponseMessage | ControlMessage) -> pd.Series:
+        if isinstance(x, MultiResponseMessage):
+            timestamps = x.get_meta(self._timestamp_col)
+        elif isinstance(x, ControlMessage):
+            timestamps = x.payload().get_data(self._timestamp_col)
 
-        is_anomaly = fftAD(signal_cp, percentile=self._filter_percent, zthresh=self._zscore_threshold)
+        if (isinstance(timestamps, cudf.Series)):
+            timestamps = timestamps.to_pandas()
 
-        if (len(is_anomaly) > 0):
+        return timestamps
 
-            # Convert back to bins
-            is_anomaly = cp.choose(is_anomaly, signal_bins)
+    def _set_anomalies(self, action: _TimeSeriesAction, is_anomaly: np.ndarray, is_complete: bool):
+        """
+        Flags the rows of the action's message which fall in an anomalous bin. `is_anomaly` is the result of the FFT
+        anomaly detection over `action.window`.
+        """
+        if (not is_anomaly.any()):
+            return
 
-            anomalies = action.window["event_bin"].isin(is_anomaly.get())
+        # Convert back to bins
+        anomalous_bins = action.window_start - 1 + np.flatnonzero(is_anomaly)
 
-            # Set the anomalies by matching indexes
-            action.message.set_meta(
-                "ts_anomaly",
-                anomalies[action.message.mess_offset:action.message.mess_offset + action.message.mess_count])
+        # Find anomalies that are in the active message
+        message_anomalies = np.isin(action.event_bins, anomalous_bins)
 
-            idx = action.message.get_meta().index
+        if (not message_anomalies.any()):
+            return
 
-            # Find anomalies that are in the active message
-            # pylint: disable=singleton-comparison
-            paired_anomalies = anomalies[anomalies == True].index.intersection(idx)  # noqa: E712
+        if isinstance(action.message, MultiResponseMessage):
+            action.message.set_meta("ts_anomaly", cp.asarray(message_anomalies))
+        elif isinstance(action.message, ControlMessage):
+            action.message.payload().set_data("ts_anomaly", cp.asarray(message_anomalies))
 
-            # Return the anomalies for priting. But only if the current message has anomalies that will get flagged
-            if (len(paired_anomalies) > 0):
-                return self._t0_epoch + pd.to_timedelta(
-                    (action.window.loc[paired_anomalies]["event_bin"].unique() * self._resolution_sec), unit='s')
+        anomalies = self._t0_epoch + pd.to_timedelta(
+            (np.unique(action.event_bins[message_anomalies]) * self._resolution_sec), unit='s')
 
-        return None
+        if (is_complete):
+            logger.debug("Found anomalies (Shutdown): %s", list(anomalies))
+        else:
+            logger.debug("Found anomalies: %s", list(anomalies))
 
     def _determine_action(self, is_complete: bool) -> typing.Optional[_TimeSeriesAction]:
 
@@ -265,23 +420,14 @@ class _UserTimeSeries:
             return None
 
         # Note: We calculate everything in bins to ensure 1) Full xbins, and 2) Even binning
-        timeseries_start = self._timeseries_data["event_bin"].iloc[0]
-        timeseries_end = self._timeseries_data["event_bin"].iloc[-1]
+        timeseries_start = self._event_counts.first_bin
+        timeseries_end = self._event_counts.last_bin
 
         # Peek the front message
-        x: MultiResponseMessage | ControlMessage = self._pending_messages[0]
+        pending: _PendingMessage = self._pending_messages[0]
 
-        # Get the first message timestamp
-        if isinstance(x, MultiResponseMessage):
-            message_start = calc_bin(x.get_meta(self._timestamp_col).iloc[0], self._t0_epoch, self._resolution_sec)
-            message_end = calc_bin(x.get_meta(self._timestamp_col).iloc[-1], self._t0_epoch, self._resolution_sec)
-        elif isinstance(x, ControlMessage):
-            message_start = calc_bin(pd.Timestamp(x.payload().get_data(self._timestamp_col).iloc[0]),
-                                     self._t0_epoch,
-                                     self._resolution_sec)
-            message_end = calc_bin(pd.Timestamp(x.payload().get_data(self._timestamp_col).iloc[-1]),
-                                   self._t0_epoch,
-                                   self._resolution_sec)
+        message_start = int(pending.event_bins[0])
+        message_end = int(pending.event_bins[-1])
 
         window_start = message_start - self._half_window_bins
         window_end = message_end + self._half_window_bins
@@ -299,7 +445,7 @@ class _UserTimeSeries:
 
             # Not shutting down and we arent warm, send through
             if (not self._is_warm and not is_complete):
-                return _TimeSeriesAction(send_message=True, message=self._pending_messages.popleft())
+                return _TimeSeriesAction(send_message=True, message=self._pending_messages.popleft().message)
 
         self._is_warm = True
 
@@ -321,7 +467,7 @@ class _UserTimeSeries:
             if (is_complete and self._cold_end):
                 # Shutting down and we have a cold ending, just empty the message
                 logger.debug("is_complete and self._cold_end")
-                return _TimeSeriesAction(send_message=True, message=self._pending_messages.popleft())
+                return _TimeSeriesAction(send_message=True, message=self._pending_messages.popleft().message)
 
             # Shutting down and hot end
             # logger.debug("Hot End. Processing. TS: %s", timeseries_start._repr_base)
@@ -335,22 +481,31 @@ class _UserTimeSeries:
                      window_end,
                      timeseries_end)
 
-        # First, remove elements in the front queue that are too old
-        self._timeseries_data.drop(self._timeseries_data[self._timeseries_data["event_bin"] < window_start].index,
-                                   inplace=True)
+        # First, remove bins that are too old
+        self._event_counts.evict_before(window_start)
 
-        # Now grab timestamps within the window
-        window_timestamps_df = self._timeseries_data[self._timeseries_data["event_bin"] <= window_end]
+        # Build the signal with one bin of buffer before the window. The last bin also holds the events in
+        # `window_end`, matching the closed right edge of a histogram over the same range
+        window = self._event_counts.window(window_start - 1, window_end)
+        window[-2] += window[-1]
+
+        pending = self._pending_messages.popleft()
 
         # Return info to perform calc
         return _TimeSeriesAction(perform_calc=True,
-                                 window=window_timestamps_df,
+                                 window=window[:-1],
                                  window_start=window_start,
                                  window_end=window_end,
                                  send_message=True,
-                                 message=self._pending_messages.popleft())
+                                 message=pending.message,
+                                 timeseries=self,
+                                 event_bins=pending.event_bins)
 
-    def _calc_timeseries(self, x: MultiResponseMessage | ControlMessage, is_complete: bool):
+    def _calc_timeseries(self, x: MultiResponseMessage | ControlMessage, is_complete: bool) -> list[_TimeSeriesAction]:
+        """
+        Adds the events of `x` to the time series and returns the actions for every pending message which is ready.
+        The anomaly calculations are performed by the caller, allowing them to be batched.
+        """
 
         if (x is not None):
 
@@ -360,61 +515,34 @@ class _UserTimeSeries:
             elif isinstance(x, ControlMessage):
                 x.payload().set_data("ts_anomaly", False)
 
-            # Save this message in the pending queue
-            self._pending_messages.append(x)
+            timestamps = self._get_timestamps(x)
 
-            if isinstance(x, MultiResponseMessage):
-                new_timedata = x.get_meta([self._timestamp_col])
-            elif isinstance(x, ControlMessage):
-                new_timedata = x.payload().get_data([self._timestamp_col]).to_pandas()
-
-            # Save this message event times in the event list. Ensure the values are always sorted
-            self._timeseries_data = pd.concat([self._timeseries_data, new_timedata]).sort_index()
-
-            # Check to see if these are out of order. If they are, just return empty and try again next item
-            if (len(
-                    pd.RangeIndex(start=self._processed_index, stop=self._timeseries_data.index[-1] + 1,
-                                  step=1).difference(self._timeseries_data.index)) > 0):
-                return []
+            # If this is our first time data, set the t0 time
+            if (self._t0_epoch is None):
+                self._t0_epoch = timestamps.iloc[0]
 
-            # Save the new max index
-            self._processed_index = self._timeseries_data.index[-1] + 1
+                # TODO(MDD): Floor to the day to unsure all buckets are always aligned with val data
+                self._t0_epoch = self._t0_epoch.floor(freq="D")
 
-        # If this is our first time data, set the t0 time
-        if (self._t0_epoch is None):
-            self._t0_epoch = self._timeseries_data[self._timestamp_col].iloc[0]
+            # Calc the bins for the new events, and add them to the counts
+            event_bins = self._calc_bin_series(timestamps).to_numpy()
+            self._event_counts.add(event_bins)
 
-            # TODO(MDD): Floor to the day to unsure all buckets are always aligned with val data
-            self._t0_epoch = self._t0_epoch.floor(freq="D")
-
-        # Calc the bins for the timeseries data
-        self._timeseries_data["event_bin"] = self._calc_bin_series(self._timeseries_data[self._timestamp_col])
+            # Save this message in the pending queue
+            self._pending_messages.append(_PendingMessage(message=x, event_bins=event_bins))
 
         # At this point there are 3 things that can happen
         # 1. We are warming up to build a front buffer. Save the current message times and send the message on
         # 2. We are warmed up and building a back buffer, Save the current message, and message times. Hold the message
         # 3. We have a front and back buffer. Perform the calc, identify outliers, and send the message on. Repeat
 
-        output_messages = []
+        actions = []
 
         # Now we calc if we have enough range
         while action := self._determine_action(is_complete):
+            actions.append(action)
 
-            if (action.perform_calc):
-                # Actually do the calc
-                anomalies = self._calc_outliers(action)
-
-                if (anomalies is not None):
-                    if (is_complete):
-                        logger.debug("Found anomalies (Shutdown): %s", list(anomalies))
-                    else:
-                        logger.debug("Found anomalies: %s", list(anomalies))
-
-            if (action.send_message):
-                # Now send the message
-                output_messages.append(action.message)
-
-        return output_messages
+        return actions
 
 
 @register_stage("timeseries", modes=[PipelineModes.AE])
@@ -512,7 +640,30 @@ class TimeSeriesStage(PassThruTypeMixin, SinglePortStage):
                                                                  filter_percent=self._filter_percent,
                                                                  zscore_threshold=self._zscore_threshold)
 
-        return self._timeseries_per_user[user_id]._calc_timeseries(x, False)
+        actions = self._timeseries_per_user[user_id]._calc_timeseries(x, False)
+
+        return self._process_actions(actions, False)
+
+    def _process_actions(self, actions: list[_TimeSeriesAction],
+                         is_complete: bool) -> list[MultiResponseMessage | ControlMessage]:
+        """
+        Performs the anomaly calculations for `actions`, batching all windows of the same length into a single FFT,
+        and returns the messages to send in order.
+        """
+        windows_by_len: dict[int, list[_TimeSeriesAction]] = defaultdict(list)
+        for action in actions:
+            if (action.perform_calc):
+                windows_by_len[len(action.window)].append(action)
+
+        for calc_actions in windows_by_len.values():
+            signals = cp.asarray(np.stack([action.window for action in calc_actions]))
+
+            is_anomaly = _fft_ad_batch(signals, percentile=self._filter_percent, zthresh=self._zscore_threshold).get()
+
+            for (action, action_is_anomaly) in zip(calc_actions, is_anomaly):
+                action.timeseries._set_anomalies(action, action_is_anomaly, is_complete)
+
+        return [action.message for action in actions if action.send_message]
 
     def _build_single(self, builder: mrc.Builder, input_node: mrc.SegmentObject) -> mrc.SegmentObject:
 
@@ -524,13 +675,12 @@ class TimeSeriesStage(PassThruTypeMixin, SinglePortStage):
 
         def on_completed():
 
-            to_send = []
+            actions = []
 
-            for timestamp in self._timeseries_per_user.values():
-                message_list: typing.List[MultiResponseMessage | ControlMessage] = timestamp._calc_timeseries(
-                    None, True)
+            for timeseries in self._timeseries_per_user.values():
+                actions.extend(timeseries._calc_timeseries(None, True))
 
-                to_send = to_send + message_list
+            to_send = self._process_actions(actions, True)
 
             return to_send if len(to_send) > 0 else None
 
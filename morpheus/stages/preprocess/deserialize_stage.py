@@ -20,11 +20,13 @@ import mrc
 
 from morpheus.cli.register_stage import register_stage
 from morpheus.config import Config
+from morpheus.config import ExecutionMode
 from morpheus.config import PipelineModes
 from morpheus.messages import ControlMessage
 from morpheus.messages import MessageMeta
 from morpheus.messages import MultiMessage
 from morpheus.modules.preprocess.deserialize import DeserializeLoaderFactory
+from morpheus.pipeline.execution_mode_mixins import GpuAndCpuMixin
 from morpheus.pipeline.multi_message_stage import MultiMessageStage
 from morpheus.pipeline.stage_schema import StageSchema
 
@@ -34,7 +36,7 @@ logger = logging.getLogger(__name__)
 @register_stage("deserialize",
                 modes=[PipelineModes.FIL, PipelineModes.NLP, PipelineModes.OTHER],
                 ignore_args=["message_type", "task_type", "task_payload"])
-class DeserializeStage(MultiMessageStage):
+class DeserializeStage(GpuAndCpuMixin, MultiMessageStage):
     """
     Messages are logically partitioned based on the pipeline config's `pipeline_batch_size` parameter.
 
@@ -80,6 +82,8 @@ class DeserializeStage(MultiMessageStage):
         self._task_payload = task_payload
 
         if (self._message_type is ControlMessage):
+            if (c.execution_mode == ExecutionMode.CPU):
+                raise ValueError("`ControlMessage` is not supported in the CPU execution mode, use `MultiMessage`.")
             if ((self._task_type is None) != (self._task_payload is None)):
                 raise ValueError("Both `task_type` and `task_payload` must be specified if either is specified.")
         elif (self._message_type is MultiMessage):
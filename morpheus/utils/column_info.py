@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import dataclasses
-import json
 import logging
 import re
 import typing
@@ -25,6 +24,8 @@ import pandas as pd
 
 import cudf
 
+from morpheus.utils.json_flatten import flatten_json_column
+
 if (typing.TYPE_CHECKING):
     with warnings.catch_warnings():
         # Ignore warning regarding tensorflow not being installed
@@ -614,10 +615,13 @@ class PreparedDFInfo:
 def _json_flatten(df_input: typing.Union[pd.DataFrame, cudf.DataFrame],
                   input_columns: dict[str, str],
                   json_cols: list[str],
-                  preserve_re: re.Pattern = None):
+                  preserve_re: re.Pattern = None,
+                  num_workers: int = 1,
+                  chunk_size: int = 10000):
     """
     Prepares a DataFrame for processing by flattening JSON columns and converting to Pandas if necessary. Will remove
-    all columns that are not specified in `input_columns` or matched by `preserve_re`.
+    all columns that are not specified in `input_columns` or matched by `preserve_re`. Only the JSON keys needed by
+    `input_columns` are flattened.
 
     Parameters
     ----------
@@ -629,6 +633,10 @@ def _json_flatten(df_input: typing.Union[pd.DataFrame, cudf.DataFrame],
         List of JSON columns to flatten.
     preserve_re : re.Pattern, optional
         A RegEx where matching column names will be preserved, by default None
+    num_workers : int, optional
+        Number of worker processes used to flatten each JSON column, by default 1
+    chunk_size : int, optional
+        Number of rows of a JSON column flattened by a worker process at a time, by default 10000
 
     Returns
     -------
@@ -659,17 +667,12 @@ def _json_flatten(df_input: typing.Union[pd.DataFrame, cudf.DataFrame],
             if (col not in columns_to_keep):
                 continue
 
-            pd_series = df_input[col]
-
-            # Get the flattened columns
-            pd_series = pd_series.apply(lambda x: x if isinstance(x, dict) else json.loads(x))
-            pdf_norm = pd.json_normalize(pd_series)
-
-            # Prefix column names with the JSON column name
-            pdf_norm.rename(columns=lambda x, col=col: col + "." + x, inplace=True)
-
-            # Reset the index otherwise there is a conflict
-            pdf_norm.set_index(df_input.index, inplace=True)
+            # Get the flattened columns, skipping any keys which would be removed below
+            pdf_norm = flatten_json_column(df_input[col],
+                                           prefix=col,
+                                           keys=[name for name in input_columns if name.startswith(col + ".")],
+                                           num_workers=num_workers,
+                                           chunk_size=chunk_size)
 
             json_normalized.append(pdf_norm)
 
@@ -732,6 +735,10 @@ class DataFrameInputSchema:
         The columns to preserve.
     row_filter : Callable[[pandas.DataFrame], pandas.DataFrame]
         A function to filter the rows of the DataFrame.
+    json_flatten_workers : int
+        Number of worker processes used to flatten the `json_columns`, by default 1 (flatten in the calling process).
+    json_flatten_chunk_size : int
+        Number of rows of a JSON column flattened by a worker process at a time.
 
     Methods
     -------
@@ -744,6 +751,8 @@ class DataFrameInputSchema:
     column_info: typing.List[ColumnInfo] = dataclasses.field(default_factory=list)
     preserve_columns: typing.Pattern[str] = dataclasses.field(default_factory=list)
     row_filter: typing.Callable[[pd.DataFrame], pd.DataFrame] = None
+    json_flatten_workers: int = 1
+    json_flatten_chunk_size: int = 10000
 
     json_output_columns: typing.List[tuple[str, str]] = dataclasses.field(init=False, repr=False)
     input_columns: typing.Dict[str, str] = dataclasses.field(init=False, repr=False)
@@ -795,6 +804,8 @@ class DataFrameInputSchema:
         self.prep_dataframe = partial(_json_flatten,
                                       input_columns=self.input_columns,
                                       json_cols=self.json_columns,
-                                      preserve_re=self.preserve_columns)
+                                      preserve_re=self.preserve_columns,
+                                      num_workers=self.json_flatten_workers,
+                                      chunk_size=self.json_flatten_chunk_size)
 
         self.nvt_workflow = None
@@ -21,12 +21,9 @@ import mrc
 from watchdog.events import FileSystemEvent
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
-from watchdog.utils.dirsnapshot import DirectorySnapshot
-from watchdog.utils.dirsnapshot import DirectorySnapshotDiff
-from watchdog.utils.dirsnapshot import EmptyDirectorySnapshot
-from watchdog.utils.patterns import filter_paths
 
 from morpheus.common import FiberQueue
+from morpheus.utils.file_discovery import IncrementalFileDiscovery
 from morpheus.utils.producer_consumer_queue import Closed
 
 logger = logging.getLogger(__name__)
@@ -58,6 +55,10 @@ class DirectoryWatcher():
         Maximum queue size to hold the file paths to be processed that match `input_glob`.
     batch_timeout: float
         Timeout to retrieve batch messages from the queue.
+    late_arrival_window: float, optional
+        When polling, files modified more than this many seconds before the newest file seen are skipped. By default
+        None, every new file is emitted regardless of its modification time, such as files copied with their
+        modification time preserved.
     """
 
     def __init__(self,
@@ -67,7 +68,8 @@ class DirectoryWatcher():
                  sort_glob: bool,
                  recursive: bool,
                  queue_max_size: int,
-                 batch_timeout: float):
+                 batch_timeout: float,
+                 late_arrival_window: float = None):
 
         self._input_glob = input_glob
         self._watch_directory = watch_directory
@@ -76,6 +78,7 @@ class DirectoryWatcher():
         self._recursive = recursive
         self._queue_max_size = queue_max_size
         self._batch_timeout = batch_timeout
+        self._late_arrival_window = late_arrival_window
 
         # Determine the directory to watch and the match pattern from the glob
         glob_split = self._input_glob.split("*", 1)
@@ -145,30 +148,32 @@ class DirectoryWatcher():
 
         return f_queue
 
+    def _create_discovery(self) -> IncrementalFileDiscovery:
+        # Rather than taking a snapshot of the whole directory on each poll, only list the directories which changed,
+        # using inotify where available
+        input_glob = self._input_glob
+        if (self._recursive):
+            # Match files in any subdirectory, as the wildcards of a directory snapshot filter would
+            input_glob = os.path.join(self._dir_to_watch, "**", self._match_pattern)
+
+        return IncrementalFileDiscovery([input_glob],
+                                        late_arrival_window=self._late_arrival_window,
+                                        use_inotify=self._watch_directory)
+
     def _generate_via_polling(self):
 
         # Its a bit ugly, but utilize a filber queue to yield the thread. This will be improved in the future
         file_queue = FiberQueue(self._queue_max_size)
 
-        snapshot = EmptyDirectorySnapshot()
+        discovery = self._create_discovery()
 
         while (True):
 
-            # Get a new snapshot
-            new_snapshot = DirectorySnapshot(self._dir_to_watch, recursive=self._recursive)
-
-            # Take the diff from the last one
-            diff_events = DirectorySnapshotDiff(snapshot, new_snapshot)
-            snapshot = new_snapshot
-
-            files_to_process = filter_paths(diff_events.files_created, included_patterns=[self._input_glob])
+            files_to_process = [file.path for file in discovery.discover()]
 
             if (self._sort_glob):
                 files_to_process = sorted(files_to_process)
 
-            # Convert from generator into list
-            files_to_process = list(files_to_process)
-
             if (len(files_to_process) > 0):
                 # is_running = yield files_to_process
                 file_queue.put(files_to_process)
@@ -195,6 +200,8 @@ class DirectoryWatcher():
                 # Exit
                 break
 
+        discovery.close()
+
     def _generate_via_watcher(self):
 
         # Gets a queue of filenames as they come in. Returns list[str]
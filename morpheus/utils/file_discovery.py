@@ -0,0 +1,493 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Incremental discovery of new files matching fsspec glob patterns."""
+
+import fnmatch
+import json
+import logging
+import os
+import posixpath
+import re
+import threading
+import time
+import typing
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+import fsspec
+from fsspec.utils import glob_translate
+
+logger = logging.getLogger(__name__)
+
+GLOB_CHARS = ("*", "?", "[")
+
+# A directory listed within this many seconds of its modification time is listed again on the next call to `discover`,
+# since files created within the resolution of the modification time would not change it
+MTIME_RESOLUTION_SECS = 1.0
+
+
+@dataclass
+class _DirListing:
+    mtime: float
+    listed_at: float
+    subdirs: typing.List[typing.Tuple[str, float]]
+
+
+def get_modified_time(info: dict) -> typing.Optional[float]:
+    """
+    Returns the modification time as a POSIX timestamp from the entries returned by `fsspec.AbstractFileSystem.ls`, or
+    `None` if the filesystem does not report one.
+    """
+    for key in ("mtime", "LastModified", "last_modified", "updated", "created"):
+        value = info.get(key)
+
+        if (value is None):
+            continue
+
+        if (isinstance(value, datetime)):
+            if (value.tzinfo is None):
+                value = value.replace(tzinfo=timezone.utc)
+
+            return value.timestamp()
+
+        if (isinstance(value, str)):
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+        return float(value)
+
+    return None
+
+
+def get_partition_end(path: str, partition_regex: re.Pattern) -> typing.Optional[float]:
+    """
+    Returns the end of the time period of a date partitioned directory as a POSIX timestamp, or `None` if the path
+    does not match `partition_regex`.
+
+    Parameters
+    ----------
+    path : str
+        Directory path.
+    partition_regex : re.Pattern
+        Regex with the named groups `year` and optionally `month`, `day` and `hour`, as used by `date_extractor`. The
+        partitions are assumed to be in UTC.
+    """
+    match = partition_regex.search(path)
+
+    if (match is None):
+        return None
+
+    groups = {key: int(value) for key, value in match.groupdict().items() if value}
+
+    if ("year" not in groups):
+        return None
+
+    start = datetime(year=groups["year"],
+                     month=groups.get("month", 1),
+                     day=groups.get("day", 1),
+                     hour=groups.get("hour", 0),
+                     tzinfo=timezone.utc)
+
+    if ("hour" in groups):
+        end = start + timedelta(hours=1)
+    elif ("day" in groups):
+        end = start + timedelta(days=1)
+    elif ("month" in groups):
+        end = start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    else:
+        end = start.replace(year=start.year + 1)
+
+    return end.timestamp()
+
+
+class _GlobPattern:
+
+    def __init__(self, url: str):
+        (self.fs, path) = fsspec.core.url_to_fs(url)
+        path = path.rstrip("/")
+
+        parts = path.split("/")
+        num_root_parts = next((i for (i, part) in enumerate(parts) if any(c in part for c in GLOB_CHARS)), len(parts))
+
+        # The directory to start listing from and the pattern components below it
+        self.root = "/".join(parts[:num_root_parts]) or "/"
+        self.parts = parts[num_root_parts:]
+        self.path = path
+
+        self.is_recursive = "**" in self.parts
+        self.regex = re.compile(glob_translate(path)) if self.is_recursive else None
+
+    @property
+    def has_wildcard(self) -> bool:
+        return len(self.parts) > 0
+
+    def match_dir(self, name: str, depth: int) -> bool:
+        """Whether a directory at `depth` below the root can contain matching files."""
+        if (self.is_recursive):
+            return True
+
+        return depth < len(self.parts) - 1 and fnmatch.fnmatchcase(name, self.parts[depth])
+
+    def match_file(self, path: str, name: str, depth: int) -> bool:
+        """Whether a file at `depth` below the root matches the pattern."""
+        if (self.is_recursive):
+            return self.regex.match(path) is not None
+
+        return depth == len(self.parts) - 1 and fnmatch.fnmatchcase(name, self.parts[-1])
+
+
+class IncrementalFileDiscovery:
+    """
+    Discovers the files matching fsspec glob patterns which are new since the previous call to `discover`, without
+    re-listing every directory on each call.
+
+    A cursor holds the modification time and path of the newest discovered file. Files modified more than
+    `late_arrival_window` seconds before the cursor are assumed to have been discovered already and are skipped, which
+    keeps the set of seen files bounded to the files within the window. Directories are skipped when:
+
+    - Their modification time is unchanged since they were last listed, on filesystems reporting one such as local
+      directories. The modification time of a directory only changes when entries are added to or removed from it.
+    - They have not been changed according to inotify, when `use_inotify` is set and the directories are local.
+    - They are date partitions, matching `partition_regex`, ending before the window, on any filesystem such as S3.
+
+    Files modified after being discovered are not discovered again. Files which are deleted are forgotten when their
+    directory is next listed, allowing a new file with the same name to be discovered.
+
+    Parameters
+    ----------
+    filenames : typing.List[str]
+        List of paths to discover files from, can include wildcard characters `*` as defined by `fsspec`. Every path
+        must use the same filesystem.
+    late_arrival_window : float, optional
+        Files modified up to this many seconds before the newest discovered file are still discovered, older files are
+        skipped. By default None, discovering files regardless of their modification time, such as files copied with
+        their modification time preserved, and remembering every discovered file.
+    partition_regex : re.Pattern, optional
+        Regex matched against directory paths, with the named groups `year` and optionally `month`, `day` and `hour`
+        as used by `morpheus.utils.file_utils.date_extractor`. For example `(?P<year>\\d{4})/(?P<month>\\d{2})` would
+        match the directory `logs/2024/05`. Partitions ending before the window are not listed. By default None.
+    cursor_file : str, optional
+        Local JSON file the cursor is saved to after each call to `discover`, allowing discovery to continue where it
+        left off after a restart. By default None.
+    use_inotify : bool, optional
+        When True, local directories are watched with inotify, when available, and only the changed directories are
+        listed. By default False.
+    """
+
+    def __init__(self,
+                 filenames: typing.List[str],
+                 late_arrival_window: float = None,
+                 partition_regex: re.Pattern = None,
+                 cursor_file: str = None,
+                 use_inotify: bool = False):
+        self._patterns = [_GlobPattern(url) for url in filenames]
+        self._late_arrival_window = late_arrival_window
+        self._partition_regex = partition_regex
+        self._cursor_file = cursor_file
+
+        # Modification time and path of the newest discovered file
+        self._cursor: typing.Tuple[float, str] = None
+
+        # Discovered files within the window, by directory
+        self._files_seen: typing.Dict[str, typing.Dict[str, float]] = {}
+
+        self._dir_listings: typing.Dict[str, _DirListing] = {}
+
+        self._use_inotify = use_inotify
+        self._observer = None
+        self._changed_dirs: typing.Set[str] = set()
+        self._listing_changed_dirs: typing.Set[str] = set()
+        self._changed_dirs_lock = threading.Lock()
+
+        if (cursor_file is not None and os.path.exists(cursor_file)):
+            self._load_cursor()
+
+    @property
+    def cursor(self) -> typing.Optional[typing.Tuple[float, str]]:
+        """
+        Modification time and path of the newest discovered file.
+        """
+        return self._cursor
+
+    @property
+    def num_files_seen(self) -> int:
+        """
+        Number of discovered files within the late arrival window.
+        """
+        return sum(len(files) for files in self._files_seen.values())
+
+    @property
+    def fs(self) -> fsspec.AbstractFileSystem:
+        return self._patterns[0].fs if len(self._patterns) > 0 else fsspec.filesystem("file")
+
+    def _load_cursor(self):
+        with open(self._cursor_file, encoding="UTF-8") as f:
+            state = json.load(f)
+
+        self._cursor = (state["mtime"], state["path"])
+
+        for (path, mtime) in state["files_seen"].items():
+            self._files_seen.setdefault(posixpath.dirname(path), {})[path] = mtime
+
+    def _save_cursor(self):
+        if (self._cursor is None):
+            return
+
+        state = {
+            "mtime": self._cursor[0],
+            "path": self._cursor[1],
+            "files_seen": {
+                path: mtime
+                for files in self._files_seen.values()
+                for (path, mtime) in files.items()
+            },
+        }
+
+        # Write to a temporary file first so an interrupted write never leaves a partial cursor behind
+        tmp_file = f"{self._cursor_file}.tmp"
+        with open(tmp_file, "w", encoding="UTF-8") as f:
+            json.dump(state, f)
+
+        os.replace(tmp_file, self._cursor_file)
+
+    @property
+    def _min_mtime(self) -> typing.Optional[float]:
+        if (self._cursor is None or self._late_arrival_window is None):
+            return None
+
+        return self._cursor[0] - self._late_arrival_window
+
+    def _is_local(self, fs: fsspec.AbstractFileSystem) -> bool:
+        protocols = fs.protocol if isinstance(fs.protocol, tuple) else (fs.protocol, )
+
+        return "file" in protocols or "local" in protocols
+
+    def _start_inotify(self):
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers.inotify import InotifyObserver
+        except ImportError:
+            logger.info("inotify is not available, falling back to polling directories")
+            self._use_inotify = False
+            return
+
+        discovery = self
+
+        class _ChangedDirHandler(FileSystemEventHandler):
+
+            def on_any_event(self, event):
+                paths = [event.src_path, getattr(event, "dest_path", None)]
+
+                with discovery._changed_dirs_lock:
+                    for path in paths:
+                        if (path):
+                            discovery._changed_dirs.add(posixpath.dirname(path))
+
+                            if (event.is_directory):
+                                discovery._changed_dirs.add(path)
+
+        observer = InotifyObserver()
+        observer.daemon = True
+        observer.name = "IncrementalFileDiscovery"
+
+        roots = {pattern.root for pattern in self._patterns if self._is_local(pattern.fs)}
+        if (len(roots) == 0):
+            self._use_inotify = False
+            return
+
+        for root in roots:
+            if (os.path.isdir(root)):
+                observer.schedule(_ChangedDirHandler(), root, recursive=True)
+
+        observer.start()
+        self._observer = observer
+
+    def close(self):
+        """
+        Stop watching directories with inotify.
+        """
+        if (self._observer is not None):
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def _list_dir(self, fs: fsspec.AbstractFileSystem, dir_path: str,
+                  dir_mtime: typing.Optional[float]) -> typing.Optional[typing.List[dict]]:
+        """
+        Returns the entries of `dir_path`, or `None` if the directory is unchanged since it was last listed.
+        """
+        listing = self._dir_listings.get(dir_path)
+
+        if (listing is not None):
+            if (self._observer is not None):
+                if (dir_path not in self._listing_changed_dirs):
+                    return None
+
+            elif (dir_mtime is not None and dir_mtime == listing.mtime
+                  and listing.listed_at - listing.mtime > MTIME_RESOLUTION_SECS):
+                return None
+
+        listed_at = time.time()
+
+        try:
+            entries = fs.ls(dir_path, detail=True, refresh=True)
+        except FileNotFoundError:
+            self._dir_listings.pop(dir_path, None)
+            self._files_seen.pop(dir_path, None)
+            return []
+
+        subdirs = [(entry["name"].rstrip("/"), get_modified_time(entry)) for entry in entries
+                   if entry["type"] == "directory"]
+
+        if (dir_mtime is not None):
+            self._dir_listings[dir_path] = _DirListing(mtime=dir_mtime, listed_at=listed_at, subdirs=subdirs)
+
+        # Forget any files which have been removed
+        files_seen = self._files_seen.get(dir_path)
+        if (files_seen):
+            file_names = {entry["name"] for entry in entries}
+            for path in [path for path in files_seen if path not in file_names]:
+                files_seen.pop(path)
+
+        return entries
+
+    def _walk(self,
+              pattern: _GlobPattern,
+              dir_path: str,
+              dir_mtime: typing.Optional[float],
+              depth: int,
+              found: typing.Dict[str, float]):
+        entries = self._list_dir(pattern.fs, dir_path, dir_mtime)
+
+        if (entries is None):
+            # Unchanged, only the subdirectories need to be checked
+            listing = self._dir_listings[dir_path]
+            subdirs = listing.subdirs
+
+            if (self._observer is None):
+                subdirs = [(path, self._get_dir_mtime(pattern.fs, path)) for (path, _) in subdirs]
+        else:
+            subdirs = []
+
+            for entry in entries:
+                path = entry["name"].rstrip("/")
+
+                if (entry["type"] == "directory"):
+                    subdirs.append((path, get_modified_time(entry)))
+                elif (pattern.match_file(path, posixpath.basename(path), depth)):
+                    mtime = get_modified_time(entry)
+                    found[path] = mtime if mtime is not None else 0.0
+
+        min_mtime = self._min_mtime
+
+        for (path, mtime) in subdirs:
+            if (not pattern.match_dir(posixpath.basename(path), depth)):
+                continue
+
+            if (min_mtime is not None and self._partition_regex is not None):
+                partition_end = get_partition_end(path, self._partition_regex)
+
+                if (partition_end is not None and partition_end < min_mtime):
+                    continue
+
+            self._walk(pattern, path, mtime, depth + 1, found)
+
+    def _get_dir_mtime(self, fs: fsspec.AbstractFileSystem, path: str) -> typing.Optional[float]:
+        try:
+            return get_modified_time(fs.info(path))
+        except FileNotFoundError:
+            return None
+
+    def _find_files(self, pattern: _GlobPattern) -> typing.Dict[str, float]:
+        found: typing.Dict[str, float] = {}
+
+        if (not pattern.has_wildcard):
+            try:
+                info = pattern.fs.info(pattern.path)
+            except FileNotFoundError:
+                return found
+
+            if (info["type"] != "directory"):
+                mtime = get_modified_time(info)
+                found[info["name"]] = mtime if mtime is not None else 0.0
+
+            return found
+
+        if (not pattern.fs.isdir(pattern.root)):
+            return found
+
+        root_mtime = self._get_dir_mtime(pattern.fs, pattern.root) if self._is_local(pattern.fs) else None
+
+        self._walk(pattern, pattern.root, root_mtime, 0, found)
+
+        return found
+
+    def discover(self) -> fsspec.core.OpenFiles:
+        """
+        Returns the files which are new since the previous call, sorted by modification time and path.
+        """
+        if (self._use_inotify and self._observer is None):
+            # Started before the first listing so no changes are missed
+            self._start_inotify()
+
+        # Directories changed during this call are listed again by the next one
+        with self._changed_dirs_lock:
+            (self._listing_changed_dirs, self._changed_dirs) = (self._changed_dirs, set())
+
+        found: typing.Dict[str, float] = {}
+        for pattern in self._patterns:
+            found.update(self._find_files(pattern))
+
+        min_mtime = self._min_mtime
+        new_files: typing.List[typing.Tuple[float, str]] = []
+
+        for (path, mtime) in found.items():
+            if (min_mtime is not None and mtime < min_mtime):
+                continue
+
+            files_seen = self._files_seen.setdefault(posixpath.dirname(path), {})
+            if (path in files_seen):
+                continue
+
+            files_seen[path] = mtime
+            new_files.append((mtime, path))
+
+        new_files.sort()
+
+        if (len(new_files) > 0 and (self._cursor is None or new_files[-1] > self._cursor)):
+            self._cursor = new_files[-1]
+
+        self._prune_files_seen()
+
+        if (self._cursor_file is not None):
+            self._save_cursor()
+
+        fs = self.fs
+        return fsspec.core.OpenFiles([fsspec.core.OpenFile(fs, path) for (_, path) in new_files], fs=fs)
+
+    def _prune_files_seen(self):
+        min_mtime = self._min_mtime
+
+        if (min_mtime is None):
+            return
+
+        for dir_path in list(self._files_seen.keys()):
+            files_seen = self._files_seen[dir_path]
+
+            for path in [path for (path, mtime) in files_seen.items() if mtime < min_mtime]:
+                files_seen.pop(path)
+
+            if (len(files_seen) == 0):
+                self._files_seen.pop(dir_path)
@@ -13,6 +13,7 @@
 # limitations under the License.
 """HTTP utilities"""
 
+import asyncio
 import logging
 import time
 import typing
@@ -22,6 +23,9 @@ from http import HTTPStatus
 import requests
 import urllib3
 
+if (typing.TYPE_CHECKING):
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
 
@@ -145,6 +149,64 @@ def request_with_retry(
             time.sleep(actual_sleep_time)
 
 
+async def request_with_retry_async(
+        request_kwargs: dict,
+        session: "aiohttp.ClientSession",
+        max_retries: int = 10,
+        sleep_time: float = 0.1,
+        accept_status_codes: typing.Iterable[HTTPStatus] = (HTTPStatus.OK, ),
+        respect_retry_after_header: bool = True,
+        on_success_fn: typing.Optional[typing.Callable] = None) -> typing.Union["aiohttp.ClientResponse", typing.Any]:
+    """
+    Asynchronous counterpart of `request_with_retry` performing the request with an `aiohttp.ClientSession`, which is
+    reused across retries since the session manages its own connection pool.
+
+    The body of the response is read before it is returned, so the response remains usable after its connection is
+    released back to the pool. Upon successfull completion, the `on_success_fn` is called (if not `None`) with the
+    response object and its return value is returned, otherwise the response object is returned.
+
+    If `on_success_fn` raises an exception, it is treated as a failure and the request is retried.
+    """
+
+    try_count = 0
+    while try_count <= max_retries:
+        # set to an int if the response has a Retry-After header and `respect_retry_after_header` is True
+        retry_after_header = None
+
+        try:
+            async with session.request(**request_kwargs) as response:
+                body = await response.read()
+                if response.status in accept_status_codes:
+                    if on_success_fn is not None:
+                        return on_success_fn(response)
+
+                    return response
+
+                if respect_retry_after_header and 'Retry-After' in response.headers:
+                    retry_after_header = int(response.headers['Retry-After'])
+
+                raise RuntimeError(f"Received unexpected status code {response.status}: "
+                                   f"{body.decode('UTF-8', errors='replace')}")
+        except Exception as e:
+            try_count += 1
+
+            if try_count >= max_retries:
+                logger.error("Failed after %s retries: %s", max_retries, e)
+                raise e
+
+            if retry_after_header is not None:
+                actual_sleep_time = retry_after_header
+            else:
+                actual_sleep_time = (2**(try_count - 1)) * sleep_time
+
+            logger.error("Error occurred performing %s request to %s: %s",
+                         request_kwargs['method'],
+                         request_kwargs['url'],
+                         e)
+            logger.debug("Sleeping for %s seconds before retrying request again", actual_sleep_time)
+            await asyncio.sleep(actual_sleep_time)
+
+
 def prepare_url(url: str) -> str:
     """
     Verifies that `url` contains a protocol scheme and a host and returns the url.
@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Flattening of JSON string columns into one column per (nested) key.
+
+This module is intentionally free of GPU imports, since it is imported by the worker processes used for parallel
+flattening.
+"""
+
+import atexit
+import json
+import logging
+import multiprocessing
+import threading
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = logging.getLogger(f"morpheus.{__name__}")
+
+_executors: dict[int, ProcessPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(num_workers: int) -> ProcessPoolExecutor:
+    with _executors_lock:
+        executor = _executors.get(num_workers)
+        if (executor is None):
+            # Forking a process which is running pipeline threads is unsafe, always start fresh interpreters
+            executor = ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context("spawn"))
+            _executors[num_workers] = executor
+
+        return executor
+
+
+def shutdown_executors():
+    """
+    Shuts down the worker processes used for parallel flattening, cancelling any chunks which haven't started yet.
+    Called automatically at exit, the workers are started again if flattening with `num_workers` > 1 continues.
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+
+    for executor in executors:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_executors)
+
+
+def _flatten_record(record: dict,
+                    prefix: str,
+                    keys: typing.Optional[frozenset[str]],
+                    parent_keys: typing.Optional[frozenset[str]],
+                    out: dict[str, typing.Any]):
+    for (key, value) in record.items():
+        name = f"{prefix}.{key}"
+
+        # Matches `pd.json_normalize`, nested objects are never leaves
+        if (isinstance(value, dict)):
+            if (parent_keys is None or name in parent_keys):
+                _flatten_record(value, name, keys, parent_keys, out)
+        elif (keys is None or name in keys):
+            out[name] = value
+
+
+def _flatten_chunk(values: list,
+                   prefix: str,
+                   keys: typing.Optional[frozenset[str]],
+                   parent_keys: typing.Optional[frozenset[str]]) -> dict[str, list]:
+    """
+    Flattens a chunk of JSON values, returning a dict of column name to column values with `np.nan` for missing keys.
+    """
+    records = []
+    for value in values:
+        if (isinstance(value, (str, bytes))):
+            value = _json_loads(value)
+
+        flat = {}
+        if (isinstance(value, dict)):
+            _flatten_record(value, prefix, keys, parent_keys, flat)
+
+        records.append(flat)
+
+    # Preserve the order in which keys are first seen, matching `pd.json_normalize`
+    names = dict.fromkeys(name for record in records for name in record)
+
+    return {name: [record.get(name, np.nan) for record in records] for name in names}
+
+
+def flatten_json_column(series: pd.Series,
+                        prefix: str,
+                        keys: typing.Iterable[str] = None,
+                        num_workers: int = 1,
+                        chunk_size: int = 10000) -> pd.DataFrame:
+    """
+    Flattens a column of JSON strings (or dictionaries) into a DataFrame with one column per nested key, named
+    `<prefix>.<key>.<nested key>`. The result matches applying `json.loads` and `pd.json_normalize` to the column,
+    restricted to `keys`.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Column of JSON encoded objects or dictionaries. Values which are not objects produce empty rows.
+    prefix : str
+        Prefix of the output column names, typically the name of `series`.
+    keys : typing.Iterable[str], optional
+        Output column names to produce, all other keys are skipped without being flattened, by default None (produce
+        all keys).
+    num_workers : int, optional
+        Number of worker processes to flatten chunks in, by default 1 (flatten in the calling process).
+    chunk_size : int, optional
+        Number of rows per chunk sent to a worker process, by default 10000.
+
+    Returns
+    -------
+    pd.DataFrame
+        The flattened columns, with the same index as `series`.
+    """
+    parent_keys = None
+    if (keys is not None):
+        keys = frozenset(keys)
+        parent_keys = frozenset(key.rsplit(".", i)[0] for key in keys for i in range(1, key.count(".")))
+
+    values = series.tolist()
+
+    if (num_workers <= 1 or len(values) <= chunk_size):
+        columns = _flatten_chunk(values, prefix, keys, parent_keys)
+    else:
+        chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+
+        executor = _get_executor(num_workers)
+        results = list(
+            executor.map(_flatten_chunk,
+                         chunks, [prefix] * len(chunks), [keys] * len(chunks), [parent_keys] * len(chunks)))
+
+        names = dict.fromkeys(name for result in results for name in result)
+
+        columns = {}
+        for name in names:
+            column = []
+            for (chunk, result) in zip(chunks, results):
+                column.extend(result.get(name, [np.nan] * len(chunk)))
+
+            columns[name] = column
+
+    return pd.DataFrame(columns, index=series.index)
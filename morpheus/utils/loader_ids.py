@@ -14,3 +14,4 @@
 
 FILE_TO_DF_LOADER = "file_to_df"
 FSSPEC_LOADER = "fsspec"
+SQL_LOADER = "SQLLoader"
@@ -28,3 +28,4 @@ FILTER_CM_FAILED = "FilterCmFailed"
 PAYLOAD_BATCHER = "PayloadBatcher"
 WRITE_TO_ELASTICSEARCH = "WriteToElasticsearch"
 WRITE_TO_VECTOR_DB = "WriteToVectorDB"
+SQL_CHUNK_LOADER = "SQLChunkLoader"
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from morpheus.common import FilterSource
+from morpheus.config import Config
+from morpheus.config import CppConfig
+from morpheus.config import ExecutionMode
+from morpheus.config import PipelineModes
+from morpheus.pipeline.linear_pipeline import LinearPipeline
+from morpheus.stages.input.file_source_stage import FileSourceStage
+from morpheus.stages.output.write_to_file_stage import WriteToFileStage
+from morpheus.stages.postprocess.filter_detections_stage import FilterDetectionsStage
+from morpheus.stages.postprocess.serialize_stage import SerializeStage
+from morpheus.stages.preprocess.deserialize_stage import DeserializeStage
+from morpheus.utils.logger import configure_logging
+
+
+def build_and_run_pipeline(config: Config, input_file: str, output_file: str):
+    pipeline = LinearPipeline(config)
+    pipeline.set_source(FileSourceStage(config, filename=input_file, iterative=False))
+    pipeline.add_stage(DeserializeStage(config))
+    pipeline.add_stage(
+        FilterDetectionsStage(config, threshold=0.5, filter_source=FilterSource.DATAFRAME, field_name="v2"))
+    pipeline.add_stage(SerializeStage(config))
+    pipeline.add_stage(WriteToFileStage(config, filename=output_file, overwrite=True))
+
+    pipeline.build()
+    pipeline.run()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("execution_mode", [ExecutionMode.GPU, ExecutionMode.CPU])
+@pytest.mark.parametrize("num_rows", [1000, 100000])
+def test_file_filter_pipeline(benchmark, tmp_path: pathlib.Path, execution_mode: ExecutionMode, num_rows: int):
+
+    # Test Data
+
+    input_file = os.path.join(tmp_path, "input.csv")
+    output_file = os.path.join(tmp_path, "output.csv")
+
+    pd.DataFrame({
+        "v1": np.random.random(num_rows),
+        "v2": np.random.random(num_rows),
+        "v3": [f"value_{i}" for i in range(num_rows)],
+    }).to_csv(input_file, index=False)
+
+    # Configuration
+
+    configure_logging(log_level=logging.INFO)
+
+    config = Config()
+    CppConfig.set_should_use_cpp(execution_mode == ExecutionMode.GPU)
+    config.mode = PipelineModes.OTHER
+    config.execution_mode = execution_mode
+
+    config.num_threads = 1
+    config.pipeline_batch_size = 1024
+    config.edge_buffer_size = 4
+
+    # would prefer to benchmark just pipeline.run, but it asserts when called multiple times
+    benchmark(build_and_run_pipeline, config, input_file, output_file)
@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import typing
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from morpheus.controllers.elasticsearch_controller import ElasticsearchController
+
+
+class FakeBulkHandler(BaseHTTPRequestHandler):
+    """
+    Minimal stand-in for the Elasticsearch REST API, answering pings and accepting every document of bulk requests.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, body: bytes):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("X-Elastic-Product", "Elasticsearch")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if (self.command != "HEAD"):
+            self.wfile.write(body)
+
+    def do_HEAD(self):  # pylint: disable=invalid-name
+        self._send_json(b"{}")
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self._send_json(json.dumps({"version": {"number": "8.9.0"}, "tagline": "You Know, for Search"}).encode())
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        num_docs = body.count(b"\n") // 2
+        self.server.num_docs += num_docs
+
+        items = ",".join(['{"index":{"status":201}}'] * num_docs)
+        self._send_json(f'{{"took":1,"errors":false,"items":[{items}]}}'.encode())
+
+    do_POST = do_PUT
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name="fake_bulk_server", scope="module")
+def fake_bulk_server_fixture() -> typing.Iterator[ThreadingHTTPServer]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeBulkHandler)
+    server.num_docs = 0
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    thread.join()
+
+
+def _make_df(num_rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "v1": np.arange(num_rows),
+        "v2": np.random.random(num_rows),
+        "v3": [f"value_{i}" for i in range(num_rows)],
+        "v4": np.random.random(num_rows) > 0.5,
+    })
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("use_bulk_encoder", [False, True])
+@pytest.mark.parametrize("num_rows", [1000, 100000])
+def test_df_to_bulk_write(benchmark, fake_bulk_server: ThreadingHTTPServer, use_bulk_encoder: bool, num_rows: int):
+    controller = ElasticsearchController(connection_kwargs={
+        "hosts": [{
+            "host": "127.0.0.1", "port": fake_bulk_server.server_address[1], "scheme": "http"
+        }]
+    })
+
+    df = _make_df(num_rows)
+
+    def write():
+        if (use_bulk_encoder):
+            controller.df_to_bulk_write(index="test_index", df=df)
+        else:
+            # The previous implementation, creating an action dict per row
+            controller.df_to_parallel_bulk_write(index="test_index", df=df)
+
+    fake_bulk_server.num_docs = 0
+    write()
+    assert fake_bulk_server.num_docs == num_rows
+
+    benchmark(write)
+
+    controller.close_client()
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+import fsspec
+import pytest
+from fsspec.spec import AbstractFileSystem
+
+from morpheus.utils.file_discovery import IncrementalFileDiscovery
+
+NUM_DAYS = 1000
+FILES_PER_DAY = 1000
+START_DATE = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+
+class SyntheticPartitionedFileSystem(AbstractFileSystem):
+    """
+    Read-only object store holding `NUM_DAYS * FILES_PER_DAY` files, partitioned by day as `logs/YYYY/MM/DD/N.json`.
+    Like S3, directories do not have a modification time.
+    """
+    protocol = "synthetic"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._days: dict[str, datetime] = {}
+        for i in range(NUM_DAYS):
+            day = START_DATE + timedelta(days=i)
+            self._days[day.strftime("logs/%Y/%m/%d")] = day
+
+        self._dirs: dict[str, list[str]] = {"": ["logs"]}
+        for day_path in self._days:
+            parts = day_path.split("/")
+            for depth in range(1, len(parts)):
+                children = self._dirs.setdefault("/".join(parts[:depth]), [])
+                if (parts[depth] not in children):
+                    children.append(parts[depth])
+
+    def _file_info(self, day_path: str, i: int) -> dict:
+        return {
+            "name": f"{day_path}/{i}.json",
+            "type": "file",
+            "size": 2,
+            "LastModified": self._days[day_path] + timedelta(seconds=i)
+        }
+
+    def ls(self, path, detail=True, **kwargs):
+        path = self._strip_protocol(path).strip("/")
+
+        if (path in self._days):
+            entries = [self._file_info(path, i) for i in range(FILES_PER_DAY)]
+        elif (path in self._dirs):
+            entries = [{
+                "name": f"{path}/{child}" if path else child, "type": "directory", "size": 0
+            } for child in self._dirs[path]]
+        else:
+            raise FileNotFoundError(path)
+
+        return entries if detail else [entry["name"] for entry in entries]
+
+    def info(self, path, **kwargs):
+        path = self._strip_protocol(path).strip("/")
+
+        if (path in self._days or path in self._dirs):
+            return {"name": path, "type": "directory", "size": 0}
+
+        # Avoid listing the parent directory for each file
+        (day_path, _, file_name) = path.rpartition("/")
+        if (day_path in self._days and file_name.endswith(".json")):
+            i = file_name[:-len(".json")]
+            if (i.isdigit() and int(i) < FILES_PER_DAY):
+                return self._file_info(day_path, int(i))
+
+        raise FileNotFoundError(path)
+
+
+@pytest.fixture(name="synthetic_glob", scope="module")
+def synthetic_glob_fixture() -> str:
+    fsspec.register_implementation(SyntheticPartitionedFileSystem.protocol,
+                                   SyntheticPartitionedFileSystem,
+                                   clobber=True)
+
+    return "synthetic://logs/*/*/*/*.json"
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("use_incremental_discovery", [False, True])
+def test_poll_new_files(benchmark, synthetic_glob: str, use_incremental_discovery: bool):
+    if (use_incremental_discovery):
+        discovery = IncrementalFileDiscovery(
+            [synthetic_glob],
+            late_arrival_window=3600,
+            partition_regex=re.compile(r"(?P<year>\d{4})(/(?P<month>\d{2}))?(/(?P<day>\d{2}))?$"))
+
+        # The first call discovers every file, subsequent polls only list the latest partitions
+        assert len(discovery.discover()) == NUM_DAYS * FILES_PER_DAY
+
+        def poll():
+            return discovery.discover()
+
+    else:
+        files_seen = set()
+
+        # The previous implementation, listing every file on each poll
+        def poll():
+            files = fsspec.open_files(synthetic_glob)
+            new_files = [file for file in files if file.full_name not in files_seen]
+            files_seen.update(file.full_name for file in new_files)
+
+            return new_files
+
+        assert len(poll()) == NUM_DAYS * FILES_PER_DAY
+
+    new_files = benchmark.pedantic(poll, rounds=3)
+    assert len(new_files) == 0
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import typing
+
+import pandas as pd
+import pytest
+
+from morpheus.utils.column_info import ColumnInfo
+from morpheus.utils.column_info import DataFrameInputSchema
+from morpheus.utils.column_info import RenameColumn
+
+
+def _make_cloudtrail_df(num_rows: int) -> pd.DataFrame:
+    records = []
+    for i in range(num_rows):
+        records.append(
+            json.dumps({
+                "eventName": f"event_{i % 17}",
+                "eventSource": "ec2.amazonaws.com",
+                "sourceIPAddress": f"10.0.{i % 255}.{i % 7}",
+                "userIdentity": {
+                    "type": "IAMUser",
+                    "userName": f"user_{i % 31}",
+                    "sessionContext": {
+                        "attributes": {
+                            "mfaAuthenticated": "false", "creationDate": "2022-08-01T00:00:00Z"
+                        }
+                    }
+                },
+                "requestParameters": {
+                    "instancesSet": {
+                        "items": [{
+                            "instanceId": f"i-{i:08d}"
+                        }]
+                    }, "filterSet": {}
+                },
+                "responseElements": None,
+                "resources": [{
+                    "ARN": f"arn:aws:ec2:us-east-1::instance/i-{i:08d}"
+                }],
+            }))
+
+    return pd.DataFrame({"timestamp": range(num_rows), "event": records})
+
+
+def _make_schema(json_flatten_workers: int) -> DataFrameInputSchema:
+    column_info = [
+        ColumnInfo(name="timestamp", dtype="int"),
+        RenameColumn(name="eventName", dtype="str", input_name="event.eventName"),
+        RenameColumn(name="sourceIPAddress", dtype="str", input_name="event.sourceIPAddress"),
+        RenameColumn(name="userName", dtype="str", input_name="event.userIdentity.userName"),
+        RenameColumn(name="mfaAuthenticated",
+                     dtype="str",
+                     input_name="event.userIdentity.sessionContext.attributes.mfaAuthenticated"),
+    ]
+
+    return DataFrameInputSchema(json_columns=["event"],
+                                column_info=column_info,
+                                json_flatten_workers=json_flatten_workers)
+
+
+def _json_normalize_flatten(df: pd.DataFrame, schema: DataFrameInputSchema) -> pd.DataFrame:
+    # The previous implementation, parsing every row with `json.loads` and flattening all keys with `json_normalize`
+    pd_series = df["event"].apply(json.loads)
+    pdf_norm = pd.json_normalize(pd_series)
+    pdf_norm.rename(columns=lambda x: "event." + x, inplace=True)
+    pdf_norm.set_index(df.index, inplace=True)
+
+    df = pd.concat([df[["timestamp"]], pdf_norm], axis=1)
+
+    return df.reindex(columns=schema.input_columns.keys(), fill_value=None).astype(schema.input_columns)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_rows", [10000, 100000])
+def test_json_normalize_flatten(benchmark: typing.Callable, num_rows: int):
+    df = _make_cloudtrail_df(num_rows)
+    schema = _make_schema(json_flatten_workers=1)
+
+    benchmark(_json_normalize_flatten, df, schema)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("json_flatten_workers", [1, 4])
+@pytest.mark.parametrize("num_rows", [10000, 100000])
+def test_json_flatten(benchmark: typing.Callable, num_rows: int, json_flatten_workers: int):
+    df = _make_cloudtrail_df(num_rows)
+    schema = _make_schema(json_flatten_workers=json_flatten_workers)
+
+    expected_df = _json_normalize_flatten(df, schema)
+    pd.testing.assert_frame_equal(schema.prep_dataframe(df).df, expected_df)
+
+    benchmark(schema.prep_dataframe, df)
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import typing
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import cudf
+
+from morpheus.common import FileTypes
+from morpheus.config import CppConfig
+from morpheus.controllers.serialize_controller import SerializeController
+from morpheus.controllers.write_to_file_controller import WriteToFileController
+from morpheus.io import serializers
+from morpheus.messages import MessageMeta
+from morpheus.messages import MultiMessage
+
+
+def _make_messages(num_messages: int, rows_per_message: int) -> typing.List[MultiMessage]:
+    messages = []
+    for i in range(num_messages):
+        df = cudf.DataFrame({
+            "v1": np.arange(rows_per_message) + i,
+            "v2": np.random.random(rows_per_message),
+            "v3": [f"value_{j}" for j in range(rows_per_message)],
+        })
+        messages.append(MultiMessage(meta=MessageMeta(df)))
+
+    return messages
+
+
+def _serialize_and_write(serialize_controller: SerializeController,
+                         write_controller: WriteToFileController,
+                         messages: typing.List[MultiMessage],
+                         use_readonly_dataframe: bool):
+    include_columns = serialize_controller.get_include_col_pattern()
+    exclude_columns = serialize_controller.get_exclude_col_pattern()
+
+    out_file = io.StringIO()
+    for msg in messages:
+        meta = serialize_controller.convert_to_df(msg, include_columns=include_columns, exclude_columns=exclude_columns)
+
+        if (use_readonly_dataframe):
+            write_controller._write_message(meta)
+        else:
+            # The previous implementation, copying the DataFrame with the deprecated `df` property
+            out_file.writelines(serializers.df_to_json(meta.copy_dataframe(), include_index_col=True))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("use_readonly_dataframe", [False, True])
+@pytest.mark.parametrize("rows_per_message", [100, 10000])
+def test_serialize_and_write(benchmark, tmp_path: str, use_readonly_dataframe: bool, rows_per_message: int):
+    # Count copies made by the Python implementation of MessageMeta
+    CppConfig.set_should_use_cpp(False)
+
+    num_messages = 10
+    messages = _make_messages(num_messages, rows_per_message)
+
+    serialize_controller = SerializeController(include=[], exclude=[r'^ID$', r'^_ts_'], fixed_columns=True)
+    write_controller = WriteToFileController(filename=os.path.join(tmp_path, "out.jsonlines"),
+                                             overwrite=True,
+                                             file_type=FileTypes.JSON,
+                                             include_index_col=True,
+                                             flush=False)
+
+    with mock.patch.object(MessageMeta,
+                           "copy_dataframe",
+                           autospec=True,
+                           side_effect=lambda meta: meta._df.copy(deep=True)) as mock_copy_dataframe:
+        _serialize_and_write(serialize_controller, write_controller, messages, use_readonly_dataframe)
+
+    copies_per_message = mock_copy_dataframe.call_count / num_messages
+    benchmark.extra_info["copies_per_message"] = copies_per_message
+
+    if (use_readonly_dataframe):
+        assert copies_per_message == 0
+
+    benchmark(_serialize_and_write, serialize_controller, write_controller, messages, use_readonly_dataframe)
+
+    write_controller.close()
@@ -14,12 +14,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import time
 import typing
 from unittest.mock import patch
 
 import pandas as pd
 import pytest
+from elasticsearch import ConnectionError as ESConnectionError
 from elasticsearch import Elasticsearch
 
 from morpheus.controllers.elasticsearch_controller import ElasticsearchController
@@ -161,3 +163,159 @@ def test_search_documents_failure_raise_error(create_controller: typing.Callable
 
     with pytest.raises(RuntimeError):
         controller.search_documents(index="test_index", query=query)
+
+
+def _parse_bulk_body(body: bytes) -> list[dict]:
+    lines = body.decode("UTF-8").splitlines()
+    assert all(json.loads(action) == {"index": {"_index": "test_index"}} for action in lines[0::2])
+    return [json.loads(doc) for doc in lines[1::2]]
+
+
+@pytest.fixture(name="bulk_requests")
+def bulk_requests_fixture() -> list[list[dict]]:
+    yield []
+
+
+@pytest.fixture(name="fake_bulk")
+def fake_bulk_fixture(bulk_requests: list[list[dict]]) -> typing.Callable[..., typing.Callable]:
+    """
+    Creates a stand-in for `Elasticsearch.bulk` which records the documents of each request, and rejects the
+    documents for which `status_fn` returns an error status.
+    """
+
+    def inner_fake_bulk(status_fn: typing.Callable[[dict], int] = lambda doc: 201) -> typing.Callable:
+
+        def bulk(operations: bytes, **_) -> dict:
+            docs = _parse_bulk_body(operations)
+            bulk_requests.append(docs)
+
+            items = []
+            for doc in docs:
+                status = status_fn(doc)
+                result = {"status": status}
+                if (status >= 300):
+                    result["error"] = {"type": "test_error", "reason": f"status {status}"}
+                items.append({"index": result})
+
+            return {"errors": any(item["index"]["status"] >= 300 for item in items), "items": items}
+
+        return bulk
+
+    yield inner_fake_bulk
+
+
+@pytest.mark.use_python
+def test_df_to_bulk_write(create_controller: typing.Callable[..., ElasticsearchController],
+                          fake_bulk: typing.Callable[..., typing.Callable],
+                          bulk_requests: list[list[dict]]):
+    df = pd.DataFrame({"field1": range(100), "field2": [f"value_{i}" for i in range(100)]})
+
+    # Small enough to split the rows into several bulk requests
+    controller = create_controller(max_chunk_bytes=1024, max_concurrent_requests=2)
+    controller._client.bulk.side_effect = fake_bulk()
+
+    assert controller.df_to_bulk_write(index="test_index", df=df) == 100
+
+    assert len(bulk_requests) > 1
+    for call in controller._client.bulk.call_args_list:
+        assert len(call.kwargs["operations"]) <= 1024
+
+    written_docs = sorted((doc for docs in bulk_requests for doc in docs), key=lambda doc: doc["field1"])
+    assert written_docs == df.to_dict("records")
+
+
+@pytest.mark.use_python
+def test_df_to_bulk_write_index(create_controller: typing.Callable[..., ElasticsearchController],
+                                fake_bulk: typing.Callable[..., typing.Callable],
+                                bulk_requests: list[list[dict]]):
+    df = pd.DataFrame({"field1": range(10), "field2": [f"value_{i}" for i in range(10)]}, index=range(100, 110))
+
+    to_json = pd.DataFrame.to_json
+
+    def strict_to_json(self, *args, **kwargs):
+        # Older versions of pandas only accept `index=False` for the "split" and "table" orientations
+        if (kwargs.get("index") is False and kwargs.get("orient") not in ("split", "table")):
+            raise ValueError("'index=False' is only valid when 'orient' is 'split' or 'table'")
+
+        return to_json(self, *args, **kwargs)
+
+    controller = create_controller()
+    controller._client.bulk.side_effect = fake_bulk()
+
+    with patch.object(pd.DataFrame, "to_json", strict_to_json):
+        assert controller.df_to_bulk_write(index="test_index", df=df) == 10
+
+    # The index isn't written as part of the documents
+    written_docs = [doc for docs in bulk_requests for doc in docs]
+    assert written_docs == df.to_dict("records")
+
+
+@pytest.mark.use_python
+def test_df_to_bulk_write_retry_failed_items(create_controller: typing.Callable[..., ElasticsearchController],
+                                             fake_bulk: typing.Callable[..., typing.Callable],
+                                             bulk_requests: list[list[dict]]):
+    df = pd.DataFrame({"field1": range(10)})
+
+    rejected = set()
+
+    def status_fn(doc: dict) -> int:
+        # Reject the odd documents once
+        if (doc["field1"] % 2 == 1 and doc["field1"] not in rejected):
+            rejected.add(doc["field1"])
+            return 429
+
+        return 201
+
+    controller = create_controller(initial_backoff_secs=0)
+    controller._client.bulk.side_effect = fake_bulk(status_fn)
+
+    assert controller.df_to_bulk_write(index="test_index", df=df) == 10
+
+    # Only the rejected documents are sent again
+    assert len(bulk_requests) == 2
+    assert bulk_requests[1] == [{"field1": i} for i in range(1, 10, 2)]
+
+
+@pytest.mark.use_python
+@pytest.mark.parametrize("raise_on_exception", [False, True])
+def test_df_to_bulk_write_failed_items(create_controller: typing.Callable[..., ElasticsearchController],
+                                       fake_bulk: typing.Callable[..., typing.Callable],
+                                       bulk_requests: list[list[dict]],
+                                       raise_on_exception: bool):
+    df = pd.DataFrame({"field1": range(10)})
+
+    controller = create_controller(raise_on_exception=raise_on_exception, max_retries=2, initial_backoff_secs=0)
+    controller._client.bulk.side_effect = fake_bulk(lambda doc: 400 if doc["field1"] < 3 else 201)
+
+    if (raise_on_exception):
+        with pytest.raises(RuntimeError, match="Error writing 3 documents"):
+            controller.df_to_bulk_write(index="test_index", df=df)
+    else:
+        assert controller.df_to_bulk_write(index="test_index", df=df) == 7
+
+    # Documents rejected with a non-retriable status are not retried
+    assert len(bulk_requests) == 1
+
+
+@pytest.mark.use_python
+def test_df_to_bulk_write_retry_request(create_controller: typing.Callable[..., ElasticsearchController],
+                                        fake_bulk: typing.Callable[..., typing.Callable],
+                                        bulk_requests: list[list[dict]]):
+    df = pd.DataFrame({"field1": range(10)})
+
+    bulk = fake_bulk()
+    errors = [ESConnectionError("Connection error")]
+
+    def failing_bulk(**kwargs) -> dict:
+        # Fail the first request
+        if (len(errors) > 0):
+            raise errors.pop()
+
+        return bulk(**kwargs)
+
+    controller = create_controller(max_retries=2, initial_backoff_secs=0)
+    controller._client.bulk.side_effect = failing_bulk
+
+    assert controller.df_to_bulk_write(index="test_index", df=df) == 10
+    assert controller._client.bulk.call_count == 2
+    assert bulk_requests == [df.to_dict("records")]
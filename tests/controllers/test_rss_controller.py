@@ -13,7 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import threading
 import time
+import typing
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 from os import path
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -283,3 +288,126 @@ def test_strip_markup(cisa_rss_feed: list[str], strip_markup: bool):
 
     series: SeriesType = dataframe["summary"]
     assert (series.to_pandas().values == expected_summary_col).all()
+
+
+def _make_rss_feed(entry_ids: list[str]) -> bytes:
+    items = "".join(f"<item><title>Title {entry_id}</title><link>https://nvidia.com/{entry_id}</link>"
+                    f"<guid>{entry_id}</guid></item>" for entry_id in entry_ids)
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Test</title>{items}</channel></rss>'.encode()
+
+
+class FeedRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves the feeds in `server.feeds` by path, answering conditional requests with 304 when the ETag of the feed
+    matches.
+    """
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        server: "FeedServer" = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+
+        time.sleep(server.delay)
+
+        content = server.feeds[self.path]
+        etag = f'"{hashlib.md5(content).hexdigest()}"'
+
+        with server.lock:
+            server.in_flight -= 1
+            if (self.headers.get("If-None-Match") == etag):
+                server.not_modified_count += 1
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            server.full_count += 1
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class FeedServer(ThreadingHTTPServer):
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FeedRequestHandler)
+        self.feeds: dict[str, bytes] = {}
+        self.delay = 0.0
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.full_count = 0
+        self.not_modified_count = 0
+
+    def url(self, feed_path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{feed_path}"
+
+
+@pytest.fixture(name="feed_server")
+def feed_server_fixture() -> typing.Iterator[FeedServer]:
+    server = FeedServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    thread.join()
+
+
+def _fetch_entry_ids(controller: RSSController) -> list[str]:
+    entry_ids = []
+    for df in controller.fetch_dataframes():
+        entry_ids.extend(df["id"].to_pandas().tolist())
+
+    return sorted(entry_ids)
+
+
+def test_conditional_fetch(feed_server: FeedServer, tmp_path: str):
+    feed_server.feeds["/feed.xml"] = _make_rss_feed(["1", "2", "3"])
+    feed_state_file = path.join(tmp_path, "feed_state.json")
+
+    controller = RSSController(feed_input=feed_server.url("/feed.xml"), feed_state_file=feed_state_file)
+    assert _fetch_entry_ids(controller) == ["1", "2", "3"]
+    assert feed_server.full_count == 1
+
+    # The unchanged feed isn't downloaded again
+    assert not _fetch_entry_ids(controller)
+    assert (feed_server.full_count, feed_server.not_modified_count) == (1, 1)
+
+    # Only the new entries of a changed feed are emitted
+    feed_server.feeds["/feed.xml"] = _make_rss_feed(["2", "3", "4"])
+    assert _fetch_entry_ids(controller) == ["4"]
+    assert feed_server.full_count == 2
+
+    # The validators and seen entries are persisted for the next controller
+    controller = RSSController(feed_input=feed_server.url("/feed.xml"), feed_state_file=feed_state_file)
+    assert not _fetch_entry_ids(controller)
+    assert (feed_server.full_count, feed_server.not_modified_count) == (2, 2)
+
+    feed_server.feeds["/feed.xml"] = _make_rss_feed(["3", "4", "5"])
+    assert _fetch_entry_ids(controller) == ["5"]
+
+
+def test_concurrent_fetch(feed_server: FeedServer):
+    feed_urls = []
+    for i in range(8):
+        feed_server.feeds[f"/feed{i}.xml"] = _make_rss_feed([f"{i}-1", f"{i}-2"])
+        feed_urls.append(feed_server.url(f"/feed{i}.xml"))
+
+    feed_server.delay = 0.2
+
+    controller = RSSController(feed_input=feed_urls, max_concurrent_requests=8, max_requests_per_host=2)
+    entry_ids = _fetch_entry_ids(controller)
+
+    assert entry_ids == sorted(f"{i}-{j}" for i in range(8) for j in (1, 2))
+
+    # Every feed is on the same host
+    assert feed_server.max_in_flight == 2
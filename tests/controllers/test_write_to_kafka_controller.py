@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import time
+import typing
+from collections import deque
+
+import confluent_kafka as ck
+import pandas as pd
+import pytest
+
+from morpheus.controllers.write_to_kafka_controller import WriteToKafkaController
+from morpheus.messages import MessageMeta
+
+
+class InProcessMessage:
+    """Stand-in for `confluent_kafka.Message`."""
+
+    def __init__(self, topic: str, value: bytes, key: str, partition: int):
+        self._topic = topic
+        self._value = value
+        self._key = key
+        self._partition = partition
+
+    def topic(self) -> str:
+        return self._topic
+
+    def value(self) -> bytes:
+        return self._value
+
+    def key(self) -> str:
+        return self._key
+
+    def partition(self) -> int:
+        return self._partition
+
+    def __len__(self) -> int:
+        return len(self._value)
+
+
+class InProcessProducer:
+    """
+    Stand-in for `confluent_kafka.Producer` which delivers produced messages in-process when `poll` or `flush` is
+    called. Raises `BufferError` once `queue_size` messages are waiting to be delivered, and fails the delivery of every
+    message when `fail_delivery` is set.
+    """
+
+    def __init__(self, conf: dict, *, queue_size: int = 100000, fail_delivery: bool = False, delivery_delay: float = 0):
+        self.conf = conf
+        self.delivered: list[InProcessMessage] = []
+        self.max_pending_bytes = 0
+        self._queue_size = queue_size
+        self._fail_delivery = fail_delivery
+        self._delivery_delay = delivery_delay
+        self._pending = deque()
+        self._pending_bytes = 0
+        self._outstanding = 0
+        self._lock = threading.Lock()
+
+    def produce(self, topic: str, value: bytes, key: str = None, partition: int = -1, on_delivery=None):
+        with self._lock:
+            if (len(self._pending) >= self._queue_size):
+                raise BufferError("Local: Queue full")
+
+            self._pending.append((InProcessMessage(topic, value, key, partition), on_delivery))
+            self._outstanding += 1
+            self._pending_bytes += len(value)
+            self.max_pending_bytes = max(self.max_pending_bytes, self._pending_bytes)
+
+    def poll(self, timeout: float = None) -> int:
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+            self._pending_bytes = 0
+
+        if (len(pending) == 0):
+            time.sleep(min(timeout or 0, 0.01))
+            return 0
+
+        time.sleep(self._delivery_delay)
+
+        for (msg, on_delivery) in pending:
+            err = ck.KafkaError(ck.KafkaError._MSG_TIMED_OUT) if self._fail_delivery else None
+            if (err is None):
+                self.delivered.append(msg)
+            if (on_delivery is not None):
+                on_delivery(err, msg)
+
+        with self._lock:
+            self._outstanding -= len(pending)
+
+        return len(pending)
+
+    def flush(self, timeout: float = None) -> int:
+        while (len(self) > 0):
+            self.poll(0.001)
+
+        return 0
+
+    def __len__(self) -> int:
+        # Like librdkafka, includes messages whose delivery report hasn't been served yet
+        with self._lock:
+            return self._outstanding
+
+
+def _make_meta(start: int, num_rows: int) -> MessageMeta:
+    df = pd.DataFrame({
+        "v1": range(start, start + num_rows),
+        "v2": [f"value_{i}" for i in range(start, start + num_rows)],
+        "key": [i % 3 for i in range(start, start + num_rows)],
+        "part": [i % 2 for i in range(start, start + num_rows)],
+    })
+    return MessageMeta(df)
+
+
+@pytest.fixture(name="create_controller")
+def create_controller_fixture() -> typing.Iterator[typing.Callable[..., WriteToKafkaController]]:
+    controllers: list[WriteToKafkaController] = []
+
+    def inner_create_controller(producer_kwargs: dict = None, **controller_kwargs) -> WriteToKafkaController:
+        controller = WriteToKafkaController(
+            {"bootstrap.servers": "localhost:9092"},
+            "test_topic",
+            poll_interval=0.01,
+            producer_factory=lambda conf: InProcessProducer(conf, **(producer_kwargs or {})),
+            **controller_kwargs)
+        controllers.append(controller)
+        return controller
+
+    yield inner_create_controller
+
+    for controller in controllers:
+        controller.stop()
+
+
+@pytest.mark.use_python
+def test_write(create_controller: typing.Callable[..., WriteToKafkaController]):
+    controller = create_controller()
+    controller.start()
+
+    metas = [_make_meta(0, 10), _make_meta(10, 5)]
+    for meta in metas:
+        assert controller.write(meta) is meta
+
+    controller.flush()
+
+    producer: InProcessProducer = controller._producer
+    expected_rows = pd.concat([meta.copy_dataframe() for meta in metas]).to_dict(orient="records")
+
+    assert [json.loads(msg.value()) for msg in producer.delivered] == expected_rows
+    assert all(msg.topic() == "test_topic" for msg in producer.delivered)
+    assert all(msg.key() is None and msg.partition() == -1 for msg in producer.delivered)
+
+    stats = controller.stats
+    assert stats["delivered_records"] == 15
+    assert stats["delivered_bytes"] == sum(len(msg) for msg in producer.delivered)
+    assert stats["failed_records"] == 0
+    assert stats["in_flight_records"] == 0
+    assert stats["in_flight_bytes"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["records_per_sec"] > 0
+
+
+@pytest.mark.use_python
+def test_key_and_partition_columns(create_controller: typing.Callable[..., WriteToKafkaController]):
+    controller = create_controller(key_column="key", partition_column="part")
+    controller.start()
+
+    controller.write(_make_meta(0, 10))
+    controller.flush()
+
+    delivered = controller._producer.delivered
+    assert [msg.key() for msg in delivered] == [str(i % 3) for i in range(10)]
+    assert [msg.partition() for msg in delivered] == [i % 2 for i in range(10)]
+
+
+@pytest.mark.use_python
+def test_max_in_flight_bytes(create_controller: typing.Callable[..., WriteToKafkaController]):
+    metas = [_make_meta(i * 10, 10) for i in range(5)]
+    meta_bytes = []
+    for meta in metas:
+        with meta.readonly_dataframe() as view:
+            records = view.df.to_json(orient="records", lines=True).encode("UTF-8").splitlines()
+            meta_bytes.append(sum(len(record) for record in records))
+
+    # Allows a single DataFrame in flight at a time
+    max_in_flight_bytes = max(meta_bytes)
+    controller = create_controller(producer_kwargs={"delivery_delay": 0.01}, max_in_flight_bytes=max_in_flight_bytes)
+    controller.start()
+
+    for meta in metas:
+        controller.write(meta)
+
+    controller.flush()
+
+    producer: InProcessProducer = controller._producer
+    assert len(producer.delivered) == 50
+    assert controller.stats["delivered_bytes"] == sum(meta_bytes)
+    assert producer.max_pending_bytes <= max_in_flight_bytes
+
+
+@pytest.mark.use_python
+def test_producer_queue_full(create_controller: typing.Callable[..., WriteToKafkaController]):
+    controller = create_controller(producer_kwargs={"queue_size": 3})
+    controller.start()
+
+    controller.write(_make_meta(0, 20))
+    controller.flush()
+
+    assert len(controller._producer.delivered) == 20
+    assert controller.stats["delivered_records"] == 20
+
+
+@pytest.mark.use_python
+def test_delivery_error(create_controller: typing.Callable[..., WriteToKafkaController]):
+    controller = create_controller(producer_kwargs={"fail_delivery": True})
+    controller.start()
+
+    # Delivery errors are only reported by the next call after the delivery report is received
+    controller.write(_make_meta(0, 10))
+
+    with pytest.raises(ck.KafkaException):
+        controller.flush()
+
+    with pytest.raises(ck.KafkaException):
+        controller.write(_make_meta(10, 10))
+
+    assert controller.stats["failed_records"] == 10
+    assert controller.stats["delivered_records"] == 0
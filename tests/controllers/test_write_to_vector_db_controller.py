@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from morpheus.controllers.write_to_vector_db_controller import WriteToVectorDBController
+from morpheus.service.vdb.vector_db_service import VectorDBService
+
+
+def _make_df(start: int, num_rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"id": range(start, start + num_rows), "embedding": [[0.1, 0.2]] * num_rows})
+
+
+@pytest.fixture(name="mock_service")
+def mock_service_fixture() -> mock.MagicMock:
+    yield mock.MagicMock(spec=VectorDBService)
+
+
+def _inserted_ids(mock_service: mock.MagicMock, name: str = "test") -> list[int]:
+    ids = []
+    for call in mock_service.insert_dataframe.call_args_list:
+        if (call.kwargs["name"] == name):
+            ids.extend(call.kwargs["df"]["id"].tolist())
+
+    return ids
+
+
+def test_write_batch_size(mock_service: mock.MagicMock):
+    controller = WriteToVectorDBController(mock_service,
+                                           resource_kwargs={"partition_name": "test_partition"},
+                                           batch_size=8,
+                                           write_time_interval=60)
+
+    assert controller.write("test", _make_df(0, 4)) == 0
+    assert controller.write("test", _make_df(4, 4)) == 8
+    assert controller.write("test", _make_df(8, 4)) == 0
+
+    controller.close()
+
+    assert _inserted_ids(mock_service) == list(range(12))
+    for call in mock_service.insert_dataframe.call_args_list:
+        assert call.kwargs["flush"] is False
+        assert call.kwargs["partition_name"] == "test_partition"
+
+    # Flushed once on completion, independently of the two inserts
+    mock_service.flush.assert_called_once_with("test")
+
+    stats = controller.stats["test"]
+    assert stats["inserted_rows"] == 12
+    assert stats["inserts"] == 2
+    assert stats["flushes"] == 1
+    assert stats["failed_rows"] == 0
+
+
+def test_write_time_interval(mock_service: mock.MagicMock):
+    controller = WriteToVectorDBController(mock_service, batch_size=1000, write_time_interval=0)
+
+    assert controller.write("test", _make_df(0, 4)) == 4
+    controller.close()
+
+    assert _inserted_ids(mock_service) == list(range(4))
+
+
+@pytest.mark.parametrize("flush_rows,flush_on_completion,expected_flushes", [(8, False, 2), (8, True, 3),
+                                                                             (None, False, 0)])
+def test_flush_rows(mock_service: mock.MagicMock, flush_rows: int, flush_on_completion: bool, expected_flushes: int):
+    controller = WriteToVectorDBController(mock_service,
+                                           batch_size=4,
+                                           write_time_interval=60,
+                                           flush_rows=flush_rows,
+                                           flush_on_completion=flush_on_completion)
+
+    for i in range(5):
+        controller.write("test", _make_df(i * 4, 4))
+
+    controller.close()
+
+    assert _inserted_ids(mock_service) == list(range(20))
+    assert mock_service.flush.call_count == expected_flushes
+    assert controller.stats["test"]["flushes"] == expected_flushes
+
+
+def test_write_does_not_wait_for_insert(mock_service: mock.MagicMock):
+    insert_started = threading.Event()
+    release_insert = threading.Event()
+
+    def insert_dataframe(**_):
+        insert_started.set()
+        assert release_insert.wait(timeout=10)
+
+    mock_service.insert_dataframe.side_effect = insert_dataframe
+
+    controller = WriteToVectorDBController(mock_service, batch_size=4, write_time_interval=60)
+
+    assert controller.write("test", _make_df(0, 4)) == 4
+    assert insert_started.wait(timeout=10)
+
+    # Accumulated into the second buffer while the first is being inserted
+    assert controller.write("test", _make_df(4, 2)) == 0
+
+    # Inserts into other resources are not blocked either
+    assert controller.write("other", _make_df(6, 4)) == 4
+
+    release_insert.set()
+    controller.close()
+
+    assert _inserted_ids(mock_service) == list(range(6))
+    assert _inserted_ids(mock_service, "other") == list(range(6, 10))
+
+
+def test_failed_insert(mock_service: mock.MagicMock, caplog: pytest.LogCaptureFixture):
+    mock_service.insert_dataframe.side_effect = RuntimeError("insert failed")
+
+    controller = WriteToVectorDBController(mock_service, batch_size=4, write_time_interval=60)
+
+    controller.write("test", _make_df(0, 4))
+    controller.write("test", _make_df(4, 4))
+
+    with caplog.at_level(logging.ERROR):
+        controller.close()
+
+    # The failures are reported once the inserts have completed
+    assert "Failed to write 8 rows to vector database resource 'test'" in caplog.text
+
+    stats = controller.stats["test"]
+    assert stats["failed_rows"] == 8
+    assert stats["inserted_rows"] == 0
+
+    # Nothing was inserted, so there is nothing to flush
+    mock_service.flush.assert_not_called()
+
+
+def test_write_embeddings(mock_service: mock.MagicMock):
+    controller = WriteToVectorDBController(mock_service,
+                                           embedding_column_name="vector",
+                                           batch_size=8,
+                                           write_time_interval=60)
+
+    embeddings = np.arange(16, dtype=np.float32).reshape(8, 2)
+    controller.write("test", pd.DataFrame({"id": range(4)}), embeddings=embeddings[:4])
+    controller.write("test", pd.DataFrame({"id": range(4, 8)}), embeddings=embeddings[4:])
+    controller.close()
+
+    mock_service.insert_dataframe.assert_called_once()
+    kwargs = mock_service.insert_dataframe.call_args.kwargs
+    assert kwargs["df"]["id"].tolist() == list(range(8))
+    assert kwargs["embedding_column_name"] == "vector"
+
+    # Passed as a single array rather than as a column of lists
+    assert "vector" not in kwargs["df"].columns
+    assert isinstance(kwargs["embeddings"], np.ndarray)
+    np.testing.assert_array_equal(kwargs["embeddings"], embeddings)
+
+
+def test_write_embeddings_mixed(mock_service: mock.MagicMock):
+    controller = WriteToVectorDBController(mock_service, batch_size=8, write_time_interval=60)
+
+    controller.write("test", _make_df(0, 4))
+    controller.write("test", pd.DataFrame({"id": range(4, 8)}), embeddings=np.full((4, 2), 0.5, dtype=np.float32))
+    controller.close()
+
+    # Falls back to a column of lists when only some of the rows have separate embeddings
+    kwargs = mock_service.insert_dataframe.call_args.kwargs
+    assert "embeddings" not in kwargs
+    assert kwargs["df"]["id"].tolist() == list(range(8))
+    assert kwargs["df"]["embedding"].tolist() == [[0.1, 0.2]] * 4 + [[0.5, 0.5]] * 4
@@ -34,6 +34,7 @@ from morpheus.models.dfencoder import scalers
 from morpheus.models.dfencoder.dataframe import EncoderDataFrame
 from morpheus.models.dfencoder.dataloader import DataframeDataset
 from morpheus.models.dfencoder.dataloader import DFEncoderDataLoader
+from morpheus.models.dfencoder.dataloader import EncodedTensorDataset
 from morpheus.models.dfencoder.dataloader import FileSystemDataset
 
 # Only pandas and Python is supported
@@ -466,6 +467,51 @@ def test_build_input_tensor(train_ae: autoencoder.AutoEncoder, train_df: pd.Data
     assert len(tensor) == len(train_df)
 
 
+def test_swap_targets(train_ae: autoencoder.AutoEncoder, train_df: pd.DataFrame):
+    train_ae.fit(train_df, epochs=1)
+    prepared_df = train_ae.prepare_df(train_df)
+
+    # Swapping the encoded targets should match swapping the prepared dataframe with the same random state
+    np.random.seed(42)
+    expected_num, expected_bin, expected_codes = train_ae.compute_targets(prepared_df.swap(train_ae.swap_probability))
+
+    np.random.seed(42)
+    num, bin, codes = train_ae.swap_targets(*train_ae.compute_targets(prepared_df))
+
+    assert torch.equal(num, expected_num)
+    assert torch.equal(bin, expected_bin)
+    assert len(codes) == len(expected_codes)
+    for (code, expected_code) in zip(codes, expected_codes):
+        assert torch.equal(code, expected_code)
+
+
+def test_auto_encoder_fit_cache_encoded_data(train_df: pd.DataFrame):
+    ae = autoencoder.AutoEncoder(encoder_layers=[64],
+                                 decoder_layers=[64],
+                                 min_cats=1,
+                                 progress_bar=False,
+                                 patience=0,
+                                 cache_encoded_data=True)
+
+    ae.fit(train_df, epochs=2, validation_data=train_df, run_validation=True, use_val_for_loss_stats=True)
+
+    dataset = ae._data_to_dataset(train_df)
+    assert isinstance(dataset, EncodedTensorDataset)
+    assert dataset.num_samples == len(train_df)
+
+    results = ae.get_results(train_df)
+    assert len(results) == len(train_df)
+    assert not results['max_abs_z'].isna().any()
+
+
+def test_auto_encoder_encoded_data_storage_validation():
+    with pytest.raises(ValueError):
+        autoencoder.AutoEncoder(encoded_data_storage='unknown')
+
+    with pytest.raises(ValueError):
+        autoencoder.AutoEncoder(encoded_data_storage='mmap')
+
+
 @pytest.mark.usefixtures("manual_seed")
 def test_auto_encoder_get_results(train_ae: autoencoder.AutoEncoder, train_df: pd.DataFrame):
     train_ae.fit(train_df, epochs=1)
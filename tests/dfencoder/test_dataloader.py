@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from unittest import mock
+
+import pandas as pd
+import pytest
+import torch
+
+from morpheus.models.dfencoder.dataloader import EncodedTensorDataset
+from morpheus.models.dfencoder.dataloader import FileSystemDataset
+
+# Only pandas and Python is supported
+pytestmark = [pytest.mark.use_pandas, pytest.mark.use_python]
+
+FILE_SIZES = [5, 13, 1, 7, 20]
+
+
+def _identity_preprocess(df, shuffle_rows_in_batch):  # pylint: disable=unused-argument
+    return df
+
+
+@pytest.fixture(name="data_folder", scope="function")
+def data_folder_fixture(tmp_path):
+    offset = 0
+    for (i, size) in enumerate(FILE_SIZES):
+        pd.DataFrame({"v": range(offset, offset + size)}).to_csv(tmp_path / f"part_{i}.csv", index=False)
+        offset += size
+
+    yield str(tmp_path)
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 7, 46, 100])
+@pytest.mark.parametrize("prefetch_batches", [0, 2])
+def test_file_system_dataset_single_parse(data_folder: str, batch_size: int, prefetch_batches: int):
+    load_data_fn = mock.MagicMock(side_effect=pd.read_csv)
+    dataset = FileSystemDataset(data_folder,
+                                batch_size=batch_size,
+                                preprocess_fn=_identity_preprocess,
+                                load_data_fn=load_data_fn,
+                                prefetch_batches=prefetch_batches)
+
+    assert dataset.num_samples == sum(FILE_SIZES)
+    df = pd.concat(dataset[i]["data"] for i in range(len(dataset)))
+    assert df["v"].tolist() == list(range(sum(FILE_SIZES)))
+
+    # Reading the batches in order should parse each file exactly once
+    assert load_data_fn.call_count == len(FILE_SIZES)
+
+
+def test_file_system_dataset_prefetch_shutdown(data_folder: str):
+    dataset = FileSystemDataset(data_folder, batch_size=4, preprocess_fn=_identity_preprocess, prefetch_batches=2)
+
+    # The prefetch thread is shut down once the last batch is read
+    for i in range(len(dataset)):
+        dataset[i]  # pylint: disable=pointless-statement
+        assert (dataset._prefetch_executor is None) == (i == len(dataset) - 1)
+
+    # As well as when iterating through the dataset stops early
+    for _ in dataset:
+        assert dataset._prefetch_executor is not None
+        break
+
+    assert dataset._prefetch_executor is None
+
+
+def test_file_system_dataset_index(data_folder: str):
+    FileSystemDataset(data_folder, preprocess_fn=_identity_preprocess)
+    assert os.path.exists(os.path.join(data_folder, FileSystemDataset.INDEX_FILENAME))
+
+    # The index file itself should not be treated as data, and the persisted row counts should be re-used
+    with mock.patch.object(FileSystemDataset, "_get_file_len") as mock_get_file_len:
+        dataset = FileSystemDataset(data_folder, preprocess_fn=_identity_preprocess)
+        mock_get_file_len.assert_not_called()
+
+    assert dataset.num_samples == sum(FILE_SIZES)
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_encoded_tensor_dataset(tmp_path, use_mmap: bool):
+    num = torch.arange(20, dtype=torch.float32).reshape(10, 2)
+    bin = (torch.arange(10) % 2).float().reshape(10, 1)
+    codes = [torch.arange(10), torch.arange(10) * 2]
+
+    dataset = EncodedTensorDataset.from_targets(num,
+                                                bin,
+                                                codes,
+                                                mmap_dir=(str(tmp_path) if use_mmap else None),
+                                                batch_size=4,
+                                                preprocess_fn=_identity_preprocess)
+
+    assert dataset.num_samples == 10
+    assert len(dataset) == 3
+
+    # The mapped files are unlinked as soon as they are mapped
+    assert os.listdir(tmp_path) == []
+
+    batch = dataset[2]["data"]
+    assert torch.equal(batch["num"], num[8:])
+    assert torch.equal(batch["bin"], bin[8:])
+    assert len(batch["codes"]) == 2
+    assert torch.equal(batch["codes"][1], codes[1][8:])
+
+    # Batches are views of the encoded buffers
+    assert batch["num"].data_ptr() == dataset[0]["data"]["num"].data_ptr() + 8 * num.stride(0) * num.element_size()
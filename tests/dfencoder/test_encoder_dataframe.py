@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -40,3 +41,24 @@ def test_swap():
     df = EncoderDataFrame(values)
     swapped = df.swap(likelihood=0)
     assert swapped.values.tolist() == values
+
+
+@pytest.mark.usefixtures("manual_seed")
+def test_swap_mixed_dtypes():
+    df = EncoderDataFrame({
+        "num": np.arange(100, dtype=np.float32),
+        "bin": np.arange(100) % 2 == 0,
+        "cat": pd.Categorical([str(i % 7) for i in range(100)]),
+    })
+    original = df.copy()
+
+    swapped = df.swap(likelihood=0.5)
+
+    assert isinstance(swapped, EncoderDataFrame)
+    assert swapped.dtypes.equals(df.dtypes)
+    assert not swapped.equals(df)
+
+    # Values are only moved between rows of the same column, and the input is left untouched
+    for col in df.columns:
+        assert set(swapped[col]).issubset(set(df[col]))
+    pd.testing.assert_frame_equal(df, original)
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import logging
+import threading
 from unittest import mock
 
 import pandas as pd
@@ -53,7 +54,8 @@ def test_constructor(config: Config, mock_mlflow_client: mock.MagicMock, mock_mo
     assert stage._model_manager is mock_model_manager
 
     mock_mlflow_client.assert_called_once()
-    mock_model_manager.assert_called_once_with(model_name_formatter="test_model_name-{user_id}-{user_md5}")
+    mock_model_manager.assert_called_once_with(model_name_formatter="test_model_name-{user_id}-{user_md5}",
+                                               max_model_bytes=None)
 
 
 def test_get_model(config: Config, mock_mlflow_client: mock.MagicMock, mock_model_manager: mock.MagicMock):
@@ -70,6 +72,17 @@ def test_get_model(config: Config, mock_mlflow_client: mock.MagicMock, mock_mode
                                                                fallback_user_ids=[config.ae.fallback_username])
 
 
+def test_prefetch_models(config: Config, mock_mlflow_client: mock.MagicMock, mock_model_manager: mock.MagicMock):
+    from dfp.stages.dfp_inference_stage import DFPInferenceStage
+
+    stage = DFPInferenceStage(config)
+    stage.prefetch_models(["user_a", "user_b"])
+
+    mock_model_manager.prefetch_user_models.assert_called_once_with(mock_mlflow_client,
+                                                                    user_ids=["user_a", "user_b"],
+                                                                    fallback_user_ids=[config.ae.fallback_username])
+
+
 @pytest.mark.usefixtures("reset_loglevel")
 @pytest.mark.parametrize('log_level', [logging.CRITICAL, logging.ERROR, logging.WARNING, logging.INFO, logging.DEBUG])
 def test_on_data(
@@ -127,3 +140,115 @@ def test_on_data_get_model_error(
 
     stage = DFPInferenceStage(config, model_name_formatter="test_model_name-{user_id}")
     assert stage.on_data(dfp_multi_message) is None
+
+
+def test_on_batch(
+        config: Config,
+        mock_mlflow_client: mock.MagicMock,  # pylint: disable=unused-argument
+        mock_model_manager: mock.MagicMock,
+        dataset_pandas: DatasetManager):
+    from dfp.messages.multi_dfp_message import DFPMessageMeta
+    from dfp.messages.multi_dfp_message import MultiDFPMessage
+    from dfp.stages.dfp_inference_stage import DFPInferenceStage
+
+    df = dataset_pandas['filter_probs.csv']
+    user_ids = ["user_a", "user_b", "user_c", "user_d"]
+    messages = [
+        MultiDFPMessage(meta=DFPMessageMeta(df.iloc[i * 5:(i + 1) * 5].copy(), user_id))
+        for (i, user_id) in enumerate(user_ids)
+    ]
+
+    def make_model_cache(name: str) -> mock.MagicMock:
+        mock_model = mock.MagicMock()
+        mock_model.get_results.side_effect = lambda df, return_abs: pd.DataFrame({"results": df["v2"] * 10})
+
+        mock_model_cache = mock.MagicMock()
+        mock_model_cache.load_model.return_value = mock_model
+        mock_model_cache.reg_model_name = name
+        mock_model_cache.reg_model_version = "1"
+        return mock_model_cache
+
+    user_model_cache = make_model_cache("user_a_model")
+    generic_model_cache = make_model_cache("generic_model")
+
+    def load_user_model(client, user_id, fallback_user_ids):  # pylint: disable=unused-argument
+        if (user_id == "user_d"):
+            return None
+
+        return user_model_cache if user_id == "user_a" else generic_model_cache
+
+    mock_model_manager.load_user_model.side_effect = load_user_model
+
+    stage = DFPInferenceStage(config,
+                              model_name_formatter="test_model_name-{user_id}",
+                              max_batch_rows=15,
+                              max_batch_delay_sec=60)
+
+    # Held until the batch holds enough rows
+    assert stage._on_batch_data(messages[0]) == []
+    assert stage._on_batch_data(messages[1]) == []
+    results = stage._on_batch_data(messages[2]) + stage._on_batch_data(messages[3])
+    assert stage._on_batch_completed() is None
+
+    # A single inference per model, the message without a model is dropped
+    user_model_cache.load_model.return_value.get_results.assert_called_once()
+    generic_model_cache.load_model.return_value.get_results.assert_called_once()
+    assert mock_model_manager.load_user_model.call_count == 4
+
+    assert len(results) == 3
+    for (result, message, model_name) in zip(results, messages, ["user_a_model", "generic_model", "generic_model"]):
+        assert isinstance(result, MultiDFPMessage)
+        assert result.meta is message.meta
+
+        expected_df = message.get_meta_dataframe().copy(deep=True)
+        expected_df["results"] = expected_df["v2"] * 10
+        expected_df["model_version"] = f"{model_name}:1"
+        dataset_pandas.assert_compare_df(result.get_meta(), expected_df)
+
+
+def test_on_batch_deadline(
+        config: Config,
+        mock_mlflow_client: mock.MagicMock,  # pylint: disable=unused-argument
+        mock_model_manager: mock.MagicMock,
+        dataset_pandas: DatasetManager):
+    from dfp.messages.multi_dfp_message import DFPMessageMeta
+    from dfp.messages.multi_dfp_message import MultiDFPMessage
+    from dfp.stages.dfp_inference_stage import DFPInferenceStage
+
+    df = dataset_pandas['filter_probs.csv']
+    message = MultiDFPMessage(meta=DFPMessageMeta(df.iloc[0:5].copy(), "user_a"))
+
+    mock_model = mock.MagicMock()
+    mock_model.get_results.side_effect = lambda df, return_abs: pd.DataFrame({"results": df["v2"] * 10})
+    mock_model_cache = mock.MagicMock()
+    mock_model_cache.load_model.return_value = mock_model
+    mock_model_cache.reg_model_name = "user_a_model"
+    mock_model_cache.reg_model_version = "1"
+    mock_model_manager.load_user_model.return_value = mock_model_cache
+
+    stage = DFPInferenceStage(config,
+                              model_name_formatter="test_model_name-{user_id}",
+                              max_batch_rows=100,
+                              max_batch_delay_sec=0.1)
+
+    results = []
+    sent = threading.Event()
+
+    def emit(messages: list):
+        results.extend(messages)
+        if (len(messages) > 0):
+            sent.set()
+
+    stage._start_batch_timer(emit)
+    try:
+        stage._process_batch_data(message, emit)
+        assert results == []
+
+        # No more messages arrive, the held message is sent once its deadline passes rather than on completion
+        assert sent.wait(timeout=10)
+    finally:
+        stage._stop_batch_timer()
+
+    assert len(results) == 1
+    assert results[0].meta is message.meta
+    assert stage._on_batch_completed() is None
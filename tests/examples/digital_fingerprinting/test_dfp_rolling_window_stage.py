@@ -74,7 +74,7 @@ def test_get_user_cache_miss(config: Config):
     with stage._get_user_cache('test_user') as results:
         assert isinstance(results, CachedUserWindow)
         assert results.user_id == 'test_user'
-        assert results.cache_location == os.path.join(stage._cache_dir, 'test_user.pkl')
+        assert results.cache_location == os.path.join(stage._cache_dir, 'test_user.parquet')
         assert results.timestamp_column == 'test_timestamp_col'
 
     with stage._get_user_cache('test_user') as results2:
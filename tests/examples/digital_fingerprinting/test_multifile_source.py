@@ -15,6 +15,7 @@
 
 import glob
 import os
+import time
 from unittest import mock
 
 import pytest
@@ -32,7 +33,7 @@ def test_constructor(config: Config):
     config.pipeline_batch_size = batch_size
     config.num_threads = n_threads
     filenames = ['some/file', '/tmp/some/files-2023-*-*.csv', 's3://some/bucket/2023-*-*.csv.gz']
-    stage = MultiFileSource(config, filenames=filenames, watch=False, watch_interval=2.1)
+    stage = MultiFileSource(config, filenames=filenames, watch=False, watch_interval=2.1, late_arrival_window=60)
 
     assert isinstance(stage, SingleOutputSource)
     assert stage._batch_size == batch_size
@@ -40,6 +41,7 @@ def test_constructor(config: Config):
     assert stage._filenames == filenames
     assert not stage._watch
     assert stage._watch_interval == 2.1
+    assert stage._late_arrival_window == 60
 
 
 def test_generate_frames_fsspec(config: Config, tmp_path: str):
@@ -87,6 +89,30 @@ def test_polling_generate_frames_fsspec(amock_time: mock.MagicMock, config: Conf
     amock_time.assert_called_once()
 
 
+@mock.patch('time.sleep')
+def test_polling_generate_frames_fsspec_preserved_mtime(amock_time: mock.MagicMock, config: Config, tmp_path: str):
+    from dfp.stages.multi_file_source import MultiFileSource
+
+    with open(os.path.join(tmp_path, 'new.json'), 'w', encoding='utf-8') as f:
+        f.write('{"foo": "bar"}')
+
+    stage = MultiFileSource(config, filenames=[os.path.join(tmp_path, '*.json')], watch=True, watch_interval=0.2)
+
+    fsspec_gen = stage._polling_generate_frames_fsspec()
+    assert [f.path for f in next(fsspec_gen)] == [os.path.join(tmp_path, 'new.json')]
+
+    # Files copied with their modification time preserved are emitted, no matter how old
+    old_file = os.path.join(tmp_path, 'old.json')
+    with open(old_file, 'w', encoding='utf-8') as f:
+        f.write('{"foo": "bar"}')
+
+    old_mtime = time.time() - 2 * 3600
+    os.utime(old_file, (old_mtime, old_mtime))
+
+    assert [f.path for f in next(fsspec_gen)] == [old_file]
+    amock_time.assert_called_once()
+
+
 def test_generate_frames_fsspec_no_files(config: Config, tmp_path: str):
     from dfp.stages.multi_file_source import MultiFileSource
 
@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pathlib
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timedelta
+from unittest import mock
+
+import mlflow
+import pytest
+import torch
+from mlflow.tracking.client import MlflowClient
+
+# Each model holds 110 float32 parameters
+MODEL_BYTES = 440
+
+
+@pytest.fixture(name="mlflow_client")
+def mlflow_client_fixture(tmp_path: pathlib.Path) -> typing.Iterator[MlflowClient]:
+    """
+    Registers a model for a few users in a local file-backed MLflow tracking store.
+    """
+    previous_tracking_uri = mlflow.get_tracking_uri()
+    mlflow.set_tracking_uri(tmp_path.as_uri())
+
+    try:
+        for user_id in ["user_a", "user_b", "user_c", "generic_user"]:
+            with mlflow.start_run():
+                mlflow.pytorch.log_model(torch.nn.Linear(10, 10),
+                                         artifact_path="model",
+                                         registered_model_name=f"dfp-{user_id}")
+
+        yield MlflowClient()
+    finally:
+        mlflow.set_tracking_uri(previous_tracking_uri)
+
+
+def test_lru_eviction(mlflow_client: MlflowClient):
+    from dfp.utils.model_cache import ModelManager
+
+    manager = ModelManager(model_name_formatter="dfp-{user_id}", max_model_bytes=2 * MODEL_BYTES)
+    model_caches = {
+        user_id: manager.load_user_model(mlflow_client, user_id=user_id, fallback_user_ids=[])
+        for user_id in ["user_a", "user_b", "user_c"]
+    }
+
+    model_caches["user_a"].load_model()
+    model_caches["user_b"].load_model()
+    model_caches["user_a"].load_model()
+
+    # Exceeds the limit, unloading the least recently used model
+    model_caches["user_c"].load_model()
+
+    assert model_caches["user_a"].is_loaded
+    assert not model_caches["user_b"].is_loaded
+    assert model_caches["user_c"].is_loaded
+
+    metrics = manager.metrics
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 3
+    assert metrics["evictions"] == 1
+    assert metrics["load_seconds"] > 0
+    assert metrics["loaded_models"] == 2
+    assert metrics["loaded_bytes"] == 2 * MODEL_BYTES
+
+    # Loaded again when next used
+    assert isinstance(model_caches["user_b"].load_model(), torch.nn.Linear)
+    assert manager.metrics["misses"] == 4
+    assert not model_caches["user_a"].is_loaded
+
+
+def test_unchanged_version(mlflow_client: MlflowClient):
+    from dfp.utils.model_cache import ModelManager
+
+    manager = ModelManager(model_name_formatter="dfp-{user_id}")
+    model_cache = manager.load_model_cache(mlflow_client, reg_model_name="dfp-user_a")
+    model_cache.load_model()
+
+    # Once the cache times out the registry is checked again, keeping the loaded model if the version is unchanged
+    model_cache.mark_checked(datetime.now() - timedelta(seconds=manager.cache_timeout_sec + 1))
+    assert manager.load_model_cache(mlflow_client, reg_model_name="dfp-user_a") is model_cache
+    assert model_cache.is_loaded
+
+
+def test_coalesced_load(mlflow_client: MlflowClient):
+    from dfp.utils.model_cache import ModelManager
+
+    manager = ModelManager(model_name_formatter="dfp-{user_id}")
+    model_cache = manager.load_user_model(mlflow_client, user_id="user_a", fallback_user_ids=[])
+
+    with mock.patch("mlflow.pytorch.load_model", wraps=mlflow.pytorch.load_model) as mock_load_model:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            models = list(executor.map(lambda _: model_cache.load_model(), range(4)))
+
+    mock_load_model.assert_called_once()
+    assert all(model is models[0] for model in models)
+
+    assert manager.metrics["misses"] == 1
+    assert manager.metrics["hits"] == 3
+
+
+def test_prefetch_user_models(mlflow_client: MlflowClient):
+    from dfp.utils.model_cache import ModelManager
+
+    manager = ModelManager(model_name_formatter="dfp-{user_id}")
+    manager.prefetch_user_models(mlflow_client, user_ids=["user_a", "unknown_user"], fallback_user_ids=["generic_user"])
+
+    # Wait for the prefetches to complete
+    manager._prefetch_executor.shutdown(wait=True)
+    assert not manager._prefetch_pending
+    assert manager.metrics["misses"] == 2
+
+    model_cache = manager.load_user_model(mlflow_client, user_id="unknown_user", fallback_user_ids=["generic_user"])
+    assert model_cache.reg_model_name == "dfp-generic_user"
+    assert model_cache.is_loaded
+
+    model_cache.load_model()
+    assert manager.metrics["hits"] == 1
+
+    manager.close()
+    assert manager._prefetch_executor is None
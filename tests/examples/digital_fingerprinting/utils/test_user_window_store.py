@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pathlib
+import typing
+
+import pandas as pd
+import pytest
+
+
+def _make_batches(num_batches: int, rows_per_batch: int) -> list[pd.DataFrame]:
+    batches = []
+    for i in range(num_batches):
+        start = i * rows_per_batch
+        batches.append(
+            pd.DataFrame({
+                "timestamp": pd.date_range("2024-01-01", periods=rows_per_batch, freq="h") + pd.Timedelta(hours=start),
+                "value": range(start, start + rows_per_batch),
+            }))
+
+    return batches
+
+
+def _concat_window(batches: list[pd.DataFrame]) -> "CachedUserWindow":  # noqa: F821
+    """The rolling window previously held by `CachedUserWindow`, concatenated on every append."""
+    from dfp.utils.cached_user_window import CachedUserWindow
+
+    window = CachedUserWindow(user_id="test_user", cache_location=None)
+    dfs = []
+    for df in batches:
+        assert window.append_dataframe(df)
+        dfs.append(window._chunks[-1].df)
+
+    return pd.concat(dfs)
+
+
+@pytest.mark.parametrize("max_history", [None, 10, 100, "5h", "30d"])
+def test_get_train_df(max_history: typing.Union[int, str, None]):
+    from dfp.utils.cached_user_window import CachedUserWindow
+
+    batches = _make_batches(num_batches=4, rows_per_batch=8)
+
+    window = CachedUserWindow(user_id="test_user", cache_location=None)
+    for df in batches[:3]:
+        assert window.append_dataframe(df)
+
+    # The rows are only concatenated when the training data is requested
+    assert len(window._chunks) == 3
+    assert window.count == 24
+
+    expected_df = CachedUserWindow.trim_dataframe(_concat_window(batches[:3]), max_history=max_history, last_batch=0)
+    train_df = window.get_train_df(max_history=max_history)
+    pd.testing.assert_frame_equal(train_df, expected_df)
+
+    assert len(window._chunks) == 1
+    assert window.count == len(expected_df)
+    assert window.min_epoch == expected_df["timestamp"].min()
+    assert window.max_epoch == expected_df["timestamp"].max()
+    assert window.pending_batch_count == 0
+
+    # Rows older than the window are rejected, rows already in the window are ignored
+    assert not window.append_dataframe(batches[0].iloc[:1].assign(timestamp=pd.Timestamp("2023-01-01")))
+    assert window.append_dataframe(batches[2])
+    assert window.batch_count == 3
+
+    # New batches are always kept
+    assert window.append_dataframe(batches[3])
+    expected_df = CachedUserWindow.trim_dataframe(pd.concat([train_df, window._chunks[-1].df]),
+                                                  max_history=max_history,
+                                                  last_batch=3)
+    pd.testing.assert_frame_equal(window.get_train_df(max_history=max_history), expected_df)
+    assert len(expected_df) >= 8
+
+
+def test_save_load(tmp_path: pathlib.Path):
+    from dfp.utils.cached_user_window import CachedUserWindow
+
+    cache_location = os.path.join(tmp_path, "windows", "test_user.parquet")
+    window = CachedUserWindow(user_id="test_user", cache_location=cache_location)
+    for df in _make_batches(num_batches=2, rows_per_batch=8):
+        window.append_dataframe(df)
+    window.get_train_df(max_history=None)
+
+    window.save()
+    loaded = CachedUserWindow.load(cache_location)
+
+    assert loaded.user_id == "test_user"
+    assert loaded.total_count == 16
+    assert loaded.batch_count == 2
+    assert loaded.last_train_count == 16
+    assert loaded.last_train_epoch == pd.Timestamp(window.last_train_epoch)
+    assert loaded.max_epoch == window.max_epoch
+    pd.testing.assert_frame_equal(loaded.get_train_df(max_history=None), window.get_train_df(max_history=None))
+
+    # The window continues from where it was saved, ignoring rows already in the window
+    assert loaded.append_dataframe(_make_batches(num_batches=1, rows_per_batch=8)[0])
+    assert loaded.batch_count == 2
+    assert loaded.append_dataframe(_make_batches(num_batches=3, rows_per_batch=8)[2])
+    assert loaded.get_train_df(max_history=None).index.tolist() == list(range(24))
+
+
+def test_spill(tmp_path: pathlib.Path):
+    from dfp.utils.user_window_store import UserWindowStore
+
+    batches = _make_batches(num_batches=1, rows_per_batch=100)
+    cache_dir = os.path.join(tmp_path, "windows")
+
+    store = UserWindowStore(cache_dir, max_memory_bytes=1)
+    for user_id in ["user_a", "user_b", "user_c"]:
+        with store.user_window(user_id) as window:
+            window.append_dataframe(batches[0])
+
+    # Only the most recently used window is held in memory
+    assert len(store) == 3
+    assert list(store._windows.keys()) == ["user_c"]
+    assert store.memory_bytes == store._windows["user_c"].memory_bytes
+
+    with store.user_window("user_a") as window:
+        assert window.total_count == 100
+        assert window.cache_location == os.path.join(cache_dir, "user_a.parquet")
+        assert len(window.get_train_df(max_history=None)) == 100
+
+    assert list(store._windows.keys()) == ["user_a"]
+
+    # Spilled windows are not kept once closed
+    store.close()
+    assert os.listdir(cache_dir) == []
+
+
+def test_persist(tmp_path: pathlib.Path):
+    from dfp.utils.user_window_store import UserWindowStore
+
+    batches = _make_batches(num_batches=2, rows_per_batch=10)
+    cache_dir = os.path.join(tmp_path, "windows")
+
+    store = UserWindowStore(cache_dir, persist=True)
+    with store.user_window("test_user") as window:
+        window.append_dataframe(batches[0])
+    store.close()
+
+    assert os.listdir(cache_dir) == ["test_user.parquet"]
+
+    # Simulate a restart
+    store = UserWindowStore(cache_dir, persist=True)
+    with store.user_window("test_user") as window:
+        assert window.total_count == 10
+        assert window.append_dataframe(batches[1])
+        assert len(window.get_train_df(max_history=None)) == 20
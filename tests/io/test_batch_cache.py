@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from morpheus.io.batch_cache import ArrowBatchCache
+from morpheus.io.batch_cache import PickleBatchCache
+from morpheus.io.batch_cache import create_batch_cache
+
+CACHE_FORMATS = [("pickle", None), ("arrow", None), ("arrow", "zstd")]
+
+
+def _make_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        "v1": range(100), "v2": [f"s{i}" for i in range(100)], "ts": pd.date_range("2024-01-01", periods=100, freq="s")
+    })
+
+
+@pytest.mark.parametrize("cache_format, compression", CACHE_FORMATS)
+def test_round_trip(tmp_path: str, cache_format: str, compression: str):
+    cache = create_batch_cache(cache_format, str(tmp_path), compression=compression)
+    df = _make_df()
+
+    assert cache.get("batch") is None
+    cache.put("batch", df)
+    assert os.path.exists(cache.get_path("batch"))
+
+    pd.testing.assert_frame_equal(cache.get("batch"), df)
+    assert cache.stats == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1, "bytes": cache.total_bytes}
+
+
+@pytest.mark.parametrize("cache_format, compression", CACHE_FORMATS)
+def test_max_bytes_evicts_lru(tmp_path: str, cache_format: str, compression: str):
+    cache = create_batch_cache(cache_format, str(tmp_path), compression=compression)
+    cache.put("a", _make_df())
+    entry_size = cache.total_bytes
+
+    # Re-open the cache with room for two entries, existing files should be picked up
+    cache = create_batch_cache(cache_format, str(tmp_path), max_bytes=int(entry_size * 2.5), compression=compression)
+    cache.put("b", _make_df())
+    assert cache.get("a") is not None
+
+    # "b" is now the least recently used entry
+    cache.put("c", _make_df())
+    assert not os.path.exists(cache.get_path("b"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats["evictions"] == 1
+    assert cache.total_bytes <= entry_size * 2.5
+
+
+@pytest.mark.parametrize("cache_class", [PickleBatchCache, ArrowBatchCache])
+def test_ttl(tmp_path: str, cache_class: type):
+    cache = cache_class(str(tmp_path), ttl=0.05)
+    cache.put("batch", _make_df())
+    assert cache.get("batch") is not None
+
+    time.sleep(0.1)
+    assert cache.get("batch") is None
+    assert not os.path.exists(cache.get_path("batch"))
+    assert cache.stats["evictions"] == 1
+
+
+def test_create_batch_cache_errors(tmp_path: str):
+    with pytest.raises(ValueError, match="Unknown batch cache format"):
+        create_batch_cache("csv", str(tmp_path))
+
+    with pytest.raises(ValueError, match="Compression is not supported"):
+        create_batch_cache("pickle", str(tmp_path), compression="zstd")
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import os
+
+import pytest
+
+from morpheus.io.rotating_file_writer import RotatingFileWriter
+from morpheus.io.rotating_file_writer import get_rotated_file_name
+
+HEADER = b"v1,v2\n"
+
+
+def _make_rows(start: int, num_rows: int) -> bytes:
+    return "".join(f"{i},value_{i}\n" for i in range(start, start + num_rows)).encode("UTF-8")
+
+
+@pytest.mark.parametrize("filename, compression, expected",
+                         [("out.jsonlines", None, ["out.jsonlines", "out.1.jsonlines", "out.2.jsonlines"]),
+                          ("out.csv.gz", "gzip", ["out.csv.gz", "out.1.csv.gz", "out.2.csv.gz"]),
+                          ("out.csv.zst", "zstd", ["out.csv.zst", "out.1.csv.zst", "out.2.csv.zst"]),
+                          ("out.csv", "gzip", ["out.csv", "out.1.csv", "out.2.csv"]),
+                          ("out", None, ["out", "out.1", "out.2"])])
+def test_get_rotated_file_name(filename: str, compression: str, expected: list[str]):
+    assert [get_rotated_file_name(filename, i, compression) for i in range(3)] == expected
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_rotation_header(tmp_path: str, compression: str):
+    compression_ext = ".gz" if compression == "gzip" else ""
+    file_name = os.path.join(tmp_path, f"out.csv{compression_ext}")
+
+    chunks = [_make_rows(i * 10, 10) for i in range(3)]
+    with RotatingFileWriter(file_name, compression=compression, max_file_size=1) as writer:
+        for chunk in chunks:
+            writer.write(chunk, header=HEADER)
+
+    expected_files = [os.path.join(tmp_path, f"out{suffix}.csv{compression_ext}") for suffix in ("", ".1", ".2")]
+    assert writer.file_names == expected_files
+
+    # Each rotated file starts with its own header
+    for (expected_file, chunk) in zip(expected_files, chunks):
+        with (gzip.open if compression == "gzip" else open)(expected_file, "rb") as fh:
+            assert fh.read() == HEADER + chunk
+
+
+def test_header_once(tmp_path: str):
+    file_name = os.path.join(tmp_path, "out.csv")
+
+    chunks = [_make_rows(i * 10, 10) for i in range(3)]
+    with RotatingFileWriter(file_name) as writer:
+        for chunk in chunks:
+            writer.write(chunk, header=HEADER)
+
+    assert writer.file_names == [file_name]
+
+    with open(file_name, "rb") as fh:
+        assert fh.read() == HEADER + b"".join(chunks)
+
+
+def test_gzip_round_trip(tmp_path: str):
+    file_name = os.path.join(tmp_path, "out.jsonlines.gz")
+
+    chunks = [f'{{"v1":{i}}}\n'.encode("UTF-8") * 100 for i in range(5)]
+    with RotatingFileWriter(file_name, compression="gzip") as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+            writer.flush()
+
+    with gzip.open(file_name, "rb") as fh:
+        assert fh.read() == b"".join(chunks)
+
+
+def test_file_exists(tmp_path: str):
+    file_name = os.path.join(tmp_path, "out.jsonlines")
+    with open(os.path.join(tmp_path, "out.1.jsonlines"), "w", encoding="UTF-8"):
+        pass
+
+    with RotatingFileWriter(file_name, max_file_size=1) as writer:
+        writer.write(_make_rows(0, 10))
+
+        with pytest.raises(FileExistsError):
+            writer.write(_make_rows(10, 10))
+
+
+def test_unsupported_compression(tmp_path: str):
+    with pytest.raises(ValueError):
+        RotatingFileWriter(os.path.join(tmp_path, "out.csv.bz2"), compression="bz2")
@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from morpheus.common import FileTypes
+from morpheus.io.streaming_file_writer import StreamingFileWriter
+
+
+def _make_df(start: int, num_rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "v1": range(start, start + num_rows),
+            "v2": [f"value_{i}" for i in range(start, start + num_rows)],
+            "v3": [i * 0.5 for i in range(start, start + num_rows)],
+        },
+        index=range(start, start + num_rows))
+
+
+def _read_text(file_name: str, compression: str) -> str:
+    if (compression == "gzip"):
+        with gzip.open(file_name, "rt", encoding="UTF-8") as fh:
+            return fh.read()
+
+    if (compression == "zstd"):
+        zstandard = pytest.importorskip("zstandard")
+        with open(file_name, "rb") as fh:
+            return zstandard.ZstdDecompressor().stream_reader(fh).read().decode("UTF-8")
+
+    with open(file_name, "r", encoding="UTF-8") as fh:
+        return fh.read()
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+@pytest.mark.parametrize("file_type", [FileTypes.JSON, FileTypes.CSV])
+def test_write_text(tmp_path: str, file_type: FileTypes, compression: str):
+    if (compression == "zstd"):
+        pytest.importorskip("zstandard")
+
+    ext = {FileTypes.JSON: "jsonlines", FileTypes.CSV: "csv"}[file_type]
+    compression_ext = {None: "", "gzip": ".gz", "zstd": ".zst"}[compression]
+    file_name = os.path.join(tmp_path, f"out.{ext}{compression_ext}")
+
+    dfs = [_make_df(0, 10), _make_df(10, 5)]
+    with StreamingFileWriter(file_name, include_index_col=False, compression=compression) as writer:
+        assert writer.file_type == file_type
+        for df in dfs:
+            writer.write(df)
+
+    text = _read_text(file_name, compression)
+
+    expected_df = pd.concat(dfs)
+    if (file_type == FileTypes.JSON):
+        assert text == expected_df.to_json(orient="records", lines=True)
+    else:
+        assert text == expected_df.to_csv(index=False)
+
+
+def test_rotation(tmp_path: str):
+    file_name = os.path.join(tmp_path, "out.csv")
+
+    dfs = [_make_df(i * 10, 10) for i in range(4)]
+    with StreamingFileWriter(file_name, include_index_col=False, max_file_size=1) as writer:
+        for df in dfs:
+            writer.write(df)
+
+    expected_files = [file_name] + [os.path.join(tmp_path, f"out.{i}.csv") for i in range(1, 4)]
+    assert writer.file_names == expected_files
+
+    # Each file is a complete CSV file with a header
+    for (expected_file, df) in zip(expected_files, dfs):
+        pd.testing.assert_frame_equal(pd.read_csv(expected_file), df.reset_index(drop=True))
+
+
+def test_rotation_file_exists(tmp_path: str):
+    file_name = os.path.join(tmp_path, "out.jsonlines")
+    with open(os.path.join(tmp_path, "out.1.jsonlines"), "w", encoding="UTF-8"):
+        pass
+
+    with StreamingFileWriter(file_name, include_index_col=False, max_file_size=1) as writer:
+        writer.write(_make_df(0, 10))
+
+        with pytest.raises(FileExistsError):
+            writer.write(_make_df(10, 10))
+
+
+@pytest.mark.parametrize("file_type", [FileTypes.PARQUET, FileTypes.ARROW])
+def test_write_table(tmp_path: str, file_type: FileTypes):
+    file_name = os.path.join(tmp_path, f"out.{file_type.name.lower()}")
+
+    dfs = [_make_df(i * 10, 10) for i in range(5)]
+    with StreamingFileWriter(file_name, include_index_col=False, row_group_size=20) as writer:
+        for df in dfs:
+            writer.write(df)
+
+    expected_df = pd.concat(dfs).reset_index(drop=True)
+
+    if (file_type == FileTypes.PARQUET):
+        parquet_file = pq.ParquetFile(file_name)
+        assert [parquet_file.metadata.row_group(i).num_rows for i in range(parquet_file.num_row_groups)] == [20, 20, 10]
+        table = parquet_file.read()
+    else:
+        with pa.ipc.open_file(file_name) as reader:
+            assert [reader.get_batch(i).num_rows for i in range(reader.num_record_batches)] == [20, 20, 10]
+            table = reader.read_all()
+
+    pd.testing.assert_frame_equal(table.to_pandas(), expected_df)
+
+
+@pytest.mark.parametrize("file_type", [FileTypes.PARQUET, FileTypes.ARROW])
+def test_write_table_all_null_column(tmp_path: str, file_type: FileTypes):
+    file_name = os.path.join(tmp_path, f"out.{file_type.name.lower()}")
+
+    # Converted on its own, the all-null column of the second DataFrame has the null type instead of string
+    dfs = [_make_df(0, 10), _make_df(10, 10).assign(v2=None)]
+    with StreamingFileWriter(file_name, include_index_col=False, row_group_size=20) as writer:
+        for df in dfs:
+            writer.write(df)
+
+    if (file_type == FileTypes.PARQUET):
+        table = pq.read_table(file_name)
+    else:
+        with pa.ipc.open_file(file_name) as reader:
+            table = reader.read_all()
+
+    assert table.schema.field("v2").type == pa.Table.from_pandas(dfs[0]).schema.field("v2").type
+    assert table.column("v2").to_pylist() == dfs[0]["v2"].tolist() + [None] * 10
+
+
+def test_write_table_schema_mismatch(tmp_path: str):
+    file_name = os.path.join(tmp_path, "out.parquet")
+
+    with StreamingFileWriter(file_name, include_index_col=False, row_group_size=20) as writer:
+        writer.write(_make_df(0, 10))
+
+        # The DataFrame which doesn't match the schema fails, rather than a later write of the buffered row group
+        with pytest.raises(pa.ArrowInvalid):
+            writer.write(_make_df(10, 10).assign(v1="not a number"))
@@ -18,6 +18,7 @@ from unittest import mock
 from _utils.llm import execute_node
 from morpheus.llm import LLMNodeBase
 from morpheus.llm.nodes.llm_generate_node import LLMGenerateNode
+from morpheus.llm.services.utils.llm_response_cache import LLMResponseCache
 
 
 def test_constructor(mock_llm_client: mock.MagicMock):
@@ -37,3 +38,18 @@ def test_execute(mock_llm_client: mock.MagicMock):
     node = LLMGenerateNode(llm_client=mock_llm_client)
     assert execute_node(node, prompt=["prompt1", "prompt2"]) == expected_output
     mock_llm_client.generate_batch_async.assert_called_once_with({'prompt': ["prompt1", "prompt2"]})
+
+
+def test_execute_cached(mock_llm_client: mock.MagicMock):
+    mock_llm_client.generate_batch_async.side_effect = lambda inputs, **_: [f"{p}_response" for p in inputs["prompt"]]
+
+    node = LLMGenerateNode(llm_client=mock_llm_client, cache=LLMResponseCache())
+    expected_output = ["prompt1_response", "prompt2_response", "prompt1_response"]
+    assert execute_node(node, prompt=["prompt1", "prompt2", "prompt1"]) == expected_output
+    mock_llm_client.generate_batch_async.assert_called_once_with({'prompt': ["prompt1", "prompt2"]},
+                                                                 return_exceptions=False)
+
+    # Second execution only sends the new prompt
+    mock_llm_client.generate_batch_async.reset_mock()
+    assert execute_node(node, prompt=["prompt2", "prompt3"]) == ["prompt2_response", "prompt3_response"]
+    mock_llm_client.generate_batch_async.assert_called_once_with({'prompt': ["prompt3"]}, return_exceptions=False)
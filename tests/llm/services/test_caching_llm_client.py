@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import time
+from unittest import mock
+
+import pytest
+
+from morpheus.llm.services.llm_service import LLMClient
+from morpheus.llm.services.utils.caching_llm_client import CachingLLMClient
+from morpheus.llm.services.utils.llm_response_cache import LLMResponseCache
+
+
+@pytest.fixture(name="mock_client")
+def mock_client_fixture():
+    mock_client = mock.MagicMock(LLMClient)
+    mock_client.get_input_names.return_value = ["prompt"]
+    mock_client.generate.side_effect = lambda prompt: f"{prompt}_response"
+    mock_client.generate_batch.side_effect = lambda inputs, **_: [f"{p}_response" for p in inputs["prompt"]]
+    mock_client.generate_batch_async = mock.AsyncMock(
+        side_effect=lambda inputs, **_: [f"{p}_response" for p in inputs["prompt"]])
+    return mock_client
+
+
+def test_make_key():
+    key = LLMResponseCache.make_key("model", {"temperature": 0}, {"prompt": "test"})
+    assert key == LLMResponseCache.make_key("model", {"temperature": 0}, {"prompt": "test"})
+    assert key != LLMResponseCache.make_key("other_model", {"temperature": 0}, {"prompt": "test"})
+    assert key != LLMResponseCache.make_key("model", {"temperature": 1}, {"prompt": "test"})
+    assert key != LLMResponseCache.make_key("model", {"temperature": 0}, {"prompt": "other"})
+
+
+def test_memory_lru():
+    cache = LLMResponseCache(max_memory_entries=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"
+
+    cache.put("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.stats == {"hits": 3, "misses": 1, "memory_entries": 2}
+
+
+def test_ttl():
+    cache = LLMResponseCache(ttl=0.05)
+    cache.put("a", "1")
+    assert cache.get("a") == "1"
+
+    time.sleep(0.1)
+    assert cache.get("a") is None
+
+
+def test_db_persistence(tmp_path: str):
+    db_path = os.path.join(tmp_path, "llm_cache.sqlite")
+    cache = LLMResponseCache(db_path=db_path)
+    cache.put("a", "1")
+    cache.close()
+
+    cache = LLMResponseCache(max_memory_entries=1, db_path=db_path)
+    assert cache.get("a") == "1"
+    cache.close()
+
+
+def test_db_max_entries(tmp_path: str):
+    cache = LLMResponseCache(max_memory_entries=1,
+                             db_path=os.path.join(tmp_path, "llm_cache.sqlite"),
+                             max_db_entries=2,
+                             db_evict_interval=1)
+    for key in ("a", "b", "c"):
+        cache.put(key, key)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "b"
+    assert cache.get("c") == "c"
+    cache.close()
+
+
+def test_generate(mock_client: mock.MagicMock):
+    client = CachingLLMClient(mock_client, LLMResponseCache(), model_name="model")
+    assert client.get_input_names() == ["prompt"]
+
+    assert client.generate(prompt="test") == "test_response"
+    assert client.generate(prompt="test") == "test_response"
+    mock_client.generate.assert_called_once_with(prompt="test")
+
+
+def test_generate_batch(mock_client: mock.MagicMock):
+    client = CachingLLMClient(mock_client, LLMResponseCache(), model_name="model")
+
+    assert client.generate_batch({"prompt": ["a", "b", "a"]}) == ["a_response", "b_response", "a_response"]
+    mock_client.generate_batch.assert_called_once_with({"prompt": ["a", "b"]}, return_exceptions=False)
+
+    mock_client.generate_batch.reset_mock()
+    assert client.generate_batch({"prompt": ["a", "b"]}) == ["a_response", "b_response"]
+    mock_client.generate_batch.assert_not_called()
+
+
+async def test_generate_batch_async_exceptions_not_cached(mock_client: mock.MagicMock):
+    error = RuntimeError("unittest")
+    mock_client.generate_batch_async.side_effect = lambda inputs, **_: [error, "b_response"]
+    client = CachingLLMClient(mock_client, LLMResponseCache(), model_name="model")
+
+    assert await client.generate_batch_async({"prompt": ["a", "b", "a"]},
+                                             return_exceptions=True) == [error, "b_response", error]
+
+    mock_client.generate_batch_async.side_effect = lambda inputs, **_: [f"{p}_response" for p in inputs["prompt"]]
+    assert await client.generate_batch_async({"prompt": ["a", "b"]}) == ["a_response", "b_response"]
+    mock_client.generate_batch_async.assert_called_with({"prompt": ["a"]}, return_exceptions=False)
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 from unittest import mock
 
 import pytest
@@ -114,3 +115,30 @@ async def test_generate_batch_async_error_retry(mock_nemollm: mock.MagicMock):
     results = await client.generate_batch_async({'prompt': ["prompt1", "prompt2"]})
 
     assert results == ["prompt1", "prompt2"]
+
+
+async def test_generate_batch_async_rate_limited(mock_nemollm: mock.MagicMock):
+    responses = [{"status": "fail", "msg": "429 Client Error: Too Many Requests"}, {"status": "success", "text": "ok"}]
+    mock_nemollm.post_process_generate_response.side_effect = responses
+
+    def mock_generate(**_):
+        future = concurrent.futures.Future()
+        future.set_result(mock.MagicMock(status_code=200))
+        return future
+
+    mock_nemollm.generate.side_effect = mock_generate
+
+    service = NeMoLLMService(api_key="dummy", retry_count=2)
+    client = service.get_client(model_name="test_model")
+
+    # Skip the cooldown after being rate limited
+    with mock.patch("morpheus.llm.services.utils.rate_limiter.asyncio.sleep", new_callable=mock.AsyncMock):
+        results = await client.generate_batch_async({'prompt': ["prompt1"]})
+
+    assert results == ["ok"]
+
+    # The failed result is reported to the limiter as a rate limit error, slowing down subsequent requests
+    stats = service.limiter.stats
+    assert stats["rate_limited_requests"] == 1
+    assert stats["rate_scale"] < 1.0
+    assert stats["in_flight"] == 0
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+import pytest
+
+from morpheus.llm.services.utils.rate_limiter import RateLimiter
+from morpheus.llm.services.utils.rate_limiter import estimate_tokens
+from morpheus.llm.services.utils.rate_limiter import is_rate_limit_error
+
+
+class _RateLimitError(Exception):
+    status_code = 429
+
+
+async def test_max_concurrency():
+    limiter = RateLimiter(max_concurrency=3)
+    max_in_flight = 0
+
+    async def request():
+        nonlocal max_in_flight
+        async with limiter.limit():
+            max_in_flight = max(max_in_flight, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*[request() for _ in range(20)])
+
+    assert max_in_flight == 3
+    assert limiter.stats["in_flight"] == 0
+    assert limiter.stats["queue_depth"] == 0
+    assert limiter.stats["total_requests"] == 20
+
+
+async def test_requests_per_minute():
+    # 600 requests per minute with a full bucket of 600, only the requests beyond that should be delayed
+    limiter = RateLimiter(requests_per_minute=600)
+
+    start = time.monotonic()
+    for _ in range(602):
+        async with limiter.limit():
+            pass
+
+    assert time.monotonic() - start >= 0.15
+
+
+async def test_rate_limit_backoff():
+    limiter = RateLimiter(requests_per_minute=600)
+
+    with pytest.raises(_RateLimitError):
+        async with limiter.limit():
+            raise _RateLimitError()
+
+    assert limiter.stats["rate_limited_requests"] == 1
+    assert limiter.stats["rate_scale"] == 0.5
+
+    # Other errors should not affect the rate
+    with pytest.raises(RuntimeError):
+        async with limiter.limit():
+            raise RuntimeError("unittest")
+
+    assert limiter.stats["rate_scale"] == 0.5
+    assert limiter.stats["in_flight"] == 0
+
+
+async def test_cancelled_waiter_releases_slot():
+    limiter = RateLimiter(max_concurrency=1)
+    release = asyncio.Event()
+
+    async def hold():
+        async with limiter.limit():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    release.set()
+    await holder
+
+    # The slot must still be available
+    await asyncio.wait_for(hold(), timeout=1)
+
+
+def test_is_rate_limit_error():
+    assert is_rate_limit_error(_RateLimitError())
+    assert not is_rate_limit_error(RuntimeError())
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("a" * 400) == 100
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        RateLimiter(max_concurrency=0)
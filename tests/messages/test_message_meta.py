@@ -16,6 +16,7 @@
 
 import operator
 import typing
+from unittest import mock
 
 import pandas as pd
 import pytest
@@ -368,6 +369,26 @@ def test_get_column_names(df: DataFrameType):
     assert sorted(meta.get_column_names()) == expected_columns
 
 
+def test_readonly_dataframe(df: DataFrameType):
+    """
+    Test that readonly_dataframe exposes the columns without copying the DataFrame
+    """
+    meta = MessageMeta(df)
+    columns = df.columns.to_list()
+
+    with mock.patch.object(MessageMeta, "copy_dataframe") as mock_copy_dataframe:
+        with meta.readonly_dataframe() as view:
+            assert view.columns == columns
+            assert view.dtypes.to_dict() == df.dtypes.to_dict()
+            assert len(view) == len(df)
+
+            DatasetManager.assert_df_equal(view.df, df)
+            DatasetManager.assert_df_equal(view.get_column(columns[0]), df[columns[0]])
+            DatasetManager.assert_df_equal(view.get_columns(columns[::-1]), df[columns[::-1]])
+
+        mock_copy_dataframe.assert_not_called()
+
+
 def test_cpp_meta_slicing(dataset_cudf: DatasetManager):
     """
     Test copy_range() and get_slice() of MessageMetaCpp
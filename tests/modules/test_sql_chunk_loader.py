@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pathlib
+import sqlite3
+
+import cudf
+
+import morpheus.modules  # noqa: F401 # pylint: disable=unused-import
+from morpheus.config import Config
+from morpheus.messages import ControlMessage
+from morpheus.messages import MessageMeta
+from morpheus.pipeline import LinearPipeline
+from morpheus.pipeline.stage_decorator import source
+from morpheus.stages.general.linear_modules_stage import LinearModulesStage
+from morpheus.stages.output.in_memory_sink_stage import InMemorySinkStage
+from morpheus.utils.module_ids import MORPHEUS_MODULE_NAMESPACE
+from morpheus.utils.module_ids import SQL_CHUNK_LOADER
+
+# pylint: disable=redundant-keyword-arg
+
+
+@source
+def source_test_stage(connection_string: str) -> ControlMessage:
+    control_message = ControlMessage()
+    control_message.add_task(
+        "load",
+        {
+            "loader_id": "SQLLoader",
+            "sql_config": {
+                "queries": [{
+                    "connection_string": connection_string, "query": "SELECT * FROM test_table ORDER BY id"
+                }]
+            }
+        })
+
+    yield control_message
+
+    # Passed through unchanged
+    control_message = ControlMessage()
+    control_message.payload(MessageMeta(cudf.DataFrame({"id": [1]})))
+
+    yield control_message
+
+
+def test_sql_chunk_loader(config: Config, tmp_path: pathlib.Path):
+    db_path = tmp_path / "test.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE test_table (id INTEGER)")
+        conn.executemany("INSERT INTO test_table VALUES (?)", [(i, ) for i in range(25)])
+
+    module_config = {
+        "module_id": SQL_CHUNK_LOADER,
+        "module_name": "sql_chunk_loader",
+        "namespace": MORPHEUS_MODULE_NAMESPACE,
+        "chunk_rows": 10
+    }
+
+    pipeline = LinearPipeline(config)
+    pipeline.set_source(source_test_stage(config, connection_string=f"sqlite:///{db_path}"))
+    pipeline.add_stage(LinearModulesStage(config, module_config, input_port_name="input", output_port_name="output"))
+    sink_stage = pipeline.add_stage(InMemorySinkStage(config))
+
+    pipeline.run()
+
+    messages = sink_stage.get_messages()
+    assert [len(msg.payload().copy_dataframe()) for msg in messages] == [10, 10, 5, 1]
+    assert all(not msg.has_task("load") for msg in messages)
+    assert messages[2].payload().copy_dataframe()["id"].to_pandas().tolist() == list(range(20, 25))
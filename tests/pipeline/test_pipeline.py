@@ -17,6 +17,7 @@
 import gc
 import typing
 
+import pandas as pd
 import pytest
 
 from _utils import assert_results
@@ -26,6 +27,8 @@ from _utils.stages.in_memory_source_x_stage import InMemSourceXStage
 from _utils.stages.multi_message_pass_thru import MultiMessagePassThruStage
 from _utils.stages.multi_port_pass_thru import MultiPortPassThruStage
 from morpheus.config import Config
+from morpheus.config import CppConfig
+from morpheus.config import ExecutionMode
 from morpheus.messages import ControlMessage
 from morpheus.messages import MessageMeta
 from morpheus.messages import MultiMessage
@@ -280,3 +283,34 @@ def test_add_segment_edge_bad_ingress(config: Config):
 
     with pytest.raises(AssertionError):
         pipe.add_segment_edge(boundary_egress, "seg_1", bad_ingress, "seg_2", ("seg_1", object, False))
+
+
+@pytest.mark.use_python
+def test_add_stage_unsupported_execution_mode(config: Config):
+    config.execution_mode = ExecutionMode.CPU
+    pipe = Pipeline(config)
+
+    # Stages which support the CPU execution mode can be added
+    pipe.add_stage(InMemorySourceStage(config, [pd.DataFrame({"v1": [1, 2, 3]})]))
+    pipe.add_stage(DeserializeStage(config))
+
+    with pytest.raises(RuntimeError, match="does not support the CPU execution mode"):
+        pipe.add_stage(ConvMsg(config))
+
+
+@pytest.mark.use_cpp
+def test_cpu_execution_mode_restores_use_cpp(config: Config):
+    config.execution_mode = ExecutionMode.CPU
+
+    pipe = LinearPipeline(config)
+    pipe.set_source(InMemorySourceStage(config, [pd.DataFrame({"v1": [1, 2, 3]})]))
+    sink_stage = pipe.add_stage(InMemorySinkStage(config))
+
+    # Constructing the pipeline does not change the global setting
+    assert CppConfig.get_should_use_cpp()
+
+    pipe.run()
+
+    # C++ messages are only disabled while the pipeline is running
+    assert all(isinstance(msg.df, pd.DataFrame) for msg in sink_stage.get_messages())
+    assert CppConfig.get_should_use_cpp()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import pathlib
+import urllib.request
+
+import pandas as pd
+import pytest
+
+from morpheus.config import Config
+from morpheus.config import ConfigStageMetrics
+from morpheus.pipeline import LinearPipeline
+from morpheus.pipeline.stage_metrics import StageMetrics
+from morpheus.pipeline.stage_metrics import StageMetricsRegistry
+from morpheus.stages.input.in_memory_source_stage import InMemorySourceStage
+from morpheus.stages.output.in_memory_sink_stage import InMemorySinkStage
+from morpheus.stages.postprocess.serialize_stage import SerializeStage
+from morpheus.stages.preprocess.deserialize_stage import DeserializeStage
+
+
+def test_stage_metrics():
+    metrics = StageMetrics("test-stage", latency_buckets=[0.5, 100.0], max_pending=2)
+
+    df = pd.DataFrame({"v1": range(10)})
+    assert metrics.on_input(df) is df
+    assert metrics.on_input("other") == "other"
+
+    # Matched with the same message rather than the oldest one
+    assert metrics.on_output("other") == "other"
+    assert metrics.snapshot()["backlog"] == 1
+
+    # Matched with the oldest message
+    metrics.on_output(df.copy())
+
+    snapshot = metrics.snapshot()
+    assert snapshot["stage"] == "test-stage"
+    assert snapshot["messages_in"] == 2
+    assert snapshot["messages_out"] == 2
+    assert snapshot["rows_out"] == 11
+    assert snapshot["bytes_out"] == len("other") + df.memory_usage(index=False).sum()
+    assert snapshot["backlog"] == 0
+    assert snapshot["rows_per_sec"] > 0
+
+    histogram = snapshot["processing_seconds"]
+    assert histogram["count"] == 2
+    assert histogram["buckets"] == {0.5: 2, 100.0: 2, float("inf"): 2}
+    assert 0 < histogram["sum"] < 1
+
+
+def test_stage_metrics_max_pending():
+    metrics = StageMetrics("test-stage", latency_buckets=[1.0], max_pending=2)
+
+    messages = [pd.DataFrame({"v1": [i]}) for i in range(5)]
+    for msg in messages:
+        metrics.on_input(msg)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["messages_in"] == 5
+    assert snapshot["backlog"] == 2
+
+
+def test_prometheus_text():
+    registry = StageMetricsRegistry(ConfigStageMetrics(latency_buckets=[1.0]), max_pending=4)
+    metrics = registry.get_stage_metrics("test-stage")
+    assert registry.get_stage_metrics("test-stage") is metrics
+
+    metrics.on_input("value")
+    metrics.on_output("value")
+
+    lines = registry.to_prometheus_text().splitlines()
+    assert 'morpheus_stage_messages_in_total{stage="test-stage"} 1' in lines
+    assert 'morpheus_stage_bytes_out_total{stage="test-stage"} 5' in lines
+    assert 'morpheus_stage_backlog{stage="test-stage"} 0' in lines
+    assert "# TYPE morpheus_stage_processing_seconds histogram" in lines
+    assert 'morpheus_stage_processing_seconds_bucket{stage="test-stage",le="1.0"} 1' in lines
+    assert 'morpheus_stage_processing_seconds_bucket{stage="test-stage",le="+Inf"} 1' in lines
+    assert 'morpheus_stage_processing_seconds_count{stage="test-stage"} 1' in lines
+
+
+def test_export(tmp_path: pathlib.Path):
+    json_file = os.path.join(tmp_path, "metrics.json")
+    registry = StageMetricsRegistry(ConfigStageMetrics(json_file=json_file, json_interval_secs=60, prometheus_port=0),
+                                    max_pending=4)
+    registry.get_stage_metrics("test-stage").on_input("value")
+
+    registry.start()
+    try:
+        (host, port) = registry.prometheus_address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert 'morpheus_stage_messages_in_total{stage="test-stage"} 1' in response.read().decode()
+    finally:
+        registry.stop()
+
+    assert registry.prometheus_address is None
+
+    # Written when stopped even though the interval did not elapse
+    with open(json_file, encoding="UTF-8") as f:
+        stages = json.load(f)["stages"]
+
+    assert [stage["stage"] for stage in stages] == ["test-stage"]
+    assert stages[0]["messages_in"] == 1
+
+
+@pytest.mark.use_python
+def test_pipeline_stage_metrics(config: Config, tmp_path: pathlib.Path):
+    json_file = os.path.join(tmp_path, "metrics.json")
+    config.stage_metrics = ConfigStageMetrics(json_file=json_file)
+    config.pipeline_batch_size = 4
+
+    df = pd.DataFrame({"v1": range(10)})
+
+    pipe = LinearPipeline(config)
+    pipe.set_source(InMemorySourceStage(config, [df]))
+    deserialize_stage = pipe.add_stage(DeserializeStage(config))
+    pipe.add_stage(SerializeStage(config))
+    pipe.add_stage(InMemorySinkStage(config))
+    pipe.run()
+
+    snapshots = {snapshot["stage"]: snapshot for snapshot in pipe.stage_metrics.snapshot()}
+    assert len(snapshots) == 4
+
+    deserialize_metrics = snapshots[deserialize_stage.unique_name]
+    assert deserialize_metrics["messages_in"] == 1
+    assert deserialize_metrics["messages_out"] == 3
+    assert deserialize_metrics["rows_out"] == 10
+
+    with open(json_file, encoding="UTF-8") as f:
+        assert len(json.load(f)["stages"]) == 4
@@ -17,6 +17,7 @@
 import typing
 
 import cupy as cp
+import numpy as np
 import pandas as pd
 import pytest
 import typing_utils
@@ -30,6 +31,9 @@ from morpheus.messages import MultiResponseMessage
 from morpheus.messages import ResponseMemory
 from morpheus.messages.message_meta import MessageMeta
 from morpheus.stages.postprocess.timeseries_stage import TimeSeriesStage
+from morpheus.stages.postprocess.timeseries_stage import _BinnedCounts
+from morpheus.stages.postprocess.timeseries_stage import _fft_ad_batch
+from morpheus.stages.postprocess.timeseries_stage import fftAD
 
 
 @pytest.fixture(name='config')
@@ -79,3 +83,63 @@ def test_call_timeseries_user(config):
 
     assert stage._call_timeseries_user(mock_multi_response_ae_message)[0].user_id == "test_user_id"
     assert stage._call_timeseries_user(mock_control_message)[0].get_metadata("user_id") == "test_user_id"
+
+
+def test_binned_counts():
+    rng = np.random.default_rng(0)
+    counts = _BinnedCounts(capacity=4)
+    events = np.array([], dtype=np.int64)
+
+    for i in range(20):
+        new_events = rng.integers(i * 5 - 3, i * 5 + 10, size=30)
+        counts.add(new_events)
+
+        window_start = i * 5 - 8
+        window_end = i * 5 + 4
+
+        counts.evict_before(window_start)
+        events = np.concatenate([events, new_events])
+        events = events[events >= window_start]
+
+        assert counts.first_bin == events.min()
+        assert counts.last_bin == events.max()
+
+        expected = np.bincount(events[events <= window_end] - window_start, minlength=window_end - window_start + 1)
+        np.testing.assert_array_equal(counts.window(window_start, window_end), expected)
+
+
+def test_binned_counts_shrink():
+    counts = _BinnedCounts(capacity=4)
+
+    # A single outlying event grows the buffer to span it
+    counts.add(np.array([0, 1, 1000]))
+    assert counts.capacity == 1024
+
+    # Shrinks back once the outlier is the only event left
+    counts.evict_before(1000)
+    assert counts.capacity == 4
+    assert (counts.first_bin, counts.last_bin) == (1000, 1000)
+    np.testing.assert_array_equal(counts.window(999, 1001), [0, 1, 0])
+
+    counts.add(np.arange(1000, 1040))
+    assert counts.capacity == 64
+
+    # Never shrinks below the initial capacity
+    counts.evict_before(2000)
+    assert counts.capacity == 4
+    assert counts.first_bin is None
+
+
+@pytest.mark.parametrize("num_points", [26, 27])
+def test_fft_ad_batch(num_points: int):
+    rng = np.random.default_rng(0)
+    signals = rng.poisson(3, size=(4, num_points))
+    signals[1, 7] = 80
+
+    is_anomaly = _fft_ad_batch(cp.asarray(signals), percentile=90, zthresh=2).get()
+
+    for (signal, signal_is_anomaly) in zip(signals, is_anomaly):
+        expected = np.zeros(num_points, dtype=bool)
+        expected[fftAD(cp.asarray(signal), percentile=90, zthresh=2).get()] = True
+
+        np.testing.assert_array_equal(signal_is_anomaly, expected)
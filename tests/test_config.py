@@ -104,3 +104,11 @@ def test_to_string(config):
     conf_str = config.to_string()
     assert isinstance(conf_str, str)
     assert isinstance(json.loads(conf_str), dict)
+
+
+def test_execution_mode():
+    config = morpheus.config.Config()
+    assert config.execution_mode == morpheus.config.ExecutionMode.GPU
+
+    config.execution_mode = morpheus.config.ExecutionMode.CPU
+    assert json.loads(config.to_string())["execution_mode"] == "CPU"
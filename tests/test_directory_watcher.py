@@ -15,6 +15,8 @@
 # limitations under the License.
 
 import os
+import pathlib
+import time
 
 import pytest
 
@@ -42,3 +44,44 @@ def test_constructor(watch_directory, max_files, sort_glob, recursive, queue_max
     assert watcher._sort_glob
     assert watcher._watch_directory
     assert watcher._max_files == -1
+
+
+def _write_file(path: pathlib.Path, mtime: float = None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{}")
+
+    if (mtime is not None):
+        os.utime(path, (mtime, mtime))
+
+
+def _create_watcher(input_glob: str, recursive: bool = False) -> DirectoryWatcher:
+    return DirectoryWatcher(input_glob,
+                            watch_directory=False,
+                            max_files=-1,
+                            sort_glob=True,
+                            recursive=recursive,
+                            queue_max_size=128,
+                            batch_timeout=0.1)
+
+
+@pytest.mark.parametrize('recursive, expected', [(False, ["a.json"]), (True, ["a.json", "sub/b.json", "sub/c/d.json"])])
+def test_discovery_recursive(tmp_path: pathlib.Path, recursive: bool, expected: list[str]):
+    for name in ["a.json", "sub/b.json", "sub/c/d.json", "sub/e.csv"]:
+        _write_file(tmp_path / name)
+
+    watcher = _create_watcher(os.path.join(tmp_path, "*.json"), recursive=recursive)
+    discovery = watcher._create_discovery()
+
+    assert sorted(file.path for file in discovery.discover()) == [str(tmp_path / name) for name in expected]
+
+
+def test_discovery_preserved_mtime(tmp_path: pathlib.Path):
+    _write_file(tmp_path / "a.json")
+
+    watcher = _create_watcher(os.path.join(tmp_path, "*.json"))
+    discovery = watcher._create_discovery()
+    assert len(discovery.discover()) == 1
+
+    # Files copied with their modification time preserved are still emitted, no matter how old
+    _write_file(tmp_path / "b.json", time.time() - 7 * 24 * 3600)
+    assert [file.path for file in discovery.discover()] == [str(tmp_path / "b.json")]
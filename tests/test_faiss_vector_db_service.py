@@ -17,6 +17,7 @@
 import os
 import typing
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
@@ -131,9 +132,161 @@ async def test_similarity_search(faiss_service: FaissVectorDBService):
     assert k_5[0][0]["page_content"] == "22"
 
 
+async def test_similarity_search_batch(faiss_service: FaissVectorDBService):
+
+    vdb = faiss_service.load_resource()
+
+    queries = ["", "1", "22", "333"]
+    query_vecs = await faiss_service.embeddings.aembed_documents(queries)
+
+    results = await vdb.similarity_search(embeddings=query_vecs, k=2)
+
+    assert len(results) == len(queries)
+    for (query, result) in zip(queries[:3], results):
+        assert len(result) == 2
+        assert result[0]["page_content"] == query
+
+    # Each batched result should match searching for the embedding individually with the LangChain store
+    for (query_vec, result) in zip(query_vecs, results):
+        assert result == [d.dict() for d in vdb._index.similarity_search_by_vector(embedding=query_vec, k=2)]
+
+    assert await vdb.similarity_search(embeddings=[], k=2) == []
+
+
 def test_has_store_object(faiss_service: FaissVectorDBService):
     assert faiss_service.has_store_object("index")
 
     assert faiss_service.has_store_object("other_index")
 
     assert not faiss_service.has_store_object("not_an_index")
+
+
+def _make_rows(texts: list[str]) -> list[dict]:
+    embedder = FakeEmbedder()
+    return [{"embedding": embedder.embed_query(text), "page_content": text, "source": "unittest"} for text in texts]
+
+
+async def test_insert(faiss_service: FaissVectorDBService):
+    vdb = faiss_service.load_resource(delta_flush_rows=2)
+    assert faiss_service.load_resource() is vdb
+
+    result = vdb.insert(_make_rows(["4444", "55555", "666666"]))
+    assert result["insert_count"] == 3
+    assert vdb.count() == 6
+
+    # The first two rows are flushed to a delta segment, the third is still buffered in memory
+    assert vdb.describe()["delta_segments"] == 1
+
+    query_vecs = await faiss_service.embeddings.aembed_documents(["22", "55555", "666666"])
+    results = await vdb.similarity_search(embeddings=query_vecs, k=2)
+    assert [result[0]["page_content"] for result in results] == ["22", "55555", "666666"]
+    assert results[1][0]["metadata"] == {"source": "unittest"}
+
+    # Searches with keyword arguments are performed per segment and merged
+    results = await vdb.similarity_search(embeddings=query_vecs, k=2, fetch_k=10)
+    assert [result[0]["page_content"] for result in results] == ["22", "55555", "666666"]
+
+
+def test_insert_dataframe_persisted(faiss_service: FaissVectorDBService, faiss_simple_store_dir: str):
+    import pandas as pd
+
+    faiss_service.insert_dataframe("index", pd.DataFrame(_make_rows(["4444", "55555"])))
+    assert faiss_service.count("index") == 5
+
+    # The base index files are never rewritten by an insert
+    base_mtime = os.path.getmtime(os.path.join(faiss_simple_store_dir, "index.faiss"))
+    faiss_service.close()
+    assert os.path.getmtime(os.path.join(faiss_simple_store_dir, "index.faiss")) == base_mtime
+    assert os.path.exists(os.path.join(faiss_simple_store_dir, "index.delta-000000.faiss"))
+
+    service = FaissVectorDBService(local_dir=faiss_simple_store_dir, embeddings=FakeEmbedder())
+    assert service.count("index") == 5
+    assert service.describe("index")["delta_segments"] == 1
+
+
+async def test_compact(faiss_service: FaissVectorDBService, faiss_simple_store_dir: str):
+    vdb = faiss_service.load_resource(delta_flush_rows=1)
+    vdb.insert(_make_rows(["4444"]))
+    vdb.insert(_make_rows(["55555"]))
+    assert vdb.describe()["delta_segments"] == 2
+
+    vdb.compact()
+    assert vdb.describe()["delta_segments"] == 0
+    assert vdb.count() == 5
+    assert not os.path.exists(os.path.join(faiss_simple_store_dir, "index.delta-000000.faiss"))
+
+    query_vec = await faiss_service.embeddings.aembed_query("4444")
+    results = await vdb.similarity_search(embeddings=[query_vec], k=1)
+    assert results[0][0]["page_content"] == "4444"
+
+    # The compacted index is loaded from disk by a new service
+    faiss_service.close()
+    service = FaissVectorDBService(local_dir=faiss_simple_store_dir, embeddings=FakeEmbedder())
+    assert service.count("index") == 5
+    assert service.describe("index")["delta_segments"] == 0
+
+
+@pytest.mark.parametrize("fail_path, committed", [("index.compact.json", False), ("index.pkl", True),
+                                                  ("index.delta-000001.faiss", True)])
+def test_compact_interrupted(faiss_service: FaissVectorDBService,
+                             faiss_simple_store_dir: str,
+                             fail_path: str,
+                             committed: bool):
+    vdb = faiss_service.load_resource(delta_flush_rows=1)
+    vdb.insert(_make_rows(["4444"]))
+    vdb.insert(_make_rows(["55555"]))
+
+    real_replace = os.replace
+    real_remove = os.remove
+
+    def fail_on(real_fn):
+
+        def wrapper(*args):
+            if (os.path.basename(args[-1]) == fail_path):
+                raise OSError("Simulated crash")
+
+            return real_fn(*args)
+
+        return wrapper
+
+    # Simulate the process stopping while committing the manifest, between replacing the `.faiss` and `.pkl` files of
+    # the base index, or while removing the merged delta segments
+    with (mock.patch("morpheus.service.vdb.faiss_vdb_service.os.replace", side_effect=fail_on(real_replace)),
+          mock.patch("morpheus.service.vdb.faiss_vdb_service.os.remove", side_effect=fail_on(real_remove))):
+        with pytest.raises(OSError, match="Simulated crash"):
+            vdb.compact()
+
+    faiss_service.close()
+
+    # Loading the resource again completes or discards the compaction, without losing or duplicating rows
+    service = FaissVectorDBService(local_dir=faiss_simple_store_dir, embeddings=FakeEmbedder())
+    assert service.count("index") == 5
+    assert service.describe("index")["delta_segments"] == (0 if committed else 2)
+    assert sorted(os.listdir(faiss_simple_store_dir)) == sorted(
+        ["index.faiss", "index.pkl", "other_index.faiss", "other_index.pkl"] +
+        ([] if committed else [f"index.delta-00000{i}{ext}" for i in range(2) for ext in (".faiss", ".pkl")]))
+
+
+def test_auto_compact(faiss_service: FaissVectorDBService):
+    vdb = faiss_service.load_resource(delta_flush_rows=1, auto_compact_segments=2)
+    vdb.insert(_make_rows(["4444"]))
+    vdb.insert(_make_rows(["55555"]))
+    vdb.wait_for_compaction()
+
+    assert vdb.describe()["delta_segments"] == 0
+    assert vdb.count() == 5
+
+
+async def test_mmap(faiss_simple_store_dir: str):
+    service = FaissVectorDBService(local_dir=faiss_simple_store_dir, embeddings=FakeEmbedder(), mmap=True)
+    vdb = service.load_resource()
+    assert vdb.count() == 3
+
+    vdb.insert(_make_rows(["4444"]))
+    vdb.flush()
+    vdb.compact()
+
+    query_vec = await service.embeddings.aembed_query("4444")
+    results = await vdb.similarity_search(embeddings=[query_vec], k=1)
+    assert results[0][0]["page_content"] == "4444"
+    assert vdb.count() == 4
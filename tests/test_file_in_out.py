@@ -20,14 +20,17 @@ import pathlib
 import typing
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from _utils import TEST_DIRS
 from _utils import assert_path_exists
 from _utils.dataset_manager import DatasetManager
 from morpheus.common import FileTypes
+from morpheus.common import FilterSource
 from morpheus.config import Config
 from morpheus.config import CppConfig
+from morpheus.config import ExecutionMode
 from morpheus.io.deserializers import read_file_to_df
 from morpheus.io.serializers import write_df_to_file
 from morpheus.messages import MessageMeta
@@ -36,6 +39,7 @@ from morpheus.pipeline import LinearPipeline
 from morpheus.stages.input.file_source_stage import FileSourceStage
 from morpheus.stages.output.in_memory_sink_stage import InMemorySinkStage
 from morpheus.stages.output.write_to_file_stage import WriteToFileStage
+from morpheus.stages.postprocess.filter_detections_stage import FilterDetectionsStage
 from morpheus.stages.postprocess.serialize_stage import SerializeStage
 from morpheus.stages.preprocess.deserialize_stage import DeserializeStage
 
@@ -295,3 +299,31 @@ def test_file_rw_serialize_deserialize_multi_segment_pipe(tmp_path: pathlib.Path
     # Somehow 0.7 ends up being 0.7000000000000001
     output_data = np.around(output_data, 2)
     assert output_data.tolist() == input_data.tolist()
+
+
+@pytest.mark.use_python
+def test_file_rw_cpu_execution_mode_pipe(tmp_path: pathlib.Path, config: Config):
+    input_file = os.path.join(TEST_DIRS.tests_data_dir, "filter_probs.csv")
+    out_file = os.path.join(tmp_path, 'results.csv')
+
+    config.execution_mode = ExecutionMode.CPU
+
+    pipe = LinearPipeline(config)
+    pipe.set_source(FileSourceStage(config, filename=input_file, iterative=False))
+    pipe.add_stage(DeserializeStage(config))
+    pipe.add_stage(FilterDetectionsStage(config, threshold=0.5, filter_source=FilterSource.DATAFRAME, field_name="v2"))
+    pipe.add_stage(SerializeStage(config))
+    sink_stage = pipe.add_stage(InMemorySinkStage(config))
+    pipe.add_stage(WriteToFileStage(config, filename=out_file, overwrite=False, include_index_col=False))
+    pipe.run()
+
+    # The DataFrames are never converted to cuDF
+    messages: list[MessageMeta] = sink_stage.get_messages()
+    assert len(messages) > 0
+    assert all(isinstance(msg.df, pd.DataFrame) for msg in messages)
+
+    expected_df = pd.read_csv(input_file)
+    expected_df = expected_df[expected_df["v2"] > 0.5]
+
+    output_df = pd.read_csv(out_file)
+    assert output_df.round(2).values.tolist() == expected_df.round(2).values.tolist()
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import gzip
+import threading
 import typing
 from functools import partial
 from io import StringIO
@@ -23,9 +26,11 @@ from _utils import make_mock_response
 from _utils.dataset_manager import DatasetManager
 from morpheus.config import Config
 from morpheus.io.serializers import df_to_stream_json
+from morpheus.messages import MessageMeta
 from morpheus.pipeline import LinearPipeline
 from morpheus.stages.input.in_memory_source_stage import InMemorySourceStage
 from morpheus.stages.output.http_client_sink_stage import HttpClientSinkStage
+from morpheus.stages.output.in_memory_sink_stage import InMemorySinkStage
 from morpheus.utils.http_utils import HTTPMethod
 from morpheus.utils.http_utils import MimeTypes
 from morpheus.utils.type_aliases import DataFrameType
@@ -136,3 +141,143 @@ def test_write_to_http_stage_pipe(mock_sleep: mock.MagicMock,
                                  data=called_buffer)
 
     mock_sleep.assert_not_called()
+
+
+@pytest.mark.use_pandas
+@mock.patch("requests.Session")
+@mock.patch("time.sleep")
+def test_write_to_http_stage_pipe_gzip(mock_sleep: mock.MagicMock,
+                                       mock_request_session: mock.MagicMock,
+                                       config: Config,
+                                       filter_probs_df: DataFrameType):
+    make_mock_response(mock_request_session)
+
+    pipe = LinearPipeline(config)
+    pipe.set_source(InMemorySourceStage(config, [filter_probs_df]))
+    pipe.add_stage(
+        HttpClientSinkStage(config,
+                            base_url="http://fake.nvidia.com",
+                            endpoint="/data",
+                            lines=True,
+                            max_rows_per_payload=10,
+                            compression="gzip"))
+    pipe.run()
+
+    mocked_calls = mock_request_session.request.call_args_list
+    assert len(mocked_calls) == len(filter_probs_df) // 10
+
+    for (i, call) in enumerate(mocked_calls):
+        expected_payload = _df_to_buffer(df=filter_probs_df[i * 10:(i + 1) * 10], lines=True).read()
+        assert gzip.decompress(call.kwargs['data']).decode("UTF-8") == expected_payload
+        assert call.kwargs['headers'] == {"Content-Type": MimeTypes.TEXT.value, "Content-Encoding": "gzip"}
+
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.use_pandas
+@mock.patch("requests.Session")
+@mock.patch("time.sleep")
+def test_write_to_http_stage_pipe_gzip_df_to_request_kwargs(mock_sleep: mock.MagicMock,
+                                                            mock_request_session: mock.MagicMock,
+                                                            config: Config,
+                                                            filter_probs_df: DataFrameType):
+    make_mock_response(mock_request_session)
+
+    pipe = LinearPipeline(config)
+    pipe.set_source(InMemorySourceStage(config, [filter_probs_df]))
+    pipe.add_stage(
+        HttpClientSinkStage(config,
+                            base_url="http://fake.nvidia.com",
+                            endpoint="/data",
+                            lines=True,
+                            max_rows_per_payload=10,
+                            df_to_request_kwargs_fn=partial(_df_to_url, True),
+                            compression="gzip"))
+    pipe.run()
+
+    mocked_calls = mock_request_session.request.call_args_list
+    assert len(mocked_calls) == len(filter_probs_df) // 10
+
+    # Payloads from `df_to_request_kwargs_fn` are sent as is, without claiming to be compressed
+    for (i, call) in enumerate(mocked_calls):
+        expected_payload = _df_to_buffer(df=filter_probs_df[i * 10:(i + 1) * 10], lines=True).read()
+        assert call.kwargs['data'].read() == expected_payload
+        assert call.kwargs['headers'] == {"Content-Type": MimeTypes.TEXT.value}
+
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.slow
+@pytest.mark.use_cudf
+@pytest.mark.parametrize("preserve_order", [False, True])
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_write_to_http_stage_async_pipe(config: Config,
+                                        filter_probs_df: DataFrameType,
+                                        mock_rest_server: str,
+                                        preserve_order: bool,
+                                        compression: str):
+    pytest.importorskip("aiohttp")
+
+    dfs = [filter_probs_df[i:i + 4] for i in range(0, len(filter_probs_df), 4)]
+
+    pipe = LinearPipeline(config)
+    pipe.set_source(InMemorySourceStage(config, dfs))
+    pipe.add_stage(
+        HttpClientSinkStage(config,
+                            base_url=mock_rest_server,
+                            endpoint="/api/v1/data",
+                            max_rows_per_payload=2,
+                            compression=compression,
+                            async_mode=True,
+                            max_in_flight_requests=4,
+                            max_connections_per_host=2,
+                            preserve_order=preserve_order))
+    sink = pipe.add_stage(InMemorySinkStage(config))
+    pipe.run()
+
+    first_rows = [msg.copy_dataframe().index[0] for msg in sink.get_messages()]
+    expected_first_rows = [df.index[0] for df in dfs]
+
+    if preserve_order:
+        assert first_rows == expected_first_rows
+    else:
+        assert sorted(first_rows) == expected_first_rows
+
+
+@pytest.mark.use_pandas
+def test_async_emit_without_more_input(config: Config, filter_probs_df: DataFrameType):
+    pytest.importorskip("aiohttp")
+
+    stage = HttpClientSinkStage(config, base_url="http://localhost:8080", endpoint="/api/v1/data", async_mode=True)
+
+    async def send_async(request_args: dict):  # pylint: disable=unused-argument
+        await asyncio.sleep(0.1)
+
+    stage._send_async = send_async
+    stage._loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=stage._loop.run_forever, daemon=True)
+    loop_thread.start()
+
+    emitted = []
+    sent = threading.Event()
+
+    def emit(msg: MessageMeta):
+        emitted.append(msg)
+        sent.set()
+
+    meta = MessageMeta(filter_probs_df)
+
+    stage._start_emitter(emit)
+    try:
+        stage._process_message_async(meta)
+
+        # No more messages arrive, the message is passed on once its request completes rather than on completion
+        assert sent.wait(timeout=10)
+        assert stage._wait_for_pending() == []
+    finally:
+        stage._stop_emitter()
+        stage._loop.call_soon_threadsafe(stage._loop.stop)
+        loop_thread.join()
+        stage._loop.close()
+
+    assert emitted == [meta]
@@ -149,6 +149,28 @@ def test_get_meta(filter_probs_df: typing.Union[cudf.DataFrame, pd.DataFrame]):
     _test_get_meta(filter_probs_df)
 
 
+def test_readonly_meta(filter_probs_df: typing.Union[cudf.DataFrame, pd.DataFrame]):
+    meta = MessageMeta(filter_probs_df)
+    multi = MultiMessage(meta=meta, mess_offset=3, mess_count=5)
+
+    df_sliced = filter_probs_df.iloc[multi.mess_offset:multi.mess_offset + multi.mess_count, :]
+
+    with patch.object(MessageMeta, "copy_dataframe") as mock_copy_dataframe:
+        with multi.readonly_meta() as view:
+            assert view.columns == multi.get_meta_column_names()
+            assert len(view) == multi.mess_count
+
+            DatasetManager.assert_df_equal(view.df, df_sliced)
+
+            col_name = df_sliced.columns[0]
+            DatasetManager.assert_df_equal(view.get_column(col_name), df_sliced[col_name])
+
+            col_name = [df_sliced.columns[3], df_sliced.columns[0]]
+            DatasetManager.assert_df_equal(view.get_columns(col_name), df_sliced[col_name])
+
+        mock_copy_dataframe.assert_not_called()
+
+
 # Ignore unused arguments warnigns due to using the `use_cpp` fixture
 # pylint:disable=unused-argument
 
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pathlib
+import sqlite3
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from morpheus.loaders.sql_loader import iter_sql_chunks
+from morpheus.loaders.sql_loader import load_sql_chunks
+from morpheus.loaders.sql_loader import sql_loader
+from morpheus.messages import ControlMessage
+
+NUM_TABLES = 3
+ROWS_PER_TABLE = 25
+
+
+@pytest.fixture(name="sql_config")
+def sql_config_fixture(tmp_path: pathlib.Path) -> dict:
+    db_path = tmp_path / "test.db"
+
+    with sqlite3.connect(db_path) as conn:
+        for table in range(NUM_TABLES):
+            conn.execute(f"CREATE TABLE table_{table} (id INTEGER, name TEXT)")
+            conn.executemany(f"INSERT INTO table_{table} VALUES (?, ?)",
+                             [(table * ROWS_PER_TABLE + i, f"name_{i}") for i in range(ROWS_PER_TABLE)])
+
+    yield {
+        "queries": [{
+            "connection_string": f"sqlite:///{db_path}", "query": f"SELECT * FROM table_{table} ORDER BY id"
+        } for table in range(NUM_TABLES)]
+    }
+
+
+def _expected_ids(num_tables: int = NUM_TABLES) -> list[int]:
+    return list(range(num_tables * ROWS_PER_TABLE))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, NUM_TABLES])
+@pytest.mark.parametrize("chunksize", [None, 7])
+def test_iter_sql_chunks(sql_config: dict, max_workers: int, chunksize: int):
+    sql_config.update(max_workers=max_workers, chunksize=chunksize)
+
+    dfs = list(iter_sql_chunks(sql_config))
+
+    # Results are returned in the order of the queries
+    assert pd.concat(dfs)["id"].tolist() == _expected_ids()
+    if (chunksize is None):
+        assert len(dfs) == NUM_TABLES
+    else:
+        assert all(len(df) <= chunksize for df in dfs)
+
+
+@pytest.mark.parametrize("max_workers", [1, NUM_TABLES])
+def test_iter_sql_chunks_chunk_rows(sql_config: dict, max_workers: int):
+    sql_config["max_workers"] = max_workers
+
+    dfs = list(iter_sql_chunks(sql_config, chunk_rows=10))
+
+    # Chunks span the results of consecutive queries
+    assert [len(df) for df in dfs] == [10] * 7 + [5]
+    assert pd.concat(dfs)["id"].tolist() == _expected_ids()
+    assert all(df.index.tolist() == list(range(len(df))) for df in dfs)
+
+
+def test_iter_sql_chunks_early_exit(sql_config: dict):
+    sql_config["max_workers"] = NUM_TABLES
+
+    chunks = iter_sql_chunks(sql_config, chunk_rows=1)
+    assert next(chunks)["id"].tolist() == [0]
+
+    # Closing the generator stops the remaining queries
+    chunks.close()
+
+
+def test_iter_sql_chunks_error(sql_config: dict):
+    sql_config["max_workers"] = NUM_TABLES
+    sql_config["queries"][1]["query"] = "SELECT * FROM missing_table"
+
+    with pytest.raises(Exception, match="missing_table"):
+        list(iter_sql_chunks(sql_config))
+
+
+def test_iter_sql_chunks_chunk_rows_empty(sql_config: dict):
+    for query_data in sql_config["queries"]:
+        query_data["query"] = query_data["query"].replace("ORDER BY", "WHERE id < 0 ORDER BY")
+
+    dfs = list(iter_sql_chunks(sql_config, chunk_rows=10))
+
+    # An empty result still yields a DataFrame with the columns of the query
+    assert len(dfs) == 1
+    assert dfs[0].empty
+    assert dfs[0].columns.tolist() == ["id", "name"]
+
+
+def test_sql_loader(sql_config: dict):
+    sql_config["max_workers"] = NUM_TABLES
+    control_message = ControlMessage()
+
+    with mock.patch("morpheus.loaders.sql_loader.pd.concat", wraps=pd.concat) as mock_concat:
+        control_message = sql_loader(control_message, {"sql_config": sql_config})
+
+    # The results of every query are concatenated once
+    mock_concat.assert_called_once()
+
+    df = control_message.payload().copy_dataframe()
+    assert df["id"].to_pandas().tolist() == _expected_ids()
+    assert df.index.to_pandas().tolist() == _expected_ids()
+
+
+def test_load_sql_chunks(sql_config: dict):
+    control_message = ControlMessage()
+    control_message.set_metadata("source", "test")
+
+    chunk_messages = list(load_sql_chunks(control_message, {"sql_config": sql_config}, chunk_rows=30))
+
+    assert [len(msg.payload().copy_dataframe()) for msg in chunk_messages] == [30, 30, 15]
+    assert all(msg.get_metadata("source") == "test" for msg in chunk_messages)
+
+
+def test_load_sql_chunks_error(sql_config: dict):
+    sql_config["queries"][1]["query"] = "SELECT * FROM missing_table"
+    control_message = ControlMessage()
+
+    chunk_messages = list(load_sql_chunks(control_message, {"sql_config": sql_config}, chunk_rows=10))
+
+    # Chunks already fetched are sent, followed by the failed control message
+    assert len(chunk_messages) == 3
+    assert chunk_messages[-1] is control_message
+    assert control_message.get_metadata("cm_failed")
+    assert not chunk_messages[0].has_metadata("cm_failed")
+
+
+def test_load_sql_chunks_empty(sql_config: dict):
+    for query_data in sql_config["queries"]:
+        query_data["query"] = query_data["query"].replace("ORDER BY", "WHERE id < 0 ORDER BY")
+
+    control_message = ControlMessage()
+    control_message.set_metadata("source", "test")
+
+    chunk_messages = list(load_sql_chunks(control_message, {"sql_config": sql_config}, chunk_rows=10))
+
+    # Queries without results still send a message on, with an empty payload
+    assert len(chunk_messages) == 1
+    assert chunk_messages[0].get_metadata("source") == "test"
+    assert not chunk_messages[0].has_metadata("cm_failed")
+
+    df = chunk_messages[0].payload().copy_dataframe()
+    assert len(df) == 0
+    assert df.columns.tolist() == ["id", "name"]
+
+
+def test_load_sql_chunks_early_exit(sql_config: dict):
+    control_message = ControlMessage()
+
+    chunk_messages = load_sql_chunks(control_message, {"sql_config": sql_config}, chunk_rows=10)
+    assert len(next(chunk_messages).payload().copy_dataframe()) == 10
+
+    # Closing the generator early neither raises nor marks the control message as failed
+    chunk_messages.close()
+    assert not control_message.has_metadata("cm_failed")
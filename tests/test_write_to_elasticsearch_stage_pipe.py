@@ -79,7 +79,7 @@ def test_write_to_elasticsearch_stage_pipe(mock_controller: typing.Any,
                                            connection_conf_file: str,
                                            config: Config,
                                            filter_probs_df: typing.Union[cudf.DataFrame, pd.DataFrame]):
-    mock_df_to_parallel_bulk_write = mock_controller.return_value.df_to_parallel_bulk_write
+    mock_df_to_bulk_write = mock_controller.return_value.df_to_bulk_write
     mock_refresh_client = mock_controller.return_value.refresh_client
 
     # Create a pipeline
@@ -95,11 +95,11 @@ def test_write_to_elasticsearch_stage_pipe(mock_controller: typing.Any,
     if isinstance(filter_probs_df, cudf.DataFrame):
         filter_probs_df = filter_probs_df.to_pandas()
 
-    expected_index = mock_df_to_parallel_bulk_write.call_args[1]["index"]
-    expected_df = mock_df_to_parallel_bulk_write.call_args[1]["df"]
+    expected_index = mock_df_to_bulk_write.call_args[1]["index"]
+    expected_df = mock_df_to_bulk_write.call_args[1]["df"]
 
     mock_refresh_client.assert_called_once()
-    mock_df_to_parallel_bulk_write.assert_called_once()
+    mock_df_to_bulk_write.assert_called_once()
 
     assert expected_index == "t_index"
     assert expected_df.equals(filter_probs_df)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pathlib
+import re
+import time
+from datetime import datetime
+from datetime import timezone
+from unittest import mock
+
+import pytest
+
+from morpheus.utils.file_discovery import IncrementalFileDiscovery
+from morpheus.utils.file_discovery import get_partition_end
+
+PARTITION_REGEX = re.compile(r"(?P<year>\d{4})(/(?P<month>\d{2}))?(/(?P<day>\d{2}))?$")
+
+
+def _write_file(path: pathlib.Path, mtime: float = None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{}")
+
+    if (mtime is not None):
+        os.utime(path, (mtime, mtime))
+
+
+def _set_mtime(paths: list[pathlib.Path], mtime: float):
+    for path in paths:
+        os.utime(path, (mtime, mtime))
+
+
+def _paths(files) -> list[str]:
+    return [file.path for file in files]
+
+
+def test_discover(tmp_path: pathlib.Path):
+    old_mtime = time.time() - 100
+    for name in ["a/1.json", "a/2.csv", "b/3.json", "4.json"]:
+        _write_file(tmp_path / name, old_mtime)
+
+    _set_mtime([tmp_path / "a", tmp_path / "b", tmp_path], old_mtime)
+
+    discovery = IncrementalFileDiscovery([os.path.join(tmp_path, "*", "*.json")])
+    assert _paths(discovery.discover()) == [str(tmp_path / "a/1.json"), str(tmp_path / "b/3.json")]
+    assert discovery.cursor == (old_mtime, str(tmp_path / "b/3.json"))
+
+    # Unchanged directories are not listed again
+    with mock.patch.object(discovery.fs, "ls", wraps=discovery.fs.ls) as mock_ls:
+        assert len(discovery.discover()) == 0
+        mock_ls.assert_not_called()
+
+        _write_file(tmp_path / "b/5.json")
+        assert _paths(discovery.discover()) == [str(tmp_path / "b/5.json")]
+        mock_ls.assert_called_once()
+        assert mock_ls.call_args.args[0] == str(tmp_path / "b")
+
+
+def test_recursive(tmp_path: pathlib.Path):
+    for name in ["1.json", "a/2.json", "a/b/3.json", "a/b/4.csv"]:
+        _write_file(tmp_path / name)
+
+    discovery = IncrementalFileDiscovery([os.path.join(tmp_path, "**", "*.json")])
+    assert sorted(_paths(
+        discovery.discover())) == [str(tmp_path / name) for name in ["1.json", "a/2.json", "a/b/3.json"]]
+
+
+def test_preserved_mtime(tmp_path: pathlib.Path):
+    _write_file(tmp_path / "new.json")
+
+    discovery = IncrementalFileDiscovery([os.path.join(tmp_path, "*.json")])
+    assert len(discovery.discover()) == 1
+
+    # Without a late arrival window, files copied with their modification time preserved are discovered
+    _write_file(tmp_path / "old.json", time.time() - 2 * 3600)
+    assert _paths(discovery.discover()) == [str(tmp_path / "old.json")]
+
+
+def test_late_arrival_window(tmp_path: pathlib.Path):
+    now = time.time()
+    _write_file(tmp_path / "1.json", now)
+
+    discovery = IncrementalFileDiscovery([os.path.join(tmp_path, "*.json")], late_arrival_window=60)
+    assert len(discovery.discover()) == 1
+
+    # Files arriving late are discovered within the window, older files are skipped
+    _write_file(tmp_path / "2.json", now - 30)
+    _write_file(tmp_path / "3.json", now - 120)
+    assert _paths(discovery.discover()) == [str(tmp_path / "2.json")]
+
+    # Files leaving the window are no longer held
+    _write_file(tmp_path / "4.json", now + 90)
+    assert _paths(discovery.discover()) == [str(tmp_path / "4.json")]
+    assert discovery.num_files_seen == 1
+
+    # Deleted files are forgotten allowing a file with the same name to be discovered
+    os.remove(tmp_path / "4.json")
+    assert len(discovery.discover()) == 0
+    assert discovery.num_files_seen == 0
+
+    _write_file(tmp_path / "4.json", now + 100)
+    assert _paths(discovery.discover()) == [str(tmp_path / "4.json")]
+
+
+def test_partition_regex(tmp_path: pathlib.Path):
+    for day in range(1, 5):
+        mtime = datetime(2024, 1, day, 12, tzinfo=timezone.utc).timestamp()
+        _write_file(tmp_path / f"2024/01/0{day}/logs.json", mtime)
+        _set_mtime([tmp_path / f"2024/01/0{day}"], mtime)
+
+    _set_mtime([tmp_path / "2024/01", tmp_path / "2024", tmp_path], mtime)
+
+    discovery = IncrementalFileDiscovery([os.path.join(tmp_path, "*", "*", "*", "*.json")],
+                                         late_arrival_window=3600,
+                                         partition_regex=PARTITION_REGEX)
+    assert len(discovery.discover()) == 4
+
+    # Partitions ending before the window are not listed, even when changed
+    _set_mtime([tmp_path / "2024/01/01", tmp_path / "2024/01/04"], time.time())
+
+    with mock.patch.object(discovery.fs, "ls", wraps=discovery.fs.ls) as mock_ls:
+        assert len(discovery.discover()) == 0
+        assert [call.args[0] for call in mock_ls.call_args_list] == [str(tmp_path / "2024/01/04")]
+
+
+@pytest.mark.parametrize("path,expected",
+                         [("logs/2024", datetime(2025, 1, 1)), ("logs/2024/12", datetime(2025, 1, 1)),
+                          ("logs/2024/02/28", datetime(2024, 2, 29)), ("logs/other", None)])
+def test_get_partition_end(path: str, expected: datetime):
+    partition_end = get_partition_end(path, PARTITION_REGEX)
+
+    if (expected is None):
+        assert partition_end is None
+    else:
+        assert partition_end == expected.replace(tzinfo=timezone.utc).timestamp()
+
+
+def test_cursor_file(tmp_path: pathlib.Path):
+    input_dir = tmp_path / "input"
+    cursor_file = os.path.join(tmp_path, "cursor.json")
+    _write_file(input_dir / "1.json")
+
+    discovery = IncrementalFileDiscovery([os.path.join(input_dir, "*.json")], cursor_file=cursor_file)
+    assert len(discovery.discover()) == 1
+
+    # Simulate a restart
+    _write_file(input_dir / "2.json")
+    discovery = IncrementalFileDiscovery([os.path.join(input_dir, "*.json")], cursor_file=cursor_file)
+    assert discovery.cursor == (os.path.getmtime(input_dir / "1.json"), str(input_dir / "1.json"))
+    assert _paths(discovery.discover()) == [str(input_dir / "2.json")]
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
+import typing
 from unittest import mock
 
 import pytest
@@ -100,3 +102,99 @@ def test_request_with_retry_max_retries(mock_sleep: mock.MagicMock,
 
     if use_on_success_fn:
         on_success_fn.assert_not_called()
+
+
+@pytest.fixture(name="aiohttp_server")
+async def aiohttp_server_fixture() -> typing.AsyncIterator[tuple]:
+    """
+    Runs an in-process HTTP server which fails the first `fail_count` requests to `/flaky/{fail_count}` and echoes the
+    decompressed body of gzip compressed requests to `/echo`. Yields the url of the server and a client session.
+    """
+    aiohttp = pytest.importorskip("aiohttp")
+    from aiohttp import test_utils
+    from aiohttp import web
+
+    request_counts = {}
+
+    async def flaky(request: web.Request) -> web.Response:
+        fail_count = int(request.match_info["fail_count"])
+        request_counts[fail_count] = request_counts.get(fail_count, 0) + 1
+        if (request_counts[fail_count] <= fail_count):
+            return web.Response(status=503, text="unavailable", headers={"Retry-After": "7"})
+
+        return web.Response(text=f"requests={request_counts[fail_count]}")
+
+    async def echo(request: web.Request) -> web.Response:
+        # The server decompresses the body according to the Content-Encoding header
+        return web.Response(body=await request.read(),
+                            headers={"X-Content-Encoding": request.headers["Content-Encoding"]})
+
+    app = web.Application()
+    app.router.add_get("/flaky/{fail_count}", flaky)
+    app.router.add_post("/echo", echo)
+
+    async with test_utils.TestServer(app) as server:
+        async with aiohttp.ClientSession() as session:
+            yield (str(server.make_url("")), session)
+
+
+@pytest.mark.parametrize("respect_retry_after_header", [True, False])
+@mock.patch("asyncio.sleep")
+async def test_request_with_retry_async(mock_sleep: mock.AsyncMock,
+                                        aiohttp_server: tuple,
+                                        respect_retry_after_header: bool):
+    (url, session) = aiohttp_server
+    response = await http_utils.request_with_retry_async({
+        'method': 'GET', 'url': f"{url}/flaky/2"
+    },
+                                                         session=session,
+                                                         sleep_time=1,
+                                                         respect_retry_after_header=respect_retry_after_header)
+
+    assert response.status == 200
+    assert await response.text() == "requests=3"
+
+    if respect_retry_after_header:
+        mock_sleep.assert_has_awaits([mock.call(7)] * 2)
+    else:
+        mock_sleep.assert_has_awaits([mock.call(1), mock.call(2)])
+
+
+@mock.patch("asyncio.sleep")
+async def test_request_with_retry_async_max_retries(mock_sleep: mock.AsyncMock, aiohttp_server: tuple):
+    (url, session) = aiohttp_server
+    on_success_fn = mock.MagicMock()
+
+    with pytest.raises(RuntimeError, match="503"):
+        await http_utils.request_with_retry_async({
+            'method': 'GET', 'url': f"{url}/flaky/10"
+        },
+                                                  session=session,
+                                                  max_retries=5,
+                                                  on_success_fn=on_success_fn)
+
+    assert mock_sleep.await_count == 4
+    on_success_fn.assert_not_called()
+
+
+@pytest.mark.parametrize("use_on_success_fn", [True, False])
+async def test_request_with_retry_async_gzip(aiohttp_server: tuple, use_on_success_fn: bool):
+    (url, session) = aiohttp_server
+    request_kwargs = {
+        'method': 'POST',
+        'url': f"{url}/echo",
+        'data': gzip.compress(b'{"v": 1}'),
+        'headers': {
+            "Content-Encoding": "gzip"
+        }
+    }
+
+    on_success_fn = (lambda response: response.status) if use_on_success_fn else None
+    result = await http_utils.request_with_retry_async(request_kwargs, session=session, on_success_fn=on_success_fn)
+
+    if use_on_success_fn:
+        assert result == 200
+    else:
+        # The body is read before the connection is released
+        assert await result.text() == '{"v": 1}'
+        assert result.headers["X-Content-Encoding"] == "gzip"
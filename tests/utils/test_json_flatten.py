@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pandas as pd
+import pytest
+
+from morpheus.utils import json_flatten
+from morpheus.utils.json_flatten import flatten_json_column
+
+RECORDS = [
+    {
+        "name": "a", "count": 1, "nested": {
+            "id": 1, "inner": {
+                "value": "x"
+            }, "tags": ["t1", "t2"]
+        }
+    },
+    {
+        "name": "b", "nested": {
+            "id": 2, "inner": {}
+        }
+    },
+    {
+        "name": None, "count": 3, "other": {
+            "skipped": True
+        }
+    },
+]
+
+
+def _json_normalize(series: pd.Series, prefix: str) -> pd.DataFrame:
+    # Reference implementation
+    pdf_norm = pd.json_normalize(series.apply(lambda x: x if isinstance(x, dict) else json.loads(x)))
+    pdf_norm.rename(columns=lambda x: prefix + "." + x, inplace=True)
+    pdf_norm.set_index(series.index, inplace=True)
+    return pdf_norm
+
+
+@pytest.mark.parametrize("as_dict", [False, True])
+def test_flatten_json_column(as_dict: bool):
+    series = pd.Series(RECORDS if as_dict else [json.dumps(r) for r in RECORDS], index=[5, 6, 7])
+
+    expected = _json_normalize(series, "data")
+    actual = flatten_json_column(series, prefix="data")
+
+    pd.testing.assert_frame_equal(actual, expected[list(actual.columns)])
+    assert sorted(actual.columns) == sorted(expected.columns)
+
+
+def test_flatten_json_column_keys():
+    series = pd.Series([json.dumps(r) for r in RECORDS])
+    keys = ["data.count", "data.nested.inner.value", "data.nested.tags", "data.missing"]
+
+    actual = flatten_json_column(series, prefix="data", keys=keys)
+
+    assert list(actual.columns) == ["data.count", "data.nested.inner.value", "data.nested.tags"]
+    pd.testing.assert_frame_equal(actual, _json_normalize(series, "data")[list(actual.columns)])
+
+
+def test_flatten_json_column_workers():
+    records = [json.dumps(r) for r in RECORDS] * 5
+    series = pd.Series(records)
+    keys = ["data.name", "data.count", "data.other.skipped"]
+
+    expected = flatten_json_column(series, prefix="data", keys=keys)
+    actual = flatten_json_column(series, prefix="data", keys=keys, num_workers=2, chunk_size=4)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_shutdown_executors():
+    series = pd.Series([json.dumps(r) for r in RECORDS] * 5)
+    expected = flatten_json_column(series, prefix="data")
+
+    flatten_json_column(series, prefix="data", num_workers=2, chunk_size=4)
+    executor = json_flatten._executors[2]
+
+    json_flatten.shutdown_executors()
+    assert not json_flatten._executors
+    with pytest.raises(RuntimeError):
+        executor.submit(len, [])
+
+    # The worker processes are started again when needed
+    actual = flatten_json_column(series, prefix="data", num_workers=2, chunk_size=4)
+    pd.testing.assert_frame_equal(actual, expected)